@@ -1,5 +1,5 @@
 from .adapter import AgentAdapter
-from .cache import AgentCache
+from .cache import AgentCache, agent_cache_key
 from .env_manager import EnvManager
 from .factory import AgentFactory
 from .mcp import MCPClientAbstraction
@@ -30,6 +30,7 @@ from .tools import (
 __all__ = [
     "AgentAdapter",
     "AgentCache",
+    "agent_cache_key",
     "AgentFactory",
     "AgentSettings",
     "EnvManager",
@@ -1,37 +1,258 @@
+"""Process-wide cache of instantiated AI agents.
+
+Agents are expensive to build (model client setup and tool registration),
+so the factory keeps them in a bounded cache shared by the whole process.
+
+Caching Behavior:
+----------------
+
+1. **Keys**: Agents are keyed by role plus digests of the effective agent
+   settings and of the tool set (see ``agent_cache_key``), so overridden
+   settings or tools never reuse an agent built for other ones
+2. **Bounded**: At most ``max_size`` agents are kept; the least recently
+   used agent is evicted first
+3. **TTL**: Agents older than ``ttl`` seconds are dropped on their next lookup
+4. **Single flight**: Concurrent ``get_or_create`` calls for the same key
+   share one build
+"""
+
+import asyncio
+import hashlib
+import json
 import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
 from typing import Any, Optional
 
+from pydantic import SecretStr
+
+from .settings import AgentSettings
+
+_UNSET: Any = object()
+
+
+def agent_cache_key(role: str, settings: AgentSettings, tools: Iterable[str] = (), mode: str = "") -> tuple[str, ...]:
+    """Build the cache key of an agent.
+
+    Args:
+        role: Agent role
+        settings: Effective agent settings, including any overrides
+        tools: Names of the tools the agent is built with
+        mode: Factory mode the agent is built for (e.g. "proposal")
+
+    Returns:
+        Tuple of (role, mode, settings digest, tool set digest)
+
+    """
+    data = settings.model_dump(mode="json", exclude={"tools"}, warnings=False)
+    # Secrets are masked in the dump, but a changed key needs a new model client
+    api_key = getattr(settings.model_settings, "api_key", None)
+    if api_key is not None:
+        secret = api_key.get_secret_value() if isinstance(api_key, SecretStr) else str(api_key)
+        data["api_key_digest"] = hashlib.sha256(secret.encode()).hexdigest()
+    settings_digest = hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    tools_digest = hashlib.sha256("\n".join(sorted(set(tools))).encode()).hexdigest()[:16]
+    return (role, mode, settings_digest, tools_digest)
+
+
+@dataclass
+class _CacheEntry:
+    """A cached agent with its creation time."""
+
+    agent: Any
+    created_at: float
+
 
 class AgentCache:
     """Singleton cache for storing instantiated AI agents.
 
-    Uses 'role' as the primary key.
+    Features:
+    --------
+    - LRU eviction beyond ``max_size`` agents
+    - TTL expiry checked on lookup
+    - Single build shared by concurrent ``get_or_create`` callers
+    - Hit, miss, eviction and build metrics
+
+    Example:
+    -------
+    >>> cache = AgentCache()
+    >>> cache.configure(max_size=64, ttl=1800.0)
+    >>> agent = await cache.get_or_create(key, build_agent)
+    >>> cache.get_stats()["builds"]
+    1
+
     """
 
+    DEFAULT_MAX_SIZE = 128
+    DEFAULT_TTL = 3600.0
+
     _instance: Optional["AgentCache"] = None
     _lock: threading.Lock = threading.Lock()
-    _agents: dict[str, Any] = {}  # noqa: RUF012
+
+    _agents: "OrderedDict[Hashable, _CacheEntry]"
+    _inflight: dict[Hashable, asyncio.Task]
 
     def __new__(cls) -> "AgentCache":
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
+                    instance = super().__new__(cls)
+                    instance._init_state()
+                    cls._instance = instance
         return cls._instance
 
-    def get(self, role: str) -> Any | None:
-        """Retrieve an agent instance by role."""
-        return self._agents.get(role)
+    def _init_state(self) -> None:
+        self.max_size: int = self.DEFAULT_MAX_SIZE
+        self.ttl: float | None = self.DEFAULT_TTL
+        self._agents = OrderedDict()
+        self._inflight = {}
+        self._state_lock = threading.RLock()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.builds = 0
+        self.coalesced = 0
 
-    def set(self, role: str, agent: Any) -> None:
-        """Store an agent instance by role."""
-        self._agents[role] = agent
+    def configure(self, max_size: int | None = None, ttl: float | None = _UNSET) -> None:
+        """Change the cache limits.
 
-    def remove(self, role: str) -> None:
+        Args:
+            max_size: Maximum number of cached agents
+            ttl: Seconds an agent stays cached; None disables expiry.
+                Omit to keep the current TTL.
+
+        """
+        with self._state_lock:
+            if max_size is not None:
+                self.max_size = max_size
+            if ttl is not _UNSET:
+                self.ttl = ttl
+            self._evict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Retrieve an agent instance by key."""
+        with self._state_lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry.agent
+
+    def set(self, key: Hashable, agent: Any) -> None:
+        """Store an agent instance by key."""
+        with self._state_lock:
+            self._agents[key] = _CacheEntry(agent=agent, created_at=time.monotonic())
+            self._agents.move_to_end(key)
+            self._evict()
+
+    async def get_or_create(self, key: Hashable, build: Callable[[], Awaitable[Any]]) -> Any:
+        """Get a cached agent, building it with ``build`` on a miss.
+
+        Concurrent callers for the same key wait for a single build. A
+        failed build is not cached and its error is raised to every waiter.
+
+        Args:
+            key: Cache key, see ``agent_cache_key``
+            build: Coroutine function creating the agent
+
+        Returns:
+            Cached or newly built agent
+
+        """
+        with self._state_lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                self.hits += 1
+                return entry.agent
+            self.misses += 1
+
+            task = self._inflight.get(key)
+            if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+                self.coalesced += 1
+            else:
+                task = asyncio.create_task(self._build(key, build))
+                self._inflight[key] = task
+                task.add_done_callback(lambda t: self._build_done(key, t))
+
+        return await asyncio.shield(task)
+
+    async def _build(self, key: Hashable, build: Callable[[], Awaitable[Any]]) -> Any:
+        agent = await build()
+        with self._state_lock:
+            self.builds += 1
+        self.set(key, agent)
+        return agent
+
+    def _build_done(self, key: Hashable, task: asyncio.Task) -> None:
+        with self._state_lock:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when no waiter is left
+            task.exception()
+
+    def _lookup(self, key: Hashable) -> _CacheEntry | None:
+        entry = self._agents.get(key)
+        if entry is None:
+            return None
+        if self.ttl is not None and time.monotonic() - entry.created_at >= self.ttl:
+            del self._agents[key]
+            self.expirations += 1
+            return None
+        self._agents.move_to_end(key)
+        return entry
+
+    def _evict(self) -> None:
+        while len(self._agents) > self.max_size:
+            self._agents.popitem(last=False)
+            self.evictions += 1
+
+    def remove(self, key: Hashable) -> None:
         """Remove an agent instance from cache."""
-        if role in self._agents:
-            del self._agents[role]
+        with self._state_lock:
+            self._agents.pop(key, None)
+
+    def remove_role(self, role: str) -> int:
+        """Remove every cached agent of a role.
+
+        Returns:
+            Number of removed agents
+
+        """
+        with self._state_lock:
+            keys = [key for key in self._agents if key == role or (isinstance(key, tuple) and key[:1] == (role,))]
+            for key in keys:
+                del self._agents[key]
+            return len(keys)
 
     def clear(self) -> None:
         """Clear all cached agents."""
-        self._agents.clear()
+        with self._state_lock:
+            self._agents.clear()
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._state_lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._agents),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "builds": self.builds,
+                "coalesced": self.coalesced,
+                "building": len(self._inflight),
+            }
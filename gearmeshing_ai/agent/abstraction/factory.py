@@ -3,7 +3,7 @@ from typing import Any
 
 from ..models.actions import MCPToolCatalog
 from .adapter import AgentAdapter
-from .cache import AgentCache
+from .cache import AgentCache, agent_cache_key
 from .mcp import MCPClientAbstraction
 from .settings import AgentSettings, ModelSettings
 
@@ -73,17 +73,14 @@ class AgentFactory:
     async def get_or_create_agent(self, role: str, override_settings: dict[str, Any] | None = None) -> Any:
         """Retrieve an agent from cache or create a new one.
         Enhanced to support proposal-only mode.
+
+        Agents are cached by role, effective settings (including overrides)
+        and tool set; concurrent requests for the same agent share one build.
         """
         # For proposal mode, check if we need to initialize
         if self.proposal_mode and not self._tool_catalog:
             await self.initialize_proposal_mode()
 
-        # check cache first
-        cache_key = f"{role}_proposal" if self.proposal_mode else role
-        cached_agent = self.cache.get(cache_key)
-        if cached_agent and not override_settings:
-            return cached_agent
-
         # Retrieve settings
         agent_settings = self.get_agent_settings(role)
         if not agent_settings:
@@ -97,18 +94,23 @@ class AgentFactory:
             # This is a bit complex with Pydantic, might need copy update
             agent_settings = agent_settings.model_copy(update=override_settings)
 
-        # Get tools (only for traditional mode)
-        tools = []
-        if not self.proposal_mode and self.mcp_client and agent_settings.tools:
-            tools = await self.mcp_client.get_tools(agent_settings.tools)
+        # Proposal agents see the discovered catalog instead of bound tools
+        if self.proposal_mode:
+            tool_names = [tool.name for tool in self._tool_catalog.tools] if self._tool_catalog else []
+        else:
+            tool_names = list(agent_settings.tools)
+        cache_key = agent_cache_key(role, agent_settings, tool_names, mode="proposal" if self.proposal_mode else "")
 
-        # Create agent via adapter
-        agent = self.adapter.create_agent(agent_settings, tools)
+        async def build() -> Any:
+            # Get tools (only for traditional mode)
+            tools = []
+            if not self.proposal_mode and self.mcp_client and agent_settings.tools:
+                tools = await self.mcp_client.get_tools(agent_settings.tools)
 
-        # Cache the agent
-        self.cache.set(cache_key, agent)
+            # Create agent via adapter
+            return self.adapter.create_agent(agent_settings, tools)
 
-        return agent
+        return await self.cache.get_or_create(cache_key, build)
 
     async def execute_proposal(self, action: str, parameters: dict) -> dict:
         """Execute a proposal using MCP client."""
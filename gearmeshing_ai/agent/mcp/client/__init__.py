@@ -30,8 +30,12 @@ Key Features:
 
 ✅ **Multiple Transport Support**: SSE, HTTP, and stdio transports
 ✅ **Connection Management**: Automatic connection pooling and reuse
+✅ **Persistent Sessions**: Optional long-lived, multiplexed MCP sessions per transport
+✅ **Tool Discovery**: Schema-rich tool catalogs cached per server with background refresh
 ✅ **Health Monitoring**: Built-in health checks and server readiness detection
 ✅ **Failover Support**: Automatic failover to backup servers
+✅ **Circuit Breaking**: Per-server and per-tool circuit breakers with hedged reads
+✅ **Load Balancing**: Round-robin, weighted, least-connections and latency-aware strategies
 ✅ **Configuration-Driven**: Create clients from configuration files
 ✅ **Type Safety**: Full type hints and Pydantic validation
 ✅ **Async Support**: Full async/await support throughout
@@ -119,7 +123,13 @@ The package is designed to be easily extensible:
 
 """
 
+from .catalog import (
+    ToolCatalogCache,
+    build_tool_catalog,
+)
 from .config import (
+    CircuitBreakerConfig,
+    HedgingConfig,
     MCPClientConfig,
     RetryConfig,
     TransportConfig,
@@ -130,6 +140,7 @@ from .core import (
     MCPClient,
 )
 from .exceptions import (
+    CircuitOpenError,
     ConnectionError,
     MCPClientError,
     ServerError,
@@ -145,8 +156,19 @@ from .monitoring import (
 )
 from .pool import (
     ConnectionPool,
+    LoadBalancer,
+    LoadBalanceStrategy,
     ServerPool,
 )
+from .resilience import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from .session import (
+    PersistentSession,
+    SessionStats,
+)
 from .transports import (
     BaseTransport,
     HTTPTransport,
@@ -168,6 +190,12 @@ __all__ = [
     "SSETransport",
     "HTTPTransport",
     "StdioTransport",
+    # Sessions
+    "PersistentSession",
+    "SessionStats",
+    # Tool discovery
+    "ToolCatalogCache",
+    "build_tool_catalog",
     # Factory
     "MCPClientFactory",
     "EasyMCPClientFactory",
@@ -175,9 +203,17 @@ __all__ = [
     "MCPClientConfig",
     "TransportConfig",
     "RetryConfig",
+    "CircuitBreakerConfig",
+    "HedgingConfig",
     # Pooling
     "ServerPool",
     "ConnectionPool",
+    "LoadBalancer",
+    "LoadBalanceStrategy",
+    # Resilience
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitState",
     # Monitoring
     "ClientMetrics",
     "HealthChecker",
@@ -186,6 +222,7 @@ __all__ = [
     "ConnectionError",
     "TimeoutError",
     "ServerError",
+    "CircuitOpenError",
 ]
 
 
@@ -0,0 +1,262 @@
+"""Tool catalog building and caching for MCP clients.
+
+This module turns MCP ``tools/list`` responses into the ``MCPToolCatalog``
+consumed by agents and caches catalogs per server, so capability discovery
+does not hit the MCP server on every workflow run.
+
+Caching Behavior:
+----------------
+
+1. **Fresh**: Within ``ttl`` seconds of fetching, the cached catalog is
+   returned without contacting the server
+2. **Refresh ahead**: Once a catalog is older than ``refresh_ahead * ttl``,
+   it is still returned immediately and a background refresh is started
+3. **Expired**: After ``ttl`` seconds the catalog is fetched again before
+   returning; concurrent callers share a single fetch
+4. **Change detection**: Every fetched catalog gets a content digest (an
+   ETag). When a refresh yields the same digest, the cached catalog object
+   is kept, so anything derived from it stays valid
+
+Usage Guidelines:
+----------------
+
+# Build a catalog from tool definitions
+tools = await transport.list_tool_definitions()
+catalog = build_tool_catalog(tools, server="http://localhost:8082/mcp")
+
+# Cache catalogs per server
+cache = ToolCatalogCache(ttl=300.0)
+catalog = await cache.get("clickup", load_clickup_catalog)
+print(cache.etag("clickup"))
+
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from mcp.types import Tool
+
+from ...models.actions import MCPToolCatalog, MCPToolInfo
+
+logger = logging.getLogger(__name__)
+
+
+def _example_usage(name: str, schema: dict[str, Any]) -> str:
+    """Render a call signature such as ``get_tasks(list_id: string, page?: integer)``."""
+    properties = schema.get("properties") or {}
+    required = set(schema.get("required") or [])
+    params = []
+    for param, spec in properties.items():
+        param_type = spec.get("type", "any") if isinstance(spec, dict) else "any"
+        if isinstance(param_type, list):
+            param_type = " | ".join(str(t) for t in param_type)
+        params.append(f"{param}{'' if param in required else '?'}: {param_type}")
+    return f"{name}({', '.join(params)})"
+
+
+def build_tool_catalog(tools: Iterable[Tool], server: str) -> MCPToolCatalog:
+    """Build an agent tool catalog from MCP tool definitions.
+
+    Args:
+        tools: Tool definitions from a ``tools/list`` response
+        server: Identifier of the MCP server providing the tools
+
+    Returns:
+        Catalog with descriptions and JSON schemas of every tool
+
+    """
+    catalog_tools = []
+    for tool in tools:
+        schema = tool.inputSchema or {}
+        catalog_tools.append(
+            MCPToolInfo(
+                name=tool.name,
+                description=tool.description or tool.title or f"Tool: {tool.name}",
+                mcp_server=server,
+                parameters=schema,
+                returns=tool.outputSchema,
+                example_usage=_example_usage(tool.name, schema),
+            )
+        )
+    return MCPToolCatalog(tools=catalog_tools)
+
+
+def catalog_etag(catalog: MCPToolCatalog) -> str:
+    """Compute a content digest identifying a catalog's tools and schemas."""
+    payload = json.dumps(catalog.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class CatalogEntry:
+    """A cached catalog with its digest and fetch time."""
+
+    catalog: MCPToolCatalog
+    etag: str
+    fetched_at: float
+
+
+class ToolCatalogCache:
+    """Per-server tool catalog cache with TTL and background refresh.
+
+    Features:
+    --------
+    - TTL expiry per server
+    - Background refresh ahead of expiry
+    - Single fetch shared by concurrent callers
+    - Digest-based change detection
+    - Stale catalog served if a refresh fails
+
+    Attributes:
+    ----------
+    ttl: Seconds a catalog stays valid; 0 disables caching
+    refresh_ahead: Fraction of the TTL after which a background refresh starts
+    on_change: Called with (server, catalog) when a refresh changed the catalog
+
+    Example:
+    -------
+    >>> cache = ToolCatalogCache(ttl=300.0, refresh_ahead=0.8)
+    >>> catalog = await cache.get("clickup", client.fetch_catalog)
+    >>> cache.get_stats()["hits"]
+    0
+
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        refresh_ahead: float = 0.8,
+        on_change: Callable[[str, MCPToolCatalog], None] | None = None,
+    ):
+        """Initialize tool catalog cache.
+
+        Args:
+            ttl: Seconds a catalog stays valid; 0 disables caching
+            refresh_ahead: Fraction of the TTL after which a background refresh starts
+            on_change: Called with (server, catalog) when a refresh changed the catalog
+
+        """
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.on_change = on_change
+        self._entries: dict[str, CatalogEntry] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.background_refreshes = 0
+        self.unchanged_refreshes = 0
+        self.changes = 0
+        self.refresh_failures = 0
+
+    async def get(self, server: str, loader: Callable[[], Awaitable[MCPToolCatalog]]) -> MCPToolCatalog:
+        """Get the catalog of a server, fetching it with ``loader`` when needed.
+
+        Args:
+            server: Server identifier
+            loader: Coroutine function fetching a fresh catalog
+
+        Returns:
+            Tool catalog of the server
+
+        """
+        entry = self._entries.get(server)
+        if entry is not None and self.ttl > 0:
+            age = time.monotonic() - entry.fetched_at
+            if age < self.ttl:
+                self.hits += 1
+                if age >= self.ttl * self.refresh_ahead and self._pending(server) is None:
+                    self.background_refreshes += 1
+                    self._start_fetch(server, loader)
+                return entry.catalog
+
+        self.misses += 1
+        task = self._pending(server) or self._start_fetch(server, loader)
+        try:
+            return await asyncio.shield(task)
+        except Exception as e:
+            if entry is None:
+                raise
+            logger.warning(f"Failed to refresh tool catalog of {server}, serving stale catalog: {e}")
+            return entry.catalog
+
+    def etag(self, server: str) -> str | None:
+        """Get the digest of a server's cached catalog."""
+        entry = self._entries.get(server)
+        return entry.etag if entry else None
+
+    def invalidate(self, server: str | None = None) -> None:
+        """Drop the cached catalog of one server, or of every server."""
+        if server is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(server, None)
+
+    async def close(self) -> None:
+        """Cancel pending fetches."""
+        tasks = list(self._inflight.values())
+        self._inflight.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _pending(self, server: str) -> asyncio.Task | None:
+        task = self._inflight.get(server)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    def _start_fetch(self, server: str, loader: Callable[[], Awaitable[MCPToolCatalog]]) -> asyncio.Task:
+        task = asyncio.create_task(self._fetch(server, loader), name=f"tool-catalog:{server}")
+        self._inflight[server] = task
+        task.add_done_callback(lambda t: self._fetch_done(server, t))
+        return task
+
+    def _fetch_done(self, server: str, task: asyncio.Task) -> None:
+        if self._inflight.get(server) is task:
+            del self._inflight[server]
+        if not task.cancelled() and task.exception() is not None:
+            self.refresh_failures += 1
+            logger.warning(f"Tool catalog fetch for {server} failed: {task.exception()}")
+
+    async def _fetch(self, server: str, loader: Callable[[], Awaitable[MCPToolCatalog]]) -> MCPToolCatalog:
+        catalog = await loader()
+        etag = catalog_etag(catalog)
+        now = time.monotonic()
+
+        previous = self._entries.get(server)
+        if previous is not None and previous.etag == etag:
+            self.unchanged_refreshes += 1
+            previous.fetched_at = now
+            return previous.catalog
+
+        self._entries[server] = CatalogEntry(catalog=catalog, etag=etag, fetched_at=now)
+        if previous is not None:
+            self.changes += 1
+            logger.info(f"Tool catalog of {server} changed ({len(catalog.tools)} tools)")
+            if self.on_change:
+                try:
+                    self.on_change(server, catalog)
+                except Exception as e:
+                    logger.error(f"Tool catalog change callback failed for {server}: {e}")
+        return catalog
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "servers": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "background_refreshes": self.background_refreshes,
+            "unchanged_refreshes": self.unchanged_refreshes,
+            "changes": self.changes,
+            "refresh_failures": self.refresh_failures,
+            "etags": {server: entry.etag for server, entry in self._entries.items()},
+        }
@@ -181,6 +181,81 @@ class RetryConfig(BaseModel):
         return v
 
 
+class CircuitBreakerConfig(BaseModel):
+    """Configuration for circuit breakers guarding servers and tools.
+
+    A circuit opens after ``failure_threshold`` consecutive transient
+    failures and rejects requests for ``recovery_timeout`` seconds. It then
+    lets up to ``half_open_max_calls`` probe requests through; a successful
+    probe closes the circuit and a failed one opens it again.
+
+    Features:
+    --------
+    - Per-server and per-tool circuits
+    - Fast rejection while a server is failing
+    - Automatic recovery probing
+
+    Example:
+    -------
+    >>> breaker_config = CircuitBreakerConfig(
+    ...     failure_threshold=5,
+    ...     recovery_timeout=30.0,
+    ...     half_open_max_calls=1
+    ... )
+
+    """
+
+    enabled: bool = Field(default=True, description="Enable circuit breakers")
+    failure_threshold: int = Field(default=5, ge=1, le=100, description="Consecutive failures before a circuit opens")
+    recovery_timeout: float = Field(
+        default=30.0, ge=0.01, le=600.0, description="Seconds a circuit stays open before probing"
+    )
+    half_open_max_calls: int = Field(default=1, ge=1, le=100, description="Concurrent probe requests when half-open")
+
+
+class HedgingConfig(BaseModel):
+    """Configuration for hedged requests.
+
+    When a call to an idempotent read tool has not completed within the
+    observed latency percentile, a second request is sent to another server
+    and the first response wins. Hedging is disabled until
+    ``min_samples`` successful calls of the tool have been observed.
+
+    Features:
+    --------
+    - Opt-in per tool name or name prefix
+    - Delay derived from recent latencies
+    - Bounded number of extra requests
+
+    Example:
+    -------
+    >>> hedging_config = HedgingConfig(
+    ...     enabled=True,
+    ...     idempotent_tools=["get_tasks"],
+    ...     percentile=0.95
+    ... )
+
+    """
+
+    enabled: bool = Field(default=False, description="Enable hedged requests")
+    idempotent_tools: list[str] = Field(default_factory=list, description="Tool names that are safe to hedge")
+    idempotent_prefixes: list[str] = Field(
+        default_factory=lambda: ["get_", "list_", "search_", "read_"],
+        description="Tool name prefixes that are safe to hedge",
+    )
+    percentile: float = Field(default=0.95, ge=0.5, le=0.999, description="Latency percentile used as hedge delay")
+    min_samples: int = Field(default=20, ge=1, le=10000, description="Observations needed before hedging")
+    min_delay: float = Field(default=0.01, ge=0.0, le=60.0, description="Lower bound of the hedge delay in seconds")
+    max_hedges: int = Field(default=1, ge=1, le=5, description="Maximum extra requests per call")
+    window_size: int = Field(default=256, ge=10, le=10000, description="Latency observations kept per tool")
+
+    def is_idempotent(self, tool_name: str) -> bool:
+        """Check whether a tool may be hedged."""
+        return tool_name in self.idempotent_tools or any(
+            tool_name.startswith(prefix) for prefix in self.idempotent_prefixes
+        )
+
+
 class TransportConfig(BaseModel):
     """Configuration for transport-specific settings.
 
@@ -200,7 +275,8 @@ class TransportConfig(BaseModel):
     ...     connection_timeout=30.0,
     ...     read_timeout=60.0,
     ...     max_connections=10,
-    ...     verify_ssl=True
+    ...     verify_ssl=True,
+    ...     persistent_session=True
     ... )
 
     """
@@ -210,6 +286,9 @@ class TransportConfig(BaseModel):
     write_timeout: float = Field(default=60.0, ge=1.0, le=600.0, description="Write timeout in seconds")
     max_connections: int = Field(default=10, ge=1, le=100, description="Maximum connections per host")
     keep_alive: bool = Field(default=True, description="Enable connection keep-alive")
+    persistent_session: bool = Field(
+        default=False, description="Keep one initialized MCP session open per transport and share it across requests"
+    )
     verify_ssl: bool = Field(default=True, description="Verify SSL certificates")
     ssl_cert_path: str | None = Field(default=None, description="Path to SSL certificate file")
     custom_headers: dict[str, str] = Field(default_factory=dict, description="Custom HTTP headers")
@@ -323,6 +402,11 @@ class MCPClientConfig(BaseModel):
     # Monitoring and metrics
     monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig, description="Monitoring configuration")
 
+    # Circuit breaking
+    circuit_breaker: CircuitBreakerConfig = Field(
+        default_factory=CircuitBreakerConfig, description="Circuit breaker configuration"
+    )
+
     # Security settings
     api_key: SecretStr | None = Field(default=None, description="API key for authentication")
     auth_token: SecretStr | None = Field(default=None, description="Authentication token")
@@ -333,6 +417,14 @@ class MCPClientConfig(BaseModel):
     enable_compression: bool = Field(default=True, description="Enable response compression")
     user_agent: str = Field(default="MCPClient/1.0", description="User agent string")
 
+    # Tool discovery
+    tool_catalog_ttl: float = Field(
+        default=300.0, ge=0.0, le=86400.0, description="Seconds a discovered tool catalog is cached; 0 disables caching"
+    )
+    tool_catalog_refresh_ahead: float = Field(
+        default=0.8, gt=0.0, le=1.0, description="Fraction of the catalog TTL after which it is refreshed in background"
+    )
+
     @field_validator("timeout")
     @classmethod
     def validate_timeout(cls, v):
@@ -382,18 +474,24 @@ class MCPClientConfig(BaseModel):
             f"{prefix}CONNECTION_POOL_SIZE": ("connection_pool_size", int),
             f"{prefix}ENABLE_COMPRESSION": ("enable_compression", lambda x: x.lower() == "true"),
             f"{prefix}USER_AGENT": ("user_agent", str),
+            f"{prefix}TOOL_CATALOG_TTL": ("tool_catalog_ttl", float),
             # Retry policy
             f"{prefix}MAX_RETRIES": ("retry_policy.max_retries", int),
             f"{prefix}BASE_DELAY": ("retry_policy.base_delay", float),
             f"{prefix}MAX_DELAY": ("retry_policy.max_delay", float),
             f"{prefix}BACKOFF_FACTOR": ("retry_policy.backoff_factor", float),
             f"{prefix}RETRY_JITTER": ("retry_policy.jitter", lambda x: x.lower() == "true"),
+            # Circuit breaker
+            f"{prefix}CIRCUIT_BREAKER_ENABLED": ("circuit_breaker.enabled", lambda x: x.lower() == "true"),
+            f"{prefix}CIRCUIT_FAILURE_THRESHOLD": ("circuit_breaker.failure_threshold", int),
+            f"{prefix}CIRCUIT_RECOVERY_TIMEOUT": ("circuit_breaker.recovery_timeout", float),
             # Transport config
             f"{prefix}CONNECTION_TIMEOUT": ("transport.connection_timeout", float),
             f"{prefix}READ_TIMEOUT": ("transport.read_timeout", float),
             f"{prefix}WRITE_TIMEOUT": ("transport.write_timeout", float),
             f"{prefix}MAX_CONNECTIONS": ("transport.max_connections", int),
             f"{prefix}KEEP_ALIVE": ("transport.keep_alive", lambda x: x.lower() == "true"),
+            f"{prefix}PERSISTENT_SESSION": ("transport.persistent_session", lambda x: x.lower() == "true"),
             f"{prefix}VERIFY_SSL": ("transport.verify_ssl", lambda x: x.lower() == "true"),
             f"{prefix}SSL_CERT_PATH": ("transport.ssl_cert_path", str),
             # Monitoring config
@@ -70,12 +70,15 @@ from dataclasses import dataclass
 from typing import Any
 
 from mcp import ClientSession
+from mcp.types import Tool
 
 from ...abstraction.mcp import MCPClientAbstraction
 from ...models.actions import MCPToolCatalog, MCPToolInfo
+from .catalog import ToolCatalogCache, build_tool_catalog
 from .config import MCPClientConfig
-from .exceptions import ConnectionError, MCPClientError, ServerError, TimeoutError
+from .exceptions import CircuitOpenError, ConnectionError, MCPClientError, ServerError, TimeoutError
 from .monitoring import ClientMetrics
+from .resilience import CircuitBreakerRegistry
 from .transports import BaseTransport, HTTPTransport, SSETransport, StdioTransport
 
 logger = logging.getLogger(__name__)
@@ -145,8 +148,16 @@ class MCPClient(MCPClientAbstraction):
         self._transport: BaseTransport | None = None
         self._stats = ClientStats()
         self._metrics = ClientMetrics()
+        self._circuit_breakers = CircuitBreakerRegistry(self.config.circuit_breaker)
+        self._tool_catalogs = ToolCatalogCache(
+            ttl=self.config.tool_catalog_ttl, refresh_ahead=self.config.tool_catalog_refresh_ahead
+        )
+        self._server_id = "unknown"
         self._lock = asyncio.Lock()
 
+    # Circuit name of the connected server; each operation also has its own circuit
+    _SERVER_CIRCUIT = "server"
+
     def set_transport(self, transport: BaseTransport) -> None:
         """Set the transport for the client.
 
@@ -155,6 +166,10 @@ class MCPClient(MCPClientAbstraction):
 
         """
         self._transport = transport
+        self._server_id = transport._describe() if isinstance(transport, BaseTransport) else "unknown"
+        # Failures and tools recorded for the previous server do not apply to this one
+        self._circuit_breakers.reset()
+        self._tool_catalogs.invalidate()
         logger.debug(f"Set transport: {type(transport).__name__}")
 
     async def connect(self, url: str, transport_type: str = "sse") -> None:
@@ -169,10 +184,11 @@ class MCPClient(MCPClientAbstraction):
             TimeoutError: If connection times out
 
         """
+        persistent = self.config.transport.persistent_session
         if transport_type == "sse":
-            transport = SSETransport(url, self.config.timeout)
+            transport = SSETransport(url, self.config.timeout, persistent=persistent)
         elif transport_type == "http":
-            transport = HTTPTransport(url, self.config.timeout)
+            transport = HTTPTransport(url, self.config.timeout, persistent=persistent)
         elif transport_type == "stdio":
             raise ValueError("Stdio transport requires command and args, use connect_stdio()")
         else:
@@ -190,7 +206,9 @@ class MCPClient(MCPClientAbstraction):
             env: Environment variables
 
         """
-        transport = StdioTransport(command, args, env, self.config.timeout)
+        transport = StdioTransport(
+            command, args, env, self.config.timeout, persistent=self.config.transport.persistent_session
+        )
         self.set_transport(transport)
         await self._ensure_session()
 
@@ -265,6 +283,10 @@ class MCPClient(MCPClientAbstraction):
     async def _execute_with_retry(self, operation, operation_name: str) -> Any:
         """Execute an operation with retry logic.
 
+        Each attempt passes through the server circuit and the operation's
+        circuit. Once a circuit opens, remaining retries are skipped and later
+        calls fail fast with CircuitOpenError until it recovers.
+
         Args:
             operation: The operation to execute
             operation_name: Name of the operation for logging
@@ -273,6 +295,7 @@ class MCPClient(MCPClientAbstraction):
             Operation result
 
         Raises:
+            CircuitOpenError: If a circuit breaker rejects the request
             MCPClientError: If all retries are exhausted
 
         """
@@ -284,23 +307,34 @@ class MCPClient(MCPClientAbstraction):
 
         for attempt in range(self.config.retry_policy.max_retries + 1):
             try:
-                result = await operation()
+                with self._circuit_breakers.guard(self._SERVER_CIRCUIT, operation_name):
+                    result = await operation()
 
                 # Update success stats
                 response_time = time.time() - start_time
                 self._stats.update_success(response_time)
-                self._metrics.record_success(operation_name, response_time)
+                await self._metrics.record_success(operation_name, response_time)
 
                 logger.debug(f"Operation {operation_name} succeeded in {response_time:.3f}s")
                 return result
 
+            except CircuitOpenError as e:
+                self._stats.update_failure()
+                await self._metrics.record_failure(operation_name, time.time() - start_time, type(e).__name__)
+                if last_error is not None:
+                    break
+                raise
+
             except (ConnectionError, TimeoutError) as e:
                 last_error = e
                 response_time = time.time() - start_time
                 self._stats.update_failure()
-                self._metrics.record_failure(operation_name, str(e))
+                await self._metrics.record_failure(operation_name, response_time, type(e).__name__)
 
                 if attempt < self.config.retry_policy.max_retries:
+                    if not self._circuit_breakers.allows(self._SERVER_CIRCUIT, operation_name):
+                        logger.error(f"Operation {operation_name} failed and its circuit opened, not retrying: {e}")
+                        break
                     delay = self.config.retry_policy.get_delay(attempt)
                     logger.warning(
                         f"Operation {operation_name} failed (attempt {attempt + 1}), retrying in {delay:.2f}s: {e}"
@@ -312,7 +346,7 @@ class MCPClient(MCPClientAbstraction):
             except Exception as e:
                 # Non-retryable errors
                 self._stats.update_failure()
-                self._metrics.record_failure(operation_name, str(e))
+                await self._metrics.record_failure(operation_name, time.time() - start_time, type(e).__name__)
                 logger.error(f"Operation {operation_name} failed with non-retryable error: {e}")
                 raise ServerError(f"Server error during {operation_name}: {e}")
 
@@ -347,9 +381,14 @@ class MCPClient(MCPClientAbstraction):
         """Get client metrics."""
         return self._metrics
 
+    def get_circuit_stats(self) -> dict[str, Any]:
+        """Get circuit breaker statistics keyed by circuit name."""
+        return self._circuit_breakers.get_stats()
+
     async def close(self) -> None:
         """Close the client and cleanup resources."""
         async with self._lock:
+            await self._tool_catalogs.close()
             if self._transport:
                 try:
                     await self._transport.close()
@@ -370,33 +409,42 @@ class MCPClient(MCPClientAbstraction):
 
     # NEW METHODS FOR PROPOSAL-ONLY AGENTS
     async def discover_tools_for_agent(self) -> MCPToolCatalog:
-        """Discover tools and format for agent consumption."""
-        # Get raw tool list using existing method
-        tool_names = await self.list_tools()
+        """Discover tools and format for agent consumption.
 
-        # Get detailed tool information
-        tools = []
-        for tool_name in tool_names:
-            # Get tool schema/description from MCP server
-            # This would require extending the transport interface to get tool details
-            tool_info = await self._get_tool_details(tool_name)
-            tools.append(tool_info)
+        Descriptions and parameter schemas of all tools come from a single
+        ``tools/list`` request. The catalog is cached per server for
+        ``config.tool_catalog_ttl`` seconds and refreshed in the background
+        before it expires.
+        """
+        return await self._tool_catalogs.get(self._server_id, self._fetch_tool_catalog)
 
-        return MCPToolCatalog(tools=tools)
+    async def _fetch_tool_catalog(self) -> MCPToolCatalog:
+        """Fetch the tool catalog from the MCP server."""
+        transport = self._transport
+        catalog: MCPToolCatalog = await self._execute_with_retry(
+            (lambda: _list_tool_catalog(transport, self._server_id)) if transport else None, "list_tools"
+        )
+        return catalog
 
     async def _get_tool_details(self, tool_name: str) -> MCPToolInfo:
         """Get detailed information about a specific tool."""
-        # This would need to be implemented in the transport layer
-        # For now, create basic info
+        catalog = await self.discover_tools_for_agent()
+        tool_info = catalog.find_tool(tool_name)
+        if tool_info is not None:
+            return tool_info
         return MCPToolInfo(
             name=tool_name,
             description=f"Tool: {tool_name}",
-            mcp_server="unknown",  # Would be determined by transport
+            mcp_server=self._server_id,
             parameters={},
             returns=None,
             example_usage=f"Use {tool_name} with appropriate parameters",
         )
 
+    def get_tool_catalog_stats(self) -> dict[str, Any]:
+        """Get tool catalog cache statistics."""
+        return self._tool_catalogs.get_stats()
+
     async def execute_proposed_tool(self, tool_name: str, parameters: dict) -> dict:
         """Execute tool (system execution)."""
         try:
@@ -406,6 +454,16 @@ class MCPClient(MCPClientAbstraction):
             return {"success": False, "error": str(e), "tool_used": tool_name}
 
 
+async def _list_tool_catalog(transport: BaseTransport, server: str) -> MCPToolCatalog:
+    """List the tools of a transport as an agent tool catalog."""
+    if isinstance(transport, BaseTransport):
+        return build_tool_catalog(await transport.list_tool_definitions(), server)
+
+    # Custom transports may only implement list_tools(), which carries no schemas
+    tool_names = await transport.list_tools()
+    return build_tool_catalog([Tool(name=name, inputSchema={}) for name in tool_names], server)
+
+
 class EasyMCPClient:
     """Convenience wrapper with static methods for common MCP operations.
 
@@ -620,21 +678,8 @@ class EasyMCPClient:
     async def discover_tools_for_agent_sse(url: str, timeout: float = 30.0) -> MCPToolCatalog:
         """Discover tools using SSE transport for agent consumption."""
         transport = SSETransport(url, timeout)
-        tool_names = await transport.list_tools()
-
-        tools = []
-        for tool_name in tool_names:
-            tool_info = MCPToolInfo(
-                name=tool_name,
-                description=f"Tool: {tool_name}",
-                mcp_server=url,  # Use URL as server identifier
-                parameters={},
-                returns=None,
-                example_usage=f"Use {tool_name} with appropriate parameters",
-            )
-            tools.append(tool_info)
-
-        return MCPToolCatalog(tools=tools)
+        # Use URL as server identifier
+        return await _list_tool_catalog(transport, url)
 
 
 class AsyncMCPClient(MCPClient):
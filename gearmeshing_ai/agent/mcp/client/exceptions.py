@@ -12,6 +12,7 @@ BaseException
     ├── ConnectionError
     │   ├── TimeoutError
     │   ├── AuthenticationError
+    │   ├── CircuitOpenError
     │   └── NetworkError
     ├── ServerError
     │   ├── ToolNotFoundError
@@ -342,6 +343,47 @@ class AuthenticationError(ConnectionError):
         return False
 
 
+class CircuitOpenError(ConnectionError):
+    """Exception for requests rejected by an open circuit breaker.
+
+    This exception is raised without contacting the server when recent
+    failures tripped the circuit breaker guarding it. Retrying immediately
+    is pointless; callers should fail over or wait for ``retry_after``.
+
+    Attributes:
+    ----------
+    circuit_name: Name of the circuit that rejected the request
+    retry_after: Seconds until the circuit lets a probe request through
+
+    Example:
+    -------
+    >>> try:
+    ...     await client.call_tool("get_tasks", {})
+    ... except CircuitOpenError as e:
+    ...     print(f"{e.circuit_name} is open, retry in {e.retry_after:.1f}s")
+
+    """
+
+    def __init__(self, message: str, circuit_name: str | None = None, retry_after: float = 0.0, **kwargs):
+        """Initialize circuit open error.
+
+        Args:
+            message: Human-readable error message
+            circuit_name: Name of the circuit that rejected the request
+            retry_after: Seconds until the circuit lets a probe request through
+            **kwargs: Additional arguments passed to base class
+
+        """
+        kwargs.setdefault("error_code", "CIRCUIT_OPEN")
+        super().__init__(message, **kwargs)
+        self.circuit_name = circuit_name
+        self.retry_after = retry_after
+
+    def is_retryable(self) -> bool:
+        """Open circuits reject requests until they recover."""
+        return False
+
+
 class ServerError(MCPClientError):
     """Exception for server-side errors.
 
@@ -265,7 +265,7 @@ class MCPClientFactory:
             client = MCPClient(client_config)
 
             # Create and set transport
-            transport = SSETransport(url, client_config.timeout)
+            transport = SSETransport(url, client_config.timeout, persistent=client_config.transport.persistent_session)
             client.set_transport(transport)
 
             # Auto-connect if requested
@@ -306,7 +306,7 @@ class MCPClientFactory:
             client = MCPClient(client_config)
 
             # Create and set transport
-            transport = HTTPTransport(url, client_config.timeout)
+            transport = HTTPTransport(url, client_config.timeout, persistent=client_config.transport.persistent_session)
             client.set_transport(transport)
 
             # Auto-connect if requested
@@ -354,7 +354,9 @@ class MCPClientFactory:
             client = MCPClient(client_config)
 
             # Create and set transport
-            transport = StdioTransport(command, args, env, client_config.timeout)
+            transport = StdioTransport(
+                command, args, env, client_config.timeout, persistent=client_config.transport.persistent_session
+            )
             client.set_transport(transport)
 
             # Auto-connect if requested
@@ -416,13 +418,23 @@ class MCPClientFactory:
             transport_config = config or TransportConfig()
 
             if transport_type.lower() == "sse":
-                return SSETransport(url_or_command, transport_config.connection_timeout)
+                return SSETransport(
+                    url_or_command, transport_config.connection_timeout, persistent=transport_config.persistent_session
+                )
             if transport_type.lower() == "http":
-                return HTTPTransport(url_or_command, transport_config.connection_timeout)
+                return HTTPTransport(
+                    url_or_command, transport_config.connection_timeout, persistent=transport_config.persistent_session
+                )
             if transport_type.lower() == "stdio":
                 if not args:
                     raise ConfigurationError("stdio transport requires args")
-                return StdioTransport(url_or_command, args, env, transport_config.connection_timeout)
+                return StdioTransport(
+                    url_or_command,
+                    args,
+                    env,
+                    transport_config.connection_timeout,
+                    persistent=transport_config.persistent_session,
+                )
             raise ConfigurationError(f"Unsupported transport type: {transport_type}")
 
         except Exception as e:
@@ -570,7 +582,9 @@ class TransportFactory:
         """
         try:
             transport_config = config or self.default_config
-            transport = SSETransport(url, transport_config.connection_timeout)
+            transport = SSETransport(
+                url, transport_config.connection_timeout, persistent=transport_config.persistent_session
+            )
             logger.debug(f"Created SSE transport for {url}")
             return transport
         except Exception as e:
@@ -592,7 +606,9 @@ class TransportFactory:
         """
         try:
             transport_config = config or self.default_config
-            transport = HTTPTransport(url, transport_config.connection_timeout)
+            transport = HTTPTransport(
+                url, transport_config.connection_timeout, persistent=transport_config.persistent_session
+            )
             logger.debug(f"Created HTTP transport for {url}")
             return transport
         except Exception as e:
@@ -618,7 +634,9 @@ class TransportFactory:
         """
         try:
             transport_config = config or self.default_config
-            transport = StdioTransport(command, args, env, transport_config.connection_timeout)
+            transport = StdioTransport(
+                command, args, env, transport_config.connection_timeout, persistent=transport_config.persistent_session
+            )
             logger.debug(f"Created stdio transport for {command} {' '.join(args)}")
             return transport
         except Exception as e:
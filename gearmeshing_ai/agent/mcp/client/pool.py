@@ -40,8 +40,8 @@ Usage Guidelines:
 
 # Basic connection pooling
 pool = ConnectionPool(max_size=10)
-async with pool.get_connection("http://localhost:8082/sse/sse") as conn:
-    tools = await conn.list_tools()
+async with pool.lease("http://localhost:8082/sse/sse") as conn:
+    tools = await conn.client.list_tools()
 
 # Server pool with failover
 server_configs = [
@@ -55,7 +55,10 @@ Performance Considerations:
 ----------------------------
 
 - Connection pooling reduces connection overhead
+- Bursts queue briefly for a released connection instead of failing
+- New connections are opened outside the pool lock
 - Load balancing improves resource utilization
+- Least-outstanding-requests and peak EWMA balancing keep traffic off slow or busy servers
 - Health monitoring prevents using failed connections
 - Configurable timeouts prevent hanging operations
 - Pool size limits prevent resource exhaustion
@@ -66,17 +69,18 @@ Extensibility:
 Add custom load balancing strategies:
 
 class CustomLoadBalancer(LoadBalancer):
-    def select_server(self, servers: List[ServerConfig]) -> ServerConfig:
-        # Custom selection logic
-        return servers[0]  # Example
+    def select(self, targets: list[tuple[str, int]]) -> str:
+        # Custom selection logic over (key, weight) pairs
+        return targets[0][0]  # Example
 
 Examples
 --------
-# Connection pooling
-pool = ConnectionPool(max_size=5, timeout=30.0)
+# Connection pooling; callers queue for up to acquire_timeout when all connections are leased
+pool = ConnectionPool(max_size=5, timeout=30.0, acquire_timeout=5.0)
 connection = await pool.get_connection("http://localhost:8082/sse/sse")
-tools = await connection.list_tools()
+tools = await connection.client.list_tools()
 await pool.release_connection(connection)
+print(pool.get_stats()["wait_time_histogram"]["p95"])
 
 # Server pool with failover
 configs = [
@@ -93,19 +97,30 @@ for i in range(10):
     result = await pool.execute_tool_call("any", "tool_name", {})
     # Requests are distributed across servers
 
+# Latency-aware balancing; slow or busy gateways receive less traffic
+pool = ServerPool(configs, load_balance_strategy="peak_ewma")
+result = await pool.execute_tool_call(None, "tool_name", {})
+print(pool.get_stats()["server_load"])
+
 """
 
 import asyncio
+import bisect
 import logging
+import math
+import random
 import time
 from collections import defaultdict, deque
+from collections.abc import AsyncGenerator, Generator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
-from .config import MCPClientConfig
+from .config import CircuitBreakerConfig, HedgingConfig, MCPClientConfig
 from .core import MCPClient
-from .exceptions import ConnectionError, ServerError
+from .exceptions import ConnectionError, ServerError, TimeoutError
+from .resilience import CircuitBreakerRegistry, CircuitState, LatencyWindow
 from .transports import BaseTransport
 
 logger = logging.getLogger(__name__)
@@ -118,6 +133,7 @@ class LoadBalanceStrategy(Enum):
     LEAST_CONNECTIONS = "least_connections"
     RANDOM = "random"
     WEIGHTED_ROUND_ROBIN = "weighted_round_robin"
+    PEAK_EWMA = "peak_ewma"
 
 
 @dataclass
@@ -132,7 +148,7 @@ class ServerConfig:
     health_check_interval: float = 60.0
     timeout: float = 30.0
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """Validate server configuration."""
         if not self.urls:
             raise ValueError("Server must have at least one URL")
@@ -143,8 +159,220 @@ class ServerConfig:
 
 
 @dataclass
+class EndpointLoad:
+    """Load and latency bookkeeping for one balancing target (a server or a URL)."""
+
+    outstanding: int = 0
+    total_requests: int = 0
+    failed_requests: int = 0
+    ewma_latency: float = 0.0
+    last_observed: float | None = None
+    current_weight: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert load information to dictionary."""
+        return {
+            "outstanding": self.outstanding,
+            "total_requests": self.total_requests,
+            "failed_requests": self.failed_requests,
+            "ewma_latency": self.ewma_latency,
+        }
+
+
+class LoadBalancer:
+    """Select targets according to a load balancing strategy.
+
+    Targets are identified by a key (a server name or a URL) and carry an
+    integer weight. The balancer tracks outstanding requests and a decaying
+    latency estimate per key, which the load-aware strategies use.
+
+    Strategies:
+    ----------
+    - ROUND_ROBIN: Rotate through the targets
+    - RANDOM: Uniform random choice
+    - LEAST_CONNECTIONS: Fewest outstanding requests per unit of weight
+    - WEIGHTED_ROUND_ROBIN: Smooth weighted round-robin; picks are spread in
+      proportion to weight and interleaved rather than sent in bursts
+    - PEAK_EWMA: Lowest ``latency * (outstanding + 1) / weight``, where latency
+      is an exponentially weighted moving average that jumps up to any slower
+      observation immediately and decays back over ``decay_time`` seconds
+
+    Ties between equally loaded targets are broken in rotation so idle
+    targets share the traffic.
+
+    Example:
+    -------
+    >>> balancer = LoadBalancer(LoadBalanceStrategy.PEAK_EWMA)
+    >>> key = balancer.select([("gateway-a", 1), ("gateway-b", 2)])
+    >>> with balancer.track(key):
+    ...     result = await call(key)
+
+    """
+
+    # Cost of a target that is busy but has not reported any latency yet
+    UNKNOWN_LATENCY_PENALTY = 1e6
+
+    def __init__(
+        self,
+        strategy: LoadBalanceStrategy | str = LoadBalanceStrategy.ROUND_ROBIN,
+        decay_time: float = 10.0,
+        failure_penalty: float = 5.0,
+    ):
+        """Initialize load balancer.
+
+        Args:
+            strategy: Load balancing strategy
+            decay_time: Time constant in seconds of the latency moving average
+            failure_penalty: Latency in seconds recorded for a failed request,
+                so that a target failing fast does not attract traffic
+
+        """
+        self.strategy = LoadBalanceStrategy(strategy)
+        self.decay_time = decay_time
+        self.failure_penalty = failure_penalty
+        self.loads: dict[str, EndpointLoad] = {}
+        self._rotation = 0
+
+    def _load(self, key: str) -> EndpointLoad:
+        load = self.loads.get(key)
+        if load is None:
+            load = self.loads[key] = EndpointLoad()
+        return load
+
+    def select(self, targets: list[tuple[str, int]]) -> str:
+        """Select one target.
+
+        Args:
+            targets: ``(key, weight)`` pairs to choose from
+
+        Returns:
+            Key of the selected target
+
+        Raises:
+            ValueError: If no targets are given
+
+        """
+        if not targets:
+            raise ValueError("No targets to select from")
+        if len(targets) == 1:
+            return targets[0][0]
+
+        if self.strategy == LoadBalanceStrategy.RANDOM:
+            return random.choice(targets)[0]
+        if self.strategy == LoadBalanceStrategy.WEIGHTED_ROUND_ROBIN:
+            return self._select_smooth_weighted(targets)
+
+        offset = self._rotation % len(targets)
+        self._rotation += 1
+        rotated = targets[offset:] + targets[:offset]
+        if self.strategy == LoadBalanceStrategy.ROUND_ROBIN:
+            return rotated[0][0]
+
+        now = time.monotonic()
+        return min(rotated, key=lambda target: self._cost(target, now))[0]
+
+    def rank(self, targets: list[tuple[str, int]]) -> list[str]:
+        """Order targets for failover.
+
+        The first key is chosen by :meth:`select`; the remaining keys follow
+        from the least to the most loaded (or by descending weight for the
+        weighted strategy).
+
+        Args:
+            targets: ``(key, weight)`` pairs to order
+
+        Returns:
+            Keys in the order they should be tried
+
+        """
+        if not targets:
+            return []
+        first = self.select(targets)
+        rest = [target for target in targets if target[0] != first]
+        if self.strategy in (LoadBalanceStrategy.LEAST_CONNECTIONS, LoadBalanceStrategy.PEAK_EWMA):
+            now = time.monotonic()
+            rest.sort(key=lambda target: self._cost(target, now))
+        elif self.strategy == LoadBalanceStrategy.WEIGHTED_ROUND_ROBIN:
+            rest.sort(key=lambda target: -target[1])
+        return [first] + [key for key, _ in rest]
+
+    @contextmanager
+    def track(self, key: str) -> Generator[None, None, None]:
+        """Track one request against a target.
+
+        Counts the request as outstanding while the block runs and records its
+        latency when it completes. Cancelled requests are not recorded.
+
+        Args:
+            key: Key of the target serving the request
+
+        """
+        load = self._load(key)
+        load.outstanding += 1
+        load.total_requests += 1
+        started = time.monotonic()
+        try:
+            yield
+        except asyncio.CancelledError:
+            load.outstanding -= 1
+            raise
+        except BaseException:
+            load.outstanding -= 1
+            load.failed_requests += 1
+            self._observe(load, max(time.monotonic() - started, self.failure_penalty))
+            raise
+        else:
+            load.outstanding -= 1
+            self._observe(load, time.monotonic() - started)
+
+    def _select_smooth_weighted(self, targets: list[tuple[str, int]]) -> str:
+        """Smooth weighted round-robin as used by nginx."""
+        total = 0
+        for key, weight in targets:
+            self._load(key).current_weight += weight
+            total += weight
+        best_key = max(targets, key=lambda target: self.loads[target[0]].current_weight)[0]
+        self.loads[best_key].current_weight -= total
+        return best_key
+
+    def _cost(self, target: tuple[str, int], now: float) -> float:
+        key, weight = target
+        load = self._load(key)
+        if self.strategy == LoadBalanceStrategy.LEAST_CONNECTIONS:
+            return load.outstanding / weight
+
+        latency = self._decayed_latency(load, now)
+        if latency == 0.0 and load.outstanding:
+            return self.UNKNOWN_LATENCY_PENALTY + load.outstanding
+        return latency * (load.outstanding + 1) / weight
+
+    def _decayed_latency(self, load: EndpointLoad, now: float) -> float:
+        if load.last_observed is None:
+            return 0.0
+        return load.ewma_latency * math.exp(-max(now - load.last_observed, 0.0) / self.decay_time)
+
+    def _observe(self, load: EndpointLoad, latency: float) -> None:
+        now = time.monotonic()
+        current = self._decayed_latency(load, now)
+        if latency > current:
+            load.ewma_latency = latency
+        else:
+            weight = math.exp(-max(now - (load.last_observed or now), 0.0) / self.decay_time)
+            load.ewma_latency = load.ewma_latency * weight + latency * (1 - weight)
+        load.last_observed = now
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-target load statistics."""
+        return {key: load.to_dict() for key, load in self.loads.items()}
+
+
+@dataclass(eq=False)
 class PooledConnection:
-    """A pooled connection with metadata."""
+    """A pooled connection with metadata.
+
+    Connections compare and hash by identity so they can be tracked in sets.
+
+    """
 
     transport: BaseTransport
     client: MCPClient
@@ -171,6 +399,85 @@ class PooledConnection:
         return time.time() - self.last_used
 
 
+@dataclass
+class WaitTimeHistogram:
+    """Histogram of the time callers waited to lease a connection.
+
+    Bucket bounds are upper limits in seconds; the last bucket collects
+    everything above the largest bound.
+
+    """
+
+    bounds: tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+    bucket_counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Initialize bucket counters."""
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """Record a wait time in seconds."""
+        self.bucket_counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    @property
+    def average(self) -> float:
+        """Get the average wait time in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Estimate a percentile as the upper bound of the bucket containing it.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Estimated wait time in seconds
+
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert histogram to a dictionary."""
+        labels = [f"le_{bound}" for bound in self.bounds] + ["le_inf"]
+        return {
+            "buckets": dict(zip(labels, self.bucket_counts, strict=True)),
+            "count": self.count,
+            "average": self.average,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+@dataclass
+class _Waiter:
+    """A caller queued for a connection.
+
+    The future resolves to a ``PooledConnection`` handed over directly, or to
+    ``None`` when the waiter was granted a reserved slot to open a new one.
+
+    """
+
+    url: str
+    future: asyncio.Future[PooledConnection | None]
+
+
 class ConnectionPool:
     """Basic connection pool for MCP clients.
 
@@ -178,28 +485,35 @@ class ConnectionPool:
     or multiple servers with the same configuration. It manages connection
     lifecycle, health checking, and resource cleanup.
 
+    Connections are handed out as leases. When the pool is at ``max_size``
+    callers queue in FIFO order until a connection is released or the
+    acquire timeout expires, instead of failing immediately. New connections
+    are opened outside the pool lock so slow handshakes do not serialize
+    each other.
+
     Features:
     --------
-    - Connection reuse and pooling
+    - Connection reuse and pooling, idle connections keyed per URL
+    - Bounded FIFO wait queue with acquire timeout
     - Health monitoring
     - Automatic cleanup of idle connections
     - Configurable pool sizes and timeouts
     - Thread-safe operations
-    - Performance metrics
+    - Performance metrics including a wait-time histogram
 
     Attributes:
     ----------
     max_size: Maximum number of connections in the pool
     timeout: Default timeout for operations
-    connections: Active connections in the pool
-    available_connections: Available connections for use
-    health_checker: Health checker for connections
+    connections: All open connections in the pool
+    idle_connections: Idle connections per URL, ready to be leased
+    wait_times: Histogram of lease wait times
 
     Example:
     -------
     >>> pool = ConnectionPool(max_size=10, timeout=30.0)
-    >>> async with pool.get_connection("http://localhost:8082/sse/sse") as conn:
-    ...     tools = await conn.list_tools()
+    >>> async with pool.lease("http://localhost:8082/sse/sse") as conn:
+    ...     tools = await conn.client.list_tools()
     >>> print(f"Pool size: {len(pool.connections)}")
 
     """
@@ -210,6 +524,8 @@ class ConnectionPool:
         timeout: float = 30.0,
         max_idle_time: float = 300.0,
         health_check_interval: float = 60.0,
+        acquire_timeout: float | None = None,
+        max_waiters: int = 1000,
     ):
         """Initialize connection pool.
 
@@ -218,78 +534,255 @@ class ConnectionPool:
             timeout: Default timeout for operations
             max_idle_time: Maximum idle time before cleanup
             health_check_interval: Health check interval in seconds
+            acquire_timeout: Maximum time to wait for a free connection, defaults to ``timeout``
+            max_waiters: Maximum number of callers queued for a connection
 
         """
         self.max_size = max_size
         self.timeout = timeout
         self.max_idle_time = max_idle_time
         self.health_check_interval = health_check_interval
+        self.acquire_timeout = timeout if acquire_timeout is None else acquire_timeout
+        self.max_waiters = max_waiters
 
         self._lock = asyncio.Lock()
         self.connections: set[PooledConnection] = set()
-        self.available_connections: deque = deque()
+        self.idle_connections: dict[str, deque[PooledConnection]] = defaultdict(deque)
         self.url_connections: dict[str, list[PooledConnection]] = defaultdict(list)
+        self._leased: set[PooledConnection] = set()
+        self._waiters: deque[_Waiter] = deque()
+        self._reserved = 0
+        self._closed = False
 
         # Metrics
         self.total_created = 0
         self.total_destroyed = 0
+        self.total_leases = 0
+        self.total_wait_timeouts = 0
+        self.total_rejections = 0
         self.last_cleanup = time.time()
+        self.wait_times = WaitTimeHistogram()
 
         # Health checking
         self._health_check_task: asyncio.Task | None = None
 
         logger.debug(f"ConnectionPool initialized: max_size={max_size}")
 
-    async def get_connection(self, url: str, config: MCPClientConfig | None = None) -> PooledConnection:
+    @property
+    def available_connections(self) -> list[PooledConnection]:
+        """Get all idle connections across URLs."""
+        return [conn for idle in self.idle_connections.values() for conn in idle]
+
+    @asynccontextmanager
+    async def lease(
+        self, url: str, config: MCPClientConfig | None = None, timeout: float | None = None
+    ) -> AsyncGenerator[PooledConnection, None]:
+        """Lease a connection for the duration of the context.
+
+        The connection is returned to the pool on exit. If the body fails with
+        a connection error, the connection is discarded instead.
+
+        Args:
+            url: Server URL
+            config: Optional client configuration used when a new connection is opened
+            timeout: Maximum time to wait for a free connection, defaults to ``acquire_timeout``
+
+        Yields:
+            Pooled connection
+
+        Raises:
+            ConnectionError: If the wait queue is full or a connection cannot be opened
+            TimeoutError: If no connection became available in time
+
+        Example:
+        -------
+        >>> async with pool.lease(url) as conn:
+        ...     result = await conn.client.call_tool("get_tasks", {})
+
+        """
+        connection = await self.get_connection(url, config, timeout)
+        try:
+            yield connection
+        except ConnectionError as e:
+            if not isinstance(e, TimeoutError):
+                connection.is_healthy = False
+            raise
+        finally:
+            await self.release_connection(connection)
+
+    async def get_connection(
+        self, url: str, config: MCPClientConfig | None = None, timeout: float | None = None
+    ) -> PooledConnection:
         """Get a connection from the pool.
 
+        Prefer ``lease()``, which releases the connection automatically. A
+        connection obtained here must be handed back with ``release_connection()``.
+
         Args:
             url: Server URL
             config: Optional client configuration
+            timeout: Maximum time to wait for a free connection, defaults to ``acquire_timeout``
 
         Returns:
             Pooled connection
 
         Raises:
-            ConnectionError: If no connections available and pool is full
+            ConnectionError: If the wait queue is full or a connection cannot be opened
+            TimeoutError: If no connection became available in time
 
         """
+        wait_timeout = self.acquire_timeout if timeout is None else timeout
+        start_time = time.monotonic()
+        stale: list[PooledConnection] = []
+        waiter: _Waiter | None = None
+        connection: PooledConnection | None = None
+
         async with self._lock:
-            # Check for available connection
-            while self.available_connections:
-                conn = self.available_connections.popleft()
+            if self._closed:
+                raise ConnectionError("Connection pool is closed")
+
+            connection = self._pop_idle_locked(url, stale)
+            if connection is None:
+                if self._has_capacity_locked() or self._evict_idle_locked(stale):
+                    self._reserved += 1
+                elif len(self._waiters) >= self.max_waiters:
+                    self.total_rejections += 1
+                    raise ConnectionError(
+                        f"Connection pool exhausted (max_size={self.max_size}, waiters={len(self._waiters)})"
+                    )
+                else:
+                    waiter = _Waiter(url=url, future=asyncio.get_running_loop().create_future())
+                    self._waiters.append(waiter)
+            if connection is not None:
+                self._leased.add(connection)
 
-                # Check if connection is still healthy
-                if conn.is_healthy and not self._is_connection_expired(conn):
-                    conn.touch()
-                    return conn
-                # Remove unhealthy or expired connection
-                await self._destroy_connection(conn)
+        try:
+            if waiter is not None:
+                connection = await self._wait_for_turn(waiter, wait_timeout)
 
-            # No available connections, create new one if under limit
-            if len(self.connections) < self.max_size:
-                return await self._create_connection(url, config)
+            wait_time = time.monotonic() - start_time
+            if connection is None:
+                connection = await self._create_reserved_connection(url, config)
+        finally:
+            await self._close_connections(stale)
 
-            # Pool is full and no available connections
-            raise ConnectionError(f"Connection pool exhausted (max_size={self.max_size})")
+        self.wait_times.observe(wait_time)
+        self.total_leases += 1
+        connection.touch()
+        return connection
 
     async def release_connection(self, connection: PooledConnection) -> None:
         """Release a connection back to the pool.
 
+        The connection is handed straight to the longest waiting caller if
+        there is one, otherwise it becomes idle.
+
         Args:
             connection: Connection to release
 
         """
+        to_close: list[PooledConnection] = []
         async with self._lock:
-            if connection in self.connections and connection.is_healthy:
-                connection.touch()
-                self.available_connections.append(connection)
+            self._return_locked(connection, to_close)
+        await self._close_connections(to_close)
+
+    async def _wait_for_turn(self, waiter: _Waiter, timeout: float) -> PooledConnection | None:
+        """Wait until the waiter is handed a connection or a slot."""
+        try:
+            done, _ = await asyncio.wait({waiter.future}, timeout=timeout)
+        except asyncio.CancelledError:
+            await self._abandon_wait(waiter, give_back=True)
+            raise
+
+        if done:
+            return waiter.future.result()
+
+        await self._abandon_wait(waiter, give_back=False)
+        if waiter.future.done() and not waiter.future.cancelled():
+            # Handed over while we were giving up; keep it rather than wasting the hand-off
+            return waiter.future.result()
+
+        self.total_wait_timeouts += 1
+        raise TimeoutError(
+            f"Timed out after {timeout:.2f}s waiting for a connection to {waiter.url} (max_size={self.max_size})",
+            timeout_duration=timeout,
+        )
+
+    async def _abandon_wait(self, waiter: _Waiter, give_back: bool) -> None:
+        """Leave the wait queue, optionally returning whatever the waiter was already handed."""
+        to_close: list[PooledConnection] = []
+        async with self._lock:
+            if not waiter.future.done():
+                waiter.future.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            elif give_back and not waiter.future.cancelled() and waiter.future.exception() is None:
+                granted = waiter.future.result()
+                if granted is None:
+                    self._reserved -= 1
+                    self._grant_slot_locked()
+                else:
+                    self._return_locked(granted, to_close)
+        await self._close_connections(to_close)
+
+    def _return_locked(self, connection: PooledConnection, to_close: list[PooledConnection]) -> None:
+        """Return a leased connection to the longest waiter, the idle set, or discard it."""
+        self._leased.discard(connection)
+        if connection not in self.connections:
+            to_close.append(connection)
+            return
+        if not connection.is_healthy or self._closed:
+            self._forget_locked(connection)
+            to_close.append(connection)
+            self._grant_slot_locked()
+            return
+
+        connection.last_used = time.time()
+        waiter = self._next_waiter_locked()
+        if waiter is None:
+            self.idle_connections[connection.url].append(connection)
+        elif waiter.url == connection.url:
+            self._leased.add(connection)
+            waiter.future.set_result(connection)
+        else:
+            # The longest waiter needs another URL: trade this connection for a fresh slot
+            self._forget_locked(connection)
+            to_close.append(connection)
+            self._reserved += 1
+            waiter.future.set_result(None)
+
+    async def _create_reserved_connection(self, url: str, config: MCPClientConfig | None) -> PooledConnection:
+        """Open a connection for a slot reserved by the caller."""
+        try:
+            connection = await self._open_connection(url, config)
+        except BaseException:
+            async with self._lock:
+                self._reserved -= 1
+                self._grant_slot_locked()
+            raise
+
+        async with self._lock:
+            self._reserved -= 1
+            if self._closed:
+                closed = True
             else:
-                # Connection is no longer valid, destroy it
-                await self._destroy_connection(connection)
+                closed = False
+                self.connections.add(connection)
+                self.url_connections[url].append(connection)
+                self._leased.add(connection)
+                self.total_created += 1
+
+        if closed:
+            await self._close_connections([connection])
+            raise ConnectionError("Connection pool is closed")
 
-    async def _create_connection(self, url: str, config: MCPClientConfig | None = None) -> PooledConnection:
-        """Create a new connection."""
+        logger.debug(f"Created new connection for {url}")
+        return connection
+
+    async def _open_connection(self, url: str, config: MCPClientConfig | None = None) -> PooledConnection:
+        """Open a new connection without registering it in the pool."""
         try:
             # Create client
             client_config = config or MCPClientConfig(timeout=self.timeout)
@@ -308,29 +801,79 @@ class ConnectionPool:
             if not transport:
                 raise ConnectionError("Failed to create transport")
 
-            # Create pooled connection
-            conn = PooledConnection(transport=transport, client=client, server_name="default", url=url, is_healthy=True)
-
-            # Add to pool
-            self.connections.add(conn)
-            self.url_connections[url].append(conn)
-            self.total_created += 1
-
-            logger.debug(f"Created new connection for {url}")
-            return conn
+            return PooledConnection(transport=transport, client=client, server_name="default", url=url, is_healthy=True)
 
         except Exception as e:
             raise ConnectionError(f"Failed to create connection for {url}: {e}")
 
+    def _has_capacity_locked(self) -> bool:
+        """Check whether another connection may be opened."""
+        return len(self.connections) + self._reserved < self.max_size
+
+    def _pop_idle_locked(self, url: str, stale: list[PooledConnection]) -> PooledConnection | None:
+        """Take the most recently used idle connection for a URL, collecting stale ones."""
+        idle = self.idle_connections.get(url)
+        while idle:
+            connection = idle.pop()
+            if connection.is_healthy and not self._is_connection_expired(connection):
+                return connection
+            self._forget_locked(connection)
+            stale.append(connection)
+        return None
+
+    def _evict_idle_locked(self, stale: list[PooledConnection]) -> bool:
+        """Evict the least recently used idle connection of any URL to free a slot."""
+        candidates = [idle[0] for idle in self.idle_connections.values() if idle]
+        if not candidates:
+            return False
+        victim = min(candidates, key=lambda conn: conn.last_used)
+        self._forget_locked(victim)
+        stale.append(victim)
+        return True
+
+    def _next_waiter_locked(self) -> _Waiter | None:
+        """Pop the longest waiting caller that is still waiting."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.future.done():
+                return waiter
+        return None
+
+    def _grant_slot_locked(self) -> None:
+        """Hand freed capacity to the longest waiting caller."""
+        while self._waiters and self._has_capacity_locked():
+            waiter = self._next_waiter_locked()
+            if waiter is None:
+                return
+            self._reserved += 1
+            waiter.future.set_result(None)
+
+    def _forget_locked(self, connection: PooledConnection) -> None:
+        """Remove a connection from all tracking structures."""
+        self.connections.discard(connection)
+        self._leased.discard(connection)
+        idle = self.idle_connections.get(connection.url)
+        if idle is not None:
+            try:
+                idle.remove(connection)
+            except ValueError:
+                pass
+            if not idle:
+                del self.idle_connections[connection.url]
+        if connection in self.url_connections.get(connection.url, []):
+            self.url_connections[connection.url].remove(connection)
+            if not self.url_connections[connection.url]:
+                del self.url_connections[connection.url]
+
+    async def _close_connections(self, connections: list[PooledConnection]) -> None:
+        """Close connections that were already removed from the pool."""
+        for connection in connections:
+            await self._destroy_connection(connection)
+
     async def _destroy_connection(self, connection: PooledConnection) -> None:
         """Destroy a connection."""
         try:
-            # Remove from all tracking structures
-            self.connections.discard(connection)
-            if connection.url in self.url_connections:
-                self.url_connections[connection.url].remove(connection)
-                if not self.url_connections[connection.url]:
-                    del self.url_connections[connection.url]
+            self._forget_locked(connection)
 
             # Close client and transport
             await connection.client.close()
@@ -346,19 +889,20 @@ class ConnectionPool:
         return connection.idle_time > self.max_idle_time
 
     async def cleanup(self) -> None:
-        """Clean up expired and unhealthy connections."""
+        """Clean up expired and unhealthy idle connections."""
         async with self._lock:
             expired_connections = [
-                conn for conn in self.connections if not conn.is_healthy or self._is_connection_expired(conn)
+                conn for conn in self.available_connections if not conn.is_healthy or self._is_connection_expired(conn)
             ]
-
             for conn in expired_connections:
-                await self._destroy_connection(conn)
-
+                self._forget_locked(conn)
+            self._grant_slot_locked()
             self.last_cleanup = time.time()
 
-            if expired_connections:
-                logger.debug(f"Cleaned up {len(expired_connections)} expired connections")
+        await self._close_connections(expired_connections)
+
+        if expired_connections:
+            logger.debug(f"Cleaned up {len(expired_connections)} expired connections")
 
     async def start_health_checking(self) -> None:
         """Start background health checking."""
@@ -393,10 +937,11 @@ class ConnectionPool:
                 await asyncio.sleep(self.health_check_interval)
 
     async def _check_connection_health(self) -> None:
-        """Check health of all connections."""
+        """Check health of all idle connections."""
         unhealthy_connections = []
 
-        for conn in self.connections:
+        # Leased connections are in use; their health is reported on release
+        for conn in self.available_connections:
             try:
                 # Simple health check - try to list tools
                 await asyncio.wait_for(conn.transport.list_tools(), timeout=5.0)
@@ -415,15 +960,20 @@ class ConnectionPool:
         await self.stop_health_checking()
 
         async with self._lock:
-            # Close all connections
-            for conn in list(self.connections):
-                await self._destroy_connection(conn)
+            self._closed = True
+
+            # Fail all queued callers
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if not waiter.future.done():
+                    waiter.future.set_exception(ConnectionError("Connection pool is closed"))
 
-            # Clear all tracking structures
-            self.connections.clear()
-            self.available_connections.clear()
-            self.url_connections.clear()
+            # Leased connections are closed when they are released
+            idle_connections = self.available_connections
+            for conn in idle_connections:
+                self._forget_locked(conn)
 
+        await self._close_connections(idle_connections)
         logger.info("Connection pool closed")
 
     def get_stats(self) -> dict[str, Any]:
@@ -431,8 +981,16 @@ class ConnectionPool:
         return {
             "total_connections": len(self.connections),
             "available_connections": len(self.available_connections),
+            "leased_connections": len(self._leased),
+            "pending_connections": self._reserved,
+            "waiting_requests": sum(1 for waiter in self._waiters if not waiter.future.done()),
+            "idle_connections_by_url": {url: len(idle) for url, idle in self.idle_connections.items() if idle},
             "total_created": self.total_created,
             "total_destroyed": self.total_destroyed,
+            "total_leases": self.total_leases,
+            "total_wait_timeouts": self.total_wait_timeouts,
+            "total_rejections": self.total_rejections,
+            "wait_time_histogram": self.wait_times.to_dict(),
             "max_size": self.max_size,
             "last_cleanup": self.last_cleanup,
         }
@@ -448,9 +1006,15 @@ class ServerPool:
     Features:
     --------
     - Multiple server support with failover
-    - Load balancing strategies
+    - Load balancing strategies, including least-outstanding-requests,
+      smooth weighted round-robin and peak EWMA latency
     - Health monitoring and automatic failover
+    - Priority-aware failover: lower ``priority`` values are tried first and
+      servers sharing a priority are ordered by the load balancer
     - Configurable weights and priorities
+    - Per-server and per-tool circuit breakers; an open server circuit marks
+      the server unhealthy until a probe or health check succeeds
+    - Optional hedged requests for idempotent read tools
     - Performance metrics
     - Thread-safe operations
 
@@ -458,6 +1022,9 @@ class ServerPool:
     ----------
     server_configs: Server configurations
     load_balance_strategy: Load balancing strategy
+    load_balancer: Balancer choosing between servers of the same priority
+    circuit_breakers: Circuit breakers per server and per server/tool
+    hedging: Hedged request configuration
     connection_pools: Per-server connection pools
     health_checker: Health checker for servers
 
@@ -469,15 +1036,23 @@ class ServerPool:
     ... ]
     >>> pool = ServerPool(configs)
     >>> result = await pool.execute_tool_call("primary", "get_tasks", {})
+    >>> # Let the balancer pick among the healthy servers
+    >>> pool = ServerPool(configs, load_balance_strategy=LoadBalanceStrategy.PEAK_EWMA)
+    >>> result = await pool.execute_tool_call(None, "get_tasks", {})
+    >>> # Hedge slow reads against a second server
+    >>> pool = ServerPool(configs, hedging=HedgingConfig(enabled=True))
+    >>> result = await pool.execute_tool_call(None, "get_tasks", {})
 
     """
 
     def __init__(
         self,
         server_configs: list[dict[str, Any]],
-        load_balance_strategy: LoadBalanceStrategy = LoadBalanceStrategy.ROUND_ROBIN,
+        load_balance_strategy: LoadBalanceStrategy | str = LoadBalanceStrategy.ROUND_ROBIN,
         max_connections_per_server: int = 10,
         health_check_interval: float = 60.0,
+        circuit_breaker: CircuitBreakerConfig | None = None,
+        hedging: HedgingConfig | None = None,
     ):
         """Initialize server pool.
 
@@ -486,11 +1061,14 @@ class ServerPool:
             load_balance_strategy: Load balancing strategy
             max_connections_per_server: Max connections per server
             health_check_interval: Health check interval in seconds
+            circuit_breaker: Circuit breaker configuration
+            hedging: Hedged request configuration (disabled by default)
 
         """
-        self.load_balance_strategy = load_balance_strategy
+        self.load_balance_strategy = LoadBalanceStrategy(load_balance_strategy)
         self.max_connections_per_server = max_connections_per_server
         self.health_check_interval = health_check_interval
+        self.hedging = hedging or HedgingConfig()
 
         # Parse server configurations
         self.server_configs = [ServerConfig(**config) for config in server_configs]
@@ -501,12 +1079,19 @@ class ServerPool:
         # Connection pools for each server
         self.connection_pools: dict[str, ConnectionPool] = {}
 
-        # Load balancing state
-        self._round_robin_index = 0
+        # Load balancing state: one balancer across servers, one per server across its URLs
+        self.load_balancer = LoadBalancer(self.load_balance_strategy)
+        self._url_balancers: dict[str, LoadBalancer] = {}
         self._lock = asyncio.Lock()
 
         # Health status
         self.server_health: dict[str, bool] = {}
+        self.circuit_breakers = CircuitBreakerRegistry(circuit_breaker, on_state_change=self._on_circuit_change)
+
+        # Hedging state: recent successful latencies per tool
+        self._tool_latencies: dict[str, LatencyWindow] = {}
+        self.total_hedges = 0
+        self.total_hedge_wins = 0
 
         # Initialize connection pools
         for config in self.server_configs:
@@ -514,6 +1099,7 @@ class ServerPool:
                 max_size=max_connections_per_server, health_check_interval=health_check_interval
             )
             self.server_health[config.name] = True
+            self._url_balancers[config.name] = LoadBalancer(self.load_balance_strategy)
 
         # Health checking
         self._health_check_task: asyncio.Task | None = None
@@ -537,18 +1123,26 @@ class ServerPool:
                     return server_name
                 return None
 
-            # Find any healthy server
-            for config in self.server_configs:
-                if self.server_health.get(config.name, False):
-                    return config.name
-
-            return None
+            # Let the balancer pick among the highest-priority healthy servers
+            return next(self._failover_order(), None)
 
-    async def execute_tool_call(self, server_name: str, tool_name: str, arguments: dict[str, Any] | None = None) -> Any:
+    async def execute_tool_call(
+        self, server_name: str | None, tool_name: str, arguments: dict[str, Any] | None = None
+    ) -> Any:
         """Execute a tool call on a server with failover.
 
+        The preferred server is tried first when it is healthy. Failover then
+        walks the remaining healthy servers by ascending priority, letting the
+        load balancer order servers that share a priority. Servers whose
+        circuit is open for the server or the tool are skipped.
+
+        When hedging is enabled and the tool is idempotent, a call still
+        running after the tool's latency percentile is duplicated to the next
+        candidate server and the first successful response is returned.
+
         Args:
-            server_name: Preferred server name
+            server_name: Preferred server name, or None (or an unknown name
+                such as ``"any"``) to let the load balancer choose
             tool_name: Name of the tool to call
             arguments: Tool arguments
 
@@ -559,28 +1153,132 @@ class ServerPool:
             ServerError: If all servers fail
 
         """
-        # Try preferred server first
-        try:
-            return await self._execute_on_server(server_name, tool_name, arguments)
-        except Exception as e:
-            logger.warning(f"Failed to execute on {server_name}: {e}")
+        candidates = self._failover_order(server_name, tool_name)
 
-        # Try other healthy servers
-        healthy_servers = [
-            config.name
-            for config in self.server_configs
-            if config.name != server_name and self.server_health.get(config.name, False)
-        ]
+        hedge_delay = self._hedge_delay(tool_name)
+        if hedge_delay is not None:
+            return await self._execute_hedged(candidates, tool_name, arguments, hedge_delay)
 
-        for backup_server in healthy_servers:
+        for candidate in candidates:
             try:
-                return await self._execute_on_server(backup_server, tool_name, arguments)
+                return await self._attempt(candidate, tool_name, arguments)
             except Exception as e:
-                logger.warning(f"Failed to execute on {backup_server}: {e}")
+                logger.warning(f"Failed to execute on {candidate}: {e}")
 
         # All servers failed
         raise ServerError(f"All servers failed to execute tool {tool_name}")
 
+    async def _attempt(self, server_name: str, tool_name: str, arguments: dict[str, Any] | None) -> Any:
+        """Execute on one server and record the latency of successful calls."""
+        started = time.monotonic()
+        result = await self._execute_on_server(server_name, tool_name, arguments)
+        window = self._tool_latencies.get(tool_name)
+        if window is None:
+            window = self._tool_latencies[tool_name] = LatencyWindow(self.hedging.window_size)
+        window.observe(time.monotonic() - started)
+        return result
+
+    def _hedge_delay(self, tool_name: str) -> float | None:
+        """Delay before hedging a call, or None if the call must not be hedged."""
+        if not self.hedging.enabled or not self.hedging.is_idempotent(tool_name):
+            return None
+        window = self._tool_latencies.get(tool_name)
+        if window is None or len(window) < self.hedging.min_samples:
+            return None
+        return max(window.percentile(self.hedging.percentile), self.hedging.min_delay)
+
+    async def _execute_hedged(
+        self, candidates: Iterator[str], tool_name: str, arguments: dict[str, Any] | None, delay: float
+    ) -> Any:
+        """Race the call against hedges sent to later candidates after ``delay``."""
+        pending: dict[asyncio.Task, bool] = {}
+        hedges_left = self.hedging.max_hedges
+
+        def launch(is_hedge: bool) -> bool:
+            candidate = next(candidates, None)
+            if candidate is None:
+                return False
+            task = asyncio.create_task(self._attempt(candidate, tool_name, arguments), name=f"{tool_name}@{candidate}")
+            pending[task] = is_hedge
+            return True
+
+        launch(is_hedge=False)
+        try:
+            while pending:
+                timeout = delay if hedges_left > 0 else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # The call is slower than usual: send a hedge
+                    hedges_left -= 1
+                    if launch(is_hedge=True):
+                        self.total_hedges += 1
+                    continue
+
+                for task in done:
+                    is_hedge = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        if is_hedge:
+                            self.total_hedge_wins += 1
+                        return task.result()
+                    logger.warning(f"Failed to execute {task.get_name()}: {error}")
+
+                if not pending:
+                    # Everything in flight failed: fail over to the next server
+                    launch(is_hedge=False)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # All servers failed
+        raise ServerError(f"All servers failed to execute tool {tool_name}")
+
+    def _is_available(self, server_name: str, tool_name: str | None = None) -> bool:
+        """Check whether a server may receive a request.
+
+        A server whose circuit is half-open is available for probing even
+        though the open circuit marked it unhealthy.
+        """
+        if not self.circuit_breakers.allows(server_name, tool_name):
+            return False
+        if self.server_health.get(server_name, False):
+            return True
+        return (
+            self.circuit_breakers.config.enabled
+            and self.circuit_breakers.get(server_name).state == CircuitState.HALF_OPEN
+        )
+
+    def _on_circuit_change(self, server_name: str, tool_name: str | None, state: CircuitState) -> None:
+        """Mirror server circuit transitions into server_health."""
+        if tool_name is not None or server_name not in self.server_health:
+            return
+        if state == CircuitState.OPEN:
+            self.server_health[server_name] = False
+            logger.warning(f"Server {server_name} circuit opened, marking unhealthy")
+        elif state == CircuitState.CLOSED:
+            self.server_health[server_name] = True
+
+    def _failover_order(self, preferred: str | None = None, tool_name: str | None = None) -> Iterator[str]:
+        """Yield available server names in the order they should be tried.
+
+        Priority tiers are ranked lazily, so a request served by its first
+        candidate only advances the balancer state of that tier.
+        """
+        healthy = [config for config in self.server_configs if self._is_available(config.name, tool_name)]
+        if preferred is not None and any(config.name == preferred for config in healthy):
+            yield preferred
+
+        tiers: dict[int, list[ServerConfig]] = defaultdict(list)
+        for config in healthy:
+            if config.name != preferred:
+                tiers[config.priority].append(config)
+
+        for priority in sorted(tiers):
+            yield from self.load_balancer.rank([(config.name, config.weight) for config in tiers[priority]])
+
     async def _execute_on_server(
         self, server_name: str, tool_name: str, arguments: dict[str, Any] | None = None
     ) -> Any:
@@ -590,30 +1288,28 @@ class ServerPool:
         if not server_config:
             raise ValueError(f"Unknown server: {server_name}")
 
-        if not self.server_health.get(server_name, False):
+        if not self._is_available(server_name):
             raise ConnectionError(f"Server {server_name} is not healthy")
 
         pool = self.connection_pools[server_name]
 
         # Select URL based on load balancing strategy
         url = self._select_url(server_config)
+        url_balancer = self._url_balancers[server_name]
 
-        # Get connection and execute
-        async with pool.get_connection(url) as conn:
-            return await conn.call_tool(tool_name, arguments or {})
+        # Lease a connection and execute, guarded by the circuits and tracking load for the balancers
+        with (
+            self.circuit_breakers.guard(server_name, tool_name),
+            self.load_balancer.track(server_name),
+            url_balancer.track(url),
+        ):
+            async with pool.lease(url) as conn:
+                return await conn.client.call_tool(tool_name, arguments or {})
 
     def _select_url(self, server_config: ServerConfig) -> str:
         """Select URL from server configuration."""
-        if self.load_balance_strategy == LoadBalanceStrategy.ROUND_ROBIN:
-            index = self._round_robin_index % len(server_config.urls)
-            self._round_robin_index += 1
-            return server_config.urls[index]
-        if self.load_balance_strategy == LoadBalanceStrategy.RANDOM:
-            import random
-
-            return random.choice(server_config.urls)
-        # Default to first URL
-        return server_config.urls[0]
+        balancer = self._url_balancers.setdefault(server_config.name, LoadBalancer(self.load_balance_strategy))
+        return balancer.select([(url, 1) for url in server_config.urls])
 
     async def start_health_checking(self) -> None:
         """Start background health checking for all servers."""
@@ -654,10 +1350,12 @@ class ServerPool:
                 pool = self.connection_pools[server_config.name]
                 url = server_config.urls[0]
 
-                async with pool.get_connection(url) as conn:
+                async with pool.lease(url) as conn:
                     await asyncio.wait_for(conn.transport.list_tools(), timeout=5.0)
 
                 self.server_health[server_config.name] = True
+                # A passing health check is a successful probe
+                self.circuit_breakers.get(server_config.name).reset()
                 logger.debug(f"Server {server_config.name} is healthy")
 
             except Exception as e:
@@ -677,10 +1375,20 @@ class ServerPool:
 
     def get_stats(self) -> dict[str, Any]:
         """Get server pool statistics."""
-        stats = {
+        stats: dict[str, Any] = {
             "total_servers": len(self.server_configs),
             "healthy_servers": sum(1 for healthy in self.server_health.values() if healthy),
             "server_health": dict(self.server_health),
+            "load_balance_strategy": self.load_balance_strategy.value,
+            "server_load": self.load_balancer.get_stats(),
+            "url_load": {name: balancer.get_stats() for name, balancer in self._url_balancers.items()},
+            "circuit_breakers": self.circuit_breakers.get_stats(),
+            "hedging": {
+                "enabled": self.hedging.enabled,
+                "total_hedges": self.total_hedges,
+                "total_hedge_wins": self.total_hedge_wins,
+                "delays": {tool: self._hedge_delay(tool) for tool in self._tool_latencies},
+            },
             "connection_pools": {},
         }
 
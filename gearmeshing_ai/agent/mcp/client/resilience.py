@@ -0,0 +1,373 @@
+"""Circuit breaking and latency tracking for MCP clients.
+
+This module keeps failing MCP servers from absorbing traffic. Circuit
+breakers reject requests to a server (or to one tool on a server) after
+repeated transient failures, and latency windows provide the percentiles
+used to decide when a slow request should be hedged.
+
+Circuit States:
+--------------
+
+1. **CLOSED** - Requests flow normally; consecutive failures are counted
+2. **OPEN** - Requests are rejected with CircuitOpenError until the
+   recovery timeout elapses
+3. **HALF_OPEN** - A limited number of probe requests are let through; a
+   success closes the circuit and a failure opens it again
+
+Only transient failures (see ``is_retryable_error``) count against a
+circuit. Errors such as a missing tool prove the server is responding and
+count as successes.
+
+Usage Guidelines:
+----------------
+
+# Guard calls to one server
+breaker = CircuitBreaker("clickup", failure_threshold=5, recovery_timeout=30.0)
+with breaker.call():
+    result = await client.call_tool("get_tasks", {})
+
+# Per-server and per-tool circuits from configuration
+registry = CircuitBreakerRegistry(CircuitBreakerConfig())
+with registry.guard("clickup", "get_tasks"):
+    result = await client.call_tool("get_tasks", {})
+
+# Latency percentiles
+window = LatencyWindow(size=256)
+window.observe(0.12)
+p95 = window.percentile(0.95)
+
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any
+
+from .config import CircuitBreakerConfig
+from .exceptions import CircuitOpenError, is_retryable_error
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker for one server or tool.
+
+    Features:
+    --------
+    - Opens after consecutive transient failures
+    - Rejects requests fast while open
+    - Probes recovery with a bounded number of half-open requests
+    - Optional callback on every state change
+
+    Attributes:
+    ----------
+    name: Circuit name used in errors and logs
+    failure_threshold: Consecutive failures before opening
+    recovery_timeout: Seconds to stay open before probing
+    half_open_max_calls: Concurrent probe requests when half-open
+
+    Example:
+    -------
+    >>> breaker = CircuitBreaker("clickup", failure_threshold=3)
+    >>> with breaker.call():
+    ...     result = await client.call_tool("get_tasks", {})
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Callable[["CircuitBreaker", CircuitState, CircuitState], None] | None = None,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            name: Circuit name used in errors and logs
+            failure_threshold: Consecutive failures before opening
+            recovery_timeout: Seconds to stay open before probing
+            half_open_max_calls: Concurrent probe requests when half-open
+            on_state_change: Called with (breaker, old_state, new_state)
+
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+
+        self._state = CircuitState.CLOSED
+        self._opened_at: float | None = None
+        self._probes_in_flight = 0
+        self.consecutive_failures = 0
+
+        # Metrics
+        self.total_successes = 0
+        self.total_failures = 0
+        self.total_rejections = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open circuit turns half-open once its recovery timeout elapses."""
+        if self._state == CircuitState.OPEN and self.retry_after == 0.0:
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        if self._state != CircuitState.OPEN or self._opened_at is None:
+            return 0.0
+        return max(self._opened_at + self.recovery_timeout - time.monotonic(), 0.0)
+
+    @property
+    def allows_requests(self) -> bool:
+        """Check whether a request would currently be let through."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN:
+            return self._probes_in_flight < self.half_open_max_calls
+        return False
+
+    def acquire(self) -> bool:
+        """Admit one request.
+
+        Returns:
+            True if the request is a half-open probe
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the request
+
+        """
+        if not self.allows_requests:
+            self.total_rejections += 1
+            raise CircuitOpenError(f"Circuit {self.name} is open", circuit_name=self.name, retry_after=self.retry_after)
+        if self._state == CircuitState.HALF_OPEN:
+            self._probes_in_flight += 1
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        self.total_successes += 1
+        self.consecutive_failures = 0
+        if self._state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a transient failure."""
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        if self._state == CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def reset(self) -> None:
+        """Close the circuit, e.g. after an external health check succeeded."""
+        self.consecutive_failures = 0
+        if self._state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    @contextmanager
+    def call(self) -> Generator[None, None, None]:
+        """Guard one request.
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the request
+
+        """
+        probe = self.acquire()
+        try:
+            yield
+        except (asyncio.CancelledError, CircuitOpenError):
+            # No response was received, so there is nothing to record
+            raise
+        except Exception as e:
+            if is_retryable_error(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        else:
+            self.record_success()
+        finally:
+            if probe:
+                self._probes_in_flight -= 1
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        if self._state != CircuitState.OPEN:
+            self.times_opened += 1
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, new_state: CircuitState) -> None:
+        old_state = self._state
+        self._state = new_state
+        if new_state != CircuitState.OPEN:
+            self._opened_at = None
+        logger.info(f"Circuit {self.name}: {old_state.value} -> {new_state.value}")
+        if self.on_state_change:
+            try:
+                self.on_state_change(self, old_state, new_state)
+            except Exception as e:
+                logger.error(f"Circuit state change callback failed for {self.name}: {e}")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert circuit information to dictionary."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "total_successes": self.total_successes,
+            "total_failures": self.total_failures,
+            "total_rejections": self.total_rejections,
+            "times_opened": self.times_opened,
+            "retry_after": self.retry_after,
+        }
+
+
+class CircuitBreakerRegistry:
+    """Per-server and per-tool circuit breakers.
+
+    A request for a tool passes through the server circuit and the tool
+    circuit. Failures of any tool count against the server, so a server that
+    is down is cut off as a whole; while other tools keep succeeding, a
+    single broken tool only opens its own circuit.
+
+    Example:
+    -------
+    >>> registry = CircuitBreakerRegistry(CircuitBreakerConfig(failure_threshold=3))
+    >>> with registry.guard("clickup", "get_tasks"):
+    ...     result = await client.call_tool("get_tasks", {})
+    >>> registry.get("clickup").state
+    <CircuitState.CLOSED: 'closed'>
+
+    """
+
+    def __init__(
+        self,
+        config: CircuitBreakerConfig | None = None,
+        on_state_change: Callable[[str, str | None, CircuitState], None] | None = None,
+    ):
+        """Initialize circuit breaker registry.
+
+        Args:
+            config: Circuit breaker configuration shared by all circuits
+            on_state_change: Called with (server, tool, new_state); tool is
+                None for server circuits
+
+        """
+        self.config = config or CircuitBreakerConfig()
+        self.on_state_change = on_state_change
+        self.breakers: dict[tuple[str, str | None], CircuitBreaker] = {}
+
+    def get(self, server: str, tool: str | None = None) -> CircuitBreaker:
+        """Get (or create) the circuit for a server or one of its tools."""
+        key = (server, tool)
+        breaker = self.breakers.get(key)
+        if breaker is None:
+            breaker = self.breakers[key] = CircuitBreaker(
+                f"{server}/{tool}" if tool else server,
+                failure_threshold=self.config.failure_threshold,
+                recovery_timeout=self.config.recovery_timeout,
+                half_open_max_calls=self.config.half_open_max_calls,
+                on_state_change=self._notify(server, tool),
+            )
+        return breaker
+
+    def allows(self, server: str, tool: str | None = None) -> bool:
+        """Check whether a request to a server (and tool) would be let through."""
+        if not self.config.enabled:
+            return True
+        if not self.get(server).allows_requests:
+            return False
+        return tool is None or self.get(server, tool).allows_requests
+
+    @contextmanager
+    def guard(self, server: str, tool: str | None = None) -> Generator[None, None, None]:
+        """Guard one request with the server circuit and, if given, the tool circuit.
+
+        Raises:
+            CircuitOpenError: If either circuit rejects the request
+
+        """
+        if not self.config.enabled:
+            yield
+            return
+
+        with self.get(server).call():
+            if tool is None:
+                yield
+            else:
+                with self.get(server, tool).call():
+                    yield
+
+    def reset(self, server: str | None = None) -> None:
+        """Close the circuits of one server, or of every server."""
+        for (name, _), breaker in self.breakers.items():
+            if server is None or name == server:
+                breaker.reset()
+
+    def _notify(self, server: str, tool: str | None) -> Callable[[CircuitBreaker, CircuitState, CircuitState], None]:
+        def notify(breaker: CircuitBreaker, old_state: CircuitState, new_state: CircuitState) -> None:
+            if self.on_state_change:
+                self.on_state_change(server, tool, new_state)
+
+        return notify
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get circuit statistics keyed by circuit name."""
+        return {breaker.name: breaker.to_dict() for breaker in self.breakers.values()}
+
+
+class LatencyWindow:
+    """Sliding window of recent latencies.
+
+    Example:
+    -------
+    >>> window = LatencyWindow(size=100)
+    >>> for latency in (0.1, 0.2, 0.3):
+    ...     window.observe(latency)
+    >>> window.percentile(0.5)
+    0.2
+
+    """
+
+    def __init__(self, size: int = 256):
+        """Initialize latency window.
+
+        Args:
+            size: Number of most recent observations to keep
+
+        """
+        self.samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def observe(self, latency: float) -> None:
+        """Record one latency in seconds."""
+        self.samples.append(latency)
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank percentile of the window, or 0.0 when empty."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = min(max(math.ceil(q * len(ordered)), 1), len(ordered))
+        return ordered[rank - 1]
@@ -0,0 +1,367 @@
+"""Persistent, multiplexed MCP sessions for long-lived transports.
+
+By default a transport opens a fresh connection, performs the MCP
+``initialize`` handshake and tears everything down again for every single
+request. This module provides the building block for the long-lived session
+mode: one initialized ``ClientSession`` is kept open per transport and all
+requests are multiplexed over it.
+
+Session Lifecycle:
+-----------------
+
+1. **Lazy connect** - The session is opened on the first request
+2. **Multiplexing** - Concurrent requests share the session; MCP matches
+   responses to requests by JSON-RPC id
+3. **Transparent reconnect** - When the connection drops, the session is
+   re-established; an interrupted read-only request is replayed, while
+   requests with side effects such as tool calls surface the lost connection
+   to the caller's retry policy, since the server may already have run them
+4. **Explicit close** - ``close()`` releases the connection
+
+Ownership:
+---------
+
+The underlying stream clients (``sse_client``, ``streamablehttp_client``,
+``stdio_client``) are built on anyio task groups and must be entered and
+exited from the same task. ``PersistentSession`` therefore owns each
+connection from a dedicated background task and hands the initialized
+session out to callers, which may run on any task of the same event loop.
+
+Usage Guidelines:
+----------------
+
+# Usually enabled through the transport
+transport = SSETransport("http://localhost:8082/sse/sse", persistent=True)
+tools = await transport.list_tools()  # connects and initializes once
+result = await transport.call_tool("tool_name", {"arg": "value"})  # reuses the session
+print(transport.get_session_stats().to_dict())
+await transport.close()
+
+"""
+
+import asyncio
+import builtins
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import anyio
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+from .exceptions import ConnectionError, TimeoutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+StreamFactory = Callable[[], AbstractAsyncContextManager[tuple[Any, Any]]]
+"""Callable returning an async context manager that yields ``(read_stream, write_stream)``."""
+
+
+@dataclass
+class SessionStats:
+    """Statistics for a persistent MCP session."""
+
+    connects: int = 0
+    reconnects: int = 0
+    connect_failures: int = 0
+    total_requests: int = 0
+    failed_requests: int = 0
+    replayed_requests: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    total_connect_time: float = 0.0
+    connected_since: float | None = None
+    last_request_time: float | None = None
+
+    @property
+    def average_connect_time(self) -> float:
+        """Get the average time spent establishing a session in seconds."""
+        if self.connects == 0:
+            return 0.0
+        return self.total_connect_time / self.connects
+
+    def record_connect(self, duration: float) -> None:
+        """Update stats after a session was established."""
+        if self.connects > 0:
+            self.reconnects += 1
+        self.connects += 1
+        self.total_connect_time += duration
+        self.connected_since = time.time()
+
+    def start_request(self) -> None:
+        """Update stats when a request is sent over the session."""
+        self.total_requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.last_request_time = time.time()
+
+    def finish_request(self, success: bool) -> None:
+        """Update stats when a request completes."""
+        self.in_flight -= 1
+        if not success:
+            self.failed_requests += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to a dictionary."""
+        return {
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "connect_failures": self.connect_failures,
+            "total_requests": self.total_requests,
+            "failed_requests": self.failed_requests,
+            "replayed_requests": self.replayed_requests,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "average_connect_time": self.average_connect_time,
+            "connected_since": self.connected_since,
+            "last_request_time": self.last_request_time,
+        }
+
+
+def is_connection_lost(error: BaseException) -> bool:
+    """Check whether an error means the underlying MCP connection is gone.
+
+    Args:
+        error: Error raised by a session operation
+
+    Returns:
+        True if the session must be re-established, False otherwise
+
+    """
+    if isinstance(error, (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)):
+        return True
+    if isinstance(error, McpError):
+        return error.error.code == CONNECTION_CLOSED
+    return False
+
+
+class PersistentSession:
+    """A long-lived, initialized MCP session shared by concurrent requests.
+
+    Features:
+    --------
+    - Single-flight connection establishment
+    - Concurrent requests multiplexed over one session
+    - Transparent reconnect and replay when the connection drops
+    - Per-session statistics
+
+    Example:
+    -------
+    >>> session = PersistentSession(lambda: sse_client(url), name=url)
+    >>> tools = await session.request(lambda s: s.list_tools())
+    >>> await session.close()
+
+    """
+
+    def __init__(
+        self,
+        stream_factory: StreamFactory,
+        name: str,
+        connect_timeout: float = 30.0,
+        request_timeout: float = 30.0,
+        max_reconnect_attempts: int = 1,
+    ):
+        """Initialize persistent session.
+
+        Args:
+            stream_factory: Factory opening the underlying read/write streams
+            name: Human readable identifier used in logs and errors
+            connect_timeout: Timeout for connecting and initializing in seconds
+            request_timeout: Timeout for a single request in seconds
+            max_reconnect_attempts: How often a request is replayed after the connection dropped
+
+        """
+        self.name = name
+        self.connect_timeout = connect_timeout
+        self.request_timeout = request_timeout
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self.stats = SessionStats()
+
+        self._stream_factory = stream_factory
+        self._session: ClientSession | None = None
+        self._owner: asyncio.Task | None = None
+        self._closing: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._connect_lock: asyncio.Lock | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Check whether an initialized session is currently open."""
+        return self._session is not None and self._owner is not None and not self._owner.done()
+
+    async def request(self, operation: Callable[[ClientSession], Awaitable[T]], replay_on_disconnect: bool = True) -> T:
+        """Run an operation on the shared session.
+
+        The session is established on demand. If the connection is lost while
+        the operation runs, the session is re-established on the next request.
+        With ``replay_on_disconnect``, the operation is replayed up to
+        ``max_reconnect_attempts`` times; only enable it for operations that
+        are safe to run twice.
+
+        Args:
+            operation: Callable receiving the initialized session
+            replay_on_disconnect: Whether to replay the operation after the connection dropped
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            ConnectionError: If the session cannot be established
+            TimeoutError: If the request times out
+
+        """
+        attempt = 0
+        while True:
+            session = await self.get_session()
+            self.stats.start_request()
+            success = False
+            try:
+                async with asyncio.timeout(self.request_timeout):
+                    result = await operation(session)
+                success = True
+                return result
+            except Exception as e:
+                if not is_connection_lost(e):
+                    raise
+                await self._invalidate(session)
+                if not replay_on_disconnect or attempt >= self.max_reconnect_attempts:
+                    raise
+                logger.info(f"MCP session to {self.name} lost during request, reconnecting: {e}")
+                self.stats.replayed_requests += 1
+                attempt += 1
+            finally:
+                self.stats.finish_request(success)
+
+    async def get_session(self) -> ClientSession:
+        """Get the initialized session, connecting if necessary.
+
+        Returns:
+            Initialized MCP session
+
+        Raises:
+            ConnectionError: If the session cannot be established
+            TimeoutError: If establishing the session times out
+
+        """
+        self._bind_loop()
+        session = self._connected_session()
+        if session is not None:
+            return session
+
+        assert self._connect_lock is not None
+        async with self._connect_lock:
+            # Another caller may have connected while we were waiting
+            session = self._connected_session()
+            if session is not None:
+                return session
+            await self._stop_owner()
+            return await self._connect()
+
+    def _connected_session(self) -> ClientSession | None:
+        """Get the open session, or None if it must be (re-)established."""
+        return self._session if self.is_connected else None
+
+    async def _connect(self) -> ClientSession:
+        """Open the connection from a dedicated owner task."""
+        loop = asyncio.get_running_loop()
+        ready: asyncio.Future[ClientSession] = loop.create_future()
+        closing = asyncio.Event()
+        start_time = time.time()
+
+        owner = asyncio.create_task(self._own_connection(ready, closing), name=f"mcp-session:{self.name}")
+        try:
+            session = await asyncio.wait_for(asyncio.shield(ready), timeout=self.connect_timeout)
+        except builtins.TimeoutError:
+            self.stats.connect_failures += 1
+            closing.set()
+            owner.cancel()
+            await asyncio.gather(owner, return_exceptions=True)
+            raise TimeoutError(f"MCP session to {self.name} timed out while connecting") from None
+        except Exception as e:
+            self.stats.connect_failures += 1
+            await asyncio.gather(owner, return_exceptions=True)
+            raise ConnectionError(f"Failed to open MCP session to {self.name}: {e}") from e
+
+        self._session = session
+        self._owner = owner
+        self._closing = closing
+        self.stats.record_connect(time.time() - start_time)
+        logger.debug(f"Persistent MCP session opened for {self.name}")
+        return session
+
+    async def _own_connection(self, ready: asyncio.Future, closing: asyncio.Event) -> None:
+        """Hold the connection open until asked to close or the connection drops."""
+        try:
+            async with self._stream_factory() as streams:
+                read_stream, write_stream = streams[0], streams[1]
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    if not ready.done():
+                        ready.set_result(session)
+                    await closing.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            elif not closing.is_set():
+                logger.warning(f"Persistent MCP session to {self.name} dropped: {e}")
+        finally:
+            if not ready.done():
+                ready.set_exception(ConnectionError(f"MCP session to {self.name} closed during initialization"))
+            logger.debug(f"Persistent MCP session closed for {self.name}")
+
+    async def _invalidate(self, session: ClientSession) -> None:
+        """Drop the given session so that the next request reconnects."""
+        assert self._connect_lock is not None
+        async with self._connect_lock:
+            if self._session is session:
+                await self._stop_owner()
+
+    async def _stop_owner(self) -> None:
+        """Stop the current owner task and forget its session."""
+        owner, closing = self._owner, self._closing
+        self._session = None
+        self._owner = None
+        self._closing = None
+        self.stats.connected_since = None
+
+        if owner is None:
+            return
+        if closing is not None:
+            closing.set()
+        done, _ = await asyncio.wait({owner}, timeout=self.connect_timeout)
+        if not done:
+            owner.cancel()
+            await asyncio.gather(owner, return_exceptions=True)
+
+    def _bind_loop(self) -> None:
+        """Bind the session to the running event loop, discarding state from a previous loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            logger.debug(f"Event loop changed for MCP session {self.name}, discarding previous session")
+        self._loop = loop
+        self._connect_lock = asyncio.Lock()
+        self._session = None
+        self._owner = None
+        self._closing = None
+
+    async def close(self) -> None:
+        """Close the session and release the underlying connection."""
+        if self._loop is not asyncio.get_running_loop() or self._connect_lock is None:
+            self._session = None
+            self._owner = None
+            self._closing = None
+            return
+        async with self._connect_lock:
+            await self._stop_owner()
@@ -56,6 +56,14 @@ Performance Considerations:
 - HTTP: Best for simple request/response patterns
 - Stdio: Best for local development and testing
 
+By default every request opens its own session, paying the connect and MCP
+``initialize`` round-trips each time. Pass ``persistent=True`` to keep one
+initialized session open per transport and multiplex all requests over it:
+
+transport = SSETransport("http://localhost:8082/sse/sse", persistent=True)
+result = await transport.call_tool("tool_name", {"arg": "value"})
+stats = transport.get_session_stats()
+
 Error Handling:
 --------------
 
@@ -91,19 +99,34 @@ import builtins
 import logging
 import time
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
-from typing import Any
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any, TypeVar
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.types import Tool
 
-from .exceptions import ConnectionError, ServerError, TimeoutError
+from .exceptions import ConnectionError, MCPClientError, ServerError, TimeoutError
+from .session import PersistentSession, SessionStats, is_connection_lost
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _request_error(error: Exception, message: str) -> MCPClientError:
+    """Classify an error raised by a request on an MCP session.
+
+    A lost connection or a socket error becomes a ConnectionError, so retries
+    and circuit breakers treat it as transient; any other error is a ServerError.
+    """
+    if isinstance(error, OSError) or is_connection_lost(error):
+        return ConnectionError(f"{message}: {error}")
+    return ServerError(f"{message}: {error}")
+
 
 class BaseTransport(ABC):
     """Abstract base class for MCP transport implementations.
@@ -143,17 +166,20 @@ class BaseTransport(ABC):
 
     """
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(self, timeout: float = 30.0, persistent: bool = False):
         """Initialize transport.
 
         Args:
             timeout: Default timeout for operations in seconds
+            persistent: Keep one initialized session open and share it across requests
 
         """
         self.timeout = timeout
+        self.persistent = persistent
         self._connected = False
         self._last_health_check = 0.0
         self._health_check_interval = 60.0  # seconds
+        self._persistent_session: PersistentSession | None = None
 
     @abstractmethod
     @asynccontextmanager
@@ -170,6 +196,76 @@ class BaseTransport(ABC):
         """
         pass
 
+    def _open_streams(self) -> AbstractAsyncContextManager[tuple[Any, Any]]:
+        """Open the raw read/write streams for a session.
+
+        Transports supporting the persistent session mode implement this.
+
+        Returns:
+            Async context manager yielding ``(read_stream, write_stream)``
+
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support persistent sessions")
+
+    def _describe(self) -> str:
+        """Get a human readable identifier of the transport endpoint."""
+        return type(self).__name__
+
+    def _get_persistent_session(self) -> PersistentSession:
+        """Get the shared session, creating it on first use."""
+        if self._persistent_session is None:
+            self._persistent_session = PersistentSession(
+                self._open_streams,
+                name=self._describe(),
+                connect_timeout=self.timeout,
+                request_timeout=self.timeout,
+            )
+        return self._persistent_session
+
+    async def _run_on_session(
+        self, operation: Callable[[ClientSession], Awaitable[T]], replay_on_disconnect: bool = True
+    ) -> T:
+        """Run an operation on a session.
+
+        Uses the shared session in persistent mode, otherwise opens a
+        dedicated session for this operation.
+
+        Args:
+            operation: Callable receiving the initialized session
+            replay_on_disconnect: Whether the shared session replays the operation after
+                the connection dropped; disable it for operations with side effects
+
+        Returns:
+            Result of the operation
+
+        """
+        if self.persistent:
+            result = await self._get_persistent_session().request(operation, replay_on_disconnect)
+            self._connected = True
+            return result
+
+        session: ClientSession
+        async with self.session() as session:
+            return await operation(session)
+
+    @asynccontextmanager
+    async def _shared_session(self) -> AsyncGenerator[ClientSession, None]:
+        """Yield the shared session of the persistent mode."""
+        session = await self._get_persistent_session().get_session()
+        self._connected = True
+        yield session
+
+    def get_session_stats(self) -> SessionStats | None:
+        """Get statistics of the shared session.
+
+        Returns:
+            Session statistics, or None if the persistent mode is disabled
+
+        """
+        if not self.persistent:
+            return None
+        return self._get_persistent_session().stats
+
     @abstractmethod
     async def list_tools(self) -> list[str]:
         """List available tools from the MCP server.
@@ -185,6 +281,41 @@ class BaseTransport(ABC):
         """
         pass
 
+    async def list_tool_definitions(self) -> list[Tool]:
+        """List available tools with their full definitions.
+
+        The MCP ``tools/list`` response already carries each tool's
+        description and input/output schemas, so no per-tool requests are
+        needed. Paginated responses are followed until the last page.
+
+        Returns:
+            Tool definitions as returned by the server
+
+        Raises:
+            TimeoutError: If request times out
+            ServerError: If server returns an error
+
+        """
+
+        async def list_all(session: ClientSession) -> list[Tool]:
+            tools: list[Tool] = []
+            cursor: str | None = None
+            while True:
+                response = await session.list_tools(cursor=cursor)
+                tools.extend(response.tools)
+                cursor = response.nextCursor
+                if not cursor:
+                    return tools
+
+        try:
+            return await self._run_on_session(list_all)
+        except builtins.TimeoutError:
+            raise TimeoutError("Tool listing request timed out")
+        except MCPClientError:
+            raise
+        except Exception as e:
+            raise _request_error(e, "Failed to list tools") from e
+
     @abstractmethod
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Call a tool on the MCP server.
@@ -230,6 +361,8 @@ class BaseTransport(ABC):
 
     async def close(self) -> None:
         """Close the transport and cleanup resources."""
+        if self._persistent_session is not None:
+            await self._persistent_session.close()
         self._connected = False
         logger.debug(f"Transport {type(self).__name__} closed")
 
@@ -273,17 +406,26 @@ class SSETransport(BaseTransport):
 
     """
 
-    def __init__(self, url: str, timeout: float = 30.0):
+    def __init__(self, url: str, timeout: float = 30.0, persistent: bool = False):
         """Initialize SSE transport.
 
         Args:
             url: SSE endpoint URL
             timeout: Default timeout for operations
+            persistent: Keep one initialized session open and share it across requests
 
         """
-        super().__init__(timeout)
+        super().__init__(timeout, persistent)
         self.url = url
 
+    def _open_streams(self) -> AbstractAsyncContextManager[tuple[Any, Any]]:
+        """Open the SSE read/write streams."""
+        return sse_client(self.url)
+
+    def _describe(self) -> str:
+        """Get the endpoint URL."""
+        return self.url
+
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[ClientSession, None]:
         """Create and manage an SSE client session.
@@ -296,6 +438,12 @@ class SSETransport(BaseTransport):
             TimeoutError: If connection times out
 
         """
+        if self.persistent:
+            async with self._shared_session() as session:
+                yield session
+            return
+
+        yielded = False
         try:
             logger.debug(f"Creating SSE session for {self.url}")
 
@@ -306,11 +454,15 @@ class SSETransport(BaseTransport):
 
                         self._connected = True
                         logger.debug(f"SSE session created for {self.url}")
+                        yielded = True
                         yield session
 
         except builtins.TimeoutError:
             raise TimeoutError(f"SSE connection to {self.url} timed out")
         except Exception as e:
+            if yielded:
+                # Errors of the operation run on the session are the caller's to classify
+                raise
             # Inspect sub-exceptions if available (e.g. ExceptionGroup or similar)
             print(f"DEBUG: Exception caught in SSE session: {type(e)} {e}")
             if hasattr(e, "exceptions"):
@@ -331,13 +483,14 @@ class SSETransport(BaseTransport):
 
         """
         try:
-            async with self.session() as session:
-                tools_resp = await session.list_tools()
-                return [tool.name for tool in tools_resp.tools]
+            tools_resp = await self._run_on_session(lambda session: session.list_tools())
+            return [tool.name for tool in tools_resp.tools]
         except builtins.TimeoutError:
             raise TimeoutError("Tool listing request timed out")
+        except MCPClientError:
+            raise
         except Exception as e:
-            raise ServerError(f"Failed to list tools: {e}")
+            raise _request_error(e, "Failed to list tools") from e
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Call tool using SSE transport.
@@ -351,13 +504,16 @@ class SSETransport(BaseTransport):
 
         """
         try:
-            async with self.session() as session:
-                result = await session.call_tool(tool_name, arguments)
-                return result
+            # A tool call may have run before the connection dropped, the client's retry policy decides
+            return await self._run_on_session(
+                lambda session: session.call_tool(tool_name, arguments), replay_on_disconnect=False
+            )
         except builtins.TimeoutError:
             raise TimeoutError(f"Tool call {tool_name} timed out")
+        except MCPClientError:
+            raise
         except Exception as e:
-            raise ServerError(f"Failed to call tool {tool_name}: {e}")
+            raise _request_error(e, f"Failed to call tool {tool_name}") from e
 
 
 class HTTPTransport(BaseTransport):
@@ -401,17 +557,28 @@ class HTTPTransport(BaseTransport):
 
     """
 
-    def __init__(self, url: str, timeout: float = 30.0):
+    def __init__(self, url: str, timeout: float = 30.0, persistent: bool = False):
         """Initialize HTTP transport.
 
         Args:
             url: HTTP endpoint URL
             timeout: Default timeout for operations
+            persistent: Keep one initialized session open and share it across requests
 
         """
-        super().__init__(timeout)
+        super().__init__(timeout, persistent)
         self.url = url
 
+    @asynccontextmanager
+    async def _open_streams(self) -> AsyncGenerator[tuple[Any, Any], None]:
+        """Open the streamable HTTP read/write streams."""
+        async with streamablehttp_client(self.url) as (read_stream, write_stream, _close_fn):
+            yield read_stream, write_stream
+
+    def _describe(self) -> str:
+        """Get the endpoint URL."""
+        return self.url
+
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[ClientSession, None]:
         """Create and manage an HTTP client session.
@@ -424,6 +591,12 @@ class HTTPTransport(BaseTransport):
             TimeoutError: If connection times out
 
         """
+        if self.persistent:
+            async with self._shared_session() as session:
+                yield session
+            return
+
+        yielded = False
         try:
             logger.debug(f"Creating HTTP session for {self.url}")
 
@@ -434,11 +607,15 @@ class HTTPTransport(BaseTransport):
 
                         self._connected = True
                         logger.debug(f"HTTP session created for {self.url}")
+                        yielded = True
                         yield session
 
         except builtins.TimeoutError:
             raise TimeoutError(f"HTTP connection to {self.url} timed out")
         except Exception as e:
+            if yielded:
+                # Errors of the operation run on the session are the caller's to classify
+                raise
             raise ConnectionError(f"Failed to create HTTP session: {e}")
 
     async def list_tools(self) -> list[str]:
@@ -449,13 +626,14 @@ class HTTPTransport(BaseTransport):
 
         """
         try:
-            async with self.session() as session:
-                tools_resp = await session.list_tools()
-                return [tool.name for tool in tools_resp.tools]
+            tools_resp = await self._run_on_session(lambda session: session.list_tools())
+            return [tool.name for tool in tools_resp.tools]
         except builtins.TimeoutError:
             raise TimeoutError("Tool listing request timed out")
+        except MCPClientError:
+            raise
         except Exception as e:
-            raise ServerError(f"Failed to list tools: {e}")
+            raise _request_error(e, "Failed to list tools") from e
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Call tool using HTTP transport.
@@ -469,13 +647,16 @@ class HTTPTransport(BaseTransport):
 
         """
         try:
-            async with self.session() as session:
-                result = await session.call_tool(tool_name, arguments)
-                return result
+            # A tool call may have run before the connection dropped, the client's retry policy decides
+            return await self._run_on_session(
+                lambda session: session.call_tool(tool_name, arguments), replay_on_disconnect=False
+            )
         except builtins.TimeoutError:
             raise TimeoutError(f"Tool call {tool_name} timed out")
+        except MCPClientError:
+            raise
         except Exception as e:
-            raise ServerError(f"Failed to call tool {tool_name}: {e}")
+            raise _request_error(e, f"Failed to call tool {tool_name}") from e
 
 
 class StdioTransport(BaseTransport):
@@ -519,7 +700,14 @@ class StdioTransport(BaseTransport):
 
     """
 
-    def __init__(self, command: str, args: list[str], env: dict[str, str] | None = None, timeout: float = 30.0):
+    def __init__(
+        self,
+        command: str,
+        args: list[str],
+        env: dict[str, str] | None = None,
+        timeout: float = 30.0,
+        persistent: bool = False,
+    ):
         """Initialize stdio transport.
 
         Args:
@@ -527,13 +715,22 @@ class StdioTransport(BaseTransport):
             args: Arguments for the command
             env: Environment variables for the process
             timeout: Default timeout for operations
+            persistent: Keep the server process and its session alive across requests
 
         """
-        super().__init__(timeout)
+        super().__init__(timeout, persistent)
         self.command = command
         self.args = args
         self.env = env
 
+    def _open_streams(self) -> AbstractAsyncContextManager[tuple[Any, Any]]:
+        """Spawn the server process and open its stdio streams."""
+        return stdio_client(StdioServerParameters(command=self.command, args=self.args, env=self.env))
+
+    def _describe(self) -> str:
+        """Get the server command line."""
+        return f"{self.command} {' '.join(self.args)}"
+
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[ClientSession, None]:
         """Create and manage a stdio client session.
@@ -546,6 +743,12 @@ class StdioTransport(BaseTransport):
             TimeoutError: If initialization times out
 
         """
+        if self.persistent:
+            async with self._shared_session() as session:
+                yield session
+            return
+
+        yielded = False
         try:
             logger.debug(f"Creating stdio session for {self.command} {' '.join(self.args)}")
 
@@ -560,11 +763,15 @@ class StdioTransport(BaseTransport):
 
                         self._connected = True
                         logger.debug(f"Stdio session created for {self.command}")
+                        yielded = True
                         yield session
 
         except builtins.TimeoutError:
             raise TimeoutError(f"Stdio connection to {self.command} timed out")
         except Exception as e:
+            if yielded:
+                # Errors of the operation run on the session are the caller's to classify
+                raise
             raise ConnectionError(f"Failed to create stdio session: {e}")
 
     async def list_tools(self) -> list[str]:
@@ -575,13 +782,14 @@ class StdioTransport(BaseTransport):
 
         """
         try:
-            async with self.session() as session:
-                tools_resp = await session.list_tools()
-                return [tool.name for tool in tools_resp.tools]
+            tools_resp = await self._run_on_session(lambda session: session.list_tools())
+            return [tool.name for tool in tools_resp.tools]
         except builtins.TimeoutError:
             raise TimeoutError("Tool listing request timed out")
+        except MCPClientError:
+            raise
         except Exception as e:
-            raise ServerError(f"Failed to list tools: {e}")
+            raise _request_error(e, "Failed to list tools") from e
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Call tool using stdio transport.
@@ -595,10 +803,13 @@ class StdioTransport(BaseTransport):
 
         """
         try:
-            async with self.session() as session:
-                result = await session.call_tool(tool_name, arguments)
-                return result
+            # A tool call may have run before the connection dropped, the client's retry policy decides
+            return await self._run_on_session(
+                lambda session: session.call_tool(tool_name, arguments), replay_on_disconnect=False
+            )
         except builtins.TimeoutError:
             raise TimeoutError(f"Tool call {tool_name} timed out")
+        except MCPClientError:
+            raise
         except Exception as e:
-            raise ServerError(f"Failed to call tool {tool_name}: {e}")
+            raise _request_error(e, f"Failed to call tool {tool_name}") from e
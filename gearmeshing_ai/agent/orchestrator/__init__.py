@@ -5,6 +5,8 @@ AI agent workflows with support for user approval workflows, state persistence,
 and comprehensive event callbacks.
 """
 
+from collections.abc import AsyncIterator, Iterable
+
 from gearmeshing_ai.agent.orchestrator.approval_workflow import ApprovalWorkflow
 from gearmeshing_ai.agent.orchestrator.exceptions import (
     ApprovalTimeoutError,
@@ -22,6 +24,7 @@ from gearmeshing_ai.agent.orchestrator.models import (
     WorkflowCallbacks,
     WorkflowResult,
     WorkflowStatus,
+    WorkflowTask,
 )
 from gearmeshing_ai.agent.orchestrator.persistence import PersistenceManager
 from gearmeshing_ai.agent.orchestrator.service import OrchestratorService
@@ -68,6 +71,25 @@ async def run_agent_workflow(
     )
 
 
+async def run_agent_workflows_batch(
+    tasks: Iterable[WorkflowTask],
+    max_concurrency: int = 8,
+) -> AsyncIterator[WorkflowResult]:
+    """Execute many AI agent workflows concurrently, yielding results as they complete.
+
+    Args:
+        tasks: Workflows to run; each task's run_id identifies its result
+        max_concurrency: Maximum number of workflows running at once
+
+    Yields:
+        WorkflowResult of each task, in completion order
+
+    """
+    service = _get_service()
+    async for result in service.run_workflows_batch(tasks, max_concurrency=max_concurrency):
+        yield result
+
+
 async def approve_workflow(
     run_id: str,
     approver_id: str,
@@ -220,6 +242,7 @@ async def get_approval_history(
 __all__ = [
     # New API (recommended)
     "run_agent_workflow",
+    "run_agent_workflows_batch",
     "approve_workflow",
     "reject_workflow",
     "cancel_workflow",
@@ -233,6 +256,7 @@ __all__ = [
     # Models
     "WorkflowResult",
     "WorkflowStatus",
+    "WorkflowTask",
     "ApprovalRequest",
     "ApprovalDecision",
     "ApprovalDecisionRecord",
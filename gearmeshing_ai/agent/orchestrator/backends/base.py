@@ -73,3 +73,7 @@ class PersistenceBackend(ABC):
     async def clear(self) -> None:
         """Clear all persisted data (for testing)."""
         pass
+
+    async def close(self) -> None:
+        """Write buffered data and release connections; a no-op for backends without any."""
+        pass
@@ -1,13 +1,197 @@
 """Local (in-memory) persistence backend.
 
 Used for testing and development. All data is stored in memory and lost on restart.
+
+History Behavior:
+----------------
+
+1. **Indexed**: Workflow history is indexed by user, agent role and status,
+   approval history by run, approver and status, so a query only visits the
+   entries of its most selective filter
+2. **Bounded**: Each history keeps its latest ``max_history_entries`` entries;
+   evicting the oldest entry takes constant amortized time
+3. **Pages**: ``page_workflow_history`` and ``page_approval_history`` return an
+   opaque cursor continuing after the last entry of the page
+
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Hashable
 from typing import Any
 
 from .base import PersistenceBackend
+from .serialization import workflow_history_entry
+
+# Evicted entries kept in the sequence lists before they are compacted away
+_COMPACT_MIN_EVICTED = 1024
+
+
+class _IndexedLog:
+    """Insertion-ordered entries with per-field indexes and bounded retention.
+
+    Every entry gets an increasing sequence number; indexes map a field value
+    to the sorted sequence numbers of the entries holding it. Eviction always
+    removes the oldest entry, so evicted sequence numbers form a prefix of
+    every list: they are skipped by queries and dropped in batches.
+    """
+
+    def __init__(self, fields: tuple[str, ...], max_entries: int | None):
+        self.fields = fields
+        self.max_entries = max_entries
+        self._entries: dict[int, dict[str, Any]] = {}
+        self._all: list[int] = []
+        # Position of the oldest live entry in _all
+        self._start = 0
+        self._indexes: dict[str, dict[Any, list[int]]] = {field: {} for field in fields}
+        self._seq_by_key: dict[Hashable, int] = {}
+        self._key_by_seq: dict[int, Hashable] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _index(self, field: str, value: Any, seq: int) -> None:
+        if value is None:
+            return
+        seqs = self._indexes[field].setdefault(value, [])
+        if not seqs or seqs[-1] < seq:
+            seqs.append(seq)
+        else:
+            insort(seqs, seq)
+
+    def _unindex(self, field: str, value: Any, seq: int) -> None:
+        seqs = self._indexes[field].get(value)
+        if seqs is None:
+            return
+        position = bisect_left(seqs, seq)
+        if position < len(seqs) and seqs[position] == seq:
+            del seqs[position]
+        if not seqs:
+            del self._indexes[field][value]
+
+    def add(self, entry: dict[str, Any], key: Hashable | None = None) -> None:
+        """Add an entry, or replace the entry with the same key keeping its position."""
+        seq = self._seq_by_key.get(key) if key is not None else None
+        if seq is not None:
+            previous = self._entries[seq]
+            for field in self.fields:
+                if previous.get(field) != entry.get(field):
+                    self._unindex(field, previous.get(field), seq)
+                    self._index(field, entry.get(field), seq)
+            self._entries[seq] = entry
+            return
+
+        seq = self._next_seq
+        self._next_seq += 1
+        self._entries[seq] = entry
+        self._all.append(seq)
+        if key is not None:
+            self._seq_by_key[key] = seq
+            self._key_by_seq[seq] = key
+        for field in self.fields:
+            self._index(field, entry.get(field), seq)
+
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._evict_oldest()
+
+    def _oldest_seq(self) -> int:
+        return self._all[self._start] if self._start < len(self._all) else self._next_seq
+
+    def _evict_oldest(self) -> None:
+        seq = self._all[self._start]
+        self._start += 1
+        del self._entries[seq]
+        key = self._key_by_seq.pop(seq, None)
+        if key is not None:
+            del self._seq_by_key[key]
+        if self._start >= max(len(self._entries), _COMPACT_MIN_EVICTED):
+            self._compact()
+
+    def _compact(self) -> None:
+        oldest = self._oldest_seq()
+        del self._all[: self._start]
+        self._start = 0
+        for index in self._indexes.values():
+            for value, seqs in list(index.items()):
+                del seqs[: bisect_left(seqs, oldest)]
+                if not seqs:
+                    del index[value]
+
+    def query(
+        self,
+        filters: dict[str, Any],
+        limit: int,
+        offset: int = 0,
+        after: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Get entries matching every filter, in insertion order.
+
+        Args:
+            filters: Field values to match; None values are ignored
+            limit: Number of results
+            offset: Matching entries to skip
+            after: Sequence number of the entry to continue after
+
+        Returns:
+            Copies of the matching entries, and the sequence number of the
+            last one when the page is full
+
+        """
+        filters = {field: value for field, value in filters.items() if value is not None}
+        candidates = self._all
+        chosen = None
+        for field, value in filters.items():
+            seqs = self._indexes[field].get(value, [])
+            if chosen is None or len(seqs) < len(candidates):
+                candidates, chosen = seqs, field
+        others = [(field, value) for field, value in filters.items() if field != chosen]
+
+        # Skip the sequence numbers of evicted entries
+        floor = self._oldest_seq() - 1
+        start = bisect_right(candidates, floor if after is None else max(after, floor))
+        if limit <= 0:
+            return [], None
+        if not others:
+            seqs = candidates[start + offset : start + offset + limit]
+        else:
+            seqs = []
+            skipped = 0
+            for position in range(start, len(candidates)):
+                seq = candidates[position]
+                entry = self._entries[seq]
+                if any(entry.get(field) != value for field, value in others):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                seqs.append(seq)
+                if len(seqs) == limit:
+                    break
+
+        results = [dict(self._entries[seq]) for seq in seqs]
+        return results, seqs[-1] if len(seqs) == limit else None
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self._all.clear()
+        self._start = 0
+        self._seq_by_key.clear()
+        self._key_by_seq.clear()
+        for index in self._indexes.values():
+            index.clear()
+
+
+def _parse_cursor(cursor: str | None) -> int | None:
+    if cursor is None:
+        return None
+    try:
+        return int(cursor)
+    except ValueError:
+        raise ValueError(f"Invalid history cursor: {cursor!r}") from None
 
 
 class LocalPersistenceBackend(PersistenceBackend):
@@ -16,17 +200,24 @@ class LocalPersistenceBackend(PersistenceBackend):
     All data is stored in memory and lost on process restart.
     """
 
-    def __init__(self):
-        """Initialize local persistence backend."""
+    def __init__(self, max_history_entries: int | None = 10_000):
+        """Initialize local persistence backend.
+
+        Args:
+            max_history_entries: Entries kept per history, the oldest evicted first; None keeps every entry
+
+        """
+        self.max_history_entries = max_history_entries
         self._workflow_states: dict[str, Any] = {}
-        self._approval_decisions: list[Any] = []
         self._cancellations: list[dict[str, Any]] = []
         self._approval_requests: dict[str, Any] = {}
-        self._workflow_history: list[dict[str, Any]] = []
+        self._approval_history = _IndexedLog(("run_id", "approver_id", "status"), max_history_entries)
+        self._workflow_history = _IndexedLog(("user_id", "agent_role", "status"), max_history_entries)
 
     async def save_workflow_state(self, run_id: str, state: Any) -> None:
         """Save workflow state for resumption."""
         self._workflow_states[run_id] = state
+        self._workflow_history.add(workflow_history_entry(run_id, state), key=run_id)
 
     async def load_workflow_state(self, run_id: str) -> Any | None:
         """Load workflow state for resumption."""
@@ -39,7 +230,17 @@ class LocalPersistenceBackend(PersistenceBackend):
 
     async def save_approval_decision(self, decision: Any) -> None:
         """Save an approval decision."""
-        self._approval_decisions.append(decision)
+        self._approval_history.add(
+            {
+                "run_id": decision.run_id,
+                "decision": decision.decision.value,
+                "approver_id": decision.approver_id,
+                "decided_at": decision.decided_at,
+                "reason": decision.reason,
+                "alternative_action": decision.alternative_action,
+                "status": decision.decision.value,
+            }
+        )
 
     async def get_approval_history(
         self,
@@ -50,33 +251,40 @@ class LocalPersistenceBackend(PersistenceBackend):
         offset: int = 0,
     ) -> list[dict[str, Any]]:
         """Get approval decision history with filtering."""
-        history = []
-        for decision in self._approval_decisions:
-            entry = {
-                "run_id": decision.run_id,
-                "decision": decision.decision.value,
-                "approver_id": decision.approver_id,
-                "decided_at": decision.decided_at,
-                "reason": decision.reason,
-                "alternative_action": decision.alternative_action,
-                "status": decision.decision.value,
-            }
-            history.append(entry)
+        history, _ = self._approval_history.query(
+            {"run_id": run_id or None, "approver_id": approver_id or None, "status": status or None},
+            limit=limit,
+            offset=offset,
+        )
+        return history
 
-        # Filter by run_id if provided
-        if run_id:
-            history = [h for h in history if h.get("run_id") == run_id]
+    async def page_approval_history(
+        self,
+        run_id: str | None = None,
+        approver_id: str | None = None,
+        status: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Get a page of approval decision history with filtering.
 
-        # Filter by approver_id if provided
-        if approver_id:
-            history = [h for h in history if h.get("approver_id") == approver_id]
+        Args:
+            run_id: Filter by workflow ID (optional)
+            approver_id: Filter by approver (optional)
+            status: Filter by status (optional)
+            limit: Number of results
+            cursor: Cursor returned with the previous page
 
-        # Filter by status if provided
-        if status:
-            history = [h for h in history if h.get("status") == status]
+        Returns:
+            Entries of the page, and the cursor of the next page or None after the last one
 
-        # Apply pagination
-        return history[offset : offset + limit]
+        """
+        history, last = self._approval_history.query(
+            {"run_id": run_id or None, "approver_id": approver_id or None, "status": status or None},
+            limit=limit,
+            after=_parse_cursor(cursor),
+        )
+        return history, str(last) if last is not None else None
 
     async def save_cancellation(self, cancellation: dict[str, Any]) -> None:
         """Save workflow cancellation record."""
@@ -91,22 +299,40 @@ class LocalPersistenceBackend(PersistenceBackend):
         offset: int = 0,
     ) -> list[dict[str, Any]]:
         """Get workflow execution history with filtering."""
-        history = self._workflow_history.copy()
+        history, _ = self._workflow_history.query(
+            {"user_id": user_id or None, "agent_role": agent_role or None, "status": status or None},
+            limit=limit,
+            offset=offset,
+        )
+        return history
 
-        # Filter by user_id if provided
-        if user_id:
-            history = [h for h in history if h.get("user_id") == user_id]
+    async def page_workflow_history(
+        self,
+        user_id: str | None = None,
+        agent_role: str | None = None,
+        status: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Get a page of workflow execution history with filtering.
 
-        # Filter by agent_role if provided
-        if agent_role:
-            history = [h for h in history if h.get("agent_role") == agent_role]
+        Args:
+            user_id: Filter by user (optional)
+            agent_role: Filter by agent role (optional)
+            status: Filter by status (optional)
+            limit: Number of results
+            cursor: Cursor returned with the previous page
 
-        # Filter by status if provided
-        if status:
-            history = [h for h in history if h.get("status") == status]
+        Returns:
+            Entries of the page, and the cursor of the next page or None after the last one
 
-        # Apply pagination
-        return history[offset : offset + limit]
+        """
+        history, last = self._workflow_history.query(
+            {"user_id": user_id or None, "agent_role": agent_role or None, "status": status or None},
+            limit=limit,
+            after=_parse_cursor(cursor),
+        )
+        return history, str(last) if last is not None else None
 
     async def save_approval_request(self, run_id: str, request: Any) -> None:
         """Save an approval request."""
@@ -115,7 +341,7 @@ class LocalPersistenceBackend(PersistenceBackend):
     async def clear(self) -> None:
         """Clear all persisted data (for testing)."""
         self._workflow_states.clear()
-        self._approval_decisions.clear()
         self._cancellations.clear()
         self._approval_requests.clear()
+        self._approval_history.clear()
         self._workflow_history.clear()
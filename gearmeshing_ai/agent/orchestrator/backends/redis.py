@@ -1,55 +1,350 @@
 """Redis persistence backend for caching and temporary state storage.
 
-TODO: Implement Redis persistence backend.
-This is a placeholder for future implementation.
+Workflow states are kept in Redis so every API and worker process can resume
+the runs of the others. History is indexed with sorted sets scored by time,
+so history pages are range reads instead of scans.
+
+Key Layout:
+----------
+
+1. **State**: ``{prefix}:state:{run_id}``, a hash of the field blobs encoded by
+   ``WorkflowStateCodec``; expires ``completed_state_ttl_seconds`` after the
+   run finishes. Capability catalogs are stored once, in ``{prefix}:shared:{digest}``
+2. **History**: ``{prefix}:history:{run_id}`` holds the run's history entry,
+   indexed by ``{prefix}:history:index`` and per user, agent role and status
+3. **Approval decisions**: ``{prefix}:approval:{id}`` holds a decision, indexed
+   by ``{prefix}:approvals:index`` and per run, approver and status
+4. **Cancellations / approval requests**: ``{prefix}:cancellations:{run_id}``
+   list and ``{prefix}:approval_request:{run_id}``
+
+Write Behavior:
+--------------
+
+Every save writes its keys and index entries in one transactional pipeline,
+i.e. one round-trip. Saving a state first reads, in one round-trip, the run's
+previous history entry, so the run leaves the index sets of its previous
+status, and the stored state's revision: when it is the revision this backend
+last stored or loaded, only the changed fields are written. A delta is applied
+by a script that checks the revision again in the transaction; when another
+process wrote the state in between, the state is written in full instead.
+
+Usage Guidelines:
+----------------
+
+backend = RedisPersistenceBackend(host="redis", completed_state_ttl_seconds=3600)
+await backend.save_workflow_state(run_id, state)
+...
+await backend.close()
+
 """
 
 from __future__ import annotations
 
+import json
+import logging
+from datetime import UTC, datetime
+from enum import Enum
 from typing import Any
+from uuid import uuid4
+
+from gearmeshing_ai.agent.orchestrator.models import WorkflowStatus
+from gearmeshing_ai.agent.runtime.models.workflow_states import (
+    STATE_CATEGORIES,
+    WorkflowStateCategory,
+)
 
 from .base import PersistenceBackend
+from .codec import META_FIELD, StateDeltaTracker, WorkflowStateCodec
+from .serialization import workflow_history_entry
+
+logger = logging.getLogger(__name__)
+
+# Statuses of finished runs, lowercased: the orchestrator's and the runtime's terminal states
+TERMINAL_STATUSES = frozenset(
+    {
+        status.value.lower()
+        for status in (WorkflowStatus.SUCCESS, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED, WorkflowStatus.TIMEOUT)
+    }
+    | {
+        state.value.lower()
+        for state, category in STATE_CATEGORIES.items()
+        if category == WorkflowStateCategory.TERMINAL
+    }
+)
+
+# Applies a delta only over the revision it was computed from.
+# KEYS: state key; ARGV: revision field, base revision, removed count, removed names, field/value pairs
+DELTA_SCRIPT = """
+if redis.call('HGET', KEYS[1], ARGV[1]) ~= ARGV[2] then
+    return 0
+end
+local removed = tonumber(ARGV[3])
+if removed > 0 then
+    redis.call('HDEL', KEYS[1], unpack(ARGV, 4, 3 + removed))
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 4 + removed))
+return 1
+"""
+
+
+def _redis_client(host: str, port: int, db: int, password: str | None) -> Any:
+    try:
+        from redis.asyncio import Redis
+    except ImportError as e:
+        raise RuntimeError("The redis persistence backend requires the 'redis' package (gearmeshing-ai[redis])") from e
+    return Redis(host=host, port=port, db=db, password=password)
+
+
+def _dumps(value: dict[str, Any]) -> bytes:
+    return json.dumps(value, default=str, separators=(",", ":")).encode()
+
+
+def _timestamp(value: datetime) -> float:
+    return (value if value.tzinfo is not None else value.replace(tzinfo=UTC)).timestamp()
+
+
+def _is_terminal(status: Any) -> bool:
+    # States may carry enum members or their values, in either case
+    status = status.value if isinstance(status, Enum) else status
+    return isinstance(status, str) and status.lower() in TERMINAL_STATUSES
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
 
 
 class RedisPersistenceBackend(PersistenceBackend):
     """Redis persistence backend for caching and temporary state storage.
 
-    TODO: Implement with redis-py or aioredis for async support.
+    Features:
+    --------
+    - Compact per-field state blobs, written as deltas, with shared capability catalogs
+    - One pipelined round-trip per save for the record and its index entries
+    - Time-ordered history pages from sorted sets
+    - Expiry of the states of finished runs
+
+    Example:
+    -------
+    >>> backend = RedisPersistenceBackend(host="redis", completed_state_ttl_seconds=3600)
+    >>> await backend.save_workflow_state("run_123", state)
+    >>> await backend.get_workflow_history(user_id="user_123")
+    [{'run_id': 'run_123', 'status': 'success', ...}]
+
     """
 
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        key_prefix: str = "gearmeshing:orchestrator",
+        completed_state_ttl_seconds: int | None = 86400,
+        codec: WorkflowStateCodec | None = None,
+        client: Any | None = None,
+    ):
         """Initialize Redis persistence backend.
 
         Args:
             host: Redis host
             port: Redis port
             db: Redis database number
+            password: Redis password
+            key_prefix: Prefix of every key written by the backend
+            completed_state_ttl_seconds: Lifetime of a finished run's state; None keeps it forever
+            codec: Workflow state codec; defaults to zstd or zlib compression with shared capability catalogs
+            client: Async Redis client to use instead of connecting to host and port
 
         """
         self.host = host
         self.port = port
         self.db = db
-        # TODO: Initialize Redis connection
+        self.key_prefix = key_prefix
+        self.completed_state_ttl_seconds = completed_state_ttl_seconds
+        self.codec = codec or WorkflowStateCodec()
+        self.redis = client if client is not None else _redis_client(host, port, db, password)
+        self._deltas = StateDeltaTracker()
+        # Shared values known to be stored
+        self._stored_shared: set[str] = set()
+
+        # Metrics
+        self.delta_writes = 0
+        self.full_writes = 0
+        self.bytes_written = 0
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self.key_prefix, *parts))
 
     async def save_workflow_state(self, run_id: str, state: Any) -> None:
         """Save workflow state for resumption."""
-        # TODO: Implement Redis save
-        raise NotImplementedError("Redis backend not yet implemented")
+        encoded = self.codec.encode(state)
+        write = self._deltas.delta(run_id, encoded)
+        entry = workflow_history_entry(run_id, state)
+        score = _timestamp(entry["created_at"])
+        ttl = self.completed_state_ttl_seconds if _is_terminal(entry["status"]) else None
+        state_key = self._key("state", run_id)
+
+        read = self.redis.pipeline(transaction=False)
+        read.get(self._key("history", run_id))
+        read.hget(state_key, META_FIELD)
+        previous_raw, stored_meta = await read.execute()
+        previous = json.loads(previous_raw) if previous_raw else {}
+
+        delta = write.is_delta and stored_meta == write.base_meta
+        pipe = self.redis.pipeline(transaction=True)
+        if delta:
+            fields = write.changed_fields()
+            pairs = [item for name_value in fields.items() for item in name_value]
+            pipe.eval(
+                DELTA_SCRIPT, 1, state_key, META_FIELD, write.base_meta, len(write.removed), *write.removed, *pairs
+            )
+        else:
+            fields = encoded.fields
+            self._queue_full_state(pipe, state_key, fields)
+        self._queue_expiry(pipe, state_key, ttl)
+        shared = {digest: blob for digest, blob in encoded.shared.items() if digest not in self._stored_shared}
+        for digest, blob in shared.items():
+            pipe.set(self._key("shared", digest), blob, nx=True)
+        pipe.set(self._key("history", run_id), _dumps(entry))
+        pipe.zadd(self._key("history", "index"), {run_id: score})
+        for field, index in (("user_id", "user"), ("agent_role", "role"), ("status", "status")):
+            if previous.get(field) and previous[field] != entry[field]:
+                pipe.zrem(self._key("history", index, previous[field]), run_id)
+            if entry[field]:
+                pipe.zadd(self._key("history", index, entry[field]), {run_id: score})
+        results = await pipe.execute()
+
+        if delta and not results[0]:
+            # Another process wrote the state after it was read
+            logger.debug(f"State of run {run_id} changed concurrently, writing it in full")
+            delta = False
+            fields = encoded.fields
+            pipe = self.redis.pipeline(transaction=True)
+            self._queue_full_state(pipe, state_key, fields)
+            self._queue_expiry(pipe, state_key, ttl)
+            await pipe.execute()
+        if delta:
+            self.delta_writes += 1
+        else:
+            self.full_writes += 1
+
+        self._deltas.remember(run_id, encoded.fields)
+        self._stored_shared.update(shared)
+        self.bytes_written += sum(map(len, fields.values())) + sum(map(len, shared.values()))
+
+    @staticmethod
+    def _queue_full_state(pipe: Any, state_key: str, fields: dict[str, bytes]) -> None:
+        pipe.delete(state_key)
+        pipe.hset(state_key, mapping=fields)
+
+    @staticmethod
+    def _queue_expiry(pipe: Any, state_key: str, ttl: int | None) -> None:
+        if ttl is None:
+            pipe.persist(state_key)
+        else:
+            pipe.expire(state_key, ttl)
 
     async def load_workflow_state(self, run_id: str) -> Any | None:
         """Load workflow state for resumption."""
-        # TODO: Implement Redis load
-        raise NotImplementedError("Redis backend not yet implemented")
+        stored = await self.redis.hgetall(self._key("state", run_id))
+        if not stored:
+            return None
+        fields = {(name.decode() if isinstance(name, bytes) else name): blob for name, blob in stored.items()}
+
+        digests = self.codec.shared_refs(fields)
+        shared = {}
+        if digests:
+            blobs = await self.redis.mget([self._key("shared", digest) for digest in digests])
+            shared = {digest: blob for digest, blob in zip(digests, blobs, strict=True) if blob is not None}
+        state = self.codec.decode(fields, shared)
+        self._deltas.remember(run_id, fields)
+        return state
 
     async def delete_workflow_state(self, run_id: str) -> None:
         """Delete workflow state after completion."""
-        # TODO: Implement Redis delete
-        raise NotImplementedError("Redis backend not yet implemented")
+        self._deltas.forget(run_id)
+        await self.redis.delete(self._key("state", run_id))
 
     async def save_approval_decision(self, decision: Any) -> None:
         """Save an approval decision."""
-        # TODO: Implement Redis save
-        raise NotImplementedError("Redis backend not yet implemented")
+        status = getattr(decision.decision, "value", decision.decision)
+        entry = {
+            "run_id": decision.run_id,
+            "decision": status,
+            "approver_id": decision.approver_id,
+            "decided_at": decision.decided_at.isoformat(),
+            "reason": decision.reason,
+            "alternative_action": decision.alternative_action,
+            "status": status,
+        }
+        approval_key = uuid4().hex
+        score = _timestamp(decision.decided_at)
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.set(self._key("approval", approval_key), _dumps(entry))
+        pipe.zadd(self._key("approvals", "index"), {approval_key: score})
+        pipe.zadd(self._key("approvals", "run", decision.run_id), {approval_key: score})
+        pipe.zadd(self._key("approvals", "approver", decision.approver_id), {approval_key: score})
+        pipe.zadd(self._key("approvals", "status", status), {approval_key: score})
+        await pipe.execute()
+
+    async def _query(
+        self,
+        record_kind: str,
+        index_key: str,
+        filters: dict[str, str],
+        limit: int,
+        offset: int,
+    ) -> list[dict[str, Any]]:
+        """Read a page of records from the most specific index, filtering on the other fields.
+
+        Args:
+            record_kind: Key part of the records, "history" or "approval"
+            index_key: Sorted set of the record IDs to page through
+            filters: Remaining field filters, checked on the records
+            limit: Number of results
+            offset: Pagination offset
+
+        Returns:
+            Matching records in time order
+
+        """
+        if limit <= 0:
+            return []
+        if not filters:
+            ids = await self.redis.zrange(index_key, offset, offset + limit - 1)
+            records = await self._records(record_kind, ids)
+            return [record for record in records if record is not None]
+
+        # Filtered pages are read in chunks until enough records match
+        results: list[dict[str, Any]] = []
+        skipped = 0
+        start = 0
+        chunk = max(limit + offset, 100)
+        while len(results) < limit:
+            ids = await self.redis.zrange(index_key, start, start + chunk - 1)
+            if not ids:
+                break
+            start += len(ids)
+            for record in await self._records(record_kind, ids):
+                if record is None or any(record.get(field) != value for field, value in filters.items()):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                results.append(record)
+                if len(results) == limit:
+                    break
+        return results
+
+    async def _records(self, record_kind: str, ids: list[Any]) -> list[dict[str, Any] | None]:
+        if not ids:
+            return []
+        keys = [
+            self._key(record_kind, record_id.decode() if isinstance(record_id, bytes) else record_id)
+            for record_id in ids
+        ]
+        return [json.loads(raw) if raw is not None else None for raw in await self.redis.mget(keys)]
 
     async def get_approval_history(
         self,
@@ -60,13 +355,29 @@ class RedisPersistenceBackend(PersistenceBackend):
         offset: int = 0,
     ) -> list[dict[str, Any]]:
         """Get approval decision history with filtering."""
-        # TODO: Implement Redis query
-        raise NotImplementedError("Redis backend not yet implemented")
+        filters = {
+            field: value
+            for field, value in (("run_id", run_id), ("approver_id", approver_id), ("status", status))
+            if value
+        }
+        index_key = self._key("approvals", "index")
+        for field, index in (("run_id", "run"), ("approver_id", "approver"), ("status", "status")):
+            if field in filters:
+                index_key = self._key("approvals", index, filters.pop(field))
+                break
+
+        history = await self._query("approval", index_key, filters, limit, offset)
+        for entry in history:
+            entry["decided_at"] = _parse_datetime(entry["decided_at"])
+        return history
 
     async def save_cancellation(self, cancellation: dict[str, Any]) -> None:
         """Save workflow cancellation record."""
-        # TODO: Implement Redis save
-        raise NotImplementedError("Redis backend not yet implemented")
+        await self.redis.rpush(self._key("cancellations", cancellation["run_id"]), _dumps(cancellation))
+
+    async def get_cancellations(self, run_id: str) -> list[dict[str, Any]]:
+        """Get the cancellation records of a run in save order."""
+        return [json.loads(raw) for raw in await self.redis.lrange(self._key("cancellations", run_id), 0, -1)]
 
     async def get_workflow_history(
         self,
@@ -77,15 +388,56 @@ class RedisPersistenceBackend(PersistenceBackend):
         offset: int = 0,
     ) -> list[dict[str, Any]]:
         """Get workflow execution history with filtering."""
-        # TODO: Implement Redis query
-        raise NotImplementedError("Redis backend not yet implemented")
+        filters = {
+            field: value
+            for field, value in (("user_id", user_id), ("agent_role", agent_role), ("status", status))
+            if value
+        }
+        index_key = self._key("history", "index")
+        for field, index in (("user_id", "user"), ("agent_role", "role"), ("status", "status")):
+            if field in filters:
+                index_key = self._key("history", index, filters.pop(field))
+                break
+
+        history = await self._query("history", index_key, filters, limit, offset)
+        for entry in history:
+            entry["created_at"] = _parse_datetime(entry["created_at"])
+            entry["updated_at"] = _parse_datetime(entry["updated_at"])
+        return history
 
     async def save_approval_request(self, run_id: str, request: Any) -> None:
         """Save an approval request."""
-        # TODO: Implement Redis save
-        raise NotImplementedError("Redis backend not yet implemented")
+        await self.redis.set(
+            self._key("approval_request", run_id),
+            _dumps(
+                {
+                    "run_id": run_id,
+                    "operation": request.operation,
+                    "risk_level": request.risk_level,
+                    "description": request.description,
+                    "created_at": request.created_at.isoformat(),
+                    "timeout_seconds": request.timeout_seconds,
+                    "metadata": request.metadata,
+                }
+            ),
+        )
 
     async def clear(self) -> None:
         """Clear all persisted data (for testing)."""
-        # TODO: Implement Redis clear
-        raise NotImplementedError("Redis backend not yet implemented")
+        self._deltas.clear()
+        self._stored_shared.clear()
+        keys = [key async for key in self.redis.scan_iter(match=f"{self.key_prefix}:*")]
+        if keys:
+            await self.redis.delete(*keys)
+
+    async def close(self) -> None:
+        """Close the Redis connections."""
+        await self.redis.aclose()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get backend statistics."""
+        return {
+            "delta_writes": self.delta_writes,
+            "full_writes": self.full_writes,
+            "bytes_written": self.bytes_written,
+        }
@@ -0,0 +1,85 @@
+"""Helpers shared by the persistence backends.
+
+Pydantic workflow states, such as the runtime's ``WorkflowState``, are
+persisted with their class path and validated back into the same class on
+load. Every backend derives a run's history entry from its saved state.
+
+Usage Guidelines:
+----------------
+
+state_class = resolve_state_class("gearmeshing_ai.agent.runtime.models.workflow_state:WorkflowState")
+entry = workflow_history_entry(run_id, state)
+
+"""
+
+from __future__ import annotations
+
+import importlib
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+def resolve_state_class(state_type: str) -> type[BaseModel]:
+    """Resolve the class path of a persisted workflow state model.
+
+    Args:
+        state_type: Class path, "module:QualifiedName"
+
+    Returns:
+        Model class
+
+    Raises:
+        TypeError: If the class path does not name a pydantic model
+
+    """
+    module_name, _, qualname = state_type.partition(":")
+    state_class: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        state_class = getattr(state_class, name)
+    if not (isinstance(state_class, type) and issubclass(state_class, BaseModel)):
+        raise TypeError(f"Workflow state type is not a pydantic model: {state_type}")
+    return state_class
+
+
+def _field(value: Any, name: str) -> Any:
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, name, None)
+
+
+def _timestamp(value: Any) -> datetime | None:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    # The runtime's states use naive UTC timestamps
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def workflow_history_entry(run_id: str, state: Any) -> dict[str, Any]:
+    """Build the workflow history entry of a workflow state.
+
+    Args:
+        run_id: Workflow run ID
+        state: Workflow state, as a model or a dictionary
+
+    Returns:
+        History entry with the run's user, agent role, status, task and timestamps
+
+    """
+    context = _field(state, "context")
+    now = datetime.now(UTC)
+    return {
+        "run_id": run_id,
+        "user_id": _field(context, "user_id"),
+        "agent_role": _field(context, "agent_role"),
+        "status": _field(_field(state, "status"), "state"),
+        "task_description": _field(context, "task_description"),
+        "created_at": _timestamp(_field(state, "created_at")) or now,
+        "updated_at": _timestamp(_field(state, "updated_at")) or now,
+    }
@@ -109,6 +109,17 @@ class WorkflowResult:
     duration_seconds: float | None = None
 
 
+@dataclass
+class WorkflowTask:
+    """Task of a batch workflow submission."""
+
+    task_description: str
+    agent_role: str | None = None
+    user_id: str = "system"
+    timeout_seconds: int = 300
+    run_id: str = field(default_factory=lambda: str(uuid4()))
+
+
 @dataclass
 class WorkflowCheckpoint:
     """Checkpoint for workflow state persistence."""
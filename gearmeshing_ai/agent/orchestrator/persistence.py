@@ -23,8 +23,8 @@ class PersistenceManager:
 
     Supports multiple backends:
     - local: In-memory storage (default, for testing/development)
-    - database: SQL database (TODO: not implemented yet)
-    - redis: Redis cache (TODO: not implemented yet)
+    - database: SQL database (SQLite, PostgreSQL) with write-behind batching
+    - redis: Redis, shared by every process, with expiry of finished runs' states
     - filesystem: Local filesystem (TODO: not implemented yet)
     """
 
@@ -34,8 +34,8 @@ class PersistenceManager:
         Args:
             backend: Storage backend type:
                      - "local": In-memory storage (default, for testing/development)
-                     - "database": SQL database (TODO: not implemented yet)
-                     - "redis": Redis cache (TODO: not implemented yet)
+                     - "database": SQL database (SQLite, PostgreSQL)
+                     - "redis": Redis
             **backend_kwargs: Additional arguments for specific backends
 
         """
@@ -54,21 +54,19 @@ class PersistenceManager:
 
         """
         if backend == "local":
-            return LocalPersistenceBackend()
+            return LocalPersistenceBackend(**kwargs)
         if backend == "database":
-            # TODO: Implement database backend
             from .backends.database import DatabasePersistenceBackend
 
-            connection_string = kwargs.get("connection_string", "sqlite:///orchestrator.db")
-            return DatabasePersistenceBackend(connection_string)
+            connection_string = kwargs.pop("connection_string", "sqlite:///orchestrator.db")
+            return DatabasePersistenceBackend(connection_string, **kwargs)
         if backend == "redis":
-            # TODO: Implement redis backend
             from .backends.redis import RedisPersistenceBackend
 
-            host = kwargs.get("host", "localhost")
-            port = kwargs.get("port", 6379)
-            db = kwargs.get("db", 0)
-            return RedisPersistenceBackend(host, port, db)
+            host = kwargs.pop("host", "localhost")
+            port = kwargs.pop("port", 6379)
+            db = kwargs.pop("db", 0)
+            return RedisPersistenceBackend(host, port, db, **kwargs)
         raise ValueError(f"Unknown backend type: {backend}")
 
     # Delegate to backend
@@ -119,6 +117,10 @@ class PersistenceManager:
         """Clear all persisted data (for testing)."""
         await self._backend.clear()
 
+    async def close(self) -> None:
+        """Write buffered data and release the backend's connections."""
+        await self._backend.close()
+
     async def save_workflow_state(self, run_id: str, state: Any) -> None:
         """Save workflow state for resumption."""
         await self._backend.save_workflow_state(run_id, state)
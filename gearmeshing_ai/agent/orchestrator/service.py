@@ -2,18 +2,30 @@
 
 Provides simple, clean API for executing AI agent workflows with approval support.
 Delegates all workflow execution to the runtime package.
+
+Batch Execution:
+---------------
+
+``run_workflows_batch`` runs many tasks on one compiled workflow, at most
+``max_concurrency`` at a time. Tasks are started round-robin across agent
+roles, so a role with many tasks does not delay the others, and results are
+yielded as the runs complete.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
 from gearmeshing_ai.agent.abstraction.factory import AgentFactory
 from gearmeshing_ai.agent.adapters.pydantic_ai import PydanticAIAdapter
+from gearmeshing_ai.agent.mcp.client.config import MCPClientConfig
 from gearmeshing_ai.agent.mcp.client.core import MCPClient
 from gearmeshing_ai.agent.models.actions import MCPToolCatalog
 from gearmeshing_ai.agent.orchestrator.exceptions import (
@@ -28,8 +40,10 @@ from gearmeshing_ai.agent.orchestrator.models import (
     ApprovalDecisionRecord,
     WorkflowResult,
     WorkflowStatus,
+    WorkflowTask,
 )
 from gearmeshing_ai.agent.orchestrator.persistence import PersistenceManager
+from gearmeshing_ai.agent.roles.registry import get_global_registry
 from gearmeshing_ai.agent.runtime import ExecutionContext, WorkflowState, create_agent_workflow
 from gearmeshing_ai.agent.runtime.models import WorkflowStatus as RuntimeWorkflowStatus
 
@@ -43,15 +57,76 @@ class OrchestratorService:
     Delegates execution to runtime, handles persistence and approval coordination.
     """
 
-    def __init__(self, persistence: PersistenceManager | None = None):
+    def __init__(
+        self,
+        persistence: PersistenceManager | None = None,
+        mcp_config: MCPClientConfig | None = None,
+        cache_workflows: bool = True,
+    ):
         """Initialize OrchestratorService.
 
         Args:
             persistence: PersistenceManager for state persistence
                         (defaults to in-memory if not provided)
+            mcp_config: Configuration of the MCP client used by workflows
+            cache_workflows: Reuse the compiled workflow while roles and
+                            configuration stay unchanged
 
         """
         self.persistence: PersistenceManager = persistence or PersistenceManager()
+        self.mcp_config: MCPClientConfig = mcp_config or MCPClientConfig()
+        self.cache_workflows = cache_workflows
+
+        # Compiled workflow cache: (configuration key, workflow)
+        self._workflow_cache: tuple[tuple[Any, ...], Any] | None = None
+        self._mcp_config_digest = hashlib.sha256(self.mcp_config.model_dump_json().encode()).hexdigest()
+        self.workflow_cache_hits = 0
+        self.workflow_cache_misses = 0
+
+    def _workflow_cache_key(self) -> tuple[Any, ...]:
+        """Key identifying the configuration a compiled workflow was built from.
+
+        Covers the role registry (instance and version) and the MCP client
+        configuration. The policy engine and approval manager are created
+        with defaults inside the workflow, so they do not vary per service.
+        """
+        registry = get_global_registry()
+        return (id(registry), registry.version, self._mcp_config_digest)
+
+    def _get_workflow(self) -> Any:
+        """Get the compiled workflow, building it only when the configuration changed.
+
+        Returns:
+            Compiled LangGraph workflow graph
+
+        """
+        if not self.cache_workflows:
+            return self._create_workflow()
+
+        key = self._workflow_cache_key()
+        if self._workflow_cache is not None and self._workflow_cache[0] == key:
+            self.workflow_cache_hits += 1
+            return self._workflow_cache[1]
+
+        self.workflow_cache_misses += 1
+        workflow = self._create_workflow()
+        self._workflow_cache = (key, workflow)
+        logger.debug("Compiled workflow cached")
+        return workflow
+
+    def invalidate_workflow_cache(self) -> None:
+        """Drop the cached workflow, e.g. after modifying a registered role in place."""
+        self._workflow_cache = None
+        logger.debug("Workflow cache invalidated")
+
+    def get_workflow_cache_stats(self) -> dict[str, Any]:
+        """Get compiled workflow cache statistics."""
+        return {
+            "enabled": self.cache_workflows,
+            "cached": self._workflow_cache is not None,
+            "hits": self.workflow_cache_hits,
+            "misses": self.workflow_cache_misses,
+        }
 
     def _create_workflow(self) -> Any:
         """Create LangGraph workflow with required dependencies.
@@ -67,15 +142,13 @@ class OrchestratorService:
             # Create MCP client with proper configuration
             # Note: MCPClient requires a transport to be set via set_transport()
             # For now, we create it without transport - the runtime will handle tool discovery
-            mcp_client = MCPClient()
+            mcp_client = MCPClient(self.mcp_config)
             logger.debug("Created MCPClient for workflow")
 
             # Create agent factory with adapter and MCP client
             agent_factory = AgentFactory(adapter=adapter, mcp_client=mcp_client, proposal_mode=True)
 
             # Register agent settings from role registry
-            from gearmeshing_ai.agent.roles.registry import get_global_registry
-
             registry = get_global_registry()
             for role_name in registry.list_roles():
                 role_def = registry.get(role_name)
@@ -127,7 +200,124 @@ class OrchestratorService:
             Exception: If workflow execution fails
 
         """
-        run_id = str(uuid4())
+        return await self._execute_workflow(
+            run_id=str(uuid4()),
+            task_description=task_description,
+            agent_role=agent_role,
+            user_id=user_id,
+            timeout_seconds=timeout_seconds,
+        )
+
+    @staticmethod
+    def _fair_order(tasks: Iterable[WorkflowTask]) -> list[WorkflowTask]:
+        """Interleave tasks round-robin across agent roles, keeping each role's order.
+
+        Args:
+            tasks: Tasks in submission order
+
+        Returns:
+            Tasks in start order
+
+        """
+        queues: dict[str | None, deque[WorkflowTask]] = {}
+        for task in tasks:
+            queues.setdefault(task.agent_role, deque()).append(task)
+
+        ordered: list[WorkflowTask] = []
+        while queues:
+            for role in list(queues):
+                queue = queues[role]
+                ordered.append(queue.popleft())
+                if not queue:
+                    del queues[role]
+        return ordered
+
+    async def run_workflows_batch(
+        self,
+        tasks: Iterable[WorkflowTask],
+        max_concurrency: int = 8,
+    ) -> AsyncIterator[WorkflowResult]:
+        """Execute many AI agent workflows concurrently, yielding results as they complete.
+
+        Every run of the batch uses the same compiled workflow and agent
+        factory. Tasks are started round-robin across agent roles; closing the
+        iterator early cancels the runs still in progress.
+
+        Args:
+            tasks: Workflows to run; each task's run_id identifies its result
+            max_concurrency: Maximum number of workflows running at once
+
+        Yields:
+            WorkflowResult of each task, in completion order
+
+        Raises:
+            ValueError: If max_concurrency is lower than 1
+
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        pending = deque(self._fair_order(tasks))
+        if not pending:
+            return
+
+        try:
+            workflow = self._get_workflow()
+        except Exception as e:
+            # Each run retries the construction and reports its failure
+            logger.error(f"Failed to prepare workflow for batch of {len(pending)} tasks: {e}")
+            workflow = None
+
+        logger.info(f"Starting batch of {len(pending)} workflows with concurrency {max_concurrency}")
+        running: set[asyncio.Task[WorkflowResult]] = set()
+        try:
+            while pending or running:
+                while pending and len(running) < max_concurrency:
+                    task = pending.popleft()
+                    running.add(
+                        asyncio.create_task(
+                            self._execute_workflow(
+                                run_id=task.run_id,
+                                task_description=task.task_description,
+                                agent_role=task.agent_role,
+                                user_id=task.user_id,
+                                timeout_seconds=task.timeout_seconds,
+                                workflow=workflow,
+                            )
+                        )
+                    )
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    yield finished.result()
+        finally:
+            for unfinished in running:
+                unfinished.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def _execute_workflow(
+        self,
+        run_id: str,
+        task_description: str,
+        agent_role: str | None,
+        user_id: str,
+        timeout_seconds: float,
+        workflow: Any | None = None,
+    ) -> WorkflowResult:
+        """Execute one AI agent workflow run.
+
+        Args:
+            run_id: Workflow run ID
+            task_description: What the agent should do
+            agent_role: Specific role (dev, qa, sre) or None for auto-select
+            user_id: User triggering the workflow
+            timeout_seconds: Maximum execution time
+            workflow: Compiled workflow to run; the service's workflow if None
+
+        Returns:
+            WorkflowResult of the run; failures are reported as FAILED results
+
+        """
         started_at = datetime.now(UTC)
 
         logger.info(f"Starting workflow {run_id}: task='{task_description}', role='{agent_role}', user='{user_id}'")
@@ -148,8 +338,9 @@ class OrchestratorService:
             )
 
             # 3. Create runtime workflow
-            logger.debug(f"Creating LangGraph workflow for run_id={run_id}")
-            workflow = self._create_workflow()
+            if workflow is None:
+                logger.debug(f"Creating LangGraph workflow for run_id={run_id}")
+                workflow = self._get_workflow()
 
             # 4. Execute workflow (delegate to runtime)
             logger.info(f"Executing workflow {run_id} with {timeout_seconds}s timeout")
@@ -289,7 +480,7 @@ class OrchestratorService:
 
             # 4. Resume workflow execution with APPROVED decision
             logger.info(f"Resuming workflow {run_id} after approval")
-            workflow = self._create_workflow()
+            workflow = self._get_workflow()
             try:
                 final_state = await workflow.ainvoke(state)
             except Exception as e:
@@ -423,7 +614,7 @@ class OrchestratorService:
 
             # 6. Resume workflow with REJECTED decision + alternative result
             logger.info(f"Resuming workflow {run_id} after rejection")
-            workflow = self._create_workflow()
+            workflow = self._get_workflow()
             try:
                 # Inject alternative result into state for LLM to process
                 if hasattr(state, "metadata"):
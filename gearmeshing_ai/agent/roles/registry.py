@@ -26,7 +26,8 @@ RoleRegistry (Singleton)
 ├── list_all(): Get all role definitions
 ├── get_roles_by_domain(domain): Filter by domain
 ├── get_roles_by_authority(authority): Filter by authority
-└── clear(): Clear all roles
+├── clear(): Clear all roles
+└── version: Counter bumped on every change
 ```
 
 ## Key Features
@@ -37,6 +38,8 @@ RoleRegistry (Singleton)
 4. **Error Handling**: Clear error messages for missing roles
 5. **Logging**: Debug logging for all operations
 6. **Operators**: Support for 'in', 'len()', and repr()
+7. **Change Tracking**: ``version`` increases whenever roles change, so
+   consumers can cache anything derived from the roles
 
 ## Usage Examples
 
@@ -112,6 +115,16 @@ class RoleRegistry:
     def __init__(self) -> None:
         """Initialize the role registry."""
         self._roles: dict[str, RoleDefinition] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter increased on every registration or clear.
+
+        Anything built from the registered roles can be cached while the
+        version stays the same.
+        """
+        return self._version
 
     def register(self, role: RoleDefinition) -> None:
         """Register a role definition.
@@ -127,6 +140,7 @@ class RoleRegistry:
             logger.warning(f"Role '{role.role}' already registered, overwriting")
 
         self._roles[role.role] = role
+        self._version += 1
         logger.debug(f"Registered role: {role.role}")
 
     def register_from_dict(self, role_dict: dict) -> None:
@@ -227,6 +241,7 @@ class RoleRegistry:
     def clear(self) -> None:
         """Clear all registered roles."""
         self._roles.clear()
+        self._version += 1
         logger.debug("Cleared all roles from registry")
 
     def __len__(self) -> int:
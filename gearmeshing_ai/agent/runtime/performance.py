@@ -5,7 +5,10 @@ for optimized workflow execution.
 """
 
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from datetime import datetime
 from typing import Any, Generic, TypeVar
 
 logger = logging.getLogger(__name__)
@@ -21,9 +24,12 @@ class CacheEntry(Generic[T]):
         created_at: Creation timestamp
         ttl_seconds: Time-to-live in seconds
         access_count: Number of times accessed
+        expires_at: Monotonic clock time at which the entry expires
 
     """
 
+    __slots__ = ("access_count", "created_at", "expires_at", "ttl_seconds", "value")
+
     def __init__(self, value: T, ttl_seconds: int = 3600) -> None:
         """Initialize CacheEntry.
 
@@ -36,16 +42,19 @@ class CacheEntry(Generic[T]):
         self.created_at = datetime.utcnow()
         self.ttl_seconds = ttl_seconds
         self.access_count = 0
+        self.expires_at = time.monotonic() + ttl_seconds
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: float | None = None) -> bool:
         """Check if cache entry has expired.
 
+        Args:
+            now: Current monotonic time (read from the clock if omitted)
+
         Returns:
             True if expired, False otherwise
 
         """
-        expiration_time = self.created_at + timedelta(seconds=self.ttl_seconds)
-        return datetime.utcnow() > expiration_time
+        return (time.monotonic() if now is None else now) > self.expires_at
 
     def access(self) -> T:
         """Access the cached value.
@@ -58,29 +67,144 @@ class CacheEntry(Generic[T]):
         return self.value
 
 
+class FrequencySketch:
+    """Approximate access frequencies for TinyLFU admission.
+
+    A count-min sketch with ``depth`` rows of small saturating counters.
+    After ``sample_size`` increments every counter is halved, so old
+    popularity fades and the sketch adapts to changing workloads.
+
+    Attributes:
+        width: Counters per row (a power of two)
+        depth: Number of rows
+        sample_size: Increments between two aging passes
+
+    """
+
+    MAX_COUNT = 15
+    MIN_WIDTH = 64
+    # Odd 64-bit multipliers giving each row an independent index
+    SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+
+    def __init__(self, capacity: int, depth: int = 4) -> None:
+        """Initialize FrequencySketch.
+
+        Args:
+            capacity: Number of entries whose frequencies should be tracked
+            depth: Number of rows (hash functions)
+
+        """
+        self.width = max(1 << max(capacity * 2 - 1, 1).bit_length(), self.MIN_WIDTH)
+        self.depth = min(depth, len(self.SEEDS))
+        self.sample_size = max(capacity, 1) * 10
+        self._shift = 64 - (self.width.bit_length() - 1)
+        self._rows = [[0] * self.width for _ in range(self.depth)]
+        self._additions = 0
+
+    def _indexes(self, key: str) -> list[int]:
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        return [((h * seed) & 0xFFFFFFFFFFFFFFFF) >> self._shift for seed in self.SEEDS[: self.depth]]
+
+    def increment(self, key: str) -> None:
+        """Record one access of a key."""
+        for row, index in zip(self._rows, self._indexes(key), strict=True):
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def frequency(self, key: str) -> int:
+        """Estimate how often a key was accessed recently."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key), strict=True))
+
+    def _age(self) -> None:
+        for row in self._rows:
+            for index, count in enumerate(row):
+                row[index] = count >> 1
+        self._additions //= 2
+
+
 class PerformanceCache(Generic[T]):
     """High-performance cache with TTL and statistics.
 
+    Features:
+    --------
+    - O(1) least-recently-used eviction
+    - Optional TinyLFU admission: when full, a new key is refused if the
+      LRU entry it would replace has been requested more often recently
+    - Expiry checked on access plus a timer wheel that purges expired
+      entries in bulk as time advances
+    - Lock-protected, non-blocking operations usable from threads and
+      coroutines alike
+    - Statistics per key namespace (the key prefix before ``:``)
+
     Attributes:
-        cache: Dictionary of cached entries
+        cache: Ordered dictionary of cached entries, least recently used first
         max_size: Maximum cache size
         hit_count: Number of cache hits
         miss_count: Number of cache misses
+        eviction_count: Number of entries evicted to make room
+        expired_count: Number of entries dropped after expiring
+        rejected_count: Number of new entries refused by admission
+
+    Example:
+    -------
+    >>> cache = PerformanceCache[MCPToolCatalog](max_size=5000, admission="tinylfu")
+    >>> cache.set("capabilities:dev", catalog, ttl_seconds=300)
+    >>> cache.get("capabilities:dev") is catalog
+    True
+    >>> cache.get_stats()["namespaces"]["capabilities"]["hit_count"]
+    1
 
     """
 
-    def __init__(self, max_size: int = 1000) -> None:
+    ADMISSION_POLICIES = (None, "tinylfu")
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        admission: str | None = None,
+        wheel_resolution: float = 1.0,
+        namespace_separator: str = ":",
+    ) -> None:
         """Initialize PerformanceCache.
 
         Args:
             max_size: Maximum cache size
+            admission: Admission policy applied when full: None (always admit)
+                or "tinylfu" (refuse keys that are less popular than the LRU victim)
+            wheel_resolution: Seconds covered by one timer wheel slot
+            namespace_separator: Separator between key namespace and name
+
+        Raises:
+            ValueError: If the admission policy is unknown
 
         """
-        self.cache: dict[str, CacheEntry[T]] = {}
+        if admission not in self.ADMISSION_POLICIES:
+            msg = f"Unknown admission policy: {admission}"
+            raise ValueError(msg)
+
+        self.cache: OrderedDict[str, CacheEntry[T]] = OrderedDict()
         self.max_size = max_size
+        self.admission = admission
+        self.namespace_separator = namespace_separator
         self.hit_count = 0
         self.miss_count = 0
-        logger.debug(f"PerformanceCache initialized with max_size={max_size}")
+        self.eviction_count = 0
+        self.expired_count = 0
+        self.rejected_count = 0
+
+        self._lock = threading.RLock()
+        self._sketch = FrequencySketch(max_size) if admission == "tinylfu" else None
+        self._namespace_stats: defaultdict[str, Counter[str]] = defaultdict(Counter)
+
+        # Timer wheel: slot number -> keys expiring within that slot
+        self._wheel_resolution = wheel_resolution
+        self._wheel: dict[int, set[str]] = defaultdict(set)
+        self._wheel_position = self._slot(time.monotonic())
+
+        logger.debug(f"PerformanceCache initialized with max_size={max_size}, admission={admission}")
 
     def set(self, key: str, value: T, ttl_seconds: int = 3600) -> None:
         """Set a cache entry.
@@ -91,17 +215,31 @@ class PerformanceCache(Generic[T]):
             ttl_seconds: Time-to-live in seconds
 
         """
-        # Evict oldest entry if cache is full
-        if len(self.cache) >= self.max_size:
-            oldest_key = min(
-                self.cache.keys(),
-                key=lambda k: self.cache[k].created_at,
-            )
-            del self.cache[oldest_key]
-            logger.debug(f"Evicted cache entry: {oldest_key}")
-
-        self.cache[key] = CacheEntry(value, ttl_seconds)
-        logger.debug(f"Cached entry: {key}")
+        with self._lock:
+            now = time.monotonic()
+            self._advance_wheel(now)
+            if self._sketch is not None:
+                self._sketch.increment(key)
+
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            elif len(self.cache) >= self.max_size:
+                victim = next(iter(self.cache), None)
+                if victim is None:
+                    return
+                if self._sketch is not None and self._sketch.frequency(key) < self._sketch.frequency(victim):
+                    self.rejected_count += 1
+                    self._namespace(key)["rejected_count"] += 1
+                    return
+                self._remove(victim)
+                self.eviction_count += 1
+                self._namespace(victim)["eviction_count"] += 1
+
+            entry = CacheEntry(value, ttl_seconds)
+            if key not in self.cache:
+                self._namespace(key)["size"] += 1
+            self.cache[key] = entry
+            self._wheel[self._slot(entry.expires_at)].add(key)
 
     def get(self, key: str) -> T | None:
         """Get a cache entry.
@@ -113,21 +251,25 @@ class PerformanceCache(Generic[T]):
             Cached value or None if not found or expired
 
         """
-        if key not in self.cache:
-            self.miss_count += 1
-            logger.debug(f"Cache miss: {key}")
-            return None
-
-        entry = self.cache[key]
-        if entry.is_expired():
-            del self.cache[key]
-            self.miss_count += 1
-            logger.debug(f"Cache expired: {key}")
-            return None
-
-        self.hit_count += 1
-        logger.debug(f"Cache hit: {key}")
-        return entry.access()
+        with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(key)
+
+            entry = self.cache.get(key)
+            if entry is not None and entry.is_expired():
+                self._expire(key)
+                entry = None
+
+            stats = self._namespace(key)
+            if entry is None:
+                self.miss_count += 1
+                stats["miss_count"] += 1
+                return None
+
+            self.cache.move_to_end(key)
+            self.hit_count += 1
+            stats["hit_count"] += 1
+            return entry.access()
 
     def invalidate(self, key: str) -> None:
         """Invalidate a cache entry.
@@ -136,15 +278,84 @@ class PerformanceCache(Generic[T]):
             key: Cache key
 
         """
-        if key in self.cache:
-            del self.cache[key]
-            logger.debug(f"Invalidated cache entry: {key}")
+        with self._lock:
+            if key in self.cache:
+                self._remove(key)
+
+    def invalidate_namespace(self, namespace: str) -> int:
+        """Invalidate every entry of a namespace.
+
+        Args:
+            namespace: Key prefix before the namespace separator
+
+        Returns:
+            Number of invalidated entries
+
+        """
+        with self._lock:
+            keys = [key for key in self.cache if self._namespace_of(key) == namespace]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def purge_expired(self) -> int:
+        """Drop every entry whose timer wheel slot has passed.
+
+        Returns:
+            Number of expired entries removed
+
+        """
+        with self._lock:
+            before = self.expired_count
+            self._advance_wheel(time.monotonic())
+            return self.expired_count - before
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
+            self._wheel.clear()
+            for stats in self._namespace_stats.values():
+                stats["size"] = 0
         logger.debug("Cleared all cache entries")
 
+    def _slot(self, timestamp: float) -> int:
+        return int(timestamp // self._wheel_resolution)
+
+    def _advance_wheel(self, now: float) -> None:
+        """Expire the entries of every wheel slot that lies fully in the past."""
+        current = self._slot(now)
+        if current <= self._wheel_position:
+            return
+        # After a long idle period, visiting only occupied slots is cheaper
+        if current - self._wheel_position > len(self._wheel):
+            due = [slot for slot in self._wheel if slot < current]
+        else:
+            due = [slot for slot in range(self._wheel_position, current) if slot in self._wheel]
+        for slot in due:
+            for key in self._wheel.pop(slot):
+                entry = self.cache.get(key)
+                # The key may have been overwritten with a later expiry since
+                if entry is not None and entry.is_expired(now):
+                    self._expire(key)
+        self._wheel_position = current
+
+    def _expire(self, key: str) -> None:
+        self._remove(key)
+        self.expired_count += 1
+        self._namespace(key)["expired_count"] += 1
+
+    def _remove(self, key: str) -> None:
+        del self.cache[key]
+        self._namespace(key)["size"] -= 1
+
+    def _namespace_of(self, key: str) -> str:
+        namespace, separator, _ = key.partition(self.namespace_separator)
+        return namespace if separator else ""
+
+    def _namespace(self, key: str) -> Counter[str]:
+        return self._namespace_stats[self._namespace_of(key)]
+
     def get_hit_rate(self) -> float:
         """Get cache hit rate.
 
@@ -157,6 +368,29 @@ class PerformanceCache(Generic[T]):
             return 0.0
         return (self.hit_count / total) * 100
 
+    def get_namespace_stats(self, namespace: str) -> dict[str, Any]:
+        """Get statistics of one namespace.
+
+        Args:
+            namespace: Key prefix before the namespace separator ("" for keys without one)
+
+        Returns:
+            Dictionary with namespace statistics
+
+        """
+        with self._lock:
+            stats = self._namespace_stats.get(namespace, Counter())
+            hits, misses = stats["hit_count"], stats["miss_count"]
+            return {
+                "size": stats["size"],
+                "hit_count": hits,
+                "miss_count": misses,
+                "hit_rate_percent": (hits / (hits + misses)) * 100 if hits + misses else 0.0,
+                "eviction_count": stats["eviction_count"],
+                "expired_count": stats["expired_count"],
+                "rejected_count": stats["rejected_count"],
+            }
+
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
 
@@ -164,14 +398,20 @@ class PerformanceCache(Generic[T]):
             Dictionary with cache statistics
 
         """
-        return {
-            "size": len(self.cache),
-            "max_size": self.max_size,
-            "hit_count": self.hit_count,
-            "miss_count": self.miss_count,
-            "hit_rate_percent": self.get_hit_rate(),
-            "utilization_percent": (len(self.cache) / self.max_size) * 100,
-        }
+        with self._lock:
+            return {
+                "size": len(self.cache),
+                "max_size": self.max_size,
+                "admission": self.admission,
+                "hit_count": self.hit_count,
+                "miss_count": self.miss_count,
+                "hit_rate_percent": self.get_hit_rate(),
+                "eviction_count": self.eviction_count,
+                "expired_count": self.expired_count,
+                "rejected_count": self.rejected_count,
+                "utilization_percent": (len(self.cache) / self.max_size) * 100,
+                "namespaces": {namespace: self.get_namespace_stats(namespace) for namespace in self._namespace_stats},
+            }
 
 
 class BatchProcessor:
@@ -0,0 +1,7 @@
+"""SQL table definitions."""
+
+from .base import metadata
+
+__all__ = [
+    "metadata",
+]
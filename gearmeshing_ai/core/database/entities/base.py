@@ -0,0 +1,53 @@
+"""Shared building blocks of the SQL table definitions.
+
+Every table of the application is declared on the ``metadata`` collection
+defined here, so one ``create_all`` call creates the whole schema and indexes
+and constraints get predictable names on every database.
+
+Usage Guidelines:
+----------------
+
+my_table = Table(
+    "my_table",
+    metadata,
+    Column("id", String(64), primary_key=True),
+    created_at_column(),
+)
+
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, DateTime, MetaData
+
+NAMING_CONVENTION = {
+    "ix": "ix_%(table_name)s_%(column_0_N_name)s",
+    "uq": "uq_%(table_name)s_%(column_0_N_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
+
+metadata = MetaData(naming_convention=NAMING_CONVENTION)
+
+
+def utc_now() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime."""
+    return datetime.now(UTC)
+
+
+def as_utc(value: datetime | None) -> datetime | None:
+    """Make a datetime read from the database timezone-aware.
+
+    SQLite drops the timezone of stored datetimes; they are stored in UTC.
+    """
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=UTC)
+
+
+def created_at_column(name: str = "created_at", index: bool = False) -> Column:
+    """Create a timezone-aware timestamp column defaulting to the current time."""
+    return Column(name, DateTime(timezone=True), nullable=False, default=utc_now, index=index)
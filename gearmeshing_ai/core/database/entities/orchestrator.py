@@ -0,0 +1,97 @@
+"""SQL tables of the agent orchestrator.
+
+The orchestrator persists its workflow states, so a paused workflow can be
+resumed by any process, and keeps the history of workflows, approval requests,
+approval decisions and cancellations.
+
+Table Layout:
+------------
+
+1. **Workflow states**: One row per top-level field of a run's encoded state,
+   so a save only rewrites the fields that changed
+2. **Shared state values**: Encoded values shared by many states, such as
+   capability catalogs, stored once by content digest
+3. **Workflow history**: One row per run, with the columns history queries filter on
+4. **Approval decisions / cancellations**: Append-only, ordered by insertion
+5. **Approval requests**: The latest request of every run
+
+Every column a history query filters on is indexed.
+
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, LargeBinary, String, Table, Text
+
+from .base import created_at_column, metadata
+
+workflow_states = Table(
+    "orchestrator_workflow_states",
+    metadata,
+    Column("run_id", String(128), primary_key=True),
+    Column("field", String(128), primary_key=True),
+    Column("value", LargeBinary, nullable=False),
+    created_at_column("updated_at"),
+)
+
+shared_state_values = Table(
+    "orchestrator_shared_state_values",
+    metadata,
+    Column("digest", String(64), primary_key=True),
+    Column("value", LargeBinary, nullable=False),
+    created_at_column(),
+)
+
+workflow_history = Table(
+    "orchestrator_workflow_history",
+    metadata,
+    Column("run_id", String(128), primary_key=True),
+    Column("user_id", String(128), nullable=True, index=True),
+    Column("agent_role", String(128), nullable=True, index=True),
+    Column("status", String(64), nullable=True, index=True),
+    Column("task_description", Text, nullable=True),
+    created_at_column(index=True),
+    created_at_column("updated_at"),
+)
+
+approval_decisions = Table(
+    "orchestrator_approval_decisions",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("approval_id", String(128), nullable=False),
+    Column("run_id", String(128), nullable=False, index=True),
+    Column("decision", String(32), nullable=False, index=True),
+    Column("approver_id", String(128), nullable=False, index=True),
+    Column("decided_at", DateTime(timezone=True), nullable=False),
+    Column("reason", Text, nullable=True),
+    Column("alternative_action", Text, nullable=True),
+    Column("alternative_result", JSON, nullable=True),
+    Column("meta", JSON, nullable=False, default=dict),
+)
+
+cancellations = Table(
+    "orchestrator_cancellations",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("run_id", String(128), nullable=False, index=True),
+    Column("canceller_id", String(128), nullable=True, index=True),
+    Column("reason", Text, nullable=True),
+    created_at_column("cancelled_at"),
+    Column("meta", JSON, nullable=False, default=dict),
+)
+
+approval_requests = Table(
+    "orchestrator_approval_requests",
+    metadata,
+    Column("run_id", String(128), primary_key=True),
+    Column("operation", String(255), nullable=False),
+    Column("risk_level", String(32), nullable=False),
+    Column("description", Text, nullable=False),
+    created_at_column(),
+    Column("timeout_seconds", Integer, nullable=False),
+    Column("meta", JSON, nullable=False, default=dict),
+)
+
+# History pages of one user or role are read in creation order
+Index("ix_orchestrator_workflow_history_user_created", workflow_history.c.user_id, workflow_history.c.created_at)
+Index("ix_orchestrator_workflow_history_role_created", workflow_history.c.agent_role, workflow_history.c.created_at)
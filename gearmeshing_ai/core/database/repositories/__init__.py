@@ -0,0 +1,9 @@
+"""Async repositories over the SQL tables."""
+
+from .base import BaseRepository
+from .orchestrator import OrchestratorRepository
+
+__all__ = [
+    "BaseRepository",
+    "OrchestratorRepository",
+]
@@ -0,0 +1,282 @@
+"""Repository of the agent orchestrator's tables.
+
+Rows are plain dictionaries keyed by column name. Writes take whole batches,
+so a caller buffering saves persists them in one transaction.
+
+Workflow states are stored as named field blobs. A state write carries every
+field of the state plus the fields changed since the revision it was computed
+against, identified by the blob of its ``__meta`` field; only the changed
+fields are rewritten when the stored revision still is that one. The
+revision is replaced with a conditional update, so of two writers deriving
+a delta from the same revision only the first applies it and the other
+writes its state in full.
+
+Usage Guidelines:
+----------------
+
+repository = OrchestratorRepository("sqlite:///orchestrator.db")
+await repository.save_batch(states=[state_write], history=[history_row], decisions=[decision_row])
+fields = await repository.get_workflow_state_fields("run_123")
+
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Connection, Table, delete, insert, select, update
+
+from ..entities.base import as_utc, utc_now
+from ..entities.orchestrator import (
+    approval_decisions,
+    approval_requests,
+    cancellations,
+    shared_state_values,
+    workflow_history,
+    workflow_states,
+)
+from .base import BaseRepository
+
+ORCHESTRATOR_TABLES = (
+    workflow_states,
+    shared_state_values,
+    workflow_history,
+    approval_decisions,
+    cancellations,
+    approval_requests,
+)
+
+# Field whose blob identifies the revision of a stored state
+STATE_REVISION_FIELD = "__meta"
+
+
+def _replace(connection: Connection, table: Table, key: str, rows: list[dict[str, Any]]) -> None:
+    """Insert rows, replacing the existing rows with the same key.
+
+    Delete-then-insert is portable across databases, unlike upsert syntax.
+    """
+    if not rows:
+        return
+    connection.execute(delete(table).where(table.c[key].in_([row[key] for row in rows])))
+    connection.execute(insert(table), rows)
+
+
+def _replace_revision(connection: Connection, run_id: str, base_meta: bytes, meta: bytes, updated_at: Any) -> bool:
+    """Replace the stored revision of a run if it still is ``base_meta``.
+
+    The conditional update locks the revision row until the transaction ends,
+    so a concurrent writer of the same base revision finds it replaced.
+    """
+    result = connection.execute(
+        update(workflow_states)
+        .where(
+            workflow_states.c.run_id == run_id,
+            workflow_states.c.field == STATE_REVISION_FIELD,
+            workflow_states.c.value == base_meta,
+        )
+        .values(value=meta, updated_at=updated_at)
+    )
+    return result.rowcount == 1
+
+
+def _write_states(connection: Connection, states: list[dict[str, Any]], stats: dict[str, int]) -> None:
+    """Write state field rows, as deltas where the stored revision allows it."""
+    rows = []
+    full_runs = []
+    for write in states:
+        run_id, fields, updated_at = write["run_id"], write["fields"], write.get("updated_at") or utc_now()
+        if write["base_meta"] is not None and _replace_revision(
+            connection, run_id, write["base_meta"], fields[STATE_REVISION_FIELD], updated_at
+        ):
+            names = [name for name in (*write["changed"], *write["removed"]) if name != STATE_REVISION_FIELD]
+            if names:
+                connection.execute(
+                    delete(workflow_states).where(
+                        workflow_states.c.run_id == run_id, workflow_states.c.field.in_(names)
+                    )
+                )
+            written = [name for name in write["changed"] if name != STATE_REVISION_FIELD]
+            stats["bytes_written"] += len(fields[STATE_REVISION_FIELD])
+            stats["delta_writes"] += 1
+        else:
+            full_runs.append(run_id)
+            written = list(fields)
+            stats["full_writes"] += 1
+        for name in written:
+            rows.append({"run_id": run_id, "field": name, "value": fields[name], "updated_at": updated_at})
+            stats["bytes_written"] += len(fields[name])
+
+    if full_runs:
+        connection.execute(delete(workflow_states).where(workflow_states.c.run_id.in_(full_runs)))
+    if rows:
+        connection.execute(insert(workflow_states), rows)
+
+
+def _rows(connection: Connection, statement: Any, datetime_columns: tuple[str, ...]) -> list[dict[str, Any]]:
+    rows = []
+    for row in connection.execute(statement).mappings():
+        entry = dict(row)
+        for column in datetime_columns:
+            entry[column] = as_utc(entry[column])
+        rows.append(entry)
+    return rows
+
+
+class OrchestratorRepository(BaseRepository):
+    """Repository of workflow states, history, approvals and cancellations.
+
+    Features:
+    --------
+    - Bulk writes of workflow states, history rows and approval decisions in one transaction
+    - Field-level state deltas and content-addressed shared values
+    - Indexed history queries with filtering and pagination
+    - Timezone-aware datetimes on every database
+
+    Example:
+    -------
+    >>> repository = OrchestratorRepository("sqlite:///orchestrator.db")
+    >>> await repository.save_batch(decisions=[row])
+    >>> await repository.get_approval_decisions(run_id="run_123")
+    [{'run_id': 'run_123', 'decision': 'approved', ...}]
+
+    """
+
+    async def save_batch(
+        self,
+        states: list[dict[str, Any]] | None = None,
+        shared: dict[str, bytes] | None = None,
+        history: list[dict[str, Any]] | None = None,
+        decisions: list[dict[str, Any]] | None = None,
+    ) -> dict[str, int]:
+        """Write a batch of rows in one transaction.
+
+        Args:
+            states: State writes, each with "run_id", "fields" (every field blob),
+                "changed" and "removed" (field names) and "base_meta" (the
+                revision blob the change is relative to, or None)
+            shared: Shared value blobs by digest, inserted when missing
+            history: Workflow history rows, replacing the stored row of their run
+            decisions: Approval decision rows to append
+
+        Returns:
+            Counts of "delta_writes", "full_writes" and "bytes_written"
+
+        """
+        states, shared = states or [], shared or {}
+        history, decisions = history or [], decisions or []
+        stats = {"delta_writes": 0, "full_writes": 0, "bytes_written": 0}
+        if not (states or shared or history or decisions):
+            return stats
+
+        def write(connection: Connection) -> None:
+            if shared:
+                existing = set(
+                    connection.execute(
+                        select(shared_state_values.c.digest).where(shared_state_values.c.digest.in_(list(shared)))
+                    ).scalars()
+                )
+                missing = [
+                    {"digest": digest, "value": value} for digest, value in shared.items() if digest not in existing
+                ]
+                if missing:
+                    connection.execute(insert(shared_state_values), missing)
+                    stats["bytes_written"] += sum(len(row["value"]) for row in missing)
+
+            if states:
+                _write_states(connection, states, stats)
+            _replace(connection, workflow_history, "run_id", history)
+            if decisions:
+                connection.execute(insert(approval_decisions), decisions)
+
+        await self.run_in_transaction(write)
+        return stats
+
+    async def get_workflow_state_fields(self, run_id: str) -> dict[str, bytes] | None:
+        """Get the stored field blobs of a run's state."""
+        statement = select(workflow_states.c.field, workflow_states.c.value).where(workflow_states.c.run_id == run_id)
+        rows = await self.run(lambda connection: connection.execute(statement).all())
+        return {field: bytes(value) for field, value in rows} or None
+
+    async def get_shared_values(self, digests: list[str]) -> dict[str, bytes]:
+        """Get stored shared value blobs by digest; missing digests are left out."""
+        if not digests:
+            return {}
+        statement = select(shared_state_values.c.digest, shared_state_values.c.value).where(
+            shared_state_values.c.digest.in_(digests)
+        )
+        rows = await self.run(lambda connection: connection.execute(statement).all())
+        return {digest: bytes(value) for digest, value in rows}
+
+    async def delete_workflow_state(self, run_id: str) -> None:
+        """Delete the stored state of a run; its history is kept."""
+        await self.run_in_transaction(
+            lambda connection: connection.execute(delete(workflow_states).where(workflow_states.c.run_id == run_id))
+        )
+
+    async def get_workflow_history(
+        self,
+        user_id: str | None = None,
+        agent_role: str | None = None,
+        status: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Get workflow history rows in creation order."""
+        statement = select(workflow_history)
+        if user_id:
+            statement = statement.where(workflow_history.c.user_id == user_id)
+        if agent_role:
+            statement = statement.where(workflow_history.c.agent_role == agent_role)
+        if status:
+            statement = statement.where(workflow_history.c.status == status)
+        statement = (
+            statement.order_by(workflow_history.c.created_at, workflow_history.c.run_id).limit(limit).offset(offset)
+        )
+        return await self.run(lambda connection: _rows(connection, statement, ("created_at", "updated_at")))
+
+    async def get_approval_decisions(
+        self,
+        run_id: str | None = None,
+        approver_id: str | None = None,
+        decision: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Get approval decision rows in insertion order."""
+        statement = select(approval_decisions)
+        if run_id:
+            statement = statement.where(approval_decisions.c.run_id == run_id)
+        if approver_id:
+            statement = statement.where(approval_decisions.c.approver_id == approver_id)
+        if decision:
+            statement = statement.where(approval_decisions.c.decision == decision)
+        statement = statement.order_by(approval_decisions.c.id).limit(limit).offset(offset)
+        return await self.run(lambda connection: _rows(connection, statement, ("decided_at",)))
+
+    async def add_cancellation(self, row: dict[str, Any]) -> None:
+        """Append a cancellation row."""
+        await self.run_in_transaction(lambda connection: connection.execute(insert(cancellations), [row]))
+
+    async def get_cancellations(self, run_id: str) -> list[dict[str, Any]]:
+        """Get the cancellation rows of a run in insertion order."""
+        statement = select(cancellations).where(cancellations.c.run_id == run_id).order_by(cancellations.c.id)
+        return await self.run(lambda connection: _rows(connection, statement, ("cancelled_at",)))
+
+    async def save_approval_request(self, row: dict[str, Any]) -> None:
+        """Store the approval request of a run, replacing the previous one."""
+        await self.run_in_transaction(lambda connection: _replace(connection, approval_requests, "run_id", [row]))
+
+    async def get_approval_request(self, run_id: str) -> dict[str, Any] | None:
+        """Get the approval request row of a run."""
+        statement = select(approval_requests).where(approval_requests.c.run_id == run_id)
+        rows = await self.run(lambda connection: _rows(connection, statement, ("created_at",)))
+        return rows[0] if rows else None
+
+    async def clear(self) -> None:
+        """Delete every row of the orchestrator's tables."""
+
+        def delete_all(connection: Connection) -> None:
+            for table in ORCHESTRATOR_TABLES:
+                connection.execute(delete(table))
+
+        await self.run_in_transaction(delete_all)
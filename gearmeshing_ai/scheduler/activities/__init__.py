@@ -13,7 +13,12 @@ Key Components:
 from .action_execute import ActionExecutionActivity, execute_action
 from .ai_workflow import AIWorkflowActivity, execute_ai_workflow
 from .base import BaseActivity
-from .data_fetch import DataFetchingActivity, evaluate_checking_point, fetch_monitoring_data
+from .data_fetch import (
+    DataFetchingActivity,
+    evaluate_checking_point,
+    evaluate_checking_points_batch,
+    fetch_monitoring_data,
+)
 
 __all__ = [
     "AIWorkflowActivity",
@@ -21,6 +26,7 @@ __all__ = [
     "BaseActivity",
     "DataFetchingActivity",
     "evaluate_checking_point",
+    "evaluate_checking_points_batch",
     "execute_action",
     "execute_ai_workflow",
     "fetch_monitoring_data",
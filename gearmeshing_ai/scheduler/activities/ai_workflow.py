@@ -11,6 +11,7 @@ from temporalio import activity
 
 from gearmeshing_ai.scheduler.activities.base import BaseActivity
 from gearmeshing_ai.scheduler.models.workflow import AIAction
+from gearmeshing_ai.scheduler.utils.blobs import get_blob_store, hydrate_values, is_blob_ref
 
 
 class AIWorkflowActivity(BaseActivity):
@@ -31,6 +32,10 @@ class AIWorkflowActivity(BaseActivity):
         This method executes AI-powered workflows by calling the orchestrator
         service with the appropriate parameters and context.
 
+        When the action's payloads were offloaded, ``data_item`` and
+        ``check_result`` only summarize them and the full values are taken from
+        the hydrated action parameters.
+
         Args:
             ai_action: AI action to execute
             data_item: Monitoring data that triggered the action
@@ -50,6 +55,12 @@ class AIWorkflowActivity(BaseActivity):
         start_time = datetime.utcnow()
 
         try:
+            # Resolve payload values passed as blob references
+            ai_action = self._hydrate_ai_action(ai_action)
+            if "data" not in data_item and isinstance(ai_action.parameters.get("data"), dict):
+                data_item = ai_action.parameters["data"]
+                check_result = ai_action.parameters.get("result", check_result)
+
             # Get orchestrator service
             orchestrator_service = self._get_orchestrator_service()
 
@@ -94,6 +105,29 @@ class AIWorkflowActivity(BaseActivity):
                 "checking_point_name": ai_action.checking_point_name,
             }
 
+    def _hydrate_ai_action(self, ai_action: AIAction) -> AIAction:
+        """Replace the blob references in an AI action's payloads with the stored values.
+
+        Args:
+            ai_action: AI action whose parameters and prompt variables may hold references
+
+        Returns:
+            AI action with inline payloads; the same instance if it holds no references
+
+        """
+        if not any(
+            is_blob_ref(value) for value in (*ai_action.parameters.values(), *ai_action.prompt_variables.values())
+        ):
+            return ai_action
+
+        store = get_blob_store()
+        return ai_action.model_copy(
+            update={
+                "parameters": hydrate_values(ai_action.parameters, store),
+                "prompt_variables": hydrate_values(ai_action.prompt_variables, store),
+            }
+        )
+
     def _get_orchestrator_service(self):
         """Get orchestrator service instance."""
         # Mock implementation - in real implementation, this would get the actual service
@@ -81,7 +81,7 @@ class BaseActivity:
                 "activity_name": activity_name,
                 "activity_id": activity.info().activity_id,
                 "workflow_id": activity.info().workflow_id,
-                "run_id": activity.info().run_id,
+                "run_id": activity.info().workflow_run_id,
                 "attempt": activity.info().attempt,
                 **context,
             },
@@ -101,7 +101,7 @@ class BaseActivity:
                 "activity_name": activity_name,
                 "activity_id": activity.info().activity_id,
                 "workflow_id": activity.info().workflow_id,
-                "run_id": activity.info().run_id,
+                "run_id": activity.info().workflow_run_id,
                 "attempt": activity.info().attempt,
                 **context,
             },
@@ -122,7 +122,7 @@ class BaseActivity:
                 "activity_name": activity_name,
                 "activity_id": activity.info().activity_id,
                 "workflow_id": activity.info().workflow_id,
-                "run_id": activity.info().run_id,
+                "run_id": activity.info().workflow_run_id,
                 "attempt": activity.info().attempt,
                 "error_type": type(error).__name__,
                 "error_message": str(error),
@@ -143,7 +143,7 @@ class BaseActivity:
             "activity_id": info.activity_id,
             "activity_type": info.activity_type.name,
             "workflow_id": info.workflow_id,
-            "run_id": info.run_id,
+            "run_id": info.workflow_run_id,
             "attempt": info.attempt,
             "heartbeat_timeout": info.heartbeat_timeout.total_seconds() if info.heartbeat_timeout else None,
             "start_to_close_timeout": info.start_to_close_timeout.total_seconds()
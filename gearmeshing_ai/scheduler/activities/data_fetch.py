@@ -4,8 +4,10 @@ This module contains activities for fetching data from external systems
 and evaluating checking points against monitoring data.
 """
 
+import asyncio
+import json
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from temporalio import activity
 
@@ -14,13 +16,22 @@ from gearmeshing_ai.scheduler.checking_points.base import (
     CheckingPoint,
     get_checking_point_class,
 )
-from gearmeshing_ai.scheduler.models.checking_point import CheckResult, CheckResultType
+from gearmeshing_ai.scheduler.checking_points.registry import checking_point_registry
+from gearmeshing_ai.scheduler.models.checking_point import CheckResult, CheckResultType, ItemEvaluation
 from gearmeshing_ai.scheduler.models.config import MonitorConfig
 from gearmeshing_ai.scheduler.models.monitoring import MonitoringData
+from gearmeshing_ai.scheduler.utils.fetching import FetchCoordinator, fetch_scope
 
 
 class DataFetchingActivity(BaseActivity):
-    """Activity for fetching monitoring data from external systems."""
+    """Activity for fetching monitoring data from external systems.
+
+    Checking point instances are kept per worker process and reused across
+    fetches with the same type and configuration, so their clients, task
+    snapshots and watermarks carry over between monitoring cycles.
+    """
+
+    _checking_point_instances: ClassVar[dict[tuple[str, str], CheckingPoint]] = {}
 
     def __init__(self, config: dict[str, Any] = None):
         super().__init__(config or {})
@@ -36,46 +47,64 @@ class DataFetchingActivity(BaseActivity):
         is responsible for fetching its own relevant data using the parent's client
         and utility methods. This replaces the old centralized data fetching logic.
 
+        Checking points fetch concurrently, at most ``max_concurrent_fetches`` at
+        a time, inside a shared ``fetch_scope``: requests to one source are
+        limited per its rate limit and identical requests share one upstream
+        call. A heartbeat reports progress after each checking point.
+
         Args:
             config: Monitoring configuration
 
         Returns:
-            List of monitoring data items
+            List of monitoring data items, in checking point order
 
         """
         self.log_activity_start("fetch_data", config_name=config.name)
 
         start_time = datetime.utcnow()
-        data_items = []
 
         try:
-            # Iterate through checking points and use their data fetching capabilities
             enabled_checking_points = config.get_enabled_checking_points()
+            limiter = asyncio.Semaphore(config.max_concurrent_fetches)
+            progress = {"completed": 0, "failed": 0, "total": len(enabled_checking_points), "items": 0}
 
-            for checking_point_config in enabled_checking_points:
+            async def fetch_checking_point(checking_point_config: dict[str, Any]) -> list[MonitoringData]:
                 cp_type = checking_point_config.get("type")
                 cp_config = checking_point_config.get("config", {})
+                fetched_data: list[MonitoringData] = []
 
                 try:
-                    # Get checking point instance
-                    checking_point = self._get_checking_point_instance(cp_type, cp_config)
-
-                    # Use checking point's decentralized data fetching capability
-                    if hasattr(checking_point, "fetch_data") and callable(checking_point.fetch_data):
-                        fetched_data = await checking_point.fetch_data(**cp_config)
-                        data_items.extend(fetched_data)
-
-                        self.logger.debug(
-                            f"Fetched {len(fetched_data)} items from {cp_type}",
-                            extra={"checking_point_type": cp_type, "item_count": len(fetched_data)},
-                        )
+                    async with limiter:
+                        # Get checking point instance
+                        checking_point = self._get_checking_point_instance(cp_type, cp_config)
+
+                        # Use checking point's decentralized data fetching capability
+                        if hasattr(checking_point, "fetch_data") and callable(checking_point.fetch_data):
+                            fetched_data = await checking_point.fetch_data(**cp_config)
+
+                    self.logger.debug(
+                        f"Fetched {len(fetched_data)} items from {cp_type}",
+                        extra={"checking_point_type": cp_type, "item_count": len(fetched_data)},
+                    )
                 except Exception as cp_error:
                     self.logger.warning(
                         f"Error fetching data from {cp_type}: {cp_error!s}",
                         extra={"checking_point_type": cp_type, "error": str(cp_error)},
                     )
                     # Continue with other checking points even if one fails
-                    continue
+                    progress["failed"] += 1
+
+                progress["completed"] += 1
+                progress["items"] += len(fetched_data)
+                self.heartbeat(dict(progress))
+                return fetched_data
+
+            coordinator = FetchCoordinator(max_concurrency_per_source=config.max_concurrent_fetches)
+            with fetch_scope(coordinator):
+                results = await asyncio.gather(
+                    *(fetch_checking_point(checking_point_config) for checking_point_config in enabled_checking_points)
+                )
+            data_items = [item for fetched_data in results for item in fetched_data]
 
             execution_time = self.measure_execution_time(start_time)
 
@@ -83,7 +112,9 @@ class DataFetchingActivity(BaseActivity):
                 "fetch_data",
                 data_items_count=len(data_items),
                 execution_time_ms=int(execution_time.total_seconds() * 1000),
-                data_types=list(set(item.type.value for item in data_items)),
+                data_types=list(set(item.type for item in data_items)),
+                failed_checking_points=progress["failed"],
+                **coordinator.get_stats(),
             )
 
             return data_items
@@ -96,7 +127,8 @@ class DataFetchingActivity(BaseActivity):
         """Get a checking point instance by name using the metaclass-based registry.
 
         This method instantiates the appropriate checking point class based on the name
-        by looking it up in the global checking point registry. The registry is populated
+        by looking it up in the global checking point registry, and reuses the
+        instance for later fetches with the same configuration. The registry is populated
         automatically via the CheckingPointMeta metaclass when checking point classes
         are defined and imported.
 
@@ -111,11 +143,21 @@ class DataFetchingActivity(BaseActivity):
             ValueError: If checking point name is not registered
 
         """
-        # Get the checking point class from the metaclass-based registry
-        cp_class = get_checking_point_class(cp_type)
+        key = (cp_type, json.dumps(cp_config, sort_keys=True, default=str))
+        checking_point = self._checking_point_instances.get(key)
+        if checking_point is None:
+            # Get the checking point class from the metaclass-based registry
+            cp_class = get_checking_point_class(cp_type)
+
+            # Instantiate the checking point with its configuration
+            checking_point = cp_class(config=cp_config)
+            self._checking_point_instances[key] = checking_point
+        return checking_point
 
-        # Instantiate and return the checking point with its configuration
-        return cp_class(config=cp_config)
+    @classmethod
+    def clear_checking_point_instances(cls) -> None:
+        """Forget the reused checking point instances."""
+        cls._checking_point_instances.clear()
 
 
 # Keep the original activity functions for Temporal workflow compatibility
@@ -147,7 +189,7 @@ async def evaluate_checking_point(checking_point: CheckingPoint, data: Monitorin
         checking_point_name=checking_point.name,
         checking_point_type=checking_point.type.value,
         data_item_id=data.id,
-        data_item_type=data.type.value,
+        data_item_type=data.type,
     )
 
     start_time = datetime.utcnow()
@@ -160,7 +202,7 @@ async def evaluate_checking_point(checking_point: CheckingPoint, data: Monitorin
                 checking_point_type=checking_point.type.value,
                 result_type=CheckResultType.SKIP,
                 should_act=False,
-                reason=f"Checking point cannot handle data type: {data.type.value}",
+                reason=f"Checking point cannot handle data type: {data.type}",
                 confidence=0.0,
             )
         else:
@@ -173,6 +215,9 @@ async def evaluate_checking_point(checking_point: CheckingPoint, data: Monitorin
             if not hasattr(result, "checking_point_type"):
                 result.checking_point_type = checking_point.type.value
 
+            # Large AI action payloads are offloaded here rather than in the workflow
+            result.ai_actions = checking_point.prepare_after_process(data, result)
+
         # Set evaluation duration
         execution_time = base.measure_execution_time(start_time)
         result.evaluation_duration_ms = int(execution_time.total_seconds() * 1000)
@@ -181,7 +226,7 @@ async def evaluate_checking_point(checking_point: CheckingPoint, data: Monitorin
             "evaluate_checking_point",
             checking_point_name=checking_point.name,
             data_item_id=data.id,
-            result_type=result.result_type.value,
+            result_type=result.result_type,
             should_act=result.should_act,
             confidence=result.confidence,
             execution_time_ms=result.evaluation_duration_ms,
@@ -206,3 +251,80 @@ async def evaluate_checking_point(checking_point: CheckingPoint, data: Monitorin
             confidence=0.0,
             error_message=str(e),
         )
+
+
+@activity.defn
+async def evaluate_checking_points_batch(
+    data_items: list[MonitoringData], checking_point_names: list[str]
+) -> list[ItemEvaluation]:
+    """Evaluate a chunk of monitoring data against several checking points.
+
+    Checking points are resolved from the registry by name and evaluated
+    in-process, so a chunk costs one activity round trip instead of one per
+    (item, checking point) pair. Evaluation of an item stops after the first
+    match of a checking point with ``stop_on_match`` set. Only results that
+    should be acted on are returned.
+
+    Args:
+        data_items: Monitoring data items to evaluate
+        checking_point_names: Registry names of the checking points, in evaluation order
+
+    Returns:
+        One compact evaluation per data item, in input order
+
+    """
+    base = BaseActivity()
+    base.log_activity_start(
+        "evaluate_checking_points_batch",
+        data_item_count=len(data_items),
+        checking_point_count=len(checking_point_names),
+    )
+
+    start_time = datetime.utcnow()
+
+    checking_points: list[tuple[str, CheckingPoint]] = []
+    unknown: dict[str, str] = {}
+    for name in checking_point_names:
+        checking_point = checking_point_registry.get_instance(name)
+        if checking_point is None:
+            unknown[name] = f"Unknown checking point: {name}"
+        else:
+            checking_points.append((name, checking_point))
+
+    evaluations = []
+    for data in data_items:
+        evaluation = ItemEvaluation(data_item_id=data.id, errors=dict(unknown))
+        for name, checking_point in checking_points:
+            if not checking_point.can_handle(data):
+                continue
+
+            try:
+                result = await checking_point.evaluate(data)
+                if result.should_act:
+                    result.ai_actions = checking_point.prepare_after_process(data, result)
+            except Exception as e:
+                base.log_activity_error(
+                    "evaluate_checking_points_batch",
+                    e,
+                    checking_point_name=name,
+                    data_item_id=data.id,
+                )
+                evaluation.errors[name] = str(e)
+                continue
+
+            evaluation.evaluated_count += 1
+            if result.should_act:
+                evaluation.matches[name] = result
+                if checking_point.stop_on_match:
+                    break
+        evaluations.append(evaluation)
+
+    execution_time = base.measure_execution_time(start_time)
+    base.log_activity_complete(
+        "evaluate_checking_points_batch",
+        data_item_count=len(data_items),
+        match_count=sum(len(evaluation.matches) for evaluation in evaluations),
+        execution_time_ms=int(execution_time.total_seconds() * 1000),
+    )
+
+    return evaluations
@@ -138,6 +138,7 @@ class CheckingPoint(metaclass=CheckingPointMeta):
     timeout_seconds: int = 600
     approval_required: bool = False
     approval_timeout_seconds: int = 3600
+    payload_reference_threshold: int = 0  # Offload larger AI action payload values to the blob store (0=inline)
 
     def __init__(self, config: dict[str, Any] | None = None):
         """Initialize the checking point.
@@ -158,6 +159,9 @@ class CheckingPoint(metaclass=CheckingPointMeta):
         self.timeout_seconds = self.config.get("timeout_seconds", self.timeout_seconds)
         self.approval_required = self.config.get("approval_required", self.approval_required)
         self.approval_timeout_seconds = self.config.get("approval_timeout_seconds", self.approval_timeout_seconds)
+        self.payload_reference_threshold = self.config.get(
+            "payload_reference_threshold", self.payload_reference_threshold
+        )
 
     @abstractmethod
     async def fetch_data(self, **kwargs) -> list[MonitoringData[dict[str, Any]]]:
@@ -293,6 +297,41 @@ class CheckingPoint(metaclass=CheckingPointMeta):
         # Default implementation creates a basic AI action
         return [self._create_ai_action(data, result)]
 
+    def prepare_after_process(self, data: MonitoringData, result: CheckResult) -> list[AIAction] | None:
+        """Create the AI actions in an activity, with large payload values offloaded.
+
+        Called by the evaluation activities, so the blob store is only written
+        outside of workflow code. Payload values larger than
+        ``payload_reference_threshold`` are replaced with blob references,
+        hydrated again by the AI workflow activity.
+
+        Args:
+            data: Monitoring data that was evaluated
+            result: Evaluation result
+
+        Returns:
+            AI actions with offloaded payloads, or None if offloading is disabled
+            and the workflow creates the actions itself
+
+        """
+        if self.payload_reference_threshold <= 0 or not result.should_act:
+            return None
+
+        from gearmeshing_ai.scheduler.utils.blobs import get_blob_store, offload_large_values
+
+        store = get_blob_store()
+        return [
+            ai_action.model_copy(
+                update={
+                    "parameters": offload_large_values(ai_action.parameters, store, self.payload_reference_threshold),
+                    "prompt_variables": offload_large_values(
+                        ai_action.prompt_variables, store, self.payload_reference_threshold
+                    ),
+                }
+            )
+            for ai_action in self.get_after_process(data, result)
+        ]
+
     def _create_ai_action(self, data: MonitoringData, result: CheckResult) -> AIAction:
         """Create an AI action for this checking point.
 
@@ -307,6 +346,13 @@ class CheckingPoint(metaclass=CheckingPointMeta):
         action_name = f"{self.name}_workflow"
         workflow_name = f"{self.type}_workflow"
 
+        parameters = {
+            "data": data.model_dump(),
+            "result": result.model_dump(),
+            "config": self.config,
+        }
+        prompt_variables = self._get_prompt_variables(data, result)
+
         return AIAction(
             name=action_name,
             type=AIActionType.WORKFLOW_EXECUTION,
@@ -318,12 +364,8 @@ class CheckingPoint(metaclass=CheckingPointMeta):
             approval_required=self.approval_required,
             approval_timeout_seconds=self.approval_timeout_seconds,
             priority=self.priority,
-            parameters={
-                "data": data.model_dump(),
-                "result": result.model_dump(),
-                "config": self.config,
-            },
-            prompt_variables=self._get_prompt_variables(data, result),
+            parameters=parameters,
+            prompt_variables=prompt_variables,
         )
 
     def _get_prompt_variables(self, data: MonitoringData, result: CheckResult) -> dict[str, Any]:
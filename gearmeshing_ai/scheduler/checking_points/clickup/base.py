@@ -1,3 +1,5 @@
+import asyncio
+import logging
 from abc import ABC
 from datetime import datetime
 from typing import Any
@@ -7,10 +9,29 @@ from clickup_mcp.models.dto.task import TaskListQuery, TaskResp
 from gearmeshing_ai.scheduler.checking_points.base import CheckingPoint
 from gearmeshing_ai.scheduler.models.checking_point import CheckResult
 from gearmeshing_ai.scheduler.models.monitoring import ClickUpTaskModel, MonitoringData, MonitoringDataType
+from gearmeshing_ai.scheduler.utils.clients import get_client_registry
+from gearmeshing_ai.scheduler.utils.fetching import current_fetch_coordinator
+
+logger = logging.getLogger(__name__)
 
 
 class ClickUpCheckingPoint(CheckingPoint, ABC):
-    """Base class for ClickUp checking points with client initialization."""
+    """Base class for ClickUp checking points with client initialization.
+
+    Tasks are fetched page by page until ClickUp reports the last page. With
+    ``incremental_fetch`` enabled, the checking point keeps a per-list
+    snapshot of tasks and a ``date_updated`` watermark: later fetches only
+    request tasks updated after the watermark and merge them into the
+    snapshot, so evaluators still see the full task set. Every
+    ``full_sync_every`` fetches, the snapshot is rebuilt from a full fetch to
+    drop deleted tasks.
+
+    Inside a ``fetch_scope``, list requests are limited per the ``rate_limit``
+    configuration and identical requests from several checking points share
+    one upstream call.
+    """
+
+    PAGE_SIZE = 100
 
     def __init__(self, config: dict[str, Any] | None = None):
         """Initialize the ClickUp checking point.
@@ -25,9 +46,19 @@ class ClickUpCheckingPoint(CheckingPoint, ABC):
         self.workspace_id = self.config.get("workspace_id")
         self.api_token = self.config.get("api_token")
 
+        # Task fetching configuration
+        self.incremental_fetch = self.config.get("incremental_fetch", False)
+        self.full_sync_every = self.config.get("full_sync_every", 50)
+        self.max_pages = self.config.get("max_pages", 100)
+
         # Client will be initialized lazily through the property
         self._clickup_client = None
 
+        # Per-list task snapshots and date_updated watermarks (milliseconds)
+        self._task_snapshots: dict[str, dict[str, TaskResp]] = {}
+        self._watermarks: dict[str, int] = {}
+        self._syncs_since_full: dict[str, int] = {}
+
     async def _get_client(self):
         """Get the initialized ClickUp client with lazy loading."""
         if self._clickup_client is None:
@@ -35,16 +66,22 @@ class ClickUpCheckingPoint(CheckingPoint, ABC):
         return self._clickup_client
 
     async def _setup_client(self) -> None:
-        """Setup ClickUp client using clickup-mcp-server library."""
-        from clickup_mcp import ClickUpAPIClientFactory
-
-        # Use the ClickUp MCP server client factory
-        ClickUpAPIClientFactory.reset()  # Reset to allow new instance
-        self._clickup_client = ClickUpAPIClientFactory.create(
-            api_token=self.api_token,
-            timeout=self.config.get("timeout_seconds", 30),
-            max_retries=self.config.get("max_retries", 3),
-            rate_limit_requests_per_minute=self.config.get("rate_limit", 100),
+        """Setup ClickUp client using clickup-mcp-server library.
+
+        The client is shared by every checking point using the same API token,
+        so its connection pool and rate limiter are shared as well.
+        """
+        from clickup_mcp.client import ClickUpAPIClient
+
+        self._clickup_client = get_client_registry().get_or_create(
+            "clickup",
+            self.api_token,
+            lambda: ClickUpAPIClient(
+                api_token=self.api_token,
+                timeout=self.config.get("timeout_seconds", 30),
+                max_retries=self.config.get("max_retries", 3),
+                rate_limit_requests_per_minute=self.config.get("rate_limit", 100),
+            ),
         )
 
     def _can_handle_data_type(self, data_type: str) -> bool:
@@ -68,17 +105,42 @@ class ClickUpCheckingPoint(CheckingPoint, ABC):
             List of TaskResp objects containing task data with proper typing
 
         """
-        client = await self._get_client()  # Lazy initialization happens here
-
         if not list_id:
             raise ValueError("list_id is required for task access")
 
-        # Build query with proper data model
-        query = TaskListQuery(limit=100, include_closed=True, page=0)
+        if self.incremental_fetch:
+            tasks = await self.sync_list_tasks(list_id)
+        else:
+            tasks = await self.fetch_list_tasks(list_id)
+
+        return self.filter_tasks(tasks, status=status, priority=priority)
+
+    async def get_tasks_of_lists(self, list_ids: list[str]) -> dict[str, list[TaskResp]]:
+        """Get the tasks of several lists concurrently.
+
+        Args:
+            list_ids: ClickUp list IDs to fetch tasks from
+
+        Returns:
+            Tasks keyed by list ID, in the order of ``list_ids``
+
+        """
+        results = await asyncio.gather(*(self.get_workspace_tasks(list_id=list_id) for list_id in list_ids))
+        return dict(zip(list_ids, results, strict=True))
+
+    @staticmethod
+    def filter_tasks(tasks: list[TaskResp], status: str | None = None, priority: str | None = None) -> list[TaskResp]:
+        """Filter tasks by status and priority.
 
-        # Use ClickUp MCP server client's task API with proper data models
-        tasks = await client.task.list_in_list(list_id, query)
+        Args:
+            tasks: Tasks to filter
+            status: Optional status filter
+            priority: Optional priority filter
 
+        Returns:
+            Tasks matching every given filter
+
+        """
         # Apply additional filters if needed using typed data models
         filtered_tasks: list[TaskResp] = []
         for task in tasks:
@@ -97,6 +159,109 @@ class ClickUpCheckingPoint(CheckingPoint, ABC):
 
         return filtered_tasks
 
+    async def fetch_list_tasks(self, list_id: str, updated_after: int | None = None) -> list[TaskResp]:
+        """Fetch every page of tasks in a list.
+
+        Args:
+            list_id: ClickUp list ID to fetch tasks from
+            updated_after: Only fetch tasks updated after this Unix time in milliseconds
+
+        Returns:
+            List of TaskResp objects across all pages
+
+        """
+        coordinator = current_fetch_coordinator()
+        if coordinator is None:
+            return await self._fetch_list_pages(list_id, updated_after)
+
+        tasks = await coordinator.fetch_once(
+            ("clickup", self.api_token, list_id, updated_after),
+            lambda: self._fetch_list_pages(list_id, updated_after),
+            source="clickup",
+            rate_limit_per_minute=self.config.get("rate_limit", 100),
+        )
+        return list(tasks)
+
+    async def _fetch_list_pages(self, list_id: str, updated_after: int | None) -> list[TaskResp]:
+        client = await self._get_client()  # Lazy initialization happens here
+
+        tasks: list[TaskResp] = []
+        for page in range(self.max_pages):
+            params = TaskListQuery(page=page, limit=self.PAGE_SIZE, include_closed=True).to_query()
+            if updated_after is not None:
+                params["date_updated_gt"] = updated_after
+            response = await client.get(f"/list/{list_id}/task", params=params)
+
+            if not response.success or not isinstance(response.data, dict):
+                raise RuntimeError(f"Failed to fetch tasks of list {list_id}: {response.error or response.status_code}")
+
+            page_tasks = response.data.get("tasks") or []
+            tasks.extend(TaskResp(**task_data) for task_data in page_tasks)
+
+            last_page = response.data.get("last_page")
+            if last_page or (last_page is None and len(page_tasks) < self.PAGE_SIZE):
+                break
+        else:
+            logger.warning(f"Stopped fetching tasks of list {list_id} after {self.max_pages} pages")
+
+        return tasks
+
+    async def sync_list_tasks(self, list_id: str) -> list[TaskResp]:
+        """Bring the task snapshot of a list up to date and return it.
+
+        The first sync, and every ``full_sync_every``-th one, fetches all tasks.
+        Other syncs only fetch tasks updated after the list's watermark.
+
+        Args:
+            list_id: ClickUp list ID to sync
+
+        Returns:
+            All tasks of the list
+
+        """
+        previous = self._task_snapshots.get(list_id)
+        syncs = self._syncs_since_full.get(list_id, 0)
+        full_sync = previous is None or (self.full_sync_every > 0 and syncs >= self.full_sync_every)
+        snapshot: dict[str, TaskResp] = {} if full_sync or previous is None else previous
+
+        if full_sync:
+            tasks = await self.fetch_list_tasks(list_id)
+            self._syncs_since_full[list_id] = 0
+        else:
+            tasks = await self.fetch_list_tasks(list_id, updated_after=self._watermarks.get(list_id))
+            self._syncs_since_full[list_id] = syncs + 1
+
+        watermark = None if full_sync else self._watermarks.get(list_id)
+        for task in tasks:
+            snapshot[task.id] = task
+            if task.date_updated and task.date_updated.isdigit():
+                watermark = max(watermark or 0, int(task.date_updated))
+
+        self._task_snapshots[list_id] = snapshot
+        if watermark is not None:
+            self._watermarks[list_id] = watermark
+
+        logger.debug(
+            f"Synced {len(tasks)} {'tasks' if full_sync else 'changed tasks'} of list {list_id}, "
+            f"{len(snapshot)} in snapshot"
+        )
+        return list(snapshot.values())
+
+    def get_watermark(self, list_id: str) -> int | None:
+        """Get the ``date_updated`` watermark of a list in milliseconds."""
+        return self._watermarks.get(list_id)
+
+    def reset_snapshots(self, list_id: str | None = None) -> None:
+        """Drop the task snapshot and watermark of one list, or of every list."""
+        if list_id is None:
+            self._task_snapshots.clear()
+            self._watermarks.clear()
+            self._syncs_since_full.clear()
+        else:
+            self._task_snapshots.pop(list_id, None)
+            self._watermarks.pop(list_id, None)
+            self._syncs_since_full.pop(list_id, None)
+
     def convert_to_monitoring_data(self, tasks: list[TaskResp]) -> list[MonitoringData[ClickUpTaskModel]]:
         """Convert ClickUp tasks to MonitoringData objects with typed task models.
 
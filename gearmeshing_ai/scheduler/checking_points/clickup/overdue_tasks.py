@@ -13,6 +13,7 @@ from gearmeshing_ai.scheduler.checking_points.base import CheckingPointType
 from gearmeshing_ai.scheduler.models.checking_point import CheckResult, CheckResultType
 from gearmeshing_ai.scheduler.models.monitoring import ClickUpTaskModel, MonitoringData
 from gearmeshing_ai.scheduler.models.workflow import AIAction
+from gearmeshing_ai.scheduler.utils.matching import compile_matcher
 
 from .base import ClickUpCheckingPoint
 
@@ -90,7 +91,7 @@ class OverdueTaskCheckingPoint(ClickUpCheckingPoint):
         """Fetch overdue tasks - different logic than urgent tasks.
 
         This method implements specific logic for overdue tasks:
-        - Uses parent's get_workspace_tasks() method
+        - Uses parent's get_tasks_of_lists() method to fetch lists concurrently
         - Fetches ALL tasks (not just high priority)
         - Filters by due date locally
         - Includes completed tasks that were overdue when completed
@@ -106,12 +107,9 @@ class OverdueTaskCheckingPoint(ClickUpCheckingPoint):
         if not list_ids:
             raise ValueError("list_ids must be provided for overdue task checking")
 
-        all_tasks = []
-
-        for list_id in list_ids:
-            # Use parent's get_workspace_tasks method (different parameters)
-            tasks = await self.get_workspace_tasks(list_id=list_id)
-            all_tasks.extend(tasks)
+        # Use parent's concurrent list fetching (no server-side filters)
+        tasks_by_list = await self.get_tasks_of_lists(list_ids)
+        all_tasks = [task for tasks in tasks_by_list.values() for task in tasks]
 
         # Filter overdue tasks locally (different filtering logic)
         overdue_tasks = self._filter_overdue_tasks(all_tasks)
@@ -239,8 +237,8 @@ class OverdueTaskCheckingPoint(ClickUpCheckingPoint):
                 impact_factors.append(f"High priority: {task_priority}")
 
             # Check impact keywords
-            text_content = f"{task_name} {task_description}".lower()
-            impact_keywords_found = [kw for kw in self.impact_keywords if kw in text_content]
+            text_content = f"{task_name} {task_description}"
+            impact_keywords_found = compile_matcher(self.impact_keywords).find_all(text_content)
             if impact_keywords_found:
                 impact_score += 0.3 * (len(impact_keywords_found) / len(self.impact_keywords))
                 impact_factors.append(f"Impact keywords: {', '.join(impact_keywords_found)}")
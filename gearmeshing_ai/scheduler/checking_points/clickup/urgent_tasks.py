@@ -80,7 +80,7 @@ class UrgentTaskCheckingPoint(ClickUpCheckingPoint):
         """Fetch urgent tasks using parent's initialized client.
 
         This method implements the specific data fetching logic for urgent tasks:
-        - Uses parent's get_workspace_tasks() method
+        - Uses parent's get_tasks_of_lists() method to fetch lists concurrently
         - Fetches tasks with high priority levels
         - Fetches tasks due soon
         - Applies urgent keyword filters
@@ -98,21 +98,15 @@ class UrgentTaskCheckingPoint(ClickUpCheckingPoint):
 
         all_urgent_tasks = []
 
-        for list_id in list_ids:
-            # Use parent's get_workspace_tasks method with initialized client
-            high_priority_tasks = await self.get_workspace_tasks(
-                list_id=list_id,
-                priority="urgent",  # ClickUp API specific
-            )
+        # Fetch every list once, concurrently, and apply both filters locally
+        tasks_by_list = await self.get_tasks_of_lists(list_ids)
+
+        for tasks in tasks_by_list.values():
+            high_priority_tasks = self.filter_tasks(tasks, priority="urgent")  # ClickUp API specific
             all_urgent_tasks.extend(high_priority_tasks)
 
-            # Fetch tasks due soon
-            due_soon_tasks = await self.get_workspace_tasks(
-                list_id=list_id,
-                status="in_progress",  # Only active tasks
-            )
-            # Filter by due date locally
-            due_soon_tasks = self._filter_tasks_due_soon(due_soon_tasks)
+            # Tasks due soon, among active tasks only
+            due_soon_tasks = self._filter_tasks_due_soon(self.filter_tasks(tasks, status="in_progress"))
             all_urgent_tasks.extend(due_soon_tasks)
 
         # Convert to monitoring data using parent's utility with typed ClickUpTaskModel
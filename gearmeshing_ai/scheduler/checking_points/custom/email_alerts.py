@@ -4,13 +4,13 @@ This checking point detects email alerts and triggers appropriate
 workflows for handling critical email notifications.
 """
 
-import re
 from typing import Any
 
 from gearmeshing_ai.scheduler.checking_points.base import CheckingPoint, CheckingPointType
 from gearmeshing_ai.scheduler.models.checking_point import CheckResult, CheckResultType
 from gearmeshing_ai.scheduler.models.monitoring import MonitoringData, MonitoringDataType
 from gearmeshing_ai.scheduler.models.workflow import AIAction
+from gearmeshing_ai.scheduler.utils.matching import PatternMatcher, compile_matcher
 
 
 class EmailCheckingPoint(CheckingPoint):
@@ -114,6 +114,26 @@ class EmailAlertCheckingPoint(CheckingPoint):
                 "high priority",
             ]
 
+    @property
+    def alert_matcher(self) -> PatternMatcher:
+        """Compiled matcher of the alert keywords."""
+        return compile_matcher(self.alert_keywords)
+
+    @property
+    def urgency_matcher(self) -> PatternMatcher:
+        """Compiled matcher of the urgency keywords."""
+        return compile_matcher(self.urgency_keywords)
+
+    @property
+    def domain_matcher(self) -> PatternMatcher:
+        """Compiled matcher of the sender domains."""
+        return compile_matcher(self.sender_domains)
+
+    @property
+    def subject_matcher(self) -> PatternMatcher:
+        """Compiled matcher of the subject patterns."""
+        return compile_matcher(patterns=self.subject_patterns)
+
     def can_handle(self, data: MonitoringData[dict[str, Any]]) -> bool:
         """Check if this checking point can handle the monitoring data.
 
@@ -132,27 +152,18 @@ class EmailAlertCheckingPoint(CheckingPoint):
             return False
 
         # Check if email contains alert indicators
+        # The matchers are case-insensitive
         email_data = data.data
-        subject = email_data.get("subject", "").lower()
-        body = email_data.get("body", "").lower()
-        sender = email_data.get("sender", "").lower()
-
-        # Check subject and body for alert keywords
-        for keyword in self.alert_keywords:
-            if keyword in subject or keyword in body:
-                return True
-
-        # Check sender domains
-        for domain in self.sender_domains:
-            if domain in sender:
-                return True
-
-        # Check subject patterns
-        for pattern in self.subject_patterns:
-            if re.search(pattern, subject, re.IGNORECASE):
-                return True
+        subject = email_data.get("subject", "")
+        body = email_data.get("body", "")
+        sender = email_data.get("sender", "")
 
-        return False
+        # Check subject and body for alert keywords, sender domains and subject patterns
+        return (
+            self.alert_matcher.matches(subject, body)
+            or self.domain_matcher.matches(sender)
+            or self.subject_matcher.matches(subject)
+        )
 
     def evaluate(self, data: MonitoringData[dict[str, Any]]) -> CheckResult:
         """Evaluate the monitoring data for email alerts.
@@ -170,21 +181,13 @@ class EmailAlertCheckingPoint(CheckingPoint):
         sender = email_data.get("sender", "")
 
         # Find alert keywords
-        found_alert_keywords = []
-        subject_lower = subject.lower()
-        body_lower = body.lower()
-
-        for keyword in self.alert_keywords:
-            if keyword in subject_lower or keyword in body_lower:
-                found_alert_keywords.append(keyword)
+        found_alert_keywords = self.alert_matcher.find_all(subject, body)
 
         # Find urgency indicators
-        found_urgency_keywords = []
+        found_urgency_keywords = self.urgency_matcher.find_all(subject, body)
         urgency_level = "normal"
-        for keyword in self.urgency_keywords:
-            if keyword in subject_lower or keyword in body_lower:
-                found_urgency_keywords.append(keyword)
-                urgency_level = self._determine_urgency_level(subject_lower, body_lower, found_urgency_keywords)
+        if found_urgency_keywords:
+            urgency_level = self._determine_urgency_level(subject.lower(), body.lower(), found_urgency_keywords)
 
         # Check sender domain
         sender_domain = self._extract_domain(sender)
@@ -1,14 +1,80 @@
+import asyncio
+import logging
 from abc import ABC
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from typing import Any
 
 from gearmeshing_ai.scheduler.checking_points.base import CheckingPoint
 from gearmeshing_ai.scheduler.models.checking_point import CheckResult
 from gearmeshing_ai.scheduler.models.monitoring import MonitoringData, MonitoringDataType
+from gearmeshing_ai.scheduler.utils.clients import get_client_registry
+
+logger = logging.getLogger(__name__)
+
+
+def _ts_value(ts: str) -> Decimal:
+    """Convert a Slack message timestamp such as ``1700000000.000100`` to a comparable number."""
+    try:
+        return Decimal(ts)
+    except (InvalidOperation, TypeError):
+        return Decimal(0)
+
+
+def _response_field(response: Any, name: str) -> Any:
+    """Read a field of a Slack response, whether it is a typed response or a dictionary."""
+    if isinstance(response, dict):
+        return response.get(name)
+    return getattr(response, name, None)
+
+
+class ChannelCursorStore:
+    """Latest seen message timestamp per Slack channel.
+
+    Timestamps only move forward, so a late or repeated page never makes a
+    channel re-read messages that were already fetched.
+    """
+
+    def __init__(self, cursors: dict[str, str] | None = None):
+        """Initialize channel cursor store.
+
+        Args:
+            cursors: Initial latest timestamps keyed by channel
+
+        """
+        self._cursors: dict[str, str] = dict(cursors or {})
+
+    def get(self, channel: str) -> str | None:
+        """Get the latest seen message timestamp of a channel."""
+        return self._cursors.get(channel)
+
+    def advance(self, channel: str, ts: str) -> None:
+        """Move the cursor of a channel to ``ts`` if it is newer."""
+        current = self._cursors.get(channel)
+        if current is None or _ts_value(ts) > _ts_value(current):
+            self._cursors[channel] = ts
+
+    def reset(self, channel: str | None = None) -> None:
+        """Forget the cursor of one channel, or of every channel."""
+        if channel is None:
+            self._cursors.clear()
+        else:
+            self._cursors.pop(channel, None)
+
+    def to_dict(self) -> dict[str, str]:
+        """Get a copy of every cursor, e.g. to persist them."""
+        return dict(self._cursors)
 
 
 class SlackCheckingPoint(CheckingPoint, ABC):
-    """Base class for Slack checking points with client initialization."""
+    """Base class for Slack checking points with client initialization.
+
+    Channel history is read page by page following Slack's cursor while
+    ``has_more`` is set. ``fetch_new_messages`` keeps the latest message
+    timestamp of each channel in a ``ChannelCursorStore`` and passes it as
+    ``oldest``, so every fetch returns exactly the messages posted since the
+    previous one.
+    """
 
     def __init__(self, config: dict[str, Any] | None = None):
         """Initialize the Slack checking point.
@@ -22,9 +88,17 @@ class SlackCheckingPoint(CheckingPoint, ABC):
         # Slack-specific configuration
         self.bot_token = self.config.get("bot_token")
 
+        # Message fetching configuration
+        self.channels = self.config.get("channels", [])
+        self.page_size = self.config.get("page_size", 200)
+        self.max_pages = self.config.get("max_pages", 50)
+
         # Client will be initialized lazily through the property
         self._slack_client = None
 
+        # Latest fetched message timestamp per channel
+        self.cursors = ChannelCursorStore()
+
     async def _get_client(self):
         """Get the initialized Slack client with lazy loading."""
         if self._slack_client is None:
@@ -32,14 +106,19 @@ class SlackCheckingPoint(CheckingPoint, ABC):
         return self._slack_client
 
     async def _setup_client(self) -> None:
-        """Setup Slack client using slack-mcp-server library."""
+        """Setup Slack client using slack-mcp-server library.
+
+        The client is shared by every checking point using the same bot token.
+        """
         from slack_mcp.client.manager import get_client_manager
 
         # Use the Slack MCP server client manager
         manager = get_client_manager()
-        self._slack_client = manager.get_async_client(
-            token=self.bot_token,
-            use_retries=self.config.get("use_retries", True),
+        use_retries = self.config.get("use_retries", True)
+        self._slack_client = get_client_registry().get_or_create(
+            "slack",
+            f"{self.bot_token}:{use_retries}",
+            lambda: manager.get_async_client(token=self.bot_token, use_retries=use_retries),
         )
 
     def _can_handle_data_type(self, data_type: str) -> bool:
@@ -51,16 +130,26 @@ class SlackCheckingPoint(CheckingPoint, ABC):
         channel: str,
         limit: int = 100,
         oldest: str | None = None,
+        max_pages: int | None = None,
     ) -> list[dict]:
         """Get messages from a Slack channel using MCP server client with proper data models.
 
+        Pages are followed with the response cursor while Slack reports
+        ``has_more``, up to ``max_pages`` pages. Without ``oldest`` only the
+        newest pages are wanted and reading stops at the limit.
+
         Args:
             channel: Slack channel ID or name
-            limit: Maximum number of messages to retrieve
+            limit: Maximum number of messages to retrieve per page
             oldest: Optional timestamp to get messages after
+            max_pages: Maximum number of pages; defaults to the ``max_pages`` configuration
 
         Returns:
-            List of message dictionaries
+            List of message dictionaries, newest first
+
+        Raises:
+            RuntimeError: If a page after the first fails, or if messages after
+                ``oldest`` remain unread after ``max_pages`` pages
 
         """
         from slack_mcp.mcp.model.input import SlackReadChannelMessagesInput
@@ -74,19 +163,106 @@ class SlackCheckingPoint(CheckingPoint, ABC):
             oldest=oldest,
         )
 
-        # Use Slack MCP server client's conversations_history method
-        # This returns a structured SlackChannelMessagesResponse data model
-        response = await client.conversations_history(
-            channel=input_params.channel,
-            limit=input_params.limit,
-            oldest=input_params.oldest,
+        messages: list[dict] = []
+        cursor = None
+        for _ in range(max_pages or self.max_pages):
+            kwargs: dict[str, Any] = {"channel": input_params.channel, "limit": input_params.limit}
+            if input_params.oldest:
+                kwargs["oldest"] = input_params.oldest
+            if cursor:
+                kwargs["cursor"] = cursor
+
+            # Use Slack MCP server client's conversations_history method
+            response = await client.conversations_history(**kwargs)
+            if not _response_field(response, "ok"):
+                if not messages:
+                    return []
+                # Returning the newer pages alone would move the channel cursor past the missing ones
+                raise RuntimeError(
+                    f"Failed to read messages of channel {channel}: {_response_field(response, 'error')}"
+                )
+
+            messages.extend(_response_field(response, "messages") or [])
+
+            cursor = (_response_field(response, "response_metadata") or {}).get("next_cursor")
+            if not _response_field(response, "has_more") or not cursor:
+                break
+        else:
+            if input_params.oldest:
+                # Returning the newest pages alone would move the channel cursor past the unread older ones
+                raise RuntimeError(
+                    f"Channel {channel} has more than {max_pages or self.max_pages} pages of messages "
+                    f"after {input_params.oldest}; increase max_pages to catch up"
+                )
+            logger.debug(f"Stopped reading channel {channel} after {max_pages or self.max_pages} pages")
+
+        return messages
+
+    async def fetch_new_messages(self, channel: str) -> list[dict]:
+        """Get the messages posted to a channel since the previous call.
+
+        The first call for a channel only reads the latest page, to start the
+        cursor without replaying the channel's whole history.
+
+        Args:
+            channel: Slack channel ID or name
+
+        Returns:
+            New message dictionaries, oldest first, each with its ``channel``
+
+        """
+        oldest = self.cursors.get(channel)
+        messages = await self.get_channel_messages(
+            channel,
+            limit=self.page_size,
+            oldest=oldest,
+            max_pages=None if oldest else 1,
         )
 
-        # Return messages from the structured response
-        # SlackChannelMessagesResponse has typed fields: ok, messages, has_more, etc.
-        if response.ok and response.messages:
-            return response.messages
-        return []
+        messages = sorted(messages, key=lambda message: _ts_value(message.get("ts", "")))
+        for message in messages:
+            message.setdefault("channel", channel)
+            if message.get("ts"):
+                self.cursors.advance(channel, message["ts"])
+        return messages
+
+    async def fetch_data(self, channels: list[str] | None = None, **kwargs: Any) -> list[MonitoringData]:
+        """Fetch the new messages of every configured channel concurrently.
+
+        A channel that fails to be read is skipped and keeps its cursor, so its
+        messages are fetched in a later call; the other channels' messages are
+        still returned, since their cursors already moved past them.
+
+        Args:
+            channels: Optional Slack channel IDs to read; defaults to the ``channels`` configuration
+            **kwargs: Other checking point configuration, ignored
+
+        Returns:
+            List of MonitoringData objects for the new messages
+
+        Raises:
+            Exception: The first channel's error if every channel failed
+
+        """
+        channels = channels or self.channels
+        results = await asyncio.gather(
+            *(self.fetch_new_messages(channel) for channel in channels), return_exceptions=True
+        )
+
+        messages: list[dict] = []
+        errors: list[Exception] = []
+        for channel, result in zip(channels, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to fetch new messages of channel {channel}: {result}")
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                messages.extend(result)
+
+        if errors and len(errors) == len(channels):
+            raise errors[0]
+        return self.convert_to_monitoring_data(messages)
 
     def convert_to_monitoring_data(self, messages: list[dict]) -> list[MonitoringData]:
         """Convert Slack messages to MonitoringData objects.
@@ -11,6 +11,7 @@ from gearmeshing_ai.scheduler.checking_points.base import CheckingPoint, Checkin
 from gearmeshing_ai.scheduler.models.checking_point import CheckResult, CheckResultType
 from gearmeshing_ai.scheduler.models.monitoring import MonitoringData, MonitoringDataType
 from gearmeshing_ai.scheduler.models.workflow import AIAction
+from gearmeshing_ai.scheduler.utils.matching import PatternMatcher, compile_matcher
 
 
 class BotMentionCheckingPoint(CheckingPoint):
@@ -54,6 +55,11 @@ class BotMentionCheckingPoint(CheckingPoint):
                 f"{self.bot_name}",
             ]
 
+    @property
+    def mention_matcher(self) -> PatternMatcher:
+        """Compiled matcher of the mention patterns, shared by instances with the same patterns."""
+        return compile_matcher(self.mention_patterns)
+
     def can_handle(self, data: MonitoringData[dict[str, Any]]) -> bool:
         """Check if this checking point can handle the monitoring data.
 
@@ -72,13 +78,7 @@ class BotMentionCheckingPoint(CheckingPoint):
             return False
 
         # Check if message contains bot mention
-        message_text = data.data.get("text", "").lower()
-
-        for pattern in self.mention_patterns:
-            if pattern.lower() in message_text:
-                return True
-
-        return False
+        return self.mention_matcher.matches(data.data.get("text", ""))
 
     def evaluate(self, data: MonitoringData[dict[str, Any]]) -> CheckResult:
         """Evaluate the monitoring data for bot mentions.
@@ -109,10 +109,7 @@ class BotMentionCheckingPoint(CheckingPoint):
             )
 
         # Find mention patterns in message
-        found_patterns = []
-        for pattern in self.mention_patterns:
-            if pattern.lower() in message_text.lower():
-                found_patterns.append(pattern)
+        found_patterns = self.mention_matcher.find_all(message_text)
 
         if not found_patterns:
             return CheckResult(
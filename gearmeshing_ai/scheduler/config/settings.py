@@ -38,6 +38,16 @@ class SchedulerSettings(BaseSettings):
     temporal_namespace: str = Field(default="default", description="Temporal namespace")
     temporal_task_queue: str = Field(default="scheduler-tasks", description="Temporal task queue name")
     temporal_worker_count: int = Field(default=1, ge=1, le=10, description="Number of worker processes")
+    temporal_workload_task_queues: bool = Field(
+        default=False, description="Run fetch, evaluate, action and AI activities on their own task queues"
+    )
+    temporal_payload_compression: str = Field(default="none", description="Payload compression: none, gzip, zstd")
+    temporal_payload_compression_threshold_bytes: int = Field(
+        default=4096, ge=0, description="Minimum payload size in bytes to compress"
+    )
+    temporal_payload_compression_level: int | None = Field(
+        default=None, description="Payload compression level (default: algorithm default)"
+    )
 
     # Monitoring configuration
     monitoring_enabled: bool = Field(default=True, description="Whether monitoring is enabled")
@@ -117,6 +127,10 @@ class SchedulerSettings(BaseSettings):
             namespace=self.temporal_namespace,
             task_queue=self.temporal_task_queue,
             worker_count=self.temporal_worker_count,
+            workload_task_queues=self.temporal_workload_task_queues,
+            payload_compression=self.temporal_payload_compression,
+            payload_compression_threshold_bytes=self.temporal_payload_compression_threshold_bytes,
+            payload_compression_level=self.temporal_payload_compression_level,
         )
 
         # Create monitoring configuration
@@ -5,10 +5,10 @@ including configuration models, monitoring data models, workflow models, and che
 """
 
 from .base import BaseSchedulerModel
-from .checking_point import CheckResult
+from .checking_point import CheckResult, ItemEvaluation
 from .config import MonitorConfig, SchedulerConfig
 from .monitoring import MonitoringData, MonitoringDataType
-from .workflow import AIAction, AIWorkflowInput, AIWorkflowResult
+from .workflow import AIAction, AIWorkflowInput, AIWorkflowResult, MonitoringCycleState, SeenItem
 
 __all__ = [
     "AIAction",
@@ -16,8 +16,11 @@ __all__ = [
     "AIWorkflowResult",
     "BaseSchedulerModel",
     "CheckResult",
+    "ItemEvaluation",
     "MonitorConfig",
+    "MonitoringCycleState",
     "MonitoringData",
     "MonitoringDataType",
     "SchedulerConfig",
+    "SeenItem",
 ]
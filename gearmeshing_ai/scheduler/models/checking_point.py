@@ -11,6 +11,7 @@ from typing import Any
 from pydantic import Field, field_validator
 
 from .base import BaseSchedulerModel
+from .workflow import AIAction
 
 
 class CheckResultType(str, Enum):
@@ -65,6 +66,12 @@ class CheckResult(BaseSchedulerModel):
 
     action_parameters: dict[str, Any] = Field(default_factory=dict, description="Parameters for suggested actions")
 
+    ai_actions: list[AIAction] | None = Field(
+        default=None,
+        description="AI actions prepared by the evaluation activity with large payloads offloaded; "
+        "None lets the workflow create them",
+    )
+
     # Data processing information
     data_processed: bool = Field(default=False, description="Whether the data was successfully processed")
 
@@ -202,3 +209,29 @@ class CheckResult(BaseSchedulerModel):
         self.result_type = CheckResultType.SKIP
         self.should_act = False
         self.reason = reason
+
+
+class ItemEvaluation(BaseSchedulerModel):
+    """Compact outcome of evaluating one data item against several checking points.
+
+    Produced by the batch evaluation activity. Only actionable results are
+    kept; checking points that did not match are just counted, which keeps
+    activity payloads and workflow history small.
+    """
+
+    data_item_id: str = Field(..., description="ID of the evaluated data item")
+
+    matches: dict[str, CheckResult] = Field(
+        default_factory=dict,
+        description="Results that should be acted on, keyed by checking point name in evaluation order",
+    )
+
+    errors: dict[str, str] = Field(
+        default_factory=dict, description="Error messages keyed by the name of the failed checking point"
+    )
+
+    evaluated_count: int = Field(default=0, ge=0, description="Number of checking points that evaluated the item")
+
+    def has_matches(self) -> bool:
+        """Check if any checking point should act on the item."""
+        return bool(self.matches)
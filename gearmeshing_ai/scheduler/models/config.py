@@ -26,6 +26,22 @@ class SchedulerTemporalConfig(BaseSchedulerModel):
 
     worker_poll_timeout: timedelta = Field(default=timedelta(seconds=30), description="Worker poll timeout")
 
+    workload_task_queues: bool = Field(
+        default=False,
+        description="Run the fetch, evaluate, action and AI activities on their own task queues",
+    )
+
+    workload_max_concurrent_activities: dict[str, int] = Field(
+        default_factory=lambda: {"fetch": 4, "evaluate": 50, "action": 10, "ai": 2},
+        description="Maximum concurrent activities per workload when workload task queues are used",
+    )
+
+    max_cached_workflows: int = Field(default=1000, ge=0, description="Maximum workflows cached per worker")
+
+    max_concurrent_workflow_tasks: int | None = Field(
+        default=None, ge=1, description="Maximum concurrent workflow tasks per worker (default: Temporal default)"
+    )
+
     # Client configuration
     client_timeout: timedelta = Field(default=timedelta(seconds=10), description="Client connection timeout")
 
@@ -36,6 +52,91 @@ class SchedulerTemporalConfig(BaseSchedulerModel):
 
     retry_maximum_interval: timedelta = Field(default=timedelta(minutes=1), description="Maximum retry interval")
 
+    # Payload compression configuration
+    payload_compression: str = Field(default="none", description="Payload compression: none, gzip, zstd")
+
+    payload_compression_threshold_bytes: int = Field(
+        default=4096, ge=0, description="Minimum payload size in bytes to compress"
+    )
+
+    payload_compression_level: int | None = Field(
+        default=None, description="Compression level (default: algorithm default)"
+    )
+
+    @field_validator("workload_max_concurrent_activities")
+    @classmethod
+    def validate_workload_max_concurrent_activities(cls, v: dict[str, int]) -> dict[str, int]:
+        """Validate per-workload activity concurrency."""
+        valid_workloads = ["fetch", "evaluate", "action", "ai"]
+        for workload, limit in v.items():
+            if workload not in valid_workloads:
+                raise ValueError(f"Workload must be one of: {valid_workloads}")
+            if limit < 1:
+                raise ValueError(f"Maximum concurrent activities of workload {workload} must be at least 1")
+        return v
+
+    @field_validator("payload_compression")
+    @classmethod
+    def validate_payload_compression(cls, v: str) -> str:
+        """Validate payload compression algorithm."""
+        valid_algorithms = ["none", "gzip", "zstd"]
+        if v.lower() not in valid_algorithms:
+            raise ValueError(f"Payload compression must be one of: {valid_algorithms}")
+        return v.lower()
+
+    def get_task_queue(self, workload: str) -> str:
+        """Get the task queue of a workload.
+
+        Args:
+            workload: "workflow", "fetch", "evaluate", "action" or "ai"
+
+        Returns:
+            The workload's own queue when workload task queues are used, otherwise the shared queue
+
+        """
+        if not self.workload_task_queues or workload == "workflow":
+            return self.task_queue
+        return f"{self.task_queue}-{workload}"
+
+    def get_activity_task_queues(self) -> dict[str, str]:
+        """Get the task queue of every activity workload, for workflows to schedule activities on.
+
+        Returns:
+            Task queues keyed by workload; empty when every activity runs on the shared queue
+
+        """
+        if not self.workload_task_queues:
+            return {}
+        return {workload: self.get_task_queue(workload) for workload in ("fetch", "evaluate", "action", "ai")}
+
+    def route_monitor_config(self, monitor_config: "MonitorConfig") -> "MonitorConfig":
+        """Set the activity task queues of a monitoring configuration before its workflow is started.
+
+        Args:
+            monitor_config: Monitoring configuration
+
+        Returns:
+            Copy of the configuration whose activities are scheduled on their
+            workloads' task queues; queues already set in it are kept
+
+        """
+        task_queues = {**self.get_activity_task_queues(), **monitor_config.activity_task_queues}
+        return monitor_config.model_copy(update={"activity_task_queues": task_queues})
+
+    def get_max_concurrent_activities(self, workload: str) -> int:
+        """Get the maximum concurrent activities of a workload's worker.
+
+        Args:
+            workload: Activity workload
+
+        Returns:
+            The workload's limit when workload task queues are used, otherwise ``worker_count``
+
+        """
+        if not self.workload_task_queues:
+            return self.worker_count
+        return self.workload_max_concurrent_activities.get(workload, self.worker_count)
+
 
 class SchedulerMonitoringConfig(BaseSchedulerModel):
     """Configuration for monitoring settings."""
@@ -201,10 +302,57 @@ class MonitorConfig(BaseSchedulerModel):
     data_sources: list[dict[str, Any]] = Field(default_factory=list, description="List of data source configurations")
 
     # Execution configuration
+    parallel_evaluation: bool = Field(
+        default=False,
+        description="Evaluate data items and checking points concurrently instead of one activity at a time",
+    )
+
     max_concurrent_evaluations: int = Field(default=5, ge=1, description="Maximum number of concurrent evaluations")
 
+    max_concurrent_fetches: int = Field(
+        default=4, ge=1, description="Maximum number of checking points, and of requests per source, fetching at once"
+    )
+
+    evaluation_batch_size: int = Field(
+        default=0,
+        ge=0,
+        description="Data items evaluated per batch activity; 0 evaluates each item and checking point separately",
+    )
+
     evaluation_timeout_seconds: int = Field(default=120, ge=30, description="Timeout for evaluation in seconds")
 
+    # Change detection
+    skip_unchanged_items: bool = Field(
+        default=False, description="Skip evaluation of data items whose content has not changed since last processed"
+    )
+
+    reevaluate_unchanged_after_cycles: int = Field(
+        default=12,
+        ge=0,
+        description="Cycles after which an unchanged data item is evaluated again; 0 never re-evaluates it",
+    )
+
+    # Task routing
+    activity_task_queues: dict[str, str] = Field(
+        default_factory=dict,
+        description="Task queue per activity workload (fetch, evaluate, action, ai); unset workloads use the workflow's queue",
+    )
+
+    # History management
+    continue_as_new_after_cycles: int = Field(
+        default=500, ge=1, description="Monitoring cycles after which the workflow continues as a new run"
+    )
+
+    continue_as_new_after_history_events: int = Field(
+        default=10_000,
+        ge=100,
+        description="Workflow history length after which the workflow continues as a new run",
+    )
+
+    max_seen_digests: int = Field(
+        default=10_000, ge=0, description="Maximum number of seen-item digests kept and carried into a new run"
+    )
+
     # Error handling
     max_retry_attempts: int = Field(default=3, ge=0, description="Maximum retry attempts for failed evaluations")
 
@@ -257,5 +405,10 @@ class MonitorConfig(BaseSchedulerModel):
             "total_checking_points": len(self.checking_points),
             "enabled_checking_points": len(self.get_enabled_checking_points()),
             "data_sources_count": len(self.data_sources),
+            "parallel_evaluation": self.parallel_evaluation,
             "max_concurrent_evaluations": self.max_concurrent_evaluations,
+            "evaluation_batch_size": self.evaluation_batch_size,
+            "max_concurrent_fetches": self.max_concurrent_fetches,
+            "continue_as_new_after_cycles": self.continue_as_new_after_cycles,
+            "continue_as_new_after_history_events": self.continue_as_new_after_history_events,
         }
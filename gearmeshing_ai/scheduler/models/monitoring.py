@@ -4,6 +4,8 @@ This module contains models for representing monitoring data from external syste
 including ClickUp tasks, Slack messages, and other data sources.
 """
 
+import hashlib
+import json
 from datetime import datetime
 from enum import Enum
 from typing import Any, Generic, TypeVar
@@ -103,6 +105,21 @@ class MonitoringData(BaseSchedulerModel, Generic[T]):
         )
         return summary
 
+    def content_digest(self) -> str:
+        """Compute a digest of the item's content.
+
+        Capture and processing metadata (timestamps, status, errors) are left
+        out, so the same upstream content fetched in another cycle has the
+        same digest.
+
+        Returns:
+            Hex digest identifying the item's identity and data
+
+        """
+        content = self.model_dump(mode="json", include={"id", "type", "source", "data"})
+        payload = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
     def get_data_field(self, field_path: str, default: Any = None) -> Any:
         """Get a nested field from the data dictionary using dot notation.
 
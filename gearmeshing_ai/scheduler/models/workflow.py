@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
 
-from pydantic import Field, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 from .base import BaseSchedulerModel
 
@@ -176,8 +176,12 @@ class AIWorkflowInput(BaseSchedulerModel):
 
     # Core input data
     ai_action: AIAction = Field(..., description="AI action to execute")
-    data_item: dict[str, Any] = Field(..., description="Monitoring data that triggered this action")
-    check_result: dict[str, Any] = Field(..., description="Checking point evaluation result")
+    data_item: dict[str, Any] = Field(
+        ..., description="Monitoring data that triggered this action, or its summary when the action carries it"
+    )
+    check_result: dict[str, Any] = Field(
+        ..., description="Checking point evaluation result, or its summary when the action carries it"
+    )
 
     # Execution context
     execution_context: dict[str, Any] = Field(default_factory=dict, description="Additional execution context")
@@ -306,3 +310,126 @@ class AIWorkflowResult(BaseSchedulerModel):
         if self.duration_ms is not None:
             return timedelta(milliseconds=self.duration_ms)
         return None
+
+
+class SeenItem(BaseModel):
+    """Last successful processing of a monitoring data item.
+
+    Kept per item in ``MonitoringCycleState``, so it has no timestamps of its own
+    to keep the continue-as-new payload small.
+    """
+
+    digest: str = Field(description="Content digest of the item when it was processed")
+    cycle: int = Field(ge=0, description="Monitoring cycle in which the item was processed")
+    matched: list[str] = Field(
+        default_factory=list, description="Checking points that matched the item and were acted on"
+    )
+
+
+class MonitoringCycleState(BaseSchedulerModel):
+    """Compact state carried across continue-as-new runs of a monitoring workflow.
+
+    A monitoring workflow periodically restarts itself with a fresh history.
+    This model holds everything a new run needs to pick up where the previous
+    one stopped, and nothing else, so the continue-as-new payload stays small.
+    """
+
+    # Counters
+    cycles_completed: int = Field(default=0, ge=0, description="Monitoring cycles completed across all runs")
+    failed_cycles: int = Field(default=0, ge=0, description="Monitoring cycles that failed across all runs")
+    data_items_processed: int = Field(default=0, ge=0, description="Data items processed across all runs")
+    data_items_skipped: int = Field(default=0, ge=0, description="Unchanged data items skipped across all runs")
+    runs: int = Field(default=1, ge=1, description="Number of workflow runs, including the current one")
+
+    # Change detection
+    seen_digests: dict[str, SeenItem] = Field(
+        default_factory=dict,
+        description="Last successful processing of each data item, keyed by data item ID",
+    )
+
+    def record_cycle(self, data_items_processed: int = 0, data_items_skipped: int = 0, failed: bool = False) -> None:
+        """Record a finished monitoring cycle.
+
+        Args:
+            data_items_processed: Number of data items processed in the cycle
+            data_items_skipped: Number of unchanged data items skipped in the cycle
+            failed: Whether the cycle failed
+
+        """
+        self.cycles_completed += 1
+        self.data_items_processed += data_items_processed
+        self.data_items_skipped += data_items_skipped
+        if failed:
+            self.failed_cycles += 1
+
+    def is_unchanged(self, item_id: str, digest: str, max_age_cycles: int = 0) -> bool:
+        """Check whether an item was already processed with the same content.
+
+        Args:
+            item_id: Data item ID
+            digest: Current content digest of the item
+            max_age_cycles: Cycles after which an unchanged item counts as changed again; 0 never expires
+
+        Returns:
+            True if the item can be skipped
+
+        """
+        seen = self.seen_digests.get(item_id)
+        if seen is None or seen.digest != digest:
+            return False
+        return not max_age_cycles or self.cycles_completed - seen.cycle < max_age_cycles
+
+    def previous_matches(self, item_id: str, digest: str) -> list[str]:
+        """Get the checking points that matched an item when it last had the same content.
+
+        Args:
+            item_id: Data item ID
+            digest: Current content digest of the item
+
+        Returns:
+            Names of the matched checking points; empty if the item is new or has changed
+
+        """
+        seen = self.seen_digests.get(item_id)
+        if seen is None or seen.digest != digest:
+            return []
+        return list(seen.matched)
+
+    def mark_seen(self, item_id: str, digest: str, max_entries: int, matched: list[str] | None = None) -> None:
+        """Record the successful processing of an item.
+
+        The least recently recorded items are dropped beyond ``max_entries``.
+
+        Args:
+            item_id: Data item ID
+            digest: Content digest of the item
+            max_entries: Maximum number of recorded items
+            matched: Checking points that matched the item and were acted on
+
+        """
+        self.seen_digests.pop(item_id, None)
+        self.seen_digests[item_id] = SeenItem(digest=digest, cycle=self.cycles_completed, matched=matched or [])
+        while len(self.seen_digests) > max_entries:
+            del self.seen_digests[next(iter(self.seen_digests))]
+
+    def compact(self, max_seen_digests: int) -> "MonitoringCycleState":
+        """Create the state to carry into the next run.
+
+        Only the most recently recorded ``max_seen_digests`` digests are kept.
+
+        Args:
+            max_seen_digests: Maximum number of seen digests to carry forward
+
+        Returns:
+            New state for the next run
+
+        """
+        seen = list(self.seen_digests.items())
+        return MonitoringCycleState(
+            cycles_completed=self.cycles_completed,
+            failed_cycles=self.failed_cycles,
+            data_items_processed=self.data_items_processed,
+            data_items_skipped=self.data_items_skipped,
+            runs=self.runs + 1,
+            seen_digests=dict(seen[len(seen) - max_seen_digests :] if max_seen_digests else []),
+        )
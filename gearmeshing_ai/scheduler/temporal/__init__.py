@@ -7,14 +7,18 @@ Key Components:
 - Client: Temporal client wrapper for workflow management
 - Worker: Worker configuration and setup
 - Schedules: Schedule management for recurring workflows
+- Codec: Payload compression shared by the client and worker
 """
 
 from .client import TemporalClient
+from .codec import CompressionCodec, create_data_converter
 from .schedules import ScheduleManager
 from .worker import TemporalWorker
 
 __all__ = [
+    "CompressionCodec",
     "ScheduleManager",
     "TemporalClient",
     "TemporalWorker",
+    "create_data_converter",
 ]
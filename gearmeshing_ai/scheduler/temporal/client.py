@@ -10,7 +10,8 @@ from typing import Any
 from temporalio.client import Client
 from temporalio.common import RetryPolicy
 
-from gearmeshing_ai.scheduler.models.config import SchedulerTemporalConfig
+from gearmeshing_ai.scheduler.models.config import MonitorConfig, SchedulerTemporalConfig
+from gearmeshing_ai.scheduler.temporal.codec import create_data_converter, create_payload_codec
 
 
 class TemporalClient:
@@ -31,6 +32,7 @@ class TemporalClient:
         self.config = config
         self._client: Client | None = None
         self._connected = False
+        self.payload_codec = create_payload_codec(config)
 
     async def connect(self) -> None:
         """Connect to the Temporal server."""
@@ -47,6 +49,7 @@ class TemporalClient:
                 target_host=f"{self.config.host}:{self.config.port}",
                 namespace=self.config.namespace,
                 tls=tls_config,
+                data_converter=create_data_converter(self.config, self.payload_codec),
                 default_retry_policy=RetryPolicy(
                     initial_interval=timedelta(seconds=1),
                     maximum_interval=timedelta(minutes=1),
@@ -87,6 +90,9 @@ class TemporalClient:
     ) -> str:
         """Start a Temporal workflow.
 
+        Monitoring configurations among the arguments get the activity task
+        queues of the configured workloads.
+
         Args:
             workflow_class: Workflow class to start
             args: Workflow arguments
@@ -99,6 +105,7 @@ class TemporalClient:
         if not self._client:
             raise RuntimeError("Not connected to Temporal server")
 
+        args = tuple(self.config.route_monitor_config(arg) if isinstance(arg, MonitorConfig) else arg for arg in args)
         try:
             result = await self._client.start_workflow(workflow_class.run, args=args, **kwargs)
             return result.id
@@ -392,6 +399,15 @@ class TemporalClient:
         """Async context manager exit."""
         await self.disconnect()
 
+    def get_payload_codec_stats(self) -> dict[str, Any] | None:
+        """Get the payload compression statistics of this client.
+
+        Returns:
+            Codec statistics, or None when payload compression is disabled
+
+        """
+        return self.payload_codec.get_stats() if self.payload_codec else None
+
     def get_client(self) -> Client:
         """Get the underlying Temporal client.
 
@@ -0,0 +1,210 @@
+"""Payload compression for the scheduler's Temporal client and worker.
+
+Every workflow and activity input and result (monitor configurations, fetched
+monitoring data, check results, AI workflow inputs) is sent to the Temporal
+server and stored in workflow history. ``CompressionCodec`` compresses large
+payloads before they leave the process and decompresses them on the way back.
+
+Codec Behavior:
+--------------
+
+1. **Threshold**: Payloads smaller than ``threshold_bytes`` are left as they are
+2. **Only when smaller**: A compressed payload is only used if it is smaller
+   than the original
+3. **Self-describing**: Compressed payloads carry the ``binary/gzip`` or
+   ``binary/zstd`` encoding, so any codec instance can decode them whatever its
+   own algorithm, and uncompressed payloads pass through unchanged
+4. **Symmetric**: The client and the worker must both use the codec, see
+   ``create_data_converter``
+
+Usage Guidelines:
+----------------
+
+data_converter = create_data_converter(temporal_config)
+client = await Client.connect(target, data_converter=data_converter)
+
+"""
+
+import dataclasses
+import gzip
+from collections.abc import Sequence
+from typing import Any
+
+import temporalio.converter
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import DataConverter, PayloadCodec
+
+from gearmeshing_ai.scheduler.models.config import SchedulerTemporalConfig
+
+ENCODING_KEY = "encoding"
+COMPRESSION_ALGORITHMS = ("gzip", "zstd")
+
+
+def _zstd() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError("zstd payload compression requires the 'zstandard' package (gearmeshing-ai[zstd])") from e
+    return zstandard
+
+
+class CompressionCodec(PayloadCodec):
+    """Temporal payload codec compressing large payloads with gzip or zstd.
+
+    Features:
+    --------
+    - Size threshold below which payloads are not compressed
+    - gzip from the standard library, zstd through the optional ``zstandard`` package
+    - Decoding of every supported algorithm
+    - Compression ratio and byte counters
+
+    Example:
+    -------
+    >>> codec = CompressionCodec("gzip", threshold_bytes=1024)
+    >>> encoded = await codec.encode(payloads)
+    >>> await codec.decode(encoded) == payloads
+    True
+    >>> codec.get_stats()["compression_ratio"]
+    0.18
+
+    """
+
+    def __init__(self, algorithm: str = "gzip", threshold_bytes: int = 4096, level: int | None = None):
+        """Initialize compression codec.
+
+        Args:
+            algorithm: "gzip" or "zstd"
+            threshold_bytes: Minimum serialized payload size to compress
+            level: Compression level; defaults to the algorithm's default
+
+        """
+        if algorithm not in COMPRESSION_ALGORITHMS:
+            raise ValueError(f"Unknown payload compression algorithm: {algorithm}")
+        if algorithm == "zstd":
+            _zstd()
+
+        self.algorithm = algorithm
+        self.threshold_bytes = threshold_bytes
+        self.level = level
+        self.encoding = f"binary/{algorithm}".encode()
+
+        # Metrics
+        self.payloads_encoded = 0
+        self.payloads_compressed = 0
+        self.payloads_decompressed = 0
+        self.bytes_before_compression = 0
+        self.bytes_after_compression = 0
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.algorithm == "zstd":
+            level = self.level if self.level is not None else 3
+            compressed: bytes = _zstd().ZstdCompressor(level=level).compress(data)
+            return compressed
+        return gzip.compress(data, compresslevel=self.level if self.level is not None else 6)
+
+    @staticmethod
+    def _decompress(encoding: bytes, data: bytes) -> bytes:
+        if encoding == b"binary/zstd":
+            decompressed: bytes = _zstd().ZstdDecompressor().decompress(data)
+            return decompressed
+        return gzip.decompress(data)
+
+    async def encode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        """Compress the payloads above the size threshold.
+
+        Args:
+            payloads: Payloads to encode
+
+        Returns:
+            Encoded payloads, in the same order
+
+        """
+        encoded = []
+        for payload in payloads:
+            self.payloads_encoded += 1
+            serialized = payload.SerializeToString()
+            if len(serialized) < self.threshold_bytes:
+                encoded.append(payload)
+                continue
+
+            compressed = self._compress(serialized)
+            if len(compressed) >= len(serialized):
+                encoded.append(payload)
+                continue
+
+            self.payloads_compressed += 1
+            self.bytes_before_compression += len(serialized)
+            self.bytes_after_compression += len(compressed)
+            encoded.append(Payload(metadata={ENCODING_KEY: self.encoding}, data=compressed))
+        return encoded
+
+    async def decode(self, payloads: Sequence[Payload]) -> list[Payload]:
+        """Decompress the compressed payloads.
+
+        Args:
+            payloads: Payloads to decode
+
+        Returns:
+            Decoded payloads, in the same order
+
+        """
+        decoded = []
+        for payload in payloads:
+            encoding = payload.metadata.get(ENCODING_KEY, b"")
+            if encoding not in (b"binary/gzip", b"binary/zstd"):
+                decoded.append(payload)
+                continue
+            self.payloads_decompressed += 1
+            decoded.append(Payload.FromString(self._decompress(encoding, payload.data)))
+        return decoded
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get codec statistics."""
+        return {
+            "algorithm": self.algorithm,
+            "threshold_bytes": self.threshold_bytes,
+            "payloads_encoded": self.payloads_encoded,
+            "payloads_compressed": self.payloads_compressed,
+            "payloads_decompressed": self.payloads_decompressed,
+            "bytes_before_compression": self.bytes_before_compression,
+            "bytes_after_compression": self.bytes_after_compression,
+            "compression_ratio": (
+                self.bytes_after_compression / self.bytes_before_compression if self.bytes_before_compression else 1.0
+            ),
+        }
+
+
+def create_payload_codec(config: SchedulerTemporalConfig) -> CompressionCodec | None:
+    """Create the payload codec configured for the scheduler.
+
+    Args:
+        config: Temporal configuration
+
+    Returns:
+        Compression codec, or None when payload compression is disabled
+
+    """
+    if config.payload_compression == "none":
+        return None
+    return CompressionCodec(
+        algorithm=config.payload_compression,
+        threshold_bytes=config.payload_compression_threshold_bytes,
+        level=config.payload_compression_level,
+    )
+
+
+def create_data_converter(config: SchedulerTemporalConfig, codec: PayloadCodec | None = None) -> DataConverter:
+    """Create the data converter shared by the scheduler's client and worker.
+
+    Args:
+        config: Temporal configuration
+        codec: Payload codec to use instead of the configured one
+
+    Returns:
+        Default data converter, with the payload codec if one is configured
+
+    """
+    codec = codec or create_payload_codec(config)
+    if codec is None:
+        return temporalio.converter.default()
+    return dataclasses.replace(temporalio.converter.default(), payload_codec=codec)
@@ -10,6 +10,7 @@ from typing import Any
 from temporalio.client import Client
 
 from gearmeshing_ai.scheduler.models.config import MonitorConfig, SchedulerTemporalConfig
+from gearmeshing_ai.scheduler.workflows import SmartMonitoringWorkflow
 
 
 class ScheduleManager:
@@ -62,6 +63,9 @@ class ScheduleManager:
             if cron_expression and interval_seconds:
                 raise ValueError("Cannot specify both cron_expression and interval_seconds")
 
+            # Schedule the workflow's activities on their workloads' task queues
+            monitor_config = self.config.route_monitor_config(monitor_config)
+
             # Create schedule specification
             schedule_spec = {
                 "id": schedule_id,
@@ -307,17 +311,18 @@ class ScheduleManager:
             raise KeyError(f"Schedule not found: {schedule_id}")
 
         schedule_info = self._schedules[schedule_id]
-        monitor_config = schedule_info["monitor_config"]
+        monitor_config = self.config.route_monitor_config(schedule_info["monitor_config"])
 
         try:
             # Start the workflow immediately
-            workflow_id = await self.client.start_workflow(
-                "SmartMonitoringWorkflow",
-                args=(monitor_config,),
+            handle = await self.client.start_workflow(
+                SmartMonitoringWorkflow.run,
+                monitor_config,
                 id=f"{schedule_id}-manual-{datetime.utcnow().timestamp()}",
+                task_queue=self.config.task_queue,
             )
 
-            return workflow_id
+            return handle.id
 
         except Exception as e:
             raise RuntimeError(f"Failed to trigger schedule run for {schedule_id}: {e!s}")
@@ -6,6 +6,7 @@ workflows and activities in the scheduler system.
 
 import asyncio
 import signal
+from collections.abc import Callable
 from typing import Any
 
 from temporalio.client import Client
@@ -16,13 +17,25 @@ from temporalio.worker.workflow_sandbox import (
 
 from gearmeshing_ai.scheduler.activities import (
     evaluate_checking_point,
+    evaluate_checking_points_batch,
     execute_action,
     execute_ai_workflow,
     fetch_monitoring_data,
 )
 from gearmeshing_ai.scheduler.models.config import SchedulerTemporalConfig
+from gearmeshing_ai.scheduler.temporal.codec import create_data_converter, create_payload_codec
+from gearmeshing_ai.scheduler.utils.clients import get_client_registry
 from gearmeshing_ai.scheduler.workflows import AIWorkflowExecutor, SmartMonitoringWorkflow
 
+WORKLOADS = ("workflow", "fetch", "evaluate", "action", "ai")
+
+WORKLOAD_ACTIVITIES: dict[str, list[Callable[..., Any]]] = {
+    "fetch": [fetch_monitoring_data],
+    "evaluate": [evaluate_checking_point, evaluate_checking_points_batch],
+    "action": [execute_action],
+    "ai": [execute_ai_workflow],
+}
+
 
 class TemporalWorker:
     """Temporal worker with scheduler-specific configuration.
@@ -30,20 +43,96 @@ class TemporalWorker:
     This class provides a Temporal worker with the workflows and activities
     needed for the scheduler system, along with proper sandbox configuration
     and error handling.
+
+    The work is split into workloads: "workflow" (the workflows themselves),
+    "fetch", "evaluate", "action" and "ai". By default all of them share the
+    configured task queue. With ``workload_task_queues`` enabled each activity
+    workload gets its own task queue and concurrency limit, and the worker
+    polls one Temporal worker per queue; passing ``workloads`` restricts a
+    worker to some of them, so workloads can be scaled in separate processes.
     """
 
-    def __init__(self, config: SchedulerTemporalConfig) -> None:
+    def __init__(self, config: SchedulerTemporalConfig, workloads: list[str] | None = None) -> None:
         """Initialize the Temporal worker.
 
         Args:
             config: Temporal configuration
+            workloads: Workloads this worker runs; defaults to every workload
+
+        Raises:
+            ValueError: If a workload is unknown, or if the worker is restricted to
+                some workloads while they all share one task queue
 
         """
+        unknown = set(workloads or ()) - set(WORKLOADS)
+        if unknown:
+            raise ValueError(f"Unknown workloads: {sorted(unknown)}; must be among {list(WORKLOADS)}")
+        if workloads is not None and set(workloads) != set(WORKLOADS) and not config.workload_task_queues:
+            # Temporal would dispatch the other workloads' tasks of the shared queue to this worker
+            raise ValueError("Restricting a worker to some workloads requires workload_task_queues to be enabled")
+
         self.config = config
-        self._worker: Worker | None = None
+        self.workloads = list(workloads or WORKLOADS)
+        self._workers: dict[str, Worker] = {}
         self._client: Client | None = None
         self._running = False
         self._shutdown_event = asyncio.Event()
+        self.payload_codec = create_payload_codec(config)
+
+    @property
+    def _worker(self) -> Worker | None:
+        """The Temporal worker of the shared task queue, or the first one when queues are split."""
+        return next(iter(self._workers.values()), None)
+
+    def get_task_queue_workloads(self) -> dict[str, list[str]]:
+        """Group this worker's workloads by the task queue they are polled from.
+
+        Returns:
+            Workloads keyed by task queue
+
+        """
+        task_queues: dict[str, list[str]] = {}
+        for workload in self.workloads:
+            task_queues.setdefault(self.config.get_task_queue(workload), []).append(workload)
+        return task_queues
+
+    def _create_worker(
+        self, client: Client, task_queue: str, workloads: list[str], sandbox: SandboxRestrictions | None
+    ) -> Worker:
+        """Create the Temporal worker polling one task queue.
+
+        Args:
+            client: Connected Temporal client
+            task_queue: Task queue to poll
+            workloads: Workloads served from the task queue
+            sandbox: Workflow sandbox restrictions
+
+        Returns:
+            Temporal worker
+
+        """
+        activity_workloads = [workload for workload in workloads if workload in WORKLOAD_ACTIVITIES]
+        options: dict[str, Any] = {}
+        if "workflow" in workloads:
+            options["max_cached_workflows"] = self.config.max_cached_workflows
+            if self.config.max_concurrent_workflow_tasks is not None:
+                options["max_concurrent_workflow_tasks"] = self.config.max_concurrent_workflow_tasks
+        if activity_workloads:
+            options["max_concurrent_activities"] = (
+                sum(self.config.get_max_concurrent_activities(workload) for workload in activity_workloads)
+                if self.config.workload_task_queues
+                else self.config.worker_count
+            )
+
+        return Worker(
+            client=client,
+            task_queue=task_queue,
+            workflows=[SmartMonitoringWorkflow, AIWorkflowExecutor] if "workflow" in workloads else [],
+            activities=[activity for workload in activity_workloads for activity in WORKLOAD_ACTIVITIES[workload]],
+            sandbox=sandbox,
+            poll_timeout=self.config.worker_poll_timeout,
+            **options,
+        )
 
     async def start(self) -> None:
         """Start the Temporal worker."""
@@ -52,39 +141,28 @@ class TemporalWorker:
 
         try:
             # Create client
-            self._client = Client(
-                target_host=f"{self.config.host}:{self.config.port}",
+            client = await Client.connect(
+                f"{self.config.host}:{self.config.port}",
                 namespace=self.config.namespace,
+                data_converter=create_data_converter(self.config, self.payload_codec),
             )
+            self._client = client
 
             # Create sandbox restrictions
             sandbox = self._create_sandbox_restrictions()
 
-            # Create worker
-            self._worker = Worker(
-                client=self._client,
-                task_queue=self.config.task_queue,
-                workflows=[
-                    SmartMonitoringWorkflow,
-                    AIWorkflowExecutor,
-                ],
-                activities=[
-                    fetch_monitoring_data,
-                    evaluate_checking_point,
-                    execute_action,
-                    execute_ai_workflow,
-                ],
-                sandbox=sandbox,
-                max_concurrent_activities=self.config.worker_count,
-                poll_timeout=self.config.worker_poll_timeout,
-            )
+            # Create one worker per task queue
+            self._workers = {
+                task_queue: self._create_worker(client, task_queue, workloads, sandbox)
+                for task_queue, workloads in self.get_task_queue_workloads().items()
+            }
 
             # Set up signal handlers for graceful shutdown
             self._setup_signal_handlers()
 
-            # Start the worker
+            # Start the workers
             self._running = True
-            await self._worker.run()
+            await asyncio.gather(*(worker.run() for worker in self._workers.values()))
 
         except Exception as e:
             self._running = False
@@ -98,9 +176,8 @@ class TemporalWorker:
         self._running = False
         self._shutdown_event.set()
 
-        if self._worker:
-            await self._worker.shutdown()
-            self._worker = None
+        workers, self._workers = list(self._workers.values()), {}
+        await asyncio.gather(*(worker.shutdown() for worker in workers))
 
         if self._client:
             await self._client.close()
@@ -189,20 +266,17 @@ class TemporalWorker:
             "worker_count": self.config.worker_count,
             "poll_timeout": self.config.worker_poll_timeout.total_seconds(),
             "running": self._running,
-            "workflows": [
-                "SmartMonitoringWorkflow",
-                "AIWorkflowExecutor",
-            ],
+            "workloads": self.workloads,
+            "task_queues": self.get_task_queue_workloads(),
+            "workflows": ["SmartMonitoringWorkflow", "AIWorkflowExecutor"] if "workflow" in self.workloads else [],
             "activities": [
-                "fetch_monitoring_data",
-                "evaluate_checking_point",
-                "execute_action",
-                "execute_ai_workflow",
+                activity.__name__ for workload in self.workloads for activity in WORKLOAD_ACTIVITIES.get(workload, [])
             ],
             "config": {
                 "host": self.config.host,
                 "port": self.config.port,
                 "namespace": self.config.namespace,
+                "payload_compression": self.config.payload_compression,
             },
         }
 
@@ -213,7 +287,7 @@ class TemporalWorker:
             Worker metrics dictionary
 
         """
-        if not self._worker:
+        if not self._workers:
             return {"status": "not_running"}
 
         try:
@@ -223,6 +297,8 @@ class TemporalWorker:
                 "status": "running",
                 "task_queue": self.config.task_queue,
                 "worker_count": self.config.worker_count,
+                "task_queues": list(self._workers),
+                "payload_codec": self.payload_codec.get_stats() if self.payload_codec else None,
                 "timestamp": asyncio.get_event_loop().time(),
             }
 
@@ -265,6 +341,33 @@ class WorkerManager:
         """
         self._workers[name] = worker
 
+    def add_workload_workers(self, config: SchedulerTemporalConfig, workloads: list[str] | None = None) -> list[str]:
+        """Add one worker per workload, so each workload runs and scales independently.
+
+        A process can add every workload, or only some of them and leave the
+        others to other processes.
+
+        Args:
+            config: Temporal configuration; ``workload_task_queues`` must be enabled
+            workloads: Workloads to add; defaults to every workload
+
+        Returns:
+            Names of the added workers
+
+        Raises:
+            ValueError: If the workloads share one task queue
+
+        """
+        if not config.workload_task_queues:
+            raise ValueError("Workload workers require workload_task_queues to be enabled")
+
+        names = []
+        for workload in workloads or WORKLOADS:
+            name = f"{config.task_queue}:{workload}"
+            self.add_worker(name, TemporalWorker(config, workloads=[workload]))
+            names.append(name)
+        return names
+
     def remove_worker(self, name: str) -> None:
         """Remove a worker from the manager.
 
@@ -306,6 +409,9 @@ class WorkerManager:
 
         await asyncio.gather(*tasks, return_exceptions=True)
 
+        # Integration clients are shared by every worker of the process
+        await get_client_registry().close_all()
+
     async def _run_worker_with_error_handling(self, name: str, worker: TemporalWorker) -> None:
         """Run a worker with error handling.
 
@@ -6,14 +6,31 @@ including monitoring, health checks, and metrics collection.
 Key Components:
 - Health: Health check endpoints and status monitoring
 - Metrics: Metrics collection and reporting
+- Fetching: Rate-limited, de-duplicated concurrent data fetching
+- Clients: Shared integration clients per credentials
+- Blobs: Content-addressed storage of large workflow payloads
+- Matching: Compiled multi-keyword and pattern matchers
 """
 
+from .blobs import BlobStore, get_blob_store
+from .clients import IntegrationClientRegistry, get_client_registry
+from .fetching import FetchCoordinator, current_fetch_coordinator, fetch_scope
 from .health import HealthChecker, HealthStatus
+from .matching import PatternMatcher, compile_matcher
 from .metrics import MetricsCollector, SchedulerMetrics
 
 __all__ = [
+    "BlobStore",
+    "FetchCoordinator",
     "HealthChecker",
     "HealthStatus",
+    "IntegrationClientRegistry",
     "MetricsCollector",
+    "PatternMatcher",
     "SchedulerMetrics",
+    "compile_matcher",
+    "current_fetch_coordinator",
+    "fetch_scope",
+    "get_blob_store",
+    "get_client_registry",
 ]
@@ -0,0 +1,313 @@
+"""Content-addressed blob storage for large workflow payloads.
+
+Temporal records every workflow and activity input in the workflow history,
+and rejects payloads above 2MB. Large values, such as a task's full data,
+can instead be stored once in a ``BlobStore`` and passed around as a small
+reference holding their digest; the activity that needs them hydrates the
+reference back into the value.
+
+Storage Behavior:
+----------------
+
+1. **Content-addressed**: A value is stored under the SHA-256 digest of its
+   canonical JSON form, so equal values are stored once and writing the same
+   value again (e.g. on workflow replay) is a no-op
+2. **Filesystem-backed**: Blobs are files below the store's root directory,
+   sharded by the first two digest characters and written atomically
+3. **References**: A reference is the dictionary ``{"$blob": digest, "size": n}``
+4. **Retention**: Blobs not written for longer than the store's retention are
+   deleted; storing a value again renews it. Writes purge expired blobs at most
+   once per purge interval
+
+Usage Guidelines:
+----------------
+
+store = get_blob_store()
+parameters = offload_large_values(parameters, store, threshold_bytes=16_384)
+...
+parameters = hydrate_values(parameters, store)
+
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+BLOB_REF_KEY = "$blob"
+BLOB_STORE_DIR_ENV = "GEARMESHING_AI_BLOB_STORE_DIR"
+BLOB_RETENTION_ENV = "GEARMESHING_AI_BLOB_RETENTION_SECONDS"
+DEFAULT_BLOB_RETENTION = timedelta(days=7)
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+def is_blob_ref(value: Any) -> bool:
+    """Check whether a value is a blob reference."""
+    return isinstance(value, dict) and isinstance(value.get(BLOB_REF_KEY), str)
+
+
+class BlobStore:
+    """Filesystem-backed, content-addressed store of JSON values.
+
+    Features:
+    --------
+    - Values stored once per content digest
+    - Atomic writes, safe for concurrent writers of the same value
+    - Time-based retention, renewed whenever a value is stored again
+    - Write, de-duplication, read and purge counters
+
+    Example:
+    -------
+    >>> store = BlobStore("/var/lib/gearmeshing/blobs")
+    >>> digest = store.put({"name": "Fix login"})
+    >>> store.get(digest)
+    {'name': 'Fix login'}
+
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        retention: timedelta | None = DEFAULT_BLOB_RETENTION,
+        purge_interval: timedelta = timedelta(hours=1),
+    ):
+        """Initialize blob store.
+
+        Args:
+            root: Directory holding the blobs, created if missing
+            retention: How long a blob is kept after it was last stored; None keeps blobs forever.
+                Must be longer than the longest AI workflow, including its retries
+            purge_interval: Minimum time between two purges triggered by writes
+
+        """
+        self.root = Path(root)
+        self.retention = retention
+        self.purge_interval = purge_interval
+        self._last_purge = time.monotonic()
+        self._purge_lock = threading.Lock()
+
+        # Metrics
+        self.writes = 0
+        self.deduplicated = 0
+        self.reads = 0
+        self.purged = 0
+
+    def _path(self, digest: str) -> Path:
+        if len(digest) != 64 or not all(char in "0123456789abcdef" for char in digest):
+            raise ValueError(f"Invalid blob digest: {digest!r}")
+        return self.root / digest[:2] / f"{digest[2:]}.json"
+
+    def put(self, value: Any) -> str:
+        """Store a JSON-serializable value.
+
+        Args:
+            value: Value to store; non-JSON types such as datetimes are stored as strings
+
+        Returns:
+            Digest identifying the value
+
+        """
+        return self.put_bytes(_encode(value))
+
+    def put_bytes(self, encoded: bytes) -> str:
+        """Store a value already encoded as JSON.
+
+        Args:
+            encoded: UTF-8 JSON form of the value
+
+        Returns:
+            Digest identifying the value
+
+        """
+        self._purge_if_due()
+        digest = hashlib.sha256(encoded).hexdigest()
+        path = self._path(digest)
+        if path.exists():
+            try:
+                # Renew the retention of a value that is still referenced
+                os.utime(path)
+                self.deduplicated += 1
+                return digest
+            except FileNotFoundError:
+                # Purged in the meantime, write it again
+                pass
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(encoded)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self.writes += 1
+        return digest
+
+    def get(self, digest: str) -> Any:
+        """Load a stored value.
+
+        Args:
+            digest: Digest returned by ``put``
+
+        Returns:
+            Stored value
+
+        Raises:
+            KeyError: If no value is stored under the digest
+
+        """
+        try:
+            encoded = self._path(digest).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+        self.reads += 1
+        return json.loads(encoded)
+
+    def contains(self, digest: str) -> bool:
+        """Check whether a value is stored under a digest."""
+        return self._path(digest).exists()
+
+    def delete(self, digest: str) -> bool:
+        """Delete a stored value.
+
+        Returns:
+            True if the value existed
+
+        """
+        try:
+            self._path(digest).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def purge(self, older_than: timedelta | None = None) -> int:
+        """Delete the blobs that were not stored for a while.
+
+        Args:
+            older_than: Age of the blobs to delete; defaults to the store's retention
+
+        Returns:
+            Number of deleted blobs
+
+        """
+        max_age = older_than or self.retention
+        if max_age is None or not self.root.exists():
+            return 0
+
+        cutoff = time.time() - max_age.total_seconds()
+        deleted = 0
+        for path in self.root.glob("*/*"):
+            try:
+                if path.stat().st_mtime >= cutoff:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            # Leftovers of interrupted writes are removed, but not counted
+            if path.suffix == ".json":
+                deleted += 1
+        self.purged += deleted
+        return deleted
+
+    def _purge_if_due(self) -> None:
+        if self.retention is None or time.monotonic() - self._last_purge < self.purge_interval.total_seconds():
+            return
+        if not self._purge_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_purge = time.monotonic()
+            self.purge()
+        finally:
+            self._purge_lock.release()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics."""
+        return {
+            "root": str(self.root),
+            "writes": self.writes,
+            "deduplicated": self.deduplicated,
+            "reads": self.reads,
+            "purged": self.purged,
+        }
+
+
+def offload_large_values(values: dict[str, Any], store: BlobStore, threshold_bytes: int) -> dict[str, Any]:
+    """Replace the large values of a mapping with blob references.
+
+    Args:
+        values: Mapping whose top-level values may be offloaded
+        store: Store receiving the large values
+        threshold_bytes: Values whose JSON form is larger than this are offloaded
+
+    Returns:
+        New mapping with large values replaced by references
+
+    """
+    result = {}
+    for key, value in values.items():
+        encoded = _encode(value)
+        if len(encoded) > threshold_bytes and not is_blob_ref(value):
+            result[key] = {BLOB_REF_KEY: store.put_bytes(encoded), "size": len(encoded)}
+        else:
+            result[key] = value
+    return result
+
+
+def hydrate_values(values: dict[str, Any], store: BlobStore) -> dict[str, Any]:
+    """Replace the blob references of a mapping with the stored values.
+
+    Args:
+        values: Mapping whose top-level values may be references
+        store: Store holding the referenced values
+
+    Returns:
+        New mapping with references resolved
+
+    Raises:
+        KeyError: If a referenced value is missing from the store
+
+    """
+    return {key: store.get(value[BLOB_REF_KEY]) if is_blob_ref(value) else value for key, value in values.items()}
+
+
+_blob_store: BlobStore | None = None
+_blob_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+    """Get the process-wide blob store.
+
+    Its root is the ``GEARMESHING_AI_BLOB_STORE_DIR`` environment variable, or a
+    directory in the system temporary directory. Workers on several hosts need
+    the variable to point to a shared filesystem. Blobs are kept for
+    ``GEARMESHING_AI_BLOB_RETENTION_SECONDS`` seconds, 7 days by default; 0
+    keeps them forever.
+    """
+    global _blob_store
+    if _blob_store is None:
+        with _blob_store_lock:
+            if _blob_store is None:
+                root = os.environ.get(BLOB_STORE_DIR_ENV) or Path(tempfile.gettempdir()) / "gearmeshing-ai-blobs"
+                retention_seconds = os.environ.get(BLOB_RETENTION_ENV)
+                if retention_seconds is None:
+                    retention: timedelta | None = DEFAULT_BLOB_RETENTION
+                else:
+                    retention = timedelta(seconds=int(retention_seconds)) if int(retention_seconds) > 0 else None
+                _blob_store = BlobStore(root, retention=retention)
+    return _blob_store
+
+
+def set_blob_store(store: BlobStore | None) -> None:
+    """Replace the process-wide blob store; None restores the default on next use."""
+    global _blob_store
+    with _blob_store_lock:
+        _blob_store = store
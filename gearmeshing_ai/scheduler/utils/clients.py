@@ -0,0 +1,149 @@
+"""Shared integration clients for the scheduler system.
+
+Checking points talk to the same integrations (ClickUp, Slack) with the same
+credentials over and over. This module keeps one client per integration and
+credentials for the whole worker process, so connection pools, TLS sessions
+and per-token rate limiters survive across checking point instances and
+monitoring cycles.
+
+Usage Guidelines:
+----------------
+
+registry = get_client_registry()
+client = registry.get_or_create(
+    "clickup",
+    api_token,
+    lambda: ClickUpAPIClient(api_token=api_token),
+)
+
+"""
+
+import hashlib
+import inspect
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+def credentials_digest(credentials: str | None) -> str:
+    """Compute the digest identifying a set of credentials without keeping them."""
+    return hashlib.sha256((credentials or "").encode()).hexdigest()[:16]
+
+
+class IntegrationClientRegistry:
+    """Process-wide registry of shared integration clients.
+
+    Features:
+    --------
+    - One client per (integration, credentials digest)
+    - Creation under a lock, so concurrent callers never build duplicates
+    - Closing of every client on shutdown
+    - Hit and creation counters
+
+    Example:
+    -------
+    >>> registry = IntegrationClientRegistry()
+    >>> client = registry.get_or_create("clickup", token, build_client)
+    >>> registry.get_or_create("clickup", token, build_client) is client
+    True
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize integration client registry."""
+        self._clients: dict[tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.hits = 0
+        self.created = 0
+
+    def get_or_create(self, integration: str, credentials: str | None, factory: Callable[[], T]) -> T:
+        """Get the shared client of an integration and credentials, creating it on first use.
+
+        Args:
+            integration: Integration name, e.g. "clickup"
+            credentials: Token or other secret the client authenticates with
+            factory: Creates the client
+
+        Returns:
+            Shared client
+
+        """
+        key = (integration, credentials_digest(credentials))
+        with self._lock:
+            cached = self._clients.get(key)
+            if cached is not None:
+                self.hits += 1
+                # Keys are per integration, so the cached client is of the factory's type
+                return cast(T, cached)
+            client = factory()
+            self._clients[key] = client
+            self.created += 1
+        logger.debug(f"Created shared {integration} client ({key[1]})")
+        return client
+
+    def remove(self, integration: str, credentials: str | None) -> Any | None:
+        """Forget the shared client of an integration and credentials.
+
+        Returns:
+            The removed client, which the caller should close, or None
+
+        """
+        with self._lock:
+            return self._clients.pop((integration, credentials_digest(credentials)), None)
+
+    async def close_all(self) -> None:
+        """Close and forget every shared client."""
+        with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+        for (integration, _), client in clients:
+            close = getattr(client, "close", None) or getattr(client, "aclose", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"Failed to close shared {integration} client: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get registry statistics."""
+        with self._lock:
+            integrations: dict[str, int] = {}
+            for integration, _ in self._clients:
+                integrations[integration] = integrations.get(integration, 0) + 1
+            return {
+                "clients": len(self._clients),
+                "integrations": integrations,
+                "hits": self.hits,
+                "created": self.created,
+            }
+
+
+_client_registry: IntegrationClientRegistry | None = None
+_client_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> IntegrationClientRegistry:
+    """Get the process-wide integration client registry."""
+    global _client_registry
+    if _client_registry is None:
+        with _client_registry_lock:
+            if _client_registry is None:
+                _client_registry = IntegrationClientRegistry()
+    return _client_registry
+
+
+def reset_client_registry() -> None:
+    """Replace the process-wide registry with an empty one, without closing clients."""
+    global _client_registry
+    with _client_registry_lock:
+        _client_registry = None
@@ -0,0 +1,181 @@
+"""Concurrent data fetching helpers for the scheduler system.
+
+This module coordinates the upstream requests made while fetching one
+monitoring cycle's data, so checking points can fetch concurrently without
+exceeding an integration's rate limit or requesting the same data twice.
+
+Fetching Behavior:
+-----------------
+
+1. **Scoped**: A ``FetchCoordinator`` lives for one fetch cycle and is made
+   current with ``fetch_scope``; code outside a scope fetches directly
+2. **Per-source limits**: Requests to one source (e.g. "clickup") share a
+   semaphore whose size is derived from the source's rate limit
+3. **De-duplication**: Requests with the same key within a scope share one
+   upstream call, whether they overlap in time or not
+
+Usage Guidelines:
+----------------
+
+coordinator = FetchCoordinator(max_concurrency_per_source=4)
+with fetch_scope(coordinator):
+    tasks = await coordinator.fetch_once(
+        ("clickup", list_id),
+        lambda: fetch_tasks(list_id),
+        source="clickup",
+        rate_limit_per_minute=100,
+    )
+
+"""
+
+import asyncio
+import math
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_current_coordinator: ContextVar["FetchCoordinator | None"] = ContextVar("fetch_coordinator", default=None)
+
+
+def concurrency_for_rate_limit(rate_limit_per_minute: int, request_seconds: float, maximum: int) -> int:
+    """Compute how many requests may be in flight without exceeding a rate limit.
+
+    By Little's law, ``rate * latency`` requests in flight sustain the rate.
+
+    Args:
+        rate_limit_per_minute: Allowed requests per minute
+        request_seconds: Expected duration of one request in seconds
+        maximum: Upper bound of the result
+
+    Returns:
+        Concurrency between 1 and ``maximum``
+
+    """
+    return max(1, min(maximum, math.ceil(rate_limit_per_minute / 60 * request_seconds)))
+
+
+class FetchCoordinator:
+    """Per-cycle coordinator of concurrent upstream requests.
+
+    Features:
+    --------
+    - Per-source concurrency limits derived from rate limits
+    - De-duplication of requests by key for the lifetime of the coordinator
+    - Request and de-duplication counters
+
+    Example:
+    -------
+    >>> coordinator = FetchCoordinator()
+    >>> with fetch_scope(coordinator):
+    ...     await coordinator.fetch_once(("clickup", "list_1"), load, source="clickup")
+    >>> coordinator.get_stats()["requests"]
+    1
+
+    """
+
+    def __init__(self, max_concurrency_per_source: int = 4, request_seconds: float = 2.0):
+        """Initialize fetch coordinator.
+
+        Args:
+            max_concurrency_per_source: Maximum requests in flight per source
+            request_seconds: Expected duration of one request, used to size rate-limited sources
+
+        """
+        self.max_concurrency_per_source = max_concurrency_per_source
+        self.request_seconds = request_seconds
+        self._limiters: dict[str, asyncio.Semaphore] = {}
+        self._results: dict[Hashable, asyncio.Task] = {}
+
+        # Metrics
+        self.requests = 0
+        self.deduplicated = 0
+
+    def limiter(self, source: str, rate_limit_per_minute: int | None = None) -> asyncio.Semaphore:
+        """Get the semaphore limiting requests to a source.
+
+        The size is fixed by the first caller for the source.
+
+        Args:
+            source: Source identifier
+            rate_limit_per_minute: Allowed requests per minute to the source, if limited
+
+        Returns:
+            Semaphore shared by every request to the source
+
+        """
+        limiter = self._limiters.get(source)
+        if limiter is None:
+            concurrency = self.max_concurrency_per_source
+            if rate_limit_per_minute:
+                concurrency = concurrency_for_rate_limit(rate_limit_per_minute, self.request_seconds, concurrency)
+            limiter = self._limiters[source] = asyncio.Semaphore(concurrency)
+        return limiter
+
+    async def fetch_once(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[T]],
+        source: str,
+        rate_limit_per_minute: int | None = None,
+    ) -> T:
+        """Run a request once per key, within the limits of its source.
+
+        A failed request is not remembered, so a later caller retries it.
+
+        Args:
+            key: Identity of the requested data
+            fetch: Coroutine function performing the request
+            source: Source identifier
+            rate_limit_per_minute: Allowed requests per minute to the source, if limited
+
+        Returns:
+            Result of the request
+
+        """
+        task = self._results.get(key)
+        if task is not None and not (task.done() and (task.cancelled() or task.exception() is not None)):
+            self.deduplicated += 1
+        else:
+            self.requests += 1
+            task = asyncio.create_task(self._limited(fetch, self.limiter(source, rate_limit_per_minute)))
+            self._results[key] = task
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _limited(fetch: Callable[[], Awaitable[T]], limiter: asyncio.Semaphore) -> T:
+        async with limiter:
+            return await fetch()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get coordinator statistics."""
+        return {
+            "requests": self.requests,
+            "deduplicated": self.deduplicated,
+            "sources": sorted(self._limiters),
+        }
+
+
+def current_fetch_coordinator() -> FetchCoordinator | None:
+    """Get the coordinator of the enclosing ``fetch_scope``, if any."""
+    return _current_coordinator.get()
+
+
+@contextmanager
+def fetch_scope(coordinator: FetchCoordinator) -> Iterator[FetchCoordinator]:
+    """Make a coordinator current for the enclosed fetches.
+
+    Args:
+        coordinator: Coordinator to use
+
+    Yields:
+        The coordinator
+
+    """
+    token = _current_coordinator.set(coordinator)
+    try:
+        yield coordinator
+    finally:
+        _current_coordinator.reset(token)
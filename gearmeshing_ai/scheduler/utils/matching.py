@@ -0,0 +1,212 @@
+r"""Compiled multi-pattern matching for the scheduler system.
+
+Keyword-based checking points look for many keywords and patterns in every
+monitored item. This module compiles a checking point's keywords once. Small
+keyword sets are checked with one substring search per keyword, which runs in
+C; from ``AUTOMATON_MIN_KEYWORDS`` keywords on, they are compiled into an
+Aho-Corasick automaton, so every keyword hit in a text is found in a single
+scan whose cost does not grow with the number of keywords.
+
+Matching Behavior:
+-----------------
+
+1. **Keywords**: Literal substrings, matched case-insensitively by default,
+   overlapping hits included (e.g. both "@bot" and "bot" in "hi @bot")
+2. **Patterns**: Regular expressions, compiled once and searched per text
+3. **Hits**: Reported once each, in the order they were configured, as the
+   original keyword or pattern string
+4. **Normalized once**: Texts are lowercased once per search, so callers pass
+   them as they are
+5. **Cached**: ``compile_matcher`` returns the same matcher for the same
+   configuration, so checking point instances share compiled automata
+
+Usage Guidelines:
+----------------
+
+matcher = compile_matcher(("production", "customer"), patterns=(r"\[ALERT\]",))
+hits = matcher.find_all(subject, body)
+if matcher.matches(text):
+    ...
+
+"""
+
+import re
+from collections import deque
+from collections.abc import Iterable
+from functools import lru_cache
+
+# Keyword count from which the automaton's single Python-level scan is faster
+# than one substring search per keyword
+AUTOMATON_MIN_KEYWORDS = 200
+
+
+class PatternMatcher:
+    """Matcher of many keywords and regular expressions in one pass.
+
+    Features:
+    --------
+    - Substring searches for small keyword sets
+    - Aho-Corasick automaton over large keyword sets, linear in the text length
+    - Regular expressions compiled once
+    - Hits reported in configuration order, without duplicates
+    - Early exit for plain "does anything match" checks
+
+    Example:
+    -------
+    >>> matcher = PatternMatcher(["@bot", "bot"])
+    >>> matcher.find_all("Hi @Bot, can you help?")
+    ['@bot', 'bot']
+    >>> matcher.matches("nothing here")
+    False
+
+    """
+
+    def __init__(
+        self,
+        keywords: Iterable[str] = (),
+        patterns: Iterable[str] = (),
+        case_sensitive: bool = False,
+    ):
+        """Initialize pattern matcher.
+
+        Args:
+            keywords: Literal substrings to find
+            patterns: Regular expressions to search for
+            case_sensitive: Whether keywords and patterns are matched case-sensitively
+
+        """
+        self.keywords = list(keywords)
+        self.patterns = list(patterns)
+        self.case_sensitive = case_sensitive
+
+        flags = 0 if case_sensitive else re.IGNORECASE
+        self._regexes = [re.compile(pattern, flags) for pattern in self.patterns]
+
+        # Automaton states: transitions, failure link and the keyword indices ending there
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+        self._normalized = [self._normalize(keyword) for keyword in self.keywords]
+        # Empty keywords are contained in every text
+        self._always = [index for index, keyword in enumerate(self.keywords) if not keyword]
+        self._use_automaton = len(self.keywords) >= AUTOMATON_MIN_KEYWORDS
+        if self._use_automaton:
+            self._build()
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def _build(self) -> None:
+        for index, keyword in enumerate(self._normalized):
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state].append(index)
+
+        # Breadth-first, so the failure state of every parent is known first
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def _keyword_hits(self, text: str, hits: set[int], stop_at_first: bool = False) -> None:
+        text = self._normalize(text)
+        if not self._use_automaton:
+            for index, keyword in enumerate(self._normalized):
+                if index not in hits and keyword in text:
+                    hits.add(index)
+                    if stop_at_first:
+                        return
+            return
+
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                hits.update(output[state])
+                if stop_at_first:
+                    return
+
+    def find_all(self, *texts: str) -> list[str]:
+        """Find every keyword and pattern contained in any of the texts.
+
+        Args:
+            *texts: Texts to search
+
+        Returns:
+            Matched keywords, then matched patterns, in configuration order
+
+        """
+        keyword_hits: set[int] = set(self._always)
+        if len(keyword_hits) < len(self.keywords):
+            for text in texts:
+                self._keyword_hits(text, keyword_hits)
+
+        found = list(dict.fromkeys(self.keywords[index] for index in sorted(keyword_hits)))
+        found.extend(
+            pattern
+            for pattern, regex in zip(self.patterns, self._regexes, strict=True)
+            if any(regex.search(text) for text in texts)
+        )
+        return found
+
+    def matches(self, *texts: str) -> bool:
+        """Check whether any keyword or pattern is contained in any of the texts.
+
+        Args:
+            *texts: Texts to search
+
+        Returns:
+            True as soon as one hit is found
+
+        """
+        if self._always:
+            return True
+        hits: set[int] = set()
+        for text in texts:
+            self._keyword_hits(text, hits, stop_at_first=True)
+            if hits:
+                return True
+        return any(regex.search(text) for regex in self._regexes for text in texts)
+
+
+@lru_cache(maxsize=256)
+def _compile_matcher(keywords: tuple[str, ...], patterns: tuple[str, ...], case_sensitive: bool) -> PatternMatcher:
+    return PatternMatcher(keywords, patterns, case_sensitive)
+
+
+def compile_matcher(
+    keywords: Iterable[str] = (),
+    patterns: Iterable[str] = (),
+    case_sensitive: bool = False,
+) -> PatternMatcher:
+    """Get the shared compiled matcher of a keyword and pattern configuration.
+
+    Args:
+        keywords: Literal substrings to find
+        patterns: Regular expressions to search for
+        case_sensitive: Whether keywords and patterns are matched case-sensitively
+
+    Returns:
+        Matcher, compiled on first use of the configuration
+
+    """
+    return _compile_matcher(tuple(keywords), tuple(patterns), case_sensitive)
@@ -38,6 +38,8 @@ class AIWorkflowExecutor(BaseWorkflow):
             checking_point_name=input.ai_action.checking_point_name,
         )
 
+        self.activity_task_queues = dict(input.execution_context.get("activity_task_queues", {}))
+
         try:
             # Execute AI workflow via orchestrator service
             result = await self.execute_activity_with_retry(
@@ -46,6 +48,7 @@ class AIWorkflowExecutor(BaseWorkflow):
                 input.data_item,
                 input.check_result,
                 timeout=input.ai_action.get_execution_timeout(),
+                workload="ai",
             )
 
             # Create workflow result
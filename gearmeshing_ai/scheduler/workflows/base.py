@@ -24,6 +24,8 @@ class BaseWorkflow:
     def __init__(self) -> None:
         """Initialize the base workflow."""
         self.logger = workflow.logger
+        # Task queue per activity workload; workloads missing here use the workflow's queue
+        self.activity_task_queues: dict[str, str] = {}
 
     async def execute_activity_with_retry(
         self,
@@ -31,6 +33,7 @@ class BaseWorkflow:
         *args: Any,
         timeout: timedelta | None = None,
         retry_policy: RetryPolicy | None = None,
+        workload: str | None = None,
         **kwargs: Any,
     ) -> Any:
         """Execute an activity with retry policy.
@@ -40,6 +43,7 @@ class BaseWorkflow:
             *args: Activity arguments
             timeout: Activity timeout
             retry_policy: Retry policy for the activity
+            workload: Activity workload ("fetch", "evaluate", "action" or "ai") selecting its task queue
             **kwargs: Additional keyword arguments
 
         Returns:
@@ -59,6 +63,10 @@ class BaseWorkflow:
         if timeout is None:
             timeout = timedelta(minutes=5)
 
+        # Route the activity to its workload's task queue
+        if workload in self.activity_task_queues and "task_queue" not in kwargs:
+            kwargs["task_queue"] = self.activity_task_queues[workload]
+
         return await workflow.execute_activity(
             activity,
             *args,
@@ -5,6 +5,7 @@ external systems and processes data through checking points.
 """
 
 import asyncio
+import contextlib
 from datetime import timedelta
 from typing import Any
 
@@ -14,34 +15,109 @@ from gearmeshing_ai.scheduler.activities.action_execute import execute_action
 from gearmeshing_ai.scheduler.activities.ai_workflow import execute_ai_workflow
 
 # Import activities (these will be implemented in the activities module)
-from gearmeshing_ai.scheduler.activities.data_fetch import fetch_monitoring_data
+from gearmeshing_ai.scheduler.activities.data_fetch import (
+    evaluate_checking_point,
+    evaluate_checking_points_batch,
+    fetch_monitoring_data,
+)
+from gearmeshing_ai.scheduler.checking_points.base import CheckingPoint
 from gearmeshing_ai.scheduler.checking_points.registry import checking_point_registry
+from gearmeshing_ai.scheduler.models.checking_point import CheckResult, ItemEvaluation
 from gearmeshing_ai.scheduler.models.config import MonitorConfig
 from gearmeshing_ai.scheduler.models.monitoring import MonitoringData
-from gearmeshing_ai.scheduler.models.workflow import AIWorkflowInput, AIWorkflowResult
+from gearmeshing_ai.scheduler.models.workflow import AIWorkflowInput, AIWorkflowResult, MonitoringCycleState
 from gearmeshing_ai.scheduler.workflows.base import BaseWorkflow
 
 
+def evaluation_waves(checking_points: list[tuple[str, Any]]) -> list[list[tuple[str, Any]]]:
+    """Split ordered checking points into waves that end at a ``stop_on_match`` checking point.
+
+    Checking points within a wave can be evaluated concurrently: only the last
+    one of a wave can stop processing, so no evaluation is wasted on
+    checking points that an earlier stopping match would have skipped.
+
+    Args:
+        checking_points: Ordered (name, checking point) pairs
+
+    Returns:
+        List of waves in evaluation order
+
+    """
+    waves: list[list[tuple[str, Any]]] = [[]]
+    for name, checking_point in checking_points:
+        waves[-1].append((name, checking_point))
+        if checking_point.stop_on_match:
+            waves.append([])
+    return [wave for wave in waves if wave]
+
+
 @workflow.defn(name="SmartMonitoringWorkflow")
 class SmartMonitoringWorkflow(BaseWorkflow):
     """Smart monitoring workflow that continuously checks external systems.
 
     This workflow runs continuously, fetching data from external systems,
     processing it through checking points, and taking appropriate actions.
+
+    By default data items and checking points are evaluated one activity at a
+    time. With ``MonitorConfig.parallel_evaluation`` enabled, items are
+    processed concurrently and the checking points of an item are evaluated
+    in waves, with at most ``max_concurrent_evaluations`` activities or child
+    workflows in flight. Each wave ends at a ``stop_on_match`` checking point,
+    so actions still run in checking point order and nothing after a
+    stopping match is acted on.
+
+    With ``MonitorConfig.evaluation_batch_size`` set, items are instead
+    evaluated in chunks by the ``evaluate_checking_points_batch`` activity,
+    which runs every checking point of a chunk in-process and returns only
+    actionable results. Chunks run one at a time, or concurrently when
+    ``parallel_evaluation`` is enabled.
+
+    To keep its history bounded, the workflow continues as a new run after
+    ``continue_as_new_after_cycles`` cycles, once the history reaches
+    ``continue_as_new_after_history_events`` events, or when the server
+    suggests it. The new run receives a compact ``MonitoringCycleState``
+    with the counters and seen-item digests of the previous runs. Fetch
+    positions, such as ClickUp watermarks, stay with the checking point
+    instances of the worker.
+
+    With ``skip_unchanged_items`` enabled, the seen-item digests short-circuit
+    evaluation: an item whose content digest matches the one recorded when it
+    was last processed successfully is skipped, so actions and AI workflows
+    only run when an item is new or has changed. Unchanged items are evaluated
+    again after ``reevaluate_unchanged_after_cycles`` cycles, for checking
+    points that depend on time such as overdue detection; only checking points
+    that did not match last time are acted on then. An item whose evaluation,
+    actions or AI workflows failed is not recorded, so it is retried in the
+    next cycle.
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.state = MonitoringCycleState()
+        self.cycles_in_run = 0
+        # Outcome of the current cycle, keyed by data item ID
+        self.cycle_matches: dict[str, list[str]] = {}
+        self.previous_matches: dict[str, list[str]] = {}
+        self.failed_item_ids: set[str] = set()
+
     @workflow.run
-    async def run(self, monitor_config: MonitorConfig) -> None:
+    async def run(self, monitor_config: MonitorConfig, state: MonitoringCycleState | None = None) -> None:
         """Run the smart monitoring workflow.
 
         Args:
             monitor_config: Configuration for the monitoring workflow
+            state: State carried over from the previous run, if continued as new
 
         """
+        if state is not None:
+            self.state = state
+        self.activity_task_queues = dict(monitor_config.activity_task_queues)
         self.log_workflow_start(
             "SmartMonitoringWorkflow",
             config_name=monitor_config.name,
             interval_seconds=monitor_config.interval_seconds,
+            run_number=self.state.runs,
+            cycles_completed=self.state.cycles_completed,
         )
 
         try:
@@ -66,19 +142,48 @@ class SmartMonitoringWorkflow(BaseWorkflow):
                         fetch_monitoring_data,
                         monitor_config,
                         timeout=timedelta(minutes=5),
+                        workload="fetch",
                     )
 
                     self.logger.info(
                         f"Fetched {len(data_items)} data items",
                         extra={
                             "data_items_count": len(data_items),
-                            "data_types": [item.type.value for item in data_items],
+                            "data_types": [item.type for item in data_items],
                         },
                     )
 
+                    # Only changed data items need to go through the checking points
+                    fetched_count = len(data_items)
+                    data_items, digests = self.select_changed_items(data_items, monitor_config)
+                    self.start_cycle(digests)
+
                     # Process each data item through all checking points
-                    for data_item in data_items:
-                        await self.process_data_item_with_checking_points(data_item, enabled_checking_points)
+                    if monitor_config.evaluation_batch_size:
+                        await self.process_data_items_in_batches(
+                            data_items,
+                            enabled_checking_points,
+                            batch_size=monitor_config.evaluation_batch_size,
+                            max_concurrency=(
+                                monitor_config.max_concurrent_evaluations if monitor_config.parallel_evaluation else 1
+                            ),
+                            timeout=timedelta(seconds=monitor_config.evaluation_timeout_seconds),
+                        )
+                    elif monitor_config.parallel_evaluation:
+                        await self.process_data_items_in_parallel(
+                            data_items,
+                            enabled_checking_points,
+                            max_concurrency=monitor_config.max_concurrent_evaluations,
+                        )
+                    else:
+                        for data_item in data_items:
+                            await self.process_data_item_with_checking_points(data_item, enabled_checking_points)
+
+                    self.mark_processed_items(digests, monitor_config)
+                    self.state.record_cycle(
+                        data_items_processed=len(data_items),
+                        data_items_skipped=fetched_count - len(data_items),
+                    )
 
                     # Wait for next monitoring cycle using Temporal durable timer
                     await asyncio.sleep(monitor_config.interval_seconds)
@@ -89,10 +194,15 @@ class SmartMonitoringWorkflow(BaseWorkflow):
                         e,
                         cycle_error=True,
                     )
+                    self.state.record_cycle(failed=True)
 
                     # Wait before retrying the cycle
                     await asyncio.sleep(min(60, monitor_config.interval_seconds // 4))
 
+                self.cycles_in_run += 1
+                if self.should_continue_as_new(monitor_config):
+                    self.continue_as_new(monitor_config)
+
         except Exception as e:
             self.log_workflow_error(
                 "SmartMonitoringWorkflow",
@@ -103,6 +213,109 @@ class SmartMonitoringWorkflow(BaseWorkflow):
         finally:
             self.log_workflow_complete("SmartMonitoringWorkflow")
 
+    def select_changed_items(
+        self, data_items: list[MonitoringData], monitor_config: MonitorConfig
+    ) -> tuple[list[MonitoringData], dict[str, str]]:
+        """Drop data items that were already processed with the same content.
+
+        Args:
+            data_items: Fetched monitoring data
+            monitor_config: Configuration for the monitoring workflow
+
+        Returns:
+            Tuple of (items to process, content digest of each item to process by ID).
+            With ``skip_unchanged_items`` disabled, every item is returned and no digest.
+
+        """
+        if not monitor_config.skip_unchanged_items:
+            return data_items, {}
+
+        changed: list[MonitoringData] = []
+        digests: dict[str, str] = {}
+        for data_item in data_items:
+            digest = data_item.content_digest()
+            if self.state.is_unchanged(data_item.id, digest, monitor_config.reevaluate_unchanged_after_cycles):
+                continue
+            if data_item.id in digests:
+                # The same item fetched by several checking points is processed once
+                continue
+            changed.append(data_item)
+            digests[data_item.id] = digest
+
+        if len(changed) < len(data_items):
+            self.logger.info(
+                f"Skipping {len(data_items) - len(changed)} unchanged data items",
+                extra={"fetched_count": len(data_items), "changed_count": len(changed)},
+            )
+        return changed, digests
+
+    def start_cycle(self, digests: dict[str, str]) -> None:
+        """Reset the outcome of the previous cycle before processing data items.
+
+        Args:
+            digests: Content digest of each item to process by ID
+
+        """
+        self.cycle_matches = {}
+        self.failed_item_ids = set()
+        self.previous_matches = {
+            item_id: matched
+            for item_id, digest in digests.items()
+            if (matched := self.state.previous_matches(item_id, digest))
+        }
+
+    def mark_processed_items(self, digests: dict[str, str], monitor_config: MonitorConfig) -> None:
+        """Record the items of the current cycle that were processed without failure.
+
+        Args:
+            digests: Content digest of each processed item by ID
+            monitor_config: Configuration for the monitoring workflow
+
+        """
+        for item_id, digest in digests.items():
+            if item_id in self.failed_item_ids:
+                continue
+            self.state.mark_seen(
+                item_id, digest, monitor_config.max_seen_digests, matched=self.cycle_matches.get(item_id)
+            )
+
+    def should_continue_as_new(self, monitor_config: MonitorConfig) -> bool:
+        """Check whether the workflow should continue as a new run.
+
+        Args:
+            monitor_config: Configuration for the monitoring workflow
+
+        Returns:
+            True if the cycle or history limit is reached, or the server suggests continuing as new
+
+        """
+        if self.cycles_in_run >= monitor_config.continue_as_new_after_cycles:
+            return True
+        info = workflow.info()
+        return (
+            info.get_current_history_length() >= monitor_config.continue_as_new_after_history_events
+            or info.is_continue_as_new_suggested()
+        )
+
+    def continue_as_new(self, monitor_config: MonitorConfig) -> None:
+        """Continue as a new run carrying the compacted cycle state.
+
+        Args:
+            monitor_config: Configuration for the monitoring workflow
+
+        """
+        next_state = self.state.compact(monitor_config.max_seen_digests)
+        self.logger.info(
+            f"Continuing as new after {self.cycles_in_run} cycles",
+            extra={
+                "cycles_in_run": self.cycles_in_run,
+                "cycles_completed": next_state.cycles_completed,
+                "next_run_number": next_state.runs,
+                "seen_digests": len(next_state.seen_digests),
+            },
+        )
+        workflow.continue_as_new(args=[monitor_config, next_state])
+
     async def process_data_item_with_checking_points(
         self, data_item: MonitoringData, checking_points: dict[str, Any]
     ) -> None:
@@ -117,7 +330,7 @@ class SmartMonitoringWorkflow(BaseWorkflow):
             f"Processing data item {data_item.id}",
             extra={
                 "data_item_id": data_item.id,
-                "data_item_type": data_item.type.value,
+                "data_item_type": data_item.type,
                 "data_source": data_item.source,
             },
         )
@@ -144,83 +357,76 @@ class SmartMonitoringWorkflow(BaseWorkflow):
                     checking_point,
                     data_item,
                     timeout=timedelta(seconds=30),
+                    workload="evaluate",
                 )
 
-                self.logger.info(
-                    f"Checking point {checking_point_name} result: {check_result.result_type.value}",
-                    extra={
-                        "checking_point_name": checking_point_name,
-                        "data_item_id": data_item.id,
-                        "result_type": check_result.result_type.value,
-                        "should_act": check_result.should_act,
-                        "confidence": check_result.confidence,
-                    },
+                # If checking point matches, trigger actions; a stopping match skips the rest
+                if await self.handle_check_result(data_item, checking_point_name, checking_point, check_result):
+                    break
+
+            except Exception as e:
+                self.failed_item_ids.add(data_item.id)
+                self.log_workflow_error(
+                    "SmartMonitoringWorkflow",
+                    e,
+                    checking_point_name=checking_point_name,
+                    data_item_id=data_item.id,
                 )
 
-                # If checking point matches, trigger actions
-                if check_result.should_act:
-                    # Get immediate actions
-                    immediate_actions = checking_point.get_actions(data_item, check_result)
-
-                    # Execute immediate actions
-                    for action in immediate_actions:
-                        await self.execute_action_with_retry(
-                            execute_action,
-                            action,
-                            timeout=timedelta(minutes=10),
-                            retry_policy=self.create_retry_policy(
-                                maximum_attempts=3,
-                                initial_interval=timedelta(seconds=1),
-                            ),
-                        )
+                # Continue with other checking points even if one fails
+                continue
 
-                        self.logger.info(
-                            f"Executed immediate action for checking point {checking_point_name}",
-                            extra={
-                                "checking_point_name": checking_point_name,
-                                "data_item_id": data_item.id,
-                                "action_type": action.get("type", "unknown"),
-                            },
-                        )
+    async def process_data_items_in_parallel(
+        self,
+        data_items: list[MonitoringData],
+        checking_points: dict[str, Any],
+        max_concurrency: int,
+    ) -> None:
+        """Process data items concurrently with a bound on in-flight work.
 
-                    # Get AI workflow actions
-                    ai_actions = checking_point.get_after_process(data_item, check_result)
-
-                    # Execute AI workflows if any
-                    for ai_action in ai_actions:
-                        await self.execute_child_workflow_with_timeout(
-                            AIWorkflowExecutor.run,
-                            AIWorkflowInput(
-                                ai_action=ai_action,
-                                data_item=data_item,
-                                check_result=check_result,
-                            ),
-                            timeout=ai_action.get_execution_timeout(),
-                        )
+        Args:
+            data_items: Monitoring data to process
+            checking_points: Dictionary of checking point instances
+            max_concurrency: Maximum number of activities and child workflows in flight
 
-                        self.logger.info(
-                            f"Executed AI workflow for checking point {checking_point_name}",
-                            extra={
-                                "checking_point_name": checking_point_name,
-                                "data_item_id": data_item.id,
-                                "ai_workflow": ai_action.workflow_name,
-                                "ai_action": ai_action.name,
-                            },
-                        )
+        """
+        limiter = asyncio.Semaphore(max_concurrency)
+        results = await asyncio.gather(
+            *(self.process_data_item_in_waves(data_item, checking_points, limiter) for data_item in data_items),
+            return_exceptions=True,
+        )
+        for data_item, result in zip(data_items, results, strict=True):
+            if isinstance(result, Exception):
+                self.failed_item_ids.add(data_item.id)
+                self.log_workflow_error("SmartMonitoringWorkflow", result, data_item_id=data_item.id)
+            elif isinstance(result, BaseException):
+                raise result
+
+    async def process_data_item_in_waves(
+        self,
+        data_item: MonitoringData,
+        checking_points: dict[str, Any],
+        limiter: asyncio.Semaphore,
+    ) -> None:
+        """Process a single data item, evaluating its checking points concurrently.
 
-                    # Optional: Stop processing further checking points for this data item
-                    if checking_point.stop_on_match:
-                        self.logger.debug(
-                            f"Stopping further checking point processing for data item {data_item.id} "
-                            f"due to stop_on_match in {checking_point_name}",
-                            extra={
-                                "data_item_id": data_item.id,
-                                "stopping_checking_point": checking_point_name,
-                            },
-                        )
-                        break
+        Checking points are split into waves that end at a ``stop_on_match``
+        checking point. A wave is evaluated concurrently, then its results are
+        acted on in order; a stopping match ends processing of the item.
+
+        Args:
+            data_item: Monitoring data to process
+            checking_points: Dictionary of checking point instances
+            limiter: Semaphore bounding in-flight activities and child workflows
 
+        """
+        applicable = []
+        for checking_point_name, checking_point in checking_points.items():
+            try:
+                if checking_point.can_handle(data_item):
+                    applicable.append((checking_point_name, checking_point))
             except Exception as e:
+                self.failed_item_ids.add(data_item.id)
                 self.log_workflow_error(
                     "SmartMonitoringWorkflow",
                     e,
@@ -228,8 +434,253 @@ class SmartMonitoringWorkflow(BaseWorkflow):
                     data_item_id=data_item.id,
                 )
 
-                # Continue with other checking points even if one fails
-                continue
+        for wave in evaluation_waves(applicable):
+            check_results = await asyncio.gather(
+                *(self._evaluate_limited(limiter, checking_point, data_item) for _, checking_point in wave),
+                return_exceptions=True,
+            )
+
+            for (checking_point_name, checking_point), check_result in zip(wave, check_results, strict=True):
+                try:
+                    if isinstance(check_result, BaseException):
+                        raise check_result
+                    if await self.handle_check_result(
+                        data_item, checking_point_name, checking_point, check_result, limiter
+                    ):
+                        return
+                except Exception as e:
+                    self.failed_item_ids.add(data_item.id)
+                    self.log_workflow_error(
+                        "SmartMonitoringWorkflow",
+                        e,
+                        checking_point_name=checking_point_name,
+                        data_item_id=data_item.id,
+                    )
+
+    async def process_data_items_in_batches(
+        self,
+        data_items: list[MonitoringData],
+        checking_points: dict[str, Any],
+        batch_size: int,
+        max_concurrency: int = 1,
+        timeout: timedelta = timedelta(seconds=120),
+    ) -> None:
+        """Process data items in chunks evaluated by one activity each.
+
+        Args:
+            data_items: Monitoring data to process
+            checking_points: Dictionary of checking point instances, keyed by registry name
+            batch_size: Maximum number of data items per batch activity
+            max_concurrency: Maximum number of activities and child workflows in flight
+            timeout: Timeout of a single batch activity
+
+        """
+        limiter = asyncio.Semaphore(max_concurrency)
+        chunks = [data_items[i : i + batch_size] for i in range(0, len(data_items), batch_size)]
+        results = await asyncio.gather(
+            *(self.process_batch(chunk, checking_points, limiter, timeout) for chunk in chunks),
+            return_exceptions=True,
+        )
+        for chunk, result in zip(chunks, results, strict=True):
+            if isinstance(result, Exception):
+                self.failed_item_ids.update(data_item.id for data_item in chunk)
+                self.log_workflow_error(
+                    "SmartMonitoringWorkflow",
+                    result,
+                    data_item_ids=[data_item.id for data_item in chunk],
+                )
+            elif isinstance(result, BaseException):
+                raise result
+
+    async def process_batch(
+        self,
+        data_items: list[MonitoringData],
+        checking_points: dict[str, Any],
+        limiter: asyncio.Semaphore,
+        timeout: timedelta,
+    ) -> None:
+        """Evaluate one chunk of data items and act on its matches in checking point order.
+
+        Args:
+            data_items: Monitoring data to evaluate
+            checking_points: Dictionary of checking point instances, keyed by registry name
+            limiter: Semaphore bounding in-flight activities and child workflows
+            timeout: Timeout of the batch activity
+
+        """
+        async with limiter:
+            evaluations: list[ItemEvaluation] = await self.execute_activity_with_retry(
+                evaluate_checking_points_batch,
+                data_items,
+                list(checking_points),
+                timeout=timeout,
+                workload="evaluate",
+            )
+
+        for data_item, evaluation in zip(data_items, evaluations, strict=True):
+            if evaluation.errors:
+                self.failed_item_ids.add(data_item.id)
+            for checking_point_name, error in evaluation.errors.items():
+                self.logger.warning(
+                    f"Checking point {checking_point_name} failed for data item {data_item.id}: {error}",
+                    extra={"checking_point_name": checking_point_name, "data_item_id": data_item.id},
+                )
+
+            for checking_point_name, check_result in evaluation.matches.items():
+                try:
+                    if await self.handle_check_result(
+                        data_item, checking_point_name, checking_points[checking_point_name], check_result, limiter
+                    ):
+                        break
+                except Exception as e:
+                    self.failed_item_ids.add(data_item.id)
+                    self.log_workflow_error(
+                        "SmartMonitoringWorkflow",
+                        e,
+                        checking_point_name=checking_point_name,
+                        data_item_id=data_item.id,
+                    )
+
+    async def _evaluate_limited(
+        self, limiter: asyncio.Semaphore, checking_point: CheckingPoint, data_item: MonitoringData
+    ) -> CheckResult:
+        async with limiter:
+            result: CheckResult = await self.execute_activity_with_retry(
+                evaluate_checking_point,
+                checking_point,
+                data_item,
+                timeout=timedelta(seconds=30),
+                workload="evaluate",
+            )
+        return result
+
+    async def handle_check_result(
+        self,
+        data_item: MonitoringData,
+        checking_point_name: str,
+        checking_point: CheckingPoint,
+        check_result: CheckResult,
+        limiter: asyncio.Semaphore | None = None,
+    ) -> bool:
+        """Log a checking point result and run its actions if it matched.
+
+        Args:
+            data_item: Monitoring data that was evaluated
+            checking_point_name: Name of the checking point
+            checking_point: Checking point instance
+            check_result: Result of the evaluation
+            limiter: Optional semaphore bounding in-flight activities and child workflows
+
+        Returns:
+            True if processing of further checking points should stop for this item
+
+        """
+        in_flight: contextlib.AbstractAsyncContextManager[Any] = (
+            limiter if limiter is not None else contextlib.nullcontext()
+        )
+        self.logger.info(
+            f"Checking point {checking_point_name} result: {check_result.result_type}",
+            extra={
+                "checking_point_name": checking_point_name,
+                "data_item_id": data_item.id,
+                "result_type": check_result.result_type,
+                "should_act": check_result.should_act,
+                "confidence": check_result.confidence,
+            },
+        )
+
+        if not check_result.should_act:
+            return False
+
+        self.cycle_matches.setdefault(data_item.id, []).append(checking_point_name)
+        if checking_point_name in self.previous_matches.get(data_item.id, ()):
+            # Neither the item nor the result changed since its actions last ran
+            self.logger.debug(
+                f"Skipping actions of checking point {checking_point_name} for unchanged data item {data_item.id}",
+                extra={"checking_point_name": checking_point_name, "data_item_id": data_item.id},
+            )
+            return bool(checking_point.stop_on_match)
+
+        # Get immediate actions
+        immediate_actions = checking_point.get_actions(data_item, check_result)
+
+        # Execute immediate actions
+        for action in immediate_actions:
+            async with in_flight:
+                await self.execute_activity_with_retry(
+                    execute_action,
+                    action,
+                    timeout=timedelta(minutes=10),
+                    workload="action",
+                    retry_policy=self.create_retry_policy(
+                        maximum_attempts=3,
+                        initial_interval=timedelta(seconds=1),
+                    ),
+                )
+
+            self.logger.info(
+                f"Executed immediate action for checking point {checking_point_name}",
+                extra={
+                    "checking_point_name": checking_point_name,
+                    "data_item_id": data_item.id,
+                    "action_type": action.get("type", "unknown"),
+                },
+            )
+
+        # Get AI workflow actions, unless the evaluation activity prepared them with offloaded payloads
+        if check_result.ai_actions is None:
+            ai_actions = checking_point.get_after_process(data_item, check_result)
+            item_payload = data_item.model_dump(mode="json")
+            result_payload = check_result.model_dump(mode="json")
+        else:
+            # The actions carry the payloads, so the child workflow input only summarizes them
+            ai_actions = check_result.ai_actions
+            item_payload = data_item.model_dump(mode="json", include={"id", "type", "source"})
+            result_payload = check_result.model_dump(
+                mode="json", include={"checking_point_name", "result_type", "should_act", "confidence", "reason"}
+            )
+
+        # Execute AI workflows if any
+        for ai_action in ai_actions:
+            async with in_flight:
+                ai_result = await self.execute_child_workflow_with_timeout(
+                    AIWorkflowExecutor.run,
+                    AIWorkflowInput(
+                        ai_action=ai_action,
+                        data_item=item_payload,
+                        check_result=result_payload,
+                        execution_context={"activity_task_queues": self.activity_task_queues},
+                    ),
+                    timeout=ai_action.get_execution_timeout(),
+                )
+
+            if isinstance(ai_result, AIWorkflowResult) and not ai_result.is_successful():
+                # The executor reports failures in its result, retry the item in the next cycle
+                self.failed_item_ids.add(data_item.id)
+
+            self.logger.info(
+                f"Executed AI workflow for checking point {checking_point_name}",
+                extra={
+                    "checking_point_name": checking_point_name,
+                    "data_item_id": data_item.id,
+                    "ai_workflow": ai_action.workflow_name,
+                    "ai_action": ai_action.name,
+                },
+            )
+
+        # Optional: Stop processing further checking points for this data item
+        if checking_point.stop_on_match:
+            self.logger.debug(
+                f"Stopping further checking point processing for data item {data_item.id} "
+                f"due to stop_on_match in {checking_point_name}",
+                extra={
+                    "data_item_id": data_item.id,
+                    "stopping_checking_point": checking_point_name,
+                },
+            )
+            return True
+
+        return False
 
 
 @workflow.defn(name="AIWorkflowExecutor")
@@ -258,6 +709,8 @@ class AIWorkflowExecutor(BaseWorkflow):
             checking_point_name=input.ai_action.checking_point_name,
         )
 
+        self.activity_task_queues = dict(input.execution_context.get("activity_task_queues", {}))
+
         try:
             # Execute AI workflow via orchestrator service
             result = await self.execute_activity_with_retry(
@@ -266,6 +719,7 @@ class AIWorkflowExecutor(BaseWorkflow):
                 input.data_item,
                 input.check_result,
                 timeout=input.ai_action.get_execution_timeout(),
+                workload="ai",
             )
 
             # Create workflow result
@@ -2,12 +2,17 @@
 Unit tests for AgentCache singleton implementation.
 """
 
+import asyncio
 import threading
 import time
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from gearmeshing_ai.agent.abstraction.cache import AgentCache
+import pytest
+from pydantic import SecretStr
+
+from gearmeshing_ai.agent.abstraction.cache import AgentCache, agent_cache_key
+from gearmeshing_ai.agent.abstraction.settings import AgentSettings, ModelSettings
 
 
 class TestAgentCache:
@@ -302,3 +307,202 @@ class TestAgentCache:
         assert callable(cache.set)
         assert callable(cache.remove)
         assert callable(cache.clear)
+
+
+@pytest.fixture
+def bounded_cache():
+    """Provide the cleared singleton cache and restore its limits afterwards."""
+    cache = AgentCache()
+    cache.clear()
+    yield cache
+    cache.configure(max_size=AgentCache.DEFAULT_MAX_SIZE, ttl=AgentCache.DEFAULT_TTL)
+    cache.clear()
+
+
+class TestAgentCacheBounds:
+    """Test LRU eviction, TTL expiry and metrics."""
+
+    def test_lru_eviction(self, bounded_cache: AgentCache) -> None:
+        """Test that the least recently used agent is evicted first."""
+        bounded_cache.configure(max_size=2)
+        bounded_cache.set("a", "agent_a")
+        bounded_cache.set("b", "agent_b")
+
+        # Touch "a" so that "b" becomes least recently used
+        assert bounded_cache.get("a") == "agent_a"
+        bounded_cache.set("c", "agent_c")
+
+        assert bounded_cache.get("b") is None
+        assert bounded_cache.get("a") == "agent_a"
+        assert bounded_cache.get("c") == "agent_c"
+        assert bounded_cache.get_stats()["evictions"] == 1
+
+    def test_shrinking_max_size_evicts(self, bounded_cache: AgentCache) -> None:
+        """Test that lowering max_size evicts immediately."""
+        for i in range(5):
+            bounded_cache.set(f"agent_{i}", i)
+
+        bounded_cache.configure(max_size=2)
+
+        assert len(bounded_cache) == 2
+        assert bounded_cache.get("agent_4") == 4
+
+    def test_ttl_expiry(self, bounded_cache: AgentCache) -> None:
+        """Test that agents expire after the TTL."""
+        bounded_cache.configure(ttl=10.0)
+        with patch("gearmeshing_ai.agent.abstraction.cache.time.monotonic", return_value=100.0):
+            bounded_cache.set("agent", "value")
+        with patch("gearmeshing_ai.agent.abstraction.cache.time.monotonic", return_value=105.0):
+            assert bounded_cache.get("agent") == "value"
+        with patch("gearmeshing_ai.agent.abstraction.cache.time.monotonic", return_value=110.0):
+            assert bounded_cache.get("agent") is None
+
+        assert bounded_cache.get_stats()["expirations"] == 1
+
+    def test_ttl_none_disables_expiry(self, bounded_cache: AgentCache) -> None:
+        """Test that a TTL of None keeps agents until evicted."""
+        bounded_cache.configure(ttl=None)
+        with patch("gearmeshing_ai.agent.abstraction.cache.time.monotonic", return_value=0.0):
+            bounded_cache.set("agent", "value")
+        with patch("gearmeshing_ai.agent.abstraction.cache.time.monotonic", return_value=1e9):
+            assert bounded_cache.get("agent") == "value"
+
+    def test_configure_keeps_unspecified_limits(self, bounded_cache: AgentCache) -> None:
+        """Test that configure only changes the given limits."""
+        bounded_cache.configure(ttl=60.0)
+        bounded_cache.configure(max_size=10)
+
+        assert bounded_cache.ttl == 60.0
+        assert bounded_cache.max_size == 10
+
+    def test_remove_role(self, bounded_cache: AgentCache) -> None:
+        """Test removing every agent of a role."""
+        bounded_cache.set(("dev", "", "s1", "t1"), "dev_1")
+        bounded_cache.set(("dev", "proposal", "s2", "t1"), "dev_2")
+        bounded_cache.set(("qa", "", "s1", "t1"), "qa")
+
+        assert bounded_cache.remove_role("dev") == 2
+        assert len(bounded_cache) == 1
+
+    def test_hit_rate(self, bounded_cache: AgentCache) -> None:
+        """Test hit and miss metrics."""
+        stats_before = bounded_cache.get_stats()
+        bounded_cache.set("agent", "value")
+        bounded_cache.get("agent")
+        bounded_cache.get("missing")
+
+        stats = bounded_cache.get_stats()
+        assert stats["hits"] - stats_before["hits"] == 1
+        assert stats["misses"] - stats_before["misses"] == 1
+        assert 0.0 < stats["hit_rate"] < 1.0
+
+
+class TestAgentCacheGetOrCreate:
+    """Test single-flight agent creation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_build(self, bounded_cache: AgentCache) -> None:
+        """Test that concurrent misses for one key build the agent once."""
+        builds = 0
+
+        async def build() -> Any:
+            nonlocal builds
+            builds += 1
+            await asyncio.sleep(0.01)
+            return Mock()
+
+        agents = await asyncio.gather(*(bounded_cache.get_or_create("key", build) for _ in range(5)))
+
+        assert builds == 1
+        assert all(agent is agents[0] for agent in agents)
+        assert await bounded_cache.get_or_create("key", build) is agents[0]
+        assert bounded_cache.get_stats()["building"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_build_is_not_cached(self, bounded_cache: AgentCache) -> None:
+        """Test that a failing build raises to all waiters and is retried later."""
+        attempts = 0
+
+        async def build() -> Any:
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.01)
+            if attempts == 1:
+                msg = "model unavailable"
+                raise RuntimeError(msg)
+            return "agent"
+
+        results = await asyncio.gather(
+            bounded_cache.get_or_create("key", build),
+            bounded_cache.get_or_create("key", build),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert bounded_cache.get("key") is None
+        assert await bounded_cache.get_or_create("key", build) == "agent"
+        assert attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_build(self, bounded_cache: AgentCache) -> None:
+        """Test that cancelling one caller leaves the shared build running."""
+        started = asyncio.Event()
+
+        async def build() -> Any:
+            started.set()
+            await asyncio.sleep(0.02)
+            return "agent"
+
+        first = asyncio.create_task(bounded_cache.get_or_create("key", build))
+        await started.wait()
+        second = asyncio.create_task(bounded_cache.get_or_create("key", build))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "agent"
+        assert bounded_cache.get("key") == "agent"
+
+
+class TestAgentCacheKey:
+    """Test agent cache key construction."""
+
+    @pytest.fixture
+    def settings(self) -> AgentSettings:
+        """Create agent settings for key tests."""
+        return AgentSettings(
+            role="dev",
+            description="Developer",
+            model_settings=ModelSettings(customized_name="dev-model", provider="openai", model="gpt-4"),
+            tools=["read_file", "write_file"],
+        )
+
+    def test_key_is_stable(self, settings: AgentSettings) -> None:
+        """Test that equal settings and tool sets produce equal keys."""
+        assert agent_cache_key("dev", settings, ["a", "b"]) == agent_cache_key("dev", settings.model_copy(), ["b", "a"])
+
+    def test_key_changes_with_settings(self, settings: AgentSettings) -> None:
+        """Test that overridden model settings produce a different key."""
+        overridden = settings.model_copy(
+            update={"model_settings": settings.model_settings.model_copy(update={"temperature": 0.1})}
+        )
+
+        assert agent_cache_key("dev", settings) != agent_cache_key("dev", overridden)
+
+    def test_key_changes_with_tools_and_mode(self, settings: AgentSettings) -> None:
+        """Test that the tool set and mode are part of the key."""
+        base = agent_cache_key("dev", settings, ["a"])
+
+        assert base != agent_cache_key("dev", settings, ["a", "b"])
+        assert base != agent_cache_key("dev", settings, ["a"], mode="proposal")
+
+    def test_key_changes_with_api_key(self, settings: AgentSettings) -> None:
+        """Test that a changed API key produces a different key without exposing it."""
+        with_key = settings.model_copy(
+            update={"model_settings": settings.model_settings.model_copy(update={"api_key": SecretStr("sk-one")})}
+        )
+        other_key = settings.model_copy(
+            update={"model_settings": settings.model_settings.model_copy(update={"api_key": SecretStr("sk-two")})}
+        )
+
+        assert agent_cache_key("dev", with_key) != agent_cache_key("dev", other_key)
+        assert "sk-one" not in repr(agent_cache_key("dev", with_key))
@@ -278,6 +278,65 @@ class TestAgentFactory:
         assert agent1 is not agent2
         assert len(adapter.created_agents) == 2
 
+    async def test_get_or_create_agent_caches_overrides_separately(self) -> None:
+        """Test that agents built with the same override are reused."""
+        adapter = MockAgentAdapter()
+        factory = AgentFactory(adapter)
+        factory.cache.clear()
+
+        model_settings = ModelSettings(customized_name="test-model", provider="openai", model="gpt-4")
+        agent_settings = AgentSettings(role="test-agent", description="Test agent", model_settings=model_settings)
+        factory.register_agent_settings(agent_settings)
+
+        override = {"description": "Override"}
+        agent1 = await factory.get_or_create_agent("test-agent", override)
+        agent2 = await factory.get_or_create_agent("test-agent", dict(override))
+        plain = await factory.get_or_create_agent("test-agent")
+
+        assert agent1 is agent2
+        assert plain is not agent1
+        assert len(adapter.created_agents) == 2
+
+    async def test_get_or_create_agent_rebuilds_when_settings_change(self) -> None:
+        """Test that re-registering different settings yields a new agent."""
+        adapter = MockAgentAdapter()
+        factory = AgentFactory(adapter)
+        factory.cache.clear()
+
+        model_settings = ModelSettings(customized_name="test-model", provider="openai", model="gpt-4")
+        factory.register_agent_settings(
+            AgentSettings(role="test-agent", description="Test agent", model_settings=model_settings)
+        )
+        agent1 = await factory.get_or_create_agent("test-agent")
+
+        factory.register_agent_settings(
+            AgentSettings(role="test-agent", description="Test agent", model_settings=model_settings, tools=["tool1"])
+        )
+        agent2 = await factory.get_or_create_agent("test-agent")
+
+        assert agent1 is not agent2
+        assert agent2.settings.tools == ["tool1"]
+
+    async def test_get_or_create_agent_concurrent_single_build(self) -> None:
+        """Test that concurrent first requests build the agent once."""
+        import asyncio
+
+        adapter = MockAgentAdapter()
+        mcp_client = MockMCPClient()
+        factory = AgentFactory(adapter, mcp_client)
+        factory.cache.clear()
+
+        model_settings = ModelSettings(customized_name="test-model", provider="openai", model="gpt-4")
+        factory.register_agent_settings(
+            AgentSettings(role="test-agent", description="Test agent", model_settings=model_settings, tools=["tool1"])
+        )
+
+        agents = await asyncio.gather(*(factory.get_or_create_agent("test-agent") for _ in range(5)))
+
+        assert all(agent is agents[0] for agent in agents)
+        assert len(adapter.created_agents) == 1
+        assert len(mcp_client.get_tools_calls) == 1
+
     async def test_get_or_create_agent_not_found_error(self) -> None:
         """Test error when agent settings not found."""
         adapter = MockAgentAdapter()
@@ -0,0 +1,223 @@
+"""
+Real-world usage tests for MCP tool catalogs.
+
+Tests cover catalog building from tool definitions and per-server catalog caching.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from mcp.types import Tool
+
+from gearmeshing_ai.agent.mcp.client.catalog import ToolCatalogCache, build_tool_catalog, catalog_etag
+from gearmeshing_ai.agent.mcp.client.config import MCPClientConfig
+from gearmeshing_ai.agent.mcp.client.core import MCPClient
+from gearmeshing_ai.agent.mcp.client.transports import SSETransport
+from gearmeshing_ai.agent.models.actions import MCPToolCatalog, MCPToolInfo
+
+TASKS_SCHEMA = {
+    "type": "object",
+    "properties": {"list_id": {"type": "string"}, "page": {"type": "integer"}},
+    "required": ["list_id"],
+}
+
+
+def _catalog(*names: str) -> MCPToolCatalog:
+    return MCPToolCatalog(
+        tools=[MCPToolInfo(name=name, description=name, mcp_server="test", parameters={}) for name in names]
+    )
+
+
+class CountingLoader:
+    """Catalog loader counting fetches."""
+
+    def __init__(self, *catalogs: MCPToolCatalog, delay: float = 0.0):
+        self.catalogs = list(catalogs)
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> MCPToolCatalog:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.catalogs[min(self.calls, len(self.catalogs)) - 1]
+
+
+class TestBuildToolCatalog:
+    """Test building catalogs from MCP tool definitions."""
+
+    def test_schemas_and_descriptions_are_kept(self):
+        """Test that descriptions and input/output schemas reach the catalog."""
+        tools = [
+            Tool(
+                name="get_tasks",
+                description="List tasks",
+                inputSchema=TASKS_SCHEMA,
+                outputSchema={"type": "object"},
+            ),
+            Tool(name="ping", inputSchema={"type": "object"}),
+        ]
+
+        catalog = build_tool_catalog(tools, server="http://localhost:8082/mcp")
+
+        get_tasks = catalog.find_tool("get_tasks")
+        assert get_tasks.description == "List tasks"
+        assert get_tasks.parameters == TASKS_SCHEMA
+        assert get_tasks.returns == {"type": "object"}
+        assert get_tasks.mcp_server == "http://localhost:8082/mcp"
+        assert get_tasks.example_usage == "get_tasks(list_id: string, page?: integer)"
+        assert catalog.find_tool("ping").description == "Tool: ping"
+
+    def test_etag_tracks_content(self):
+        """Test that the digest changes only when tools change."""
+        assert catalog_etag(_catalog("a", "b")) == catalog_etag(_catalog("a", "b"))
+        assert catalog_etag(_catalog("a", "b")) != catalog_etag(_catalog("a", "c"))
+
+
+class TestToolCatalogCache:
+    """Test per-server catalog caching."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_catalog_is_served_from_cache(self):
+        """Test that a catalog within its TTL is not fetched again."""
+        cache = ToolCatalogCache(ttl=60.0)
+        loader = CountingLoader(_catalog("a"))
+
+        first = await cache.get("server", loader)
+        second = await cache.get("server", loader)
+
+        assert first is second
+        assert loader.calls == 1
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Test that concurrent callers wait for the same fetch."""
+        cache = ToolCatalogCache(ttl=60.0)
+        loader = CountingLoader(_catalog("a"), delay=0.02)
+
+        catalogs = await asyncio.gather(*(cache.get("server", loader) for _ in range(5)))
+
+        assert loader.calls == 1
+        assert all(catalog is catalogs[0] for catalog in catalogs)
+
+    @pytest.mark.asyncio
+    async def test_servers_are_cached_separately(self):
+        """Test that each server has its own catalog."""
+        cache = ToolCatalogCache(ttl=60.0)
+
+        await cache.get("one", CountingLoader(_catalog("a")))
+        await cache.get("two", CountingLoader(_catalog("b")))
+
+        assert cache.etag("one") != cache.etag("two")
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_runs_in_background(self):
+        """Test that an ageing catalog is returned immediately and refreshed in background."""
+        cache = ToolCatalogCache(ttl=0.2, refresh_ahead=0.1)
+        loader = CountingLoader(_catalog("a"), _catalog("a", "b"))
+        first = await cache.get("server", loader)
+        await asyncio.sleep(0.05)
+
+        served = await cache.get("server", loader)
+        await asyncio.sleep(0.01)
+
+        assert served is first
+        assert loader.calls == 2
+        assert cache.changes == 1
+        assert (await cache.get("server", loader)).get_tool_names() == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_refresh_keeps_catalog_identity(self):
+        """Test that a refresh with the same digest keeps the cached object."""
+        changes = []
+        cache = ToolCatalogCache(ttl=0.01, on_change=lambda server, catalog: changes.append(server))
+        loader = CountingLoader(_catalog("a"), _catalog("a"))
+        first = await cache.get("server", loader)
+        await asyncio.sleep(0.02)
+
+        second = await cache.get("server", loader)
+
+        assert second is first
+        assert cache.unchanged_refreshes == 1
+        assert changes == []
+
+    @pytest.mark.asyncio
+    async def test_stale_catalog_served_when_refresh_fails(self):
+        """Test that a failing refresh falls back to the expired catalog."""
+        cache = ToolCatalogCache(ttl=0.01)
+        first = await cache.get("server", CountingLoader(_catalog("a")))
+        await asyncio.sleep(0.02)
+
+        failing = AsyncMock(side_effect=RuntimeError("server down"))
+
+        assert await cache.get("server", failing) is first
+        assert cache.refresh_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_first_fetch_failure_raises(self):
+        """Test that failures propagate when nothing is cached."""
+        cache = ToolCatalogCache(ttl=60.0)
+
+        with pytest.raises(RuntimeError):
+            await cache.get("server", AsyncMock(side_effect=RuntimeError("server down")))
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        """Test that invalidation forces a new fetch."""
+        cache = ToolCatalogCache(ttl=60.0)
+        loader = CountingLoader(_catalog("a"))
+        await cache.get("server", loader)
+
+        cache.invalidate("server")
+        await cache.get("server", loader)
+
+        assert loader.calls == 2
+
+
+class TestClientToolDiscovery:
+    """Test MCPClient tool discovery through the catalog cache."""
+
+    @staticmethod
+    def _client(ttl: float = 60.0) -> tuple[MCPClient, SSETransport]:
+        client = MCPClient(MCPClientConfig(tool_catalog_ttl=ttl))
+        transport = SSETransport("http://localhost:8082/sse/sse")
+        transport.list_tool_definitions = AsyncMock(
+            return_value=[Tool(name="get_tasks", description="List tasks", inputSchema=TASKS_SCHEMA)]
+        )
+        client.set_transport(transport)
+        return client, transport
+
+    @pytest.mark.asyncio
+    async def test_discovery_uses_single_list_request(self):
+        """Test that the catalog is built from one tools/list request with schemas."""
+        client, transport = self._client()
+
+        catalog = await client.discover_tools_for_agent()
+
+        assert catalog.find_tool("get_tasks").parameters == TASKS_SCHEMA
+        assert catalog.find_tool("get_tasks").mcp_server == "http://localhost:8082/sse/sse"
+        transport.list_tool_definitions.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_discovery_is_cached(self):
+        """Test that repeated discovery within the TTL reuses the catalog."""
+        client, transport = self._client()
+
+        await client.discover_tools_for_agent()
+        await client.discover_tools_for_agent()
+        details = await client._get_tool_details("get_tasks")
+
+        assert details.description == "List tasks"
+        transport.list_tool_definitions.assert_awaited_once()
+        assert client.get_tool_catalog_stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_caching(self):
+        """Test that a zero TTL fetches on every discovery."""
+        client, transport = self._client(ttl=0.0)
+
+        await client.discover_tools_for_agent()
+        await client.discover_tools_for_agent()
+
+        assert transport.list_tool_definitions.await_count == 2
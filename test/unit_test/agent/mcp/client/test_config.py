@@ -9,7 +9,14 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
-from gearmeshing_ai.agent.mcp.client.config import MCPClientConfig, MonitoringConfig, RetryConfig, TransportConfig
+from gearmeshing_ai.agent.mcp.client.config import (
+    CircuitBreakerConfig,
+    HedgingConfig,
+    MCPClientConfig,
+    MonitoringConfig,
+    RetryConfig,
+    TransportConfig,
+)
 
 
 class TestRetryConfig:
@@ -85,6 +92,44 @@ class TestMonitoringConfig:
         assert config.health_check_interval == 60.0
 
 
+class TestCircuitBreakerConfig:
+    """Test CircuitBreakerConfig functionality."""
+
+    def test_circuit_breaker_config_defaults(self):
+        """Test default circuit breaker configuration."""
+        config = CircuitBreakerConfig()
+
+        assert config.enabled is True
+        assert config.failure_threshold == 5
+        assert config.recovery_timeout == 30.0
+        assert config.half_open_max_calls == 1
+
+    def test_circuit_breaker_config_from_env(self):
+        """Test circuit breaker settings from environment variables."""
+        env = {"MCP_CLIENT_CIRCUIT_FAILURE_THRESHOLD": "3", "MCP_CLIENT_CIRCUIT_BREAKER_ENABLED": "false"}
+        with patch.dict("os.environ", env):
+            config = MCPClientConfig.from_env()
+
+            assert config.circuit_breaker.failure_threshold == 3
+            assert config.circuit_breaker.enabled is False
+
+
+class TestHedgingConfig:
+    """Test HedgingConfig functionality."""
+
+    def test_hedging_disabled_by_default(self):
+        """Test that hedging is opt-in."""
+        assert HedgingConfig().enabled is False
+
+    def test_is_idempotent(self):
+        """Test idempotent tool detection by name and prefix."""
+        config = HedgingConfig(idempotent_tools=["fetch_board"])
+
+        assert config.is_idempotent("get_tasks") is True
+        assert config.is_idempotent("fetch_board") is True
+        assert config.is_idempotent("create_task") is False
+
+
 class TestMCPClientConfig:
     """Test MCPClientConfig functionality."""
 
@@ -6,13 +6,13 @@ They test the actual behavior of the client with realistic configurations and wo
 """
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from gearmeshing_ai.agent.mcp.client.config import MCPClientConfig, RetryConfig
+from gearmeshing_ai.agent.mcp.client.config import CircuitBreakerConfig, MCPClientConfig, RetryConfig
 from gearmeshing_ai.agent.mcp.client.core import AsyncMCPClient, ClientStats, EasyMCPClient, MCPClient
-from gearmeshing_ai.agent.mcp.client.exceptions import ConnectionError, ServerError, TimeoutError
+from gearmeshing_ai.agent.mcp.client.exceptions import CircuitOpenError, ConnectionError, ServerError, TimeoutError
 from gearmeshing_ai.agent.mcp.client.transports import SSETransport
 
 
@@ -75,10 +75,6 @@ class TestMCPClientRetryLogic:
         mock_transport.list_tools.side_effect = [ConnectionError("Connection failed"), ["tool1", "tool2"]]
         client.set_transport(mock_transport)
 
-        # Mock metrics to avoid missing argument error
-        client._metrics.record_failure = MagicMock()
-        client._metrics.record_success = MagicMock()
-
         result = await client.list_tools()
 
         assert result == ["tool1", "tool2"]
@@ -95,9 +91,6 @@ class TestMCPClientRetryLogic:
         mock_transport.list_tools.side_effect = ConnectionError("Connection failed")
         client.set_transport(mock_transport)
 
-        # Mock metrics to avoid missing argument error
-        client._metrics.record_failure = MagicMock()
-
         with pytest.raises(ConnectionError):
             await client.list_tools()
 
@@ -105,6 +98,79 @@ class TestMCPClientRetryLogic:
         assert mock_transport.list_tools.call_count == 3
 
 
+class TestMCPClientCircuitBreaking:
+    """Test client circuit breaker behavior."""
+
+    @staticmethod
+    def _failing_client(failure_threshold: int) -> tuple[MCPClient, AsyncMock]:
+        config = MCPClientConfig(
+            retry_policy=RetryConfig(max_retries=3, base_delay=0.01),
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=failure_threshold, recovery_timeout=60.0),
+        )
+        client = MCPClient(config)
+        mock_transport = AsyncMock()
+        mock_transport.list_tools.side_effect = ConnectionError("Connection failed")
+        client.set_transport(mock_transport)
+        return client, mock_transport
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_stops_retries(self):
+        """Test that retries stop once the circuit opens."""
+        client, mock_transport = self._failing_client(failure_threshold=2)
+
+        with pytest.raises(ConnectionError):
+            await client.list_tools()
+
+        assert mock_transport.list_tools.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """Test that later calls are rejected without reaching the server."""
+        client, mock_transport = self._failing_client(failure_threshold=2)
+        with pytest.raises(ConnectionError):
+            await client.list_tools()
+
+        with pytest.raises(CircuitOpenError):
+            await client.list_tools()
+
+        assert mock_transport.list_tools.call_count == 2
+        assert client.get_circuit_stats()["server"]["state"] == "open"
+        assert client.get_metrics().error_counts == {"ConnectionError": 2, "CircuitOpenError": 1}
+
+    @pytest.mark.asyncio
+    async def test_unreachable_server_opens_circuit(self):
+        """Test that connection failures of a real transport count against the circuit."""
+        config = MCPClientConfig(
+            retry_policy=RetryConfig(max_retries=0, base_delay=0.01),
+            circuit_breaker=CircuitBreakerConfig(failure_threshold=2, recovery_timeout=60.0),
+        )
+        client = MCPClient(config)
+        client.set_transport(SSETransport("http://127.0.0.1:1/sse", timeout=2.0))
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await client.list_tools()
+        with pytest.raises(CircuitOpenError):
+            await client.list_tools()
+
+        server = client.get_circuit_stats()["server"]
+        assert server["total_successes"] == 0
+        assert server["total_failures"] == 2
+
+    @pytest.mark.asyncio
+    async def test_new_transport_resets_circuits(self):
+        """Test that switching servers discards failures of the previous one."""
+        client, _ = self._failing_client(failure_threshold=2)
+        with pytest.raises(ConnectionError):
+            await client.list_tools()
+
+        mock_transport = AsyncMock()
+        mock_transport.list_tools.return_value = ["tool1"]
+        client.set_transport(mock_transport)
+
+        assert await client.list_tools() == ["tool1"]
+
+
 class TestMCPClientToolCalling:
     """Test tool calling functionality."""
 
@@ -252,9 +318,6 @@ class TestClientStatistics:
         mock_transport.list_tools.side_effect = ServerError("Server error")
         client.set_transport(mock_transport)
 
-        # Mock metrics to avoid missing argument error
-        client._metrics.record_failure = MagicMock()
-
         with pytest.raises(ServerError):
             await client.list_tools()
 
@@ -284,8 +347,5 @@ class TestClientErrorHandling:
         mock_transport.list_tools.side_effect = TimeoutError("Request timed out")
         client.set_transport(mock_transport)
 
-        # Mock metrics to avoid missing argument error
-        client._metrics.record_failure = MagicMock()
-
         with pytest.raises(TimeoutError):
             await client.list_tools()
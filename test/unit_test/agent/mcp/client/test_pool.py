@@ -4,11 +4,23 @@ Real-world usage tests for MCP client connection and server pooling.
 Tests cover connection pooling, server pool management, and failover functionality.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from gearmeshing_ai.agent.mcp.client.pool import ConnectionPool, PooledConnection, ServerPool
+from gearmeshing_ai.agent.mcp.client.exceptions import ConnectionError, TimeoutError
+from gearmeshing_ai.agent.mcp.client.config import CircuitBreakerConfig, HedgingConfig
+from gearmeshing_ai.agent.mcp.client.exceptions import ServerError
+from gearmeshing_ai.agent.mcp.client.pool import (
+    ConnectionPool,
+    LoadBalancer,
+    LoadBalanceStrategy,
+    PooledConnection,
+    ServerPool,
+    WaitTimeHistogram,
+)
+from gearmeshing_ai.agent.mcp.client.resilience import LatencyWindow
 
 
 class TestPooledConnection:
@@ -217,3 +229,618 @@ class TestServerPooling:
         pool = ServerPool(server_configs)
 
         assert pool is not None
+
+
+def _fake_opener(delay: float = 0.0):
+    """Build a replacement for ConnectionPool._open_connection that needs no server."""
+    opened = []
+
+    async def open_connection(url, config=None):
+        await asyncio.sleep(delay)
+        client = MagicMock()
+        client.close = AsyncMock()
+        client.call_tool = AsyncMock(side_effect=lambda tool_name, arguments: {"tool": tool_name})
+        conn = PooledConnection(transport=MagicMock(), client=client, server_name="default", url=url)
+        opened.append(conn)
+        return conn
+
+    return open_connection, opened
+
+
+class TestConnectionLeasing:
+    """Test awaitable connection leasing."""
+
+    @pytest.mark.asyncio
+    async def test_lease_reuses_released_connection(self):
+        """Test that a released connection is reused for the same URL."""
+        pool = ConnectionPool(max_size=2)
+        pool._open_connection, opened = _fake_opener()
+
+        async with pool.lease("http://server-a/mcp") as first:
+            pass
+        async with pool.lease("http://server-a/mcp") as second:
+            pass
+
+        assert first is second
+        assert len(opened) == 1
+        assert pool.get_stats()["available_connections"] == 1
+        assert pool.get_stats()["total_leases"] == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_connections_are_keyed_per_url(self):
+        """Test that an idle connection is not handed out for another URL."""
+        pool = ConnectionPool(max_size=2)
+        pool._open_connection, opened = _fake_opener()
+
+        async with pool.lease("http://server-a/mcp"):
+            pass
+        async with pool.lease("http://server-b/mcp") as conn:
+            assert conn.url == "http://server-b/mcp"
+
+        assert len(opened) == 2
+        assert pool.get_stats()["idle_connections_by_url"] == {"http://server-a/mcp": 1, "http://server-b/mcp": 1}
+
+    @pytest.mark.asyncio
+    async def test_exhausted_pool_queues_instead_of_failing(self):
+        """Test that callers wait for a released connection when the pool is full."""
+        pool = ConnectionPool(max_size=1, acquire_timeout=1.0)
+        pool._open_connection, opened = _fake_opener()
+
+        holder = await pool.get_connection("http://server-a/mcp")
+        waiter = asyncio.create_task(pool.get_connection("http://server-a/mcp"))
+        await asyncio.sleep(0.01)
+        assert pool.get_stats()["waiting_requests"] == 1
+
+        await pool.release_connection(holder)
+        handed_over = await waiter
+
+        assert handed_over is holder
+        assert len(opened) == 1
+        assert pool.wait_times.count == 2
+        assert pool.wait_times.max > 0
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_fifo_order(self):
+        """Test that the longest waiting caller is served first."""
+        pool = ConnectionPool(max_size=1, acquire_timeout=1.0)
+        pool._open_connection, _ = _fake_opener()
+        order = []
+
+        async def worker(name):
+            async with pool.lease("http://server-a/mcp"):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        holder = await pool.get_connection("http://server-a/mcp")
+        tasks = []
+        for name in ["first", "second", "third"]:
+            tasks.append(asyncio.create_task(worker(name)))
+            await asyncio.sleep(0.001)
+        await pool.release_connection(holder)
+        await asyncio.gather(*tasks)
+
+        assert order == ["first", "second", "third"]
+
+    @pytest.mark.asyncio
+    async def test_waiter_for_other_url_gets_fresh_connection(self):
+        """Test that a released connection is traded for a slot when the waiter needs another URL."""
+        pool = ConnectionPool(max_size=1, acquire_timeout=1.0)
+        pool._open_connection, opened = _fake_opener()
+
+        holder = await pool.get_connection("http://server-a/mcp")
+        waiter = asyncio.create_task(pool.get_connection("http://server-b/mcp"))
+        await asyncio.sleep(0.01)
+        await pool.release_connection(holder)
+        conn = await waiter
+
+        assert conn.url == "http://server-b/mcp"
+        holder.client.close.assert_awaited_once()
+        assert len(pool.connections) == 1
+        assert len(opened) == 2
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout(self):
+        """Test that waiting gives up with TimeoutError."""
+        pool = ConnectionPool(max_size=1)
+        pool._open_connection, _ = _fake_opener()
+
+        await pool.get_connection("http://server-a/mcp")
+
+        with pytest.raises(TimeoutError):
+            await pool.get_connection("http://server-a/mcp", timeout=0.05)
+
+        stats = pool.get_stats()
+        assert stats["total_wait_timeouts"] == 1
+        assert stats["waiting_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_bounded_wait_queue(self):
+        """Test that callers beyond max_waiters are rejected immediately."""
+        pool = ConnectionPool(max_size=1, max_waiters=1, acquire_timeout=1.0)
+        pool._open_connection, _ = _fake_opener()
+
+        holder = await pool.get_connection("http://server-a/mcp")
+        waiter = asyncio.create_task(pool.get_connection("http://server-a/mcp"))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ConnectionError, match="exhausted"):
+            await pool.get_connection("http://server-a/mcp")
+
+        await pool.release_connection(holder)
+        await waiter
+        assert pool.get_stats()["total_rejections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_connections_are_created_concurrently(self):
+        """Test that slow connection setup does not serialize under the pool lock."""
+        pool = ConnectionPool(max_size=5)
+        pool._open_connection, opened = _fake_opener(delay=0.1)
+
+        start = asyncio.get_running_loop().time()
+        await asyncio.gather(*(pool.get_connection(f"http://server-{i}/mcp") for i in range(5)))
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert len(opened) == 5
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_failed_creation_frees_slot(self):
+        """Test that a failed connection attempt frees its slot."""
+        pool = ConnectionPool(max_size=1)
+        pool._open_connection = AsyncMock(side_effect=ConnectionError("refused"))
+
+        with pytest.raises(ConnectionError):
+            await pool.get_connection("http://server-a/mcp")
+
+        assert pool.get_stats()["pending_connections"] == 0
+        pool._open_connection, _ = _fake_opener()
+        assert await pool.get_connection("http://server-a/mcp") is not None
+
+    @pytest.mark.asyncio
+    async def test_connection_error_in_lease_discards_connection(self):
+        """Test that a connection failing inside the lease is not reused."""
+        pool = ConnectionPool(max_size=1)
+        pool._open_connection, opened = _fake_opener()
+
+        with pytest.raises(ConnectionError):
+            async with pool.lease("http://server-a/mcp"):
+                raise ConnectionError("dropped")
+
+        async with pool.lease("http://server-a/mcp"):
+            pass
+
+        assert len(opened) == 2
+        assert pool.total_destroyed == 1
+
+    @pytest.mark.asyncio
+    async def test_close_fails_waiters(self):
+        """Test that closing the pool fails queued callers."""
+        pool = ConnectionPool(max_size=1, acquire_timeout=1.0)
+        pool._open_connection, _ = _fake_opener()
+
+        await pool.get_connection("http://server-a/mcp")
+        waiter = asyncio.create_task(pool.get_connection("http://server-a/mcp"))
+        await asyncio.sleep(0.01)
+
+        await pool.close()
+
+        with pytest.raises(ConnectionError, match="closed"):
+            await waiter
+
+
+class TestWaitTimeHistogram:
+    """Test WaitTimeHistogram."""
+
+    def test_observe_and_percentiles(self):
+        """Test bucketing and percentile estimation."""
+        histogram = WaitTimeHistogram()
+        for _ in range(90):
+            histogram.observe(0.0)
+        for _ in range(10):
+            histogram.observe(0.3)
+
+        summary = histogram.to_dict()
+
+        assert summary["count"] == 100
+        assert summary["p50"] == 0.001
+        assert summary["p95"] == 0.5
+        assert summary["buckets"]["le_0.5"] == 10
+        assert summary["max"] == pytest.approx(0.3)
+
+
+class TestServerPoolExecution:
+    """Test ServerPool tool execution through leased connections."""
+
+    @pytest.mark.asyncio
+    async def test_execute_on_server_uses_lease(self):
+        """Test that tool calls go through a leased connection's client."""
+        pool = ServerPool([{"urls": ["http://localhost:8082/mcp"], "name": "server1"}])
+        connection_pool = pool.connection_pools["server1"]
+        connection_pool._open_connection, opened = _fake_opener()
+
+        results = [await pool.execute_tool_call("server1", "get_tasks", {}) for _ in range(2)]
+
+        assert results == [{"tool": "get_tasks"}, {"tool": "get_tasks"}]
+        assert len(opened) == 1
+        assert connection_pool.get_stats()["leased_connections"] == 0
+
+
+class TestLoadBalancer:
+    """Test LoadBalancer strategies."""
+
+    def test_round_robin_rotates(self):
+        """Test that round-robin visits every target in turn."""
+        balancer = LoadBalancer(LoadBalanceStrategy.ROUND_ROBIN)
+        targets = [("a", 1), ("b", 1), ("c", 1)]
+
+        picks = [balancer.select(targets) for _ in range(6)]
+
+        assert picks == ["a", "b", "c", "a", "b", "c"]
+
+    def test_smooth_weighted_round_robin(self):
+        """Test that picks follow weights and are interleaved."""
+        balancer = LoadBalancer("weighted_round_robin")
+        targets = [("a", 5), ("b", 1), ("c", 1)]
+
+        picks = [balancer.select(targets) for _ in range(7)]
+
+        assert picks == ["a", "a", "b", "a", "c", "a", "a"]
+
+    def test_least_connections_prefers_idle_target(self):
+        """Test that busy targets are avoided."""
+        balancer = LoadBalancer(LoadBalanceStrategy.LEAST_CONNECTIONS)
+        targets = [("a", 1), ("b", 1)]
+
+        with balancer.track("a"):
+            picks = {balancer.select(targets) for _ in range(4)}
+
+        assert picks == {"b"}
+        assert balancer.loads["a"].outstanding == 0
+
+    def test_least_connections_accounts_for_weight(self):
+        """Test that outstanding requests are scaled by weight."""
+        balancer = LoadBalancer(LoadBalanceStrategy.LEAST_CONNECTIONS)
+        balancer._load("a").outstanding = 2
+        balancer._load("b").outstanding = 1
+
+        assert balancer.select([("a", 4), ("b", 1)]) == "a"
+
+    def test_peak_ewma_avoids_slow_target(self):
+        """Test that a slow target loses traffic to a fast one."""
+        balancer = LoadBalancer(LoadBalanceStrategy.PEAK_EWMA)
+        balancer._observe(balancer._load("slow"), 0.5)
+        balancer._observe(balancer._load("fast"), 0.01)
+
+        picks = {balancer.select([("slow", 1), ("fast", 1)]) for _ in range(4)}
+
+        assert picks == {"fast"}
+
+    def test_peak_ewma_reacts_to_latency_spike(self):
+        """Test that a slower observation replaces the average immediately."""
+        balancer = LoadBalancer(LoadBalanceStrategy.PEAK_EWMA, decay_time=10.0)
+        load = balancer._load("a")
+
+        balancer._observe(load, 0.01)
+        balancer._observe(load, 0.4)
+        assert load.ewma_latency == pytest.approx(0.4)
+
+        balancer._observe(load, 0.01)
+        assert load.ewma_latency == pytest.approx(0.4, rel=0.01)
+
+    def test_peak_ewma_spreads_over_unmeasured_busy_target(self):
+        """Test that concurrent picks do not all pile onto an unmeasured target."""
+        balancer = LoadBalancer(LoadBalanceStrategy.PEAK_EWMA)
+        balancer._observe(balancer._load("measured"), 0.05)
+
+        with balancer.track("new"):
+            assert balancer.select([("new", 1), ("measured", 1)]) == "measured"
+
+    def test_failures_record_penalty_latency(self):
+        """Test that failing fast does not make a target look attractive."""
+        balancer = LoadBalancer(LoadBalanceStrategy.PEAK_EWMA, failure_penalty=2.0)
+
+        with pytest.raises(RuntimeError), balancer.track("a"):
+            raise RuntimeError("boom")
+
+        assert balancer.loads["a"].failed_requests == 1
+        assert balancer.loads["a"].ewma_latency == pytest.approx(2.0)
+
+    def test_cancelled_requests_are_not_recorded(self):
+        """Test that cancellation releases the slot without recording latency."""
+        balancer = LoadBalancer(LoadBalanceStrategy.PEAK_EWMA)
+
+        with pytest.raises(asyncio.CancelledError), balancer.track("a"):
+            raise asyncio.CancelledError()
+
+        assert balancer.loads["a"].outstanding == 0
+        assert balancer.loads["a"].last_observed is None
+
+    def test_rank_orders_remaining_by_load(self):
+        """Test failover ranking puts the least loaded targets first."""
+        balancer = LoadBalancer(LoadBalanceStrategy.LEAST_CONNECTIONS)
+        balancer._load("a").outstanding = 3
+        balancer._load("b").outstanding = 1
+        balancer._load("c").outstanding = 2
+
+        assert balancer.rank([("a", 1), ("b", 1), ("c", 1)]) == ["b", "c", "a"]
+
+    def test_select_requires_targets(self):
+        """Test that selecting from nothing fails."""
+        with pytest.raises(ValueError):
+            LoadBalancer().select([])
+
+
+class TestServerPoolLoadBalancing:
+    """Test ServerPool server selection and failover order."""
+
+    @staticmethod
+    def _pool(configs, strategy=LoadBalanceStrategy.ROUND_ROBIN):
+        pool = ServerPool(configs, load_balance_strategy=strategy)
+        calls = []
+
+        async def execute(server_name, tool_name, arguments=None):
+            calls.append(server_name)
+            if server_name in pool.failing:
+                raise ConnectionError(f"{server_name} down")
+            return server_name
+
+        pool.failing = set()
+        pool._execute_on_server = execute
+        return pool, calls
+
+    @pytest.mark.asyncio
+    async def test_failover_follows_priority(self):
+        """Test that backups are tried by ascending priority, not declaration order."""
+        pool, calls = self._pool(
+            [
+                {"urls": ["http://a/mcp"], "name": "low", "priority": 3},
+                {"urls": ["http://b/mcp"], "name": "primary", "priority": 1},
+                {"urls": ["http://c/mcp"], "name": "secondary", "priority": 2},
+            ]
+        )
+        pool.failing = {"primary", "secondary"}
+
+        result = await pool.execute_tool_call("primary", "get_tasks", {})
+
+        assert result == "low"
+        assert calls == ["primary", "secondary", "low"]
+
+    @pytest.mark.asyncio
+    async def test_balancer_distributes_within_priority_tier(self):
+        """Test that requests without a preferred server follow the weights of the top tier."""
+        pool, calls = self._pool(
+            [
+                {"urls": ["http://a/mcp"], "name": "large", "weight": 3},
+                {"urls": ["http://b/mcp"], "name": "small", "weight": 1},
+                {"urls": ["http://c/mcp"], "name": "backup", "priority": 2},
+            ],
+            strategy="weighted_round_robin",
+        )
+
+        for _ in range(8):
+            await pool.execute_tool_call(None, "get_tasks", {})
+
+        assert calls.count("large") == 6
+        assert calls.count("small") == 2
+        assert "backup" not in calls
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_servers_are_skipped(self):
+        """Test that unhealthy servers are left out of failover."""
+        pool, calls = self._pool(
+            [
+                {"urls": ["http://a/mcp"], "name": "server1"},
+                {"urls": ["http://b/mcp"], "name": "server2"},
+            ]
+        )
+        pool.server_health["server1"] = False
+
+        assert await pool.execute_tool_call("server1", "get_tasks", {}) == "server2"
+        assert calls == ["server2"]
+        assert await pool.get_healthy_server() == "server2"
+
+    @pytest.mark.asyncio
+    async def test_all_servers_failing_raises(self):
+        """Test that exhausting every server raises ServerError."""
+        pool, calls = self._pool([{"urls": ["http://a/mcp"], "name": "server1"}])
+        pool.failing = {"server1"}
+
+        with pytest.raises(ServerError):
+            await pool.execute_tool_call("server1", "get_tasks", {})
+
+    @pytest.mark.asyncio
+    async def test_execution_tracks_server_and_url_load(self):
+        """Test that executions feed the balancers and show up in stats."""
+        pool = ServerPool(
+            [{"urls": ["http://localhost:8082/mcp", "http://localhost:8083/mcp"], "name": "server1"}],
+            load_balance_strategy=LoadBalanceStrategy.LEAST_CONNECTIONS,
+        )
+        pool.connection_pools["server1"]._open_connection, opened = _fake_opener()
+
+        await asyncio.gather(*(pool.execute_tool_call("server1", "get_tasks", {}) for _ in range(4)))
+
+        stats = pool.get_stats()
+        assert stats["load_balance_strategy"] == "least_connections"
+        assert stats["server_load"]["server1"]["total_requests"] == 4
+        assert stats["server_load"]["server1"]["outstanding"] == 0
+        assert set(stats["url_load"]["server1"]) == {"http://localhost:8082/mcp", "http://localhost:8083/mcp"}
+
+
+class TestServerPoolCircuitBreaking:
+    """Test ServerPool circuit breakers and their effect on server health."""
+
+    @staticmethod
+    def _pool(failure_threshold=2, recovery_timeout=60.0):
+        pool = ServerPool(
+            [
+                {"urls": ["http://a/mcp"], "name": "server1"},
+                {"urls": ["http://b/mcp"], "name": "server2"},
+            ],
+            circuit_breaker=CircuitBreakerConfig(
+                failure_threshold=failure_threshold, recovery_timeout=recovery_timeout
+            ),
+        )
+        pool.failing = set()
+        calls = []
+
+        for name, connection_pool in pool.connection_pools.items():
+
+            async def call_tool(tool_name, arguments, name=name):
+                calls.append(name)
+                if name in pool.failing:
+                    raise ConnectionError(f"{name} down")
+                return name
+
+            async def open_connection(url, config=None, call_tool=call_tool):
+                client = MagicMock()
+                client.close = AsyncMock()
+                client.call_tool = call_tool
+                transport = MagicMock()
+                transport.list_tools = AsyncMock(return_value=[])
+                return PooledConnection(transport=transport, client=client, server_name="default", url=url)
+
+            connection_pool._open_connection = open_connection
+
+        return pool, calls
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_marks_server_unhealthy(self):
+        """Test that a tripped server circuit takes the server out of rotation."""
+        pool, calls = self._pool(failure_threshold=2)
+        pool.failing = {"server1"}
+
+        for _ in range(2):
+            assert await pool.execute_tool_call("server1", "get_tasks", {}) == "server2"
+        calls.clear()
+
+        assert pool.server_health["server1"] is False
+        assert await pool.execute_tool_call("server1", "get_tasks", {}) == "server2"
+        assert calls == ["server2"]
+        assert pool.get_stats()["circuit_breakers"]["server1"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_restores_server(self):
+        """Test that a successful probe after recovery marks the server healthy again."""
+        pool, calls = self._pool(failure_threshold=1, recovery_timeout=0.01)
+        pool.failing = {"server1"}
+        await pool.execute_tool_call("server1", "get_tasks", {})
+        assert pool.server_health["server1"] is False
+
+        pool.failing = set()
+        await asyncio.sleep(0.02)
+
+        assert await pool.execute_tool_call("server1", "get_tasks", {}) == "server1"
+        assert pool.server_health["server1"] is True
+
+    @pytest.mark.asyncio
+    async def test_tool_circuit_only_skips_that_tool(self):
+        """Test that an open tool circuit leaves other tools on the server."""
+        pool, _ = self._pool()
+        pool.circuit_breakers.get("server1", "get_tasks")._open()
+
+        assert list(pool._failover_order("server1", "get_tasks")) == ["server2"]
+        assert list(pool._failover_order("server1", "list_docs"))[0] == "server1"
+
+    @pytest.mark.asyncio
+    async def test_health_check_closes_circuit(self):
+        """Test that a passing health check counts as a successful probe."""
+        pool, _ = self._pool()
+        pool.circuit_breakers.get("server1")._open()
+        assert pool.server_health["server1"] is False
+
+        await pool._check_server_health()
+
+        assert pool.server_health["server1"] is True
+        assert pool.circuit_breakers.get("server1").state.value == "closed"
+
+
+class TestServerPoolHedging:
+    """Test hedged requests for idempotent tools."""
+
+    @staticmethod
+    def _pool(latencies, **hedging):
+        pool = ServerPool(
+            [
+                {"urls": ["http://a/mcp"], "name": "server1"},
+                {"urls": ["http://b/mcp"], "name": "server2"},
+            ],
+            hedging=HedgingConfig(enabled=True, min_samples=5, **hedging),
+        )
+        calls = []
+
+        async def execute(server_name, tool_name, arguments=None):
+            calls.append(server_name)
+            latency = latencies[server_name]
+            if isinstance(latency, Exception):
+                raise latency
+            await asyncio.sleep(latency)
+            return server_name
+
+        pool._execute_on_server = execute
+        return pool, calls
+
+    @staticmethod
+    def _warm_up(pool, tool_name="get_tasks", latency=0.01):
+        for _ in range(pool.hedging.min_samples):
+            pool._tool_latencies.setdefault(tool_name, LatencyWindow()).observe(latency)
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged(self):
+        """Test that a call slower than the percentile is raced against another server."""
+        pool, calls = self._pool({"server1": 1.0, "server2": 0.01})
+        self._warm_up(pool)
+
+        started = asyncio.get_running_loop().time()
+        result = await pool.execute_tool_call("server1", "get_tasks", {})
+
+        assert result == "server2"
+        assert calls == ["server1", "server2"]
+        assert asyncio.get_running_loop().time() - started < 0.5
+        assert pool.total_hedges == 1
+        assert pool.total_hedge_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_call_is_not_hedged(self):
+        """Test that calls finishing within the delay send no hedge."""
+        pool, calls = self._pool({"server1": 0.001, "server2": 0.001})
+        self._warm_up(pool, latency=0.2)
+
+        assert await pool.execute_tool_call("server1", "get_tasks", {}) == "server1"
+        assert calls == ["server1"]
+        assert pool.total_hedges == 0
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_tools_are_not_hedged(self):
+        """Test that write tools keep serial failover."""
+        pool, calls = self._pool({"server1": 0.05, "server2": 0.01})
+        self._warm_up(pool, tool_name="create_task")
+
+        assert await pool.execute_tool_call("server1", "create_task", {}) == "server1"
+        assert calls == ["server1"]
+
+    @pytest.mark.asyncio
+    async def test_no_hedging_before_enough_samples(self):
+        """Test that hedging waits for latency observations."""
+        pool, calls = self._pool({"server1": 0.05, "server2": 0.01})
+
+        assert await pool.execute_tool_call("server1", "get_tasks", {}) == "server1"
+        assert pool._hedge_delay("get_tasks") is None
+
+    @pytest.mark.asyncio
+    async def test_failure_fails_over_while_hedging(self):
+        """Test that a failed first attempt moves on to the next server."""
+        pool, calls = self._pool({"server1": ConnectionError("down"), "server2": 0.01})
+        self._warm_up(pool, latency=1.0)
+
+        assert await pool.execute_tool_call("server1", "get_tasks", {}) == "server2"
+        assert calls == ["server1", "server2"]
+        assert pool.total_hedges == 0
+
+    @pytest.mark.asyncio
+    async def test_all_attempts_failing_raises(self):
+        """Test that hedged calls still raise ServerError when every server fails."""
+        pool, _ = self._pool({"server1": ConnectionError("down"), "server2": ConnectionError("down")})
+        self._warm_up(pool)
+
+        with pytest.raises(ServerError):
+            await pool.execute_tool_call("server1", "get_tasks", {})
@@ -62,9 +62,6 @@ class TestMCPClientProposal:
         # Mock transport to raise exception
         mcp_client._transport.call_tool = AsyncMock(side_effect=Exception("Tool error"))
 
-        # Mock metrics to avoid the record_failure error
-        mcp_client._metrics.record_failure = MagicMock()
-
         result = await mcp_client.execute_proposed_tool("run_tests", {})
 
         assert result["success"] is False
@@ -0,0 +1,198 @@
+"""
+Real-world usage tests for MCP client circuit breaking.
+
+Tests cover circuit state transitions, per-server and per-tool circuits and latency windows.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from gearmeshing_ai.agent.mcp.client.config import CircuitBreakerConfig
+from gearmeshing_ai.agent.mcp.client.exceptions import CircuitOpenError, ConnectionError, ToolNotFoundError
+from gearmeshing_ai.agent.mcp.client.resilience import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    LatencyWindow,
+)
+
+
+def _fail(breaker: CircuitBreaker, error: Exception | None = None) -> None:
+    with pytest.raises(type(error or ConnectionError("down"))), breaker.call():
+        raise error or ConnectionError("down")
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens at the failure threshold and rejects requests."""
+        breaker = CircuitBreaker("server", failure_threshold=3, recovery_timeout=30.0)
+
+        for _ in range(3):
+            _fail(breaker)
+
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.acquire()
+        assert exc_info.value.circuit_name == "server"
+        assert exc_info.value.retry_after > 0
+        assert breaker.total_rejections == 1
+
+    def test_success_resets_failure_count(self):
+        """Test that only consecutive failures count."""
+        breaker = CircuitBreaker("server", failure_threshold=2)
+
+        _fail(breaker)
+        with breaker.call():
+            pass
+        _fail(breaker)
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_non_transient_errors_do_not_trip(self):
+        """Test that errors proving the server responded count as successes."""
+        breaker = CircuitBreaker("server", failure_threshold=1)
+
+        _fail(breaker, ToolNotFoundError("missing"))
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.total_successes == 1
+
+    def test_half_open_probe_closes_circuit(self):
+        """Test that a successful probe after the recovery timeout closes the circuit."""
+        breaker = CircuitBreaker("server", failure_threshold=1, recovery_timeout=0.01)
+        _fail(breaker)
+        time.sleep(0.02)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        with breaker.call():
+            # Only one probe at a time
+            assert breaker.allows_requests is False
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_failed_probe_reopens_circuit(self):
+        """Test that a failed probe opens the circuit again."""
+        breaker = CircuitBreaker("server", failure_threshold=3, recovery_timeout=0.01)
+        for _ in range(3):
+            _fail(breaker)
+        time.sleep(0.02)
+
+        _fail(breaker)
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.times_opened == 2
+
+    def test_cancellation_releases_probe_without_verdict(self):
+        """Test that a cancelled probe frees its slot and keeps the circuit half-open."""
+        breaker = CircuitBreaker("server", failure_threshold=1, recovery_timeout=0.01)
+        _fail(breaker)
+        time.sleep(0.02)
+
+        with pytest.raises(asyncio.CancelledError), breaker.call():
+            raise asyncio.CancelledError()
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allows_requests is True
+
+    def test_state_change_callback(self):
+        """Test that transitions are reported."""
+        transitions = []
+        breaker = CircuitBreaker(
+            "server", failure_threshold=1, on_state_change=lambda b, old, new: transitions.append((old, new))
+        )
+
+        _fail(breaker)
+        breaker.reset()
+
+        assert transitions == [
+            (CircuitState.CLOSED, CircuitState.OPEN),
+            (CircuitState.OPEN, CircuitState.CLOSED),
+        ]
+
+
+class TestCircuitBreakerRegistry:
+    """Test per-server and per-tool circuits."""
+
+    def test_tool_circuit_isolates_broken_tool(self):
+        """Test that a failing tool does not cut off a server whose other tools work."""
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig(failure_threshold=2))
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError), registry.guard("clickup", "get_tasks"):
+                raise ConnectionError("down")
+            with registry.guard("clickup", "create_task"):
+                pass
+
+        assert registry.allows("clickup", "get_tasks") is False
+        assert registry.allows("clickup", "create_task") is True
+        assert registry.get("clickup").state == CircuitState.CLOSED
+
+    def test_tool_rejection_is_not_recorded_on_server(self):
+        """Test that a rejected tool call is neither a success nor a failure for the server."""
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig(failure_threshold=1))
+        with pytest.raises(ConnectionError), registry.guard("clickup", "get_tasks"):
+            raise ConnectionError("down")
+        server = registry.get("clickup")
+        successes = server.total_successes
+
+        with pytest.raises(CircuitOpenError), registry.guard("clickup", "get_tasks"):
+            pass
+
+        assert server.total_successes == successes
+
+    def test_disabled_registry_never_rejects(self):
+        """Test that disabled circuits let every request through."""
+        registry = CircuitBreakerRegistry(CircuitBreakerConfig(enabled=False, failure_threshold=1))
+
+        for _ in range(3):
+            with pytest.raises(ConnectionError), registry.guard("clickup"):
+                raise ConnectionError("down")
+
+        assert registry.allows("clickup") is True
+
+    def test_state_change_reports_server_and_tool(self):
+        """Test that the registry callback identifies the circuit."""
+        changes = []
+        registry = CircuitBreakerRegistry(
+            CircuitBreakerConfig(failure_threshold=1),
+            on_state_change=lambda server, tool, state: changes.append((server, tool, state)),
+        )
+
+        with pytest.raises(ConnectionError), registry.guard("clickup", "get_tasks"):
+            raise ConnectionError("down")
+
+        assert ("clickup", "get_tasks", CircuitState.OPEN) in changes
+        assert ("clickup", None, CircuitState.OPEN) in changes
+        assert set(registry.get_stats()) == {"clickup", "clickup/get_tasks"}
+
+
+class TestLatencyWindow:
+    """Test LatencyWindow percentiles."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        window = LatencyWindow(size=100)
+        for i in range(1, 101):
+            window.observe(i / 100)
+
+        assert window.percentile(0.5) == pytest.approx(0.5)
+        assert window.percentile(0.95) == pytest.approx(0.95)
+        assert len(window) == 100
+
+    def test_window_keeps_recent_samples(self):
+        """Test that old samples are evicted."""
+        window = LatencyWindow(size=10)
+        for _ in range(10):
+            window.observe(5.0)
+        for _ in range(10):
+            window.observe(0.1)
+
+        assert window.percentile(0.99) == pytest.approx(0.1)
+
+    def test_empty_window(self):
+        """Test that an empty window reports zero."""
+        assert LatencyWindow().percentile(0.95) == 0.0
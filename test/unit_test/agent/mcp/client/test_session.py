@@ -0,0 +1,273 @@
+"""
+Real-world usage tests for persistent MCP sessions.
+
+Tests cover lazy connection, request multiplexing, reconnection and session statistics.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import anyio
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, ErrorData
+
+from gearmeshing_ai.agent.mcp.client.exceptions import ConnectionError, TimeoutError
+from gearmeshing_ai.agent.mcp.client.session import PersistentSession, SessionStats, is_connection_lost
+
+
+class FakeClientSession:
+    """In-process stand-in for mcp.ClientSession."""
+
+    instances: list["FakeClientSession"] = []
+    initialize_delay = 0.0
+
+    def __init__(self, read_stream, write_stream):
+        self.read_stream = read_stream
+        self.write_stream = write_stream
+        self.initialize_calls = 0
+        self.closed = False
+        FakeClientSession.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.closed = True
+
+    async def initialize(self):
+        await asyncio.sleep(self.initialize_delay)
+        self.initialize_calls += 1
+
+    async def call_tool(self, name, arguments):
+        await asyncio.sleep(0.01)
+        return {"tool": name, "arguments": arguments, "session": id(self)}
+
+
+class StreamFactory:
+    """Stream factory counting how many connections were opened."""
+
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+
+    @asynccontextmanager
+    async def __call__(self):
+        self.opened += 1
+        try:
+            yield ("read", "write")
+        finally:
+            self.closed += 1
+
+
+@pytest.fixture
+def fake_session_cls():
+    FakeClientSession.instances = []
+    FakeClientSession.initialize_delay = 0.0
+    with patch("gearmeshing_ai.agent.mcp.client.session.ClientSession", FakeClientSession):
+        yield FakeClientSession
+
+
+class TestSessionStats:
+    """Test SessionStats bookkeeping."""
+
+    def test_record_connect_counts_reconnects(self):
+        """Test that only connections after the first count as reconnects."""
+        stats = SessionStats()
+
+        stats.record_connect(0.2)
+        stats.record_connect(0.4)
+
+        assert stats.connects == 2
+        assert stats.reconnects == 1
+        assert stats.average_connect_time == pytest.approx(0.3)
+        assert stats.connected_since is not None
+
+    def test_request_tracking(self):
+        """Test in-flight and peak tracking."""
+        stats = SessionStats()
+
+        stats.start_request()
+        stats.start_request()
+        stats.finish_request(success=True)
+        stats.finish_request(success=False)
+
+        assert stats.total_requests == 2
+        assert stats.failed_requests == 1
+        assert stats.in_flight == 0
+        assert stats.peak_in_flight == 2
+        assert stats.to_dict()["peak_in_flight"] == 2
+
+
+class TestIsConnectionLost:
+    """Test connection loss detection."""
+
+    def test_closed_stream_errors(self):
+        """Test that closed or broken streams mean the connection is lost."""
+        assert is_connection_lost(anyio.ClosedResourceError())
+        assert is_connection_lost(anyio.BrokenResourceError())
+
+    def test_connection_closed_mcp_error(self):
+        """Test that the MCP connection-closed error means the connection is lost."""
+        error = McpError(ErrorData(code=CONNECTION_CLOSED, message="Connection closed"))
+
+        assert is_connection_lost(error)
+
+    def test_other_errors(self):
+        """Test that tool and protocol errors keep the session."""
+        assert not is_connection_lost(McpError(ErrorData(code=-32602, message="Invalid params")))
+        assert not is_connection_lost(ValueError("bad"))
+
+
+class TestPersistentSession:
+    """Test PersistentSession behavior."""
+
+    @pytest.mark.asyncio
+    async def test_session_is_opened_once_for_many_requests(self, fake_session_cls):
+        """Test that sequential requests reuse one initialized session."""
+        factory = StreamFactory()
+        session = PersistentSession(factory, name="test")
+
+        for i in range(5):
+            result = await session.request(lambda s, i=i: s.call_tool("echo", {"i": i}))
+            assert result["arguments"] == {"i": i}
+
+        assert factory.opened == 1
+        assert len(fake_session_cls.instances) == 1
+        assert fake_session_cls.instances[0].initialize_calls == 1
+        assert session.stats.total_requests == 5
+        assert session.stats.connects == 1
+
+        await session.close()
+
+        assert factory.closed == 1
+        assert session.is_connected is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_single_connect(self, fake_session_cls):
+        """Test that concurrent first requests are multiplexed over one session."""
+        fake_session_cls.initialize_delay = 0.05
+        factory = StreamFactory()
+        session = PersistentSession(factory, name="test")
+
+        results = await asyncio.gather(*(session.request(lambda s: s.call_tool("echo", {})) for _ in range(10)))
+
+        assert factory.opened == 1
+        assert len({result["session"] for result in results}) == 1
+        assert session.stats.peak_in_flight == 10
+        assert session.stats.in_flight == 0
+
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_reconnects_and_replays_on_connection_loss(self, fake_session_cls):
+        """Test that a dropped connection is re-established transparently."""
+        factory = StreamFactory()
+        session = PersistentSession(factory, name="test")
+        calls = []
+
+        async def operation(s):
+            calls.append(s)
+            if len(calls) == 1:
+                raise anyio.ClosedResourceError()
+            return "ok"
+
+        result = await session.request(operation)
+
+        assert result == "ok"
+        assert calls[0] is not calls[1]
+        assert factory.opened == 2
+        assert session.stats.reconnects == 1
+        assert session.stats.replayed_requests == 1
+        assert session.stats.failed_requests == 1
+
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_loss_without_replay_is_raised(self, fake_session_cls):
+        """Test that an operation with side effects is not run again after the connection dropped."""
+        factory = StreamFactory()
+        session = PersistentSession(factory, name="test")
+        calls = []
+
+        async def operation(s):
+            calls.append(s)
+            raise anyio.ClosedResourceError()
+
+        with pytest.raises(anyio.ClosedResourceError):
+            await session.request(operation, replay_on_disconnect=False)
+
+        assert len(calls) == 1
+        assert session.stats.replayed_requests == 0
+        assert session.is_connected is False
+
+        # The next request reconnects
+        await session.request(lambda s: s.call_tool("echo", {}))
+        assert factory.opened == 2
+
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_reconnects_when_owner_died_between_requests(self, fake_session_cls):
+        """Test that a connection dropped while idle is reopened on the next request."""
+        factory = StreamFactory()
+        session = PersistentSession(factory, name="test")
+        await session.request(lambda s: s.call_tool("echo", {}))
+
+        session._owner.cancel()
+        await asyncio.gather(session._owner, return_exceptions=True)
+        assert session.is_connected is False
+
+        await session.request(lambda s: s.call_tool("echo", {}))
+
+        assert factory.opened == 2
+        assert session.stats.reconnects == 1
+
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_non_connection_errors_are_not_replayed(self, fake_session_cls):
+        """Test that tool errors propagate without reconnecting."""
+        factory = StreamFactory()
+        session = PersistentSession(factory, name="test")
+
+        async def operation(s):
+            raise ValueError("tool failed")
+
+        with pytest.raises(ValueError):
+            await session.request(operation)
+
+        assert factory.opened == 1
+        assert session.is_connected is True
+
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_connect_failure(self, fake_session_cls):
+        """Test that failing to open the streams raises ConnectionError."""
+
+        @asynccontextmanager
+        async def failing_factory():
+            raise OSError("connection refused")
+            yield
+
+        session = PersistentSession(failing_factory, name="test")
+
+        with pytest.raises(ConnectionError):
+            await session.request(lambda s: s.call_tool("echo", {}))
+
+        assert session.stats.connect_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_connect_timeout(self, fake_session_cls):
+        """Test that a hanging handshake raises TimeoutError."""
+        fake_session_cls.initialize_delay = 1.0
+        factory = StreamFactory()
+        session = PersistentSession(factory, name="test", connect_timeout=0.05)
+
+        with pytest.raises(TimeoutError):
+            await session.get_session()
+
+        assert session.stats.connect_failures == 1
+        assert factory.closed == 1
@@ -4,11 +4,15 @@ Real-world usage tests for MCP client transports.
 Tests cover SSE, HTTP, and Stdio transport implementations.
 """
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
+import anyio
 import pytest
+from mcp.types import ListToolsResult, Tool
 
-from gearmeshing_ai.agent.mcp.client.exceptions import ConnectionError
+from gearmeshing_ai.agent.mcp.client.config import MCPClientConfig, TransportConfig
+from gearmeshing_ai.agent.mcp.client.core import MCPClient
+from gearmeshing_ai.agent.mcp.client.exceptions import ConnectionError, ServerError
 from gearmeshing_ai.agent.mcp.client.transports import HTTPTransport, SSETransport, StdioTransport
 
 
@@ -171,3 +175,126 @@ class TestTransportCommonBehavior:
 
         assert is_healthy is False
         assert transport._connected is False
+
+
+class TestPersistentTransportSessions:
+    """Test the persistent session mode of transports."""
+
+    def test_session_stats_disabled_by_default(self):
+        """Test that per-call sessions expose no session stats."""
+        transport = SSETransport("http://localhost:8082/sse/sse")
+
+        assert transport.persistent is False
+        assert transport.get_session_stats() is None
+
+    @pytest.mark.asyncio
+    async def test_persistent_calls_share_one_session(self):
+        """Test that list_tools and call_tool reuse the shared session."""
+        transport = HTTPTransport("http://localhost:3000/mcp", persistent=True)
+
+        mock_session = MagicMock()
+        mock_session.list_tools = AsyncMock(return_value=MagicMock(tools=[MagicMock(name="tool")]))
+        mock_session.call_tool = AsyncMock(return_value={"ok": True})
+        persistent_session = transport._get_persistent_session()
+        persistent_session.get_session = AsyncMock(return_value=mock_session)
+
+        await transport.list_tools()
+        result = await transport.call_tool("tool", {"a": 1})
+
+        assert result == {"ok": True}
+        assert persistent_session.get_session.await_count == 2
+        mock_session.call_tool.assert_awaited_once_with("tool", {"a": 1})
+        assert transport.get_session_stats().total_requests == 2
+        assert transport._connected is True
+
+    @pytest.mark.asyncio
+    async def test_persistent_call_tool_is_not_replayed(self):
+        """Test that a tool call interrupted by a lost connection is left to the retry policy."""
+        transport = SSETransport("http://localhost:8082/sse/sse", persistent=True)
+
+        mock_session = MagicMock()
+        mock_session.list_tools = AsyncMock(
+            side_effect=[anyio.ClosedResourceError(), MagicMock(tools=[MagicMock(name="tool")])]
+        )
+        mock_session.call_tool = AsyncMock(side_effect=anyio.ClosedResourceError())
+        persistent_session = transport._get_persistent_session()
+        persistent_session.get_session = AsyncMock(return_value=mock_session)
+        persistent_session._invalidate = AsyncMock()
+
+        with pytest.raises(ConnectionError):
+            await transport.call_tool("tool", {"a": 1})
+        await transport.list_tools()
+
+        assert mock_session.call_tool.await_count == 1
+        assert mock_session.list_tools.await_count == 2
+        assert persistent_session._invalidate.await_count == 2
+        assert transport.get_session_stats().replayed_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_persistent_session_context_yields_shared_session(self):
+        """Test that session() hands out the shared session in persistent mode."""
+        transport = StdioTransport("python", ["server.py"], persistent=True)
+        mock_session = MagicMock()
+        transport._get_persistent_session().get_session = AsyncMock(return_value=mock_session)
+
+        async with transport.session() as first:
+            pass
+        async with transport.session() as second:
+            pass
+
+        assert first is mock_session
+        assert second is mock_session
+
+    @pytest.mark.asyncio
+    async def test_close_releases_persistent_session(self):
+        """Test that closing the transport closes the shared session."""
+        transport = SSETransport("http://localhost:8082/sse/sse", persistent=True)
+        persistent_session = transport._get_persistent_session()
+        persistent_session.close = AsyncMock()
+
+        await transport.close()
+
+        persistent_session.close.assert_awaited_once()
+        assert transport._connected is False
+
+    @pytest.mark.asyncio
+    async def test_client_config_enables_persistent_transport(self):
+        """Test that MCPClient.connect honours TransportConfig.persistent_session."""
+        config = MCPClientConfig(transport=TransportConfig(persistent_session=True))
+        client = MCPClient(config)
+
+        await client.connect("http://localhost:8082/sse/sse", "sse")
+
+        assert client._transport.persistent is True
+
+
+class TestToolDefinitions:
+    """Test listing full tool definitions."""
+
+    @pytest.mark.asyncio
+    async def test_list_tool_definitions_follows_pages(self):
+        """Test that every page of a paginated tools/list response is collected."""
+        transport = HTTPTransport("http://localhost:3000/mcp", persistent=True)
+        pages = {
+            None: ListToolsResult(tools=[Tool(name="a", inputSchema={"type": "object"})], nextCursor="page2"),
+            "page2": ListToolsResult(tools=[Tool(name="b", inputSchema={"type": "object"})], nextCursor=None),
+        }
+        mock_session = MagicMock()
+        mock_session.list_tools = AsyncMock(side_effect=lambda cursor=None: pages[cursor])
+        transport._get_persistent_session().get_session = AsyncMock(return_value=mock_session)
+
+        tools = await transport.list_tool_definitions()
+
+        assert [tool.name for tool in tools] == ["a", "b"]
+        assert mock_session.list_tools.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_tool_definitions_wraps_errors(self):
+        """Test that listing failures surface as ServerError."""
+        transport = SSETransport("http://localhost:8082/sse/sse", persistent=True)
+        mock_session = MagicMock()
+        mock_session.list_tools = AsyncMock(side_effect=RuntimeError("boom"))
+        transport._get_persistent_session().get_session = AsyncMock(return_value=mock_session)
+
+        with pytest.raises(ServerError):
+            await transport.list_tool_definitions()
@@ -0,0 +1,237 @@
+"""Pytest fixtures for the persistence backend unit tests."""
+
+from __future__ import annotations
+
+import fnmatch
+import time
+from typing import Any
+
+import pytest
+
+from gearmeshing_ai.agent.orchestrator.backends.redis import DELTA_SCRIPT
+
+
+class FakeRedis:
+    """In-process stand-in for the subset of ``redis.asyncio.Redis`` used by the backends.
+
+    Values are stored as bytes like a client without ``decode_responses``.
+    ``round_trips`` counts the commands sent directly plus one per executed pipeline.
+    """
+
+    def __init__(self) -> None:
+        self.strings: dict[str, bytes] = {}
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.lists: dict[str, list[bytes]] = {}
+        self.expires: dict[str, float] = {}
+        self.round_trips = 0
+        self.closed = False
+
+    @staticmethod
+    def _bytes(value: Any) -> bytes:
+        return value if isinstance(value, bytes) else str(value).encode()
+
+    def _expire_keys(self) -> None:
+        now = time.monotonic()
+        for key, deadline in list(self.expires.items()):
+            if deadline <= now:
+                self.strings.pop(key, None)
+                self.hashes.pop(key, None)
+                del self.expires[key]
+
+    def ttl(self, key: str) -> float | None:
+        """Get the seconds left before a key expires, None if it never does."""
+        deadline = self.expires.get(key)
+        return None if deadline is None else deadline - time.monotonic()
+
+    # Commands, each applied without counting a round-trip
+    def _set(self, key: str, value: Any, ex: int | None = None, nx: bool = False) -> bool | None:
+        self._expire_keys()
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = self._bytes(value)
+        if ex is None:
+            self.expires.pop(key, None)
+        else:
+            self.expires[key] = time.monotonic() + ex
+        return True
+
+    def _get(self, key: str) -> bytes | None:
+        self._expire_keys()
+        return self.strings.get(key)
+
+    def _hset(self, key: str, mapping: dict[str, Any]) -> int:
+        self._expire_keys()
+        fields = self.hashes.setdefault(key, {})
+        added = sum(1 for name in mapping if self._bytes(name) not in fields)
+        fields.update({self._bytes(name): self._bytes(value) for name, value in mapping.items()})
+        return added
+
+    def _hdel(self, key: str, *names: str) -> int:
+        fields = self.hashes.get(key, {})
+        deleted = sum(1 for name in names if fields.pop(self._bytes(name), None) is not None)
+        if key in self.hashes and not fields:
+            del self.hashes[key]
+        return deleted
+
+    def _hget(self, key: str, name: str) -> bytes | None:
+        self._expire_keys()
+        return self.hashes.get(key, {}).get(self._bytes(name))
+
+    def _expire(self, key: str, seconds: int) -> bool:
+        self._expire_keys()
+        if key not in self.strings and key not in self.hashes:
+            return False
+        self.expires[key] = time.monotonic() + seconds
+        return True
+
+    def _persist(self, key: str) -> bool:
+        return self.expires.pop(key, None) is not None
+
+    def _zadd(self, key: str, mapping: dict[str, float]) -> int:
+        zset = self.zsets.setdefault(key, {})
+        added = sum(1 for member in mapping if member not in zset)
+        zset.update(mapping)
+        return added
+
+    def _zrem(self, key: str, *members: str) -> int:
+        zset = self.zsets.get(key, {})
+        return sum(1 for member in members if zset.pop(member, None) is not None)
+
+    def _eval(self, script: str, numkeys: int, *args: Any) -> int:
+        # Only the backend's delta script is emulated
+        if script != DELTA_SCRIPT:
+            raise NotImplementedError("FakeRedis only runs the state delta script")
+        (key,), (meta_field, base_meta, removed, *rest) = args[:numkeys], args[numkeys:]
+        if self._hget(key, meta_field) != self._bytes(base_meta):
+            return 0
+        removed_names, pairs = rest[:removed], rest[removed:]
+        if removed_names:
+            self._hdel(key, *removed_names)
+        self._hset(key, mapping=dict(zip(pairs[::2], pairs[1::2])))
+        return 1
+
+    def _delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            for store in (self.strings, self.hashes, self.zsets, self.lists):
+                if store.pop(key, None) is not None:
+                    deleted += 1
+            self.expires.pop(key, None)
+        return deleted
+
+    # Client API
+    async def set(self, key: str, value: Any, ex: int | None = None, nx: bool = False) -> bool | None:
+        self.round_trips += 1
+        return self._set(key, value, ex, nx)
+
+    async def get(self, key: str) -> bytes | None:
+        self.round_trips += 1
+        return self._get(key)
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        self.round_trips += 1
+        return [self._get(key) for key in keys]
+
+    async def delete(self, *keys: str) -> int:
+        self.round_trips += 1
+        return self._delete(*keys)
+
+    async def hget(self, key: str, name: str) -> bytes | None:
+        self.round_trips += 1
+        return self._hget(key, name)
+
+    async def hgetall(self, key: str) -> dict[bytes, bytes]:
+        self.round_trips += 1
+        self._expire_keys()
+        return dict(self.hashes.get(key, {}))
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.round_trips += 1
+        return self._zadd(key, mapping)
+
+    async def zrange(self, key: str, start: int, end: int) -> list[bytes]:
+        self.round_trips += 1
+        members = sorted(self.zsets.get(key, {}).items(), key=lambda item: (item[1], item[0]))
+        end = len(members) if end == -1 else end + 1
+        return [member.encode() for member, _ in members[start:end]]
+
+    async def rpush(self, key: str, *values: Any) -> int:
+        self.round_trips += 1
+        items = self.lists.setdefault(key, [])
+        items.extend(self._bytes(value) for value in values)
+        return len(items)
+
+    async def lrange(self, key: str, start: int, end: int) -> list[bytes]:
+        self.round_trips += 1
+        items = self.lists.get(key, [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    async def scan_iter(self, match: str = "*"):
+        self.round_trips += 1
+        self._expire_keys()
+        for key in [*self.strings, *self.hashes, *self.zsets, *self.lists]:
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class FakePipeline:
+    """Pipeline of the fake client, queuing commands until ``execute``."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple, dict]] = []
+
+    def _queue(self, name: str, *args: Any, **kwargs: Any) -> FakePipeline:
+        self.commands.append((name, args, kwargs))
+        return self
+
+    def set(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        return self._queue("_set", *args, **kwargs)
+
+    def get(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        return self._queue("_get", *args, **kwargs)
+
+    def hset(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        return self._queue("_hset", *args, **kwargs)
+
+    def hdel(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        return self._queue("_hdel", *args, **kwargs)
+
+    def hget(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        return self._queue("_hget", *args, **kwargs)
+
+    def expire(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        return self._queue("_expire", *args, **kwargs)
+
+    def persist(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        return self._queue("_persist", *args, **kwargs)
+
+    def zadd(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        return self._queue("_zadd", *args, **kwargs)
+
+    def zrem(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        return self._queue("_zrem", *args, **kwargs)
+
+    def delete(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        return self._queue("_delete", *args, **kwargs)
+
+    def eval(self, *args: Any, **kwargs: Any) -> FakePipeline:
+        return self._queue("_eval", *args, **kwargs)
+
+    async def execute(self) -> list[Any]:
+        self.redis.round_trips += 1
+        commands, self.commands = self.commands, []
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in commands]
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    """Create an in-process Redis stand-in."""
+    return FakeRedis()
@@ -0,0 +1,76 @@
+"""Factories of the workflow states and approval decisions saved by the persistence backend tests."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from gearmeshing_ai.agent.orchestrator.models import ApprovalDecision, ApprovalDecisionRecord
+from gearmeshing_ai.agent.runtime.models.workflow_state import (
+    ExecutionContext,
+    WorkflowState,
+    WorkflowStatus,
+)
+
+
+def make_state(
+    run_id: str = "run_1",
+    state: str = "running",
+    user_id: str = "user_1",
+    agent_role: str = "dev",
+    created_at: datetime | None = None,
+    **extra: Any,
+) -> WorkflowState:
+    """Create a runtime workflow state.
+
+    Args:
+        run_id: Workflow run ID
+        state: Workflow status state
+        user_id: User who started the run
+        agent_role: Agent role of the run
+        created_at: Creation time, now when omitted
+        **extra: Other workflow state fields
+
+    Returns:
+        Workflow state
+
+    """
+    if created_at is not None:
+        extra["created_at"] = created_at
+    return WorkflowState(
+        run_id=run_id,
+        status=WorkflowStatus(state=state),
+        context=ExecutionContext(task_description="Run tests", agent_role=agent_role, user_id=user_id),
+        **extra,
+    )
+
+
+def make_decision(
+    run_id: str,
+    approver_id: str = "approver_1",
+    decision: ApprovalDecision = ApprovalDecision.APPROVED,
+    decided_at: datetime | None = None,
+    **extra: Any,
+) -> ApprovalDecisionRecord:
+    """Create an approval decision record.
+
+    Args:
+        run_id: Workflow run ID
+        approver_id: User who decided
+        decision: Approval decision
+        decided_at: Decision time, now when omitted
+        **extra: Other approval decision record fields
+
+    Returns:
+        Approval decision record
+
+    """
+    if decided_at is not None:
+        extra["decided_at"] = decided_at
+    return ApprovalDecisionRecord(
+        approval_id=f"approval_{run_id}",
+        run_id=run_id,
+        decision=decision,
+        approver_id=approver_id,
+        **extra,
+    )
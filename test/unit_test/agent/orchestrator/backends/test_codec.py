@@ -0,0 +1,182 @@
+"""Unit tests for the workflow state codec."""
+
+from __future__ import annotations
+
+import orjson
+import pytest
+
+from gearmeshing_ai.agent.models.actions import MCPToolCatalog, MCPToolInfo
+from gearmeshing_ai.agent.orchestrator.backends.codec import (
+    META_FIELD,
+    StateDeltaTracker,
+    WorkflowStateCodec,
+)
+from gearmeshing_ai.agent.runtime.models.workflow_state import WorkflowStatus
+from test.unit_test.agent.orchestrator.backends.factories import make_state
+
+
+def make_catalog(size: int = 20) -> MCPToolCatalog:
+    """Create a capability catalog."""
+    return MCPToolCatalog(
+        tools=[
+            MCPToolInfo(
+                name=f"tool_{index}",
+                description="Run the project's test suite and report failures",
+                mcp_server="ci",
+                parameters={"type": "object", "properties": {"path": {"type": "string"}}},
+            )
+            for index in range(size)
+        ]
+    )
+
+
+class TestWorkflowStateCodec:
+    """Test encoding and decoding workflow states."""
+
+    @pytest.mark.parametrize("compression", ["zstd", "zlib", "none"])
+    def test_model_round_trip(self, compression):
+        """Test that a model is decoded as its own class with every compression."""
+        codec = WorkflowStateCodec(compression=compression, compress_threshold_bytes=64)
+        state = make_state(available_capabilities=make_catalog())
+
+        encoded = codec.encode(state)
+
+        assert codec.decode(encoded.fields, encoded.shared) == state
+
+    def test_plain_values_round_trip(self):
+        """Test that dictionaries and other values are decoded as they were."""
+        codec = WorkflowStateCodec()
+
+        for value in ({"run_id": "run_1", "steps": [1, 2]}, [1, 2, 3], "text"):
+            encoded = codec.encode(value)
+            assert codec.decode(encoded.fields, encoded.shared) == value
+
+    def test_large_fields_are_compressed(self):
+        """Test that fields above the threshold are compressed and small ones are not."""
+        codec = WorkflowStateCodec(compression="zlib", compress_threshold_bytes=256)
+        state = make_state()
+        state.decisions = [{"step": index, "note": "same text"} for index in range(200)]
+
+        encoded = codec.encode(state)
+
+        assert encoded.fields["decisions"][0] == 1
+        assert encoded.fields["run_id"][0] == 0
+        assert encoded.size < len(state.model_dump_json())
+
+    def test_any_compression_is_decoded(self):
+        """Test that a decoder reads blobs whatever the encoder's compression."""
+        state = make_state(available_capabilities=make_catalog())
+        encoded = WorkflowStateCodec(compression="zstd", compress_threshold_bytes=0).encode(state)
+
+        assert WorkflowStateCodec(compression="none").decode(encoded.fields, encoded.shared) == state
+
+    def test_unknown_compression(self):
+        """Test that an unknown compression is rejected."""
+        with pytest.raises(ValueError):
+            WorkflowStateCodec(compression="lz4")
+
+    def test_capability_catalog_is_shared(self):
+        """Test that equal catalogs are referenced by one digest."""
+        codec = WorkflowStateCodec()
+        catalog = make_catalog()
+
+        first = codec.encode(make_state("run_1", available_capabilities=catalog))
+        second = codec.encode(make_state("run_2", available_capabilities=catalog))
+
+        assert first.shared.keys() == second.shared.keys()
+        assert codec.shared_refs(first.fields) == list(first.shared)
+        assert len(first.fields["available_capabilities"]) < 100
+
+    def test_missing_catalog_is_not_shared(self):
+        """Test that a state without capabilities references no shared value."""
+        codec = WorkflowStateCodec()
+
+        encoded = codec.encode(make_state())
+
+        assert encoded.shared == {}
+        assert codec.shared_refs(encoded.fields) == []
+
+    def test_missing_shared_value(self):
+        """Test that decoding needs the referenced shared values."""
+        codec = WorkflowStateCodec()
+        encoded = codec.encode(make_state(available_capabilities=make_catalog()))
+
+        with pytest.raises(KeyError):
+            codec.decode(encoded.fields, {})
+
+    def test_newer_version_is_rejected(self):
+        """Test that states written by a newer codec are not misread."""
+        codec = WorkflowStateCodec(compression="none")
+        encoded = codec.encode(make_state())
+        meta = orjson.loads(encoded.fields[META_FIELD][1:])
+        encoded.fields[META_FIELD] = b"\x00" + orjson.dumps({**meta, "v": meta["v"] + 1})
+
+        with pytest.raises(ValueError):
+            codec.decode(encoded.fields)
+
+    def test_every_encode_has_a_new_revision(self):
+        """Test that the metadata changes on every encode."""
+        codec = WorkflowStateCodec()
+        state = make_state()
+
+        assert codec.encode(state).fields[META_FIELD] != codec.encode(state).fields[META_FIELD]
+
+
+class TestStateDeltaTracker:
+    """Test delta computation."""
+
+    def test_first_write_is_full(self):
+        """Test that a run without baseline writes every field."""
+        encoded = WorkflowStateCodec().encode(make_state())
+
+        write = StateDeltaTracker().delta("run_1", encoded)
+
+        assert not write.is_delta
+        assert write.changed == list(encoded.fields)
+
+    def test_only_changed_fields_are_written(self):
+        """Test that a delta holds the metadata and the changed fields."""
+        codec = WorkflowStateCodec()
+        tracker = StateDeltaTracker()
+        state = make_state(available_capabilities=make_catalog())
+        first = codec.encode(state)
+        tracker.remember("run_1", first.fields)
+
+        state.status = WorkflowStatus(state="success")
+        write = tracker.delta("run_1", codec.encode(state))
+
+        assert write.is_delta
+        assert write.base_meta == first.fields[META_FIELD]
+        assert sorted(write.changed) == [META_FIELD, "status"]
+        assert write.removed == []
+
+    def test_removed_fields(self):
+        """Test that fields missing from the new state are reported."""
+        codec = WorkflowStateCodec()
+        tracker = StateDeltaTracker()
+        tracker.remember("run_1", codec.encode({"a": 1, "b": 2}).fields)
+
+        write = tracker.delta("run_1", codec.encode({"a": 1}))
+
+        assert write.changed == [META_FIELD]
+        assert write.removed == ["b"]
+
+    def test_least_recently_used_baselines_are_forgotten(self):
+        """Test that the tracker keeps at most max_runs baselines."""
+        codec = WorkflowStateCodec()
+        tracker = StateDeltaTracker(max_runs=2)
+        for run_id in ("run_1", "run_2", "run_3"):
+            tracker.remember(run_id, codec.encode({"run_id": run_id}).fields)
+
+        assert not tracker.delta("run_1", codec.encode({"run_id": "run_1"})).is_delta
+        assert tracker.delta("run_3", codec.encode({"run_id": "run_3"})).is_delta
+
+    def test_forget(self):
+        """Test that a forgotten run is written in full."""
+        codec = WorkflowStateCodec()
+        tracker = StateDeltaTracker()
+        tracker.remember("run_1", codec.encode({"a": 1}).fields)
+
+        tracker.forget("run_1")
+
+        assert not tracker.delta("run_1", codec.encode({"a": 1})).is_delta
@@ -0,0 +1,327 @@
+"""Unit tests for the database persistence backend."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from gearmeshing_ai.agent.models.actions import MCPToolCatalog, MCPToolInfo
+from gearmeshing_ai.agent.orchestrator.backends.database import DatabasePersistenceBackend
+from gearmeshing_ai.agent.orchestrator.models import ApprovalDecision, ApprovalRequest
+from gearmeshing_ai.agent.orchestrator.persistence import PersistenceManager
+from gearmeshing_ai.agent.runtime.models.workflow_state import WorkflowState, WorkflowStatus
+from test.unit_test.agent.orchestrator.backends.factories import make_decision, make_state
+
+
+@pytest.fixture
+async def backend(tmp_path):
+    """Create a database backend on a SQLite file."""
+    backend = DatabasePersistenceBackend(f"sqlite:///{tmp_path / 'orchestrator.db'}", flush_interval_seconds=60)
+    yield backend
+    await backend.close()
+
+
+class TestDatabaseWorkflowState:
+    """Test workflow state persistence."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_load_model_state(self, backend):
+        """Test that a pydantic state is loaded back as the same model."""
+        state = make_state("run_1", decisions=[{"step": 1}])
+        await backend.save_workflow_state("run_1", state)
+        await backend.flush()
+
+        loaded = await backend.load_workflow_state("run_1")
+
+        assert isinstance(loaded, WorkflowState)
+        assert loaded == state
+
+    @pytest.mark.asyncio
+    async def test_save_and_load_dict_state(self, backend):
+        """Test that a plain state is stored as JSON."""
+        await backend.save_workflow_state("run_1", {"status": {"state": "running"}})
+        await backend.flush()
+
+        assert await backend.load_workflow_state("run_1") == {"status": {"state": "running"}}
+
+    @pytest.mark.asyncio
+    async def test_load_missing_state(self, backend):
+        """Test loading the state of an unknown run."""
+        assert await backend.load_workflow_state("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_pending_state_is_readable_before_flush(self, backend):
+        """Test read-your-writes for buffered states."""
+        await backend.save_workflow_state("run_1", make_state("run_1"))
+
+        assert backend.pending_rows == 1
+        assert (await backend.load_workflow_state("run_1")).run_id == "run_1"
+        assert await backend.repository.get_workflow_state_fields("run_1") is None
+
+    @pytest.mark.asyncio
+    async def test_saves_of_one_run_are_coalesced(self, backend):
+        """Test that only the latest pending state of a run is written."""
+        for state in ("pending", "running", "awaiting_approval"):
+            await backend.save_workflow_state("run_1", make_state("run_1", state=state))
+        await backend.flush()
+
+        stats = backend.get_stats()
+        assert stats["saves"] == 3
+        assert stats["coalesced"] == 2
+        assert stats["rows_flushed"] == 1
+        assert (await backend.load_workflow_state("run_1")).status.state == "awaiting_approval"
+
+    @pytest.mark.asyncio
+    async def test_state_survives_a_new_backend(self, tmp_path):
+        """Test that states are durable across backend instances."""
+        url = f"sqlite:///{tmp_path / 'orchestrator.db'}"
+        first = DatabasePersistenceBackend(url)
+        await first.save_workflow_state("run_1", make_state("run_1"))
+        await first.close()
+
+        second = DatabasePersistenceBackend(url)
+        try:
+            assert (await second.load_workflow_state("run_1")).run_id == "run_1"
+        finally:
+            await second.close()
+
+    @pytest.mark.asyncio
+    async def test_delete_state_keeps_history(self, backend):
+        """Test that deleting a pending state still records the run's history."""
+        await backend.save_workflow_state("run_1", make_state("run_1", state="success"))
+        await backend.delete_workflow_state("run_1")
+
+        assert await backend.load_workflow_state("run_1") is None
+        history = await backend.get_workflow_history()
+        assert [entry["run_id"] for entry in history] == ["run_1"]
+
+    @pytest.mark.asyncio
+    async def test_resave_writes_only_changed_fields(self, backend, tmp_path):
+        """Test that a flushed run is saved again as a delta."""
+        state = make_state("run_1")
+        state.decisions = [{"step": index, "note": "same text"} for index in range(200)]
+        await backend.save_workflow_state("run_1", state)
+        await backend.flush()
+        full_bytes = backend.bytes_written
+
+        state.status = WorkflowStatus(state="awaiting_approval")
+        await backend.save_workflow_state("run_1", state)
+        await backend.flush()
+
+        stats = backend.get_stats()
+        assert stats["full_writes"] == 1
+        assert stats["delta_writes"] == 1
+        assert stats["bytes_written"] - full_bytes < full_bytes / 2
+        reopened = DatabasePersistenceBackend(f"sqlite:///{tmp_path / 'orchestrator.db'}")
+        try:
+            assert await reopened.load_workflow_state("run_1") == state
+        finally:
+            await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_capability_catalog_is_stored_once(self, backend):
+        """Test that runs with the same capability catalog share one stored copy."""
+        catalog = MCPToolCatalog(
+            tools=[
+                MCPToolInfo(name=f"tool_{index}", description="Run tests", mcp_server="ci", parameters={})
+                for index in range(10)
+            ]
+        )
+        for run_id in ("run_1", "run_2"):
+            state = make_state(run_id)
+            state.available_capabilities = catalog
+            await backend.save_workflow_state(run_id, state)
+        await backend.flush()
+
+        fields = await backend.repository.get_workflow_state_fields("run_2")
+        digests = backend.codec.shared_refs(fields)
+        assert len(await backend.repository.get_shared_values(digests)) == 1
+        backend._shared_cache.clear()
+        assert (await backend.load_workflow_state("run_2")).available_capabilities == catalog
+
+
+class TestDatabaseWriteBehind:
+    """Test the write-behind batching."""
+
+    @pytest.mark.asyncio
+    async def test_batch_size_triggers_flush(self, tmp_path):
+        """Test that a full batch is written in one flush."""
+        backend = DatabasePersistenceBackend(f"sqlite:///{tmp_path / 'o.db'}", batch_size=4, flush_interval_seconds=60)
+        try:
+            for index in range(4):
+                await backend.save_workflow_state(f"run_{index}", make_state(f"run_{index}"))
+
+            assert backend.pending_rows == 0
+            assert backend.get_stats()["flushes"] == 1
+            assert await backend.repository.get_workflow_state_fields("run_3") is not None
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_interval_triggers_flush(self, tmp_path):
+        """Test that pending rows are flushed in the background."""
+        backend = DatabasePersistenceBackend(f"sqlite:///{tmp_path / 'o.db'}", flush_interval_seconds=0.01)
+        try:
+            await backend.save_workflow_state("run_1", make_state("run_1"))
+            await backend.save_approval_decision(make_decision("run_1"))
+            await asyncio.wait_for(backend._flush_task, timeout=5)
+
+            assert backend.pending_rows == 0
+            assert backend.get_stats()["flushes"] == 1
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_zero_interval_writes_through(self, tmp_path):
+        """Test that every save is written when batching is disabled."""
+        backend = DatabasePersistenceBackend(f"sqlite:///{tmp_path / 'o.db'}", flush_interval_seconds=0)
+        try:
+            await backend.save_workflow_state("run_1", make_state("run_1"))
+
+            assert backend.pending_rows == 0
+            assert await backend.repository.get_workflow_state_fields("run_1") is not None
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_rows_pending(self, backend, monkeypatch):
+        """Test that rows of a failed flush are retried by the next one."""
+        await backend.save_workflow_state("run_1", make_state("run_1"))
+        await backend.save_approval_decision(make_decision("run_1"))
+
+        async def fail(**kwargs):
+            raise RuntimeError("database unavailable")
+
+        original = backend.repository.save_batch
+        monkeypatch.setattr(backend.repository, "save_batch", fail)
+        with pytest.raises(RuntimeError):
+            await backend.flush()
+        assert backend.pending_rows == 2
+        assert backend.get_stats()["failed_flushes"] == 1
+
+        monkeypatch.setattr(backend.repository, "save_batch", original)
+        await backend.flush()
+        assert backend.pending_rows == 0
+        assert len(await backend.get_approval_history()) == 1
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_rows(self, tmp_path):
+        """Test that closing the backend writes the buffer."""
+        url = f"sqlite:///{tmp_path / 'o.db'}"
+        backend = DatabasePersistenceBackend(url, flush_interval_seconds=60)
+        await backend.save_approval_decision(make_decision("run_1"))
+        await backend.close()
+
+        reopened = DatabasePersistenceBackend(url)
+        try:
+            assert len(await reopened.get_approval_history(run_id="run_1")) == 1
+        finally:
+            await reopened.close()
+
+
+class TestDatabaseHistory:
+    """Test history queries."""
+
+    @pytest.mark.asyncio
+    async def test_approval_history_filters(self, backend):
+        """Test filtering approval history by run, approver and status."""
+        await backend.save_approval_decision(make_decision("run_1", approver_id="alice"))
+        await backend.save_approval_decision(make_decision("run_2", approver_id="bob"))
+        await backend.save_approval_decision(
+            make_decision(
+                "run_3",
+                approver_id="alice",
+                decision=ApprovalDecision.REJECTED,
+                reason="Too risky",
+                alternative_result={"exit_code": 0},
+            )
+        )
+
+        assert len(await backend.get_approval_history()) == 3
+        assert [h["run_id"] for h in await backend.get_approval_history(approver_id="alice")] == ["run_1", "run_3"]
+        rejected = await backend.get_approval_history(status="rejected")
+        assert [h["run_id"] for h in rejected] == ["run_3"]
+        assert rejected[0]["decision"] == "rejected"
+        assert rejected[0]["reason"] == "Too risky"
+        assert rejected[0]["decided_at"].tzinfo is not None
+        assert [h["run_id"] for h in await backend.get_approval_history(limit=1, offset=1)] == ["run_2"]
+
+    @pytest.mark.asyncio
+    async def test_workflow_history_filters(self, backend):
+        """Test filtering workflow history by user, role and status."""
+        await backend.save_workflow_state("run_1", make_state("run_1", state="success", user_id="alice"))
+        await backend.save_workflow_state("run_2", make_state("run_2", state="failed", user_id="bob", agent_role="qa"))
+        await backend.save_workflow_state("run_3", make_state("run_3", state="success", user_id="alice"))
+
+        assert {h["run_id"] for h in await backend.get_workflow_history(user_id="alice")} == {"run_1", "run_3"}
+        assert [h["run_id"] for h in await backend.get_workflow_history(agent_role="qa")] == ["run_2"]
+        assert [h["run_id"] for h in await backend.get_workflow_history(status="failed")] == ["run_2"]
+        entry = (await backend.get_workflow_history(user_id="bob"))[0]
+        assert entry["task_description"] == "Run tests"
+        assert len(await backend.get_workflow_history(limit=2)) == 2
+
+    @pytest.mark.asyncio
+    async def test_history_status_follows_latest_state(self, backend):
+        """Test that saving a run again updates its history entry."""
+        await backend.save_workflow_state("run_1", make_state("run_1", state="awaiting_approval"))
+        await backend.flush()
+        await backend.save_workflow_state("run_1", make_state("run_1", state="success"))
+
+        history = await backend.get_workflow_history()
+        assert [(h["run_id"], h["status"]) for h in history] == [("run_1", "success")]
+
+    @pytest.mark.asyncio
+    async def test_save_cancellation_and_approval_request(self, backend):
+        """Test cancellation and approval request records."""
+        await backend.save_cancellation(
+            {"run_id": "run_1", "canceller_id": "alice", "reason": "obsolete", "cancelled_at": datetime.now(UTC)}
+        )
+        await backend.save_approval_request(
+            "run_1", ApprovalRequest(run_id="run_1", operation="deploy", risk_level="high", description="Deploy")
+        )
+        await backend.save_approval_request(
+            "run_1", ApprovalRequest(run_id="run_1", operation="rollback", risk_level="low", description="Rollback")
+        )
+
+        cancellations = await backend.repository.get_cancellations("run_1")
+        assert [(c["canceller_id"], c["reason"]) for c in cancellations] == [("alice", "obsolete")]
+        request = await backend.repository.get_approval_request("run_1")
+        assert request["operation"] == "rollback"
+
+    @pytest.mark.asyncio
+    async def test_clear(self, backend):
+        """Test clearing persisted and pending data."""
+        await backend.save_workflow_state("run_1", make_state("run_1"))
+        await backend.flush()
+        await backend.save_approval_decision(make_decision("run_1"))
+
+        await backend.clear()
+
+        assert backend.pending_rows == 0
+        assert await backend.load_workflow_state("run_1") is None
+        assert await backend.get_approval_history() == []
+        assert await backend.get_workflow_history() == []
+
+
+class TestPersistenceManagerDatabase:
+    """Test the persistence manager on the database backend."""
+
+    @pytest.mark.asyncio
+    async def test_manager_passes_backend_options(self, tmp_path):
+        """Test that backend options reach the database backend."""
+        manager = PersistenceManager(
+            backend="database",
+            connection_string="sqlite://",
+            batch_size=10,
+            flush_interval_seconds=0,
+        )
+        try:
+            assert isinstance(manager._backend, DatabasePersistenceBackend)
+            assert manager._backend.batch_size == 10
+
+            await manager.save_workflow_state("run_1", make_state("run_1"))
+            assert (await manager.load_workflow_state("run_1")).run_id == "run_1"
+        finally:
+            await manager.close()
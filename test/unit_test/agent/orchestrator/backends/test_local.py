@@ -0,0 +1,165 @@
+"""Unit tests for the local persistence backend."""
+
+from __future__ import annotations
+
+import pytest
+
+from gearmeshing_ai.agent.orchestrator.backends.local import LocalPersistenceBackend, _IndexedLog
+from gearmeshing_ai.agent.orchestrator.models import ApprovalDecision
+from gearmeshing_ai.agent.orchestrator.persistence import PersistenceManager
+from test.unit_test.agent.orchestrator.backends.factories import make_decision, make_state
+
+
+class TestIndexedLog:
+    """Test the indexed history log."""
+
+    def test_query_uses_most_selective_index(self):
+        """Test that combined filters only visit the smallest index."""
+        log = _IndexedLog(("user", "status"), max_entries=None)
+        for index in range(100):
+            log.add({"id": index, "user": "alice", "status": "success" if index != 42 else "failed"})
+
+        entries, _ = log.query({"user": "alice", "status": "failed"}, limit=10)
+
+        assert [entry["id"] for entry in entries] == [42]
+        assert len(log._indexes["status"]["failed"]) == 1
+
+    def test_replacing_a_keyed_entry_moves_it_between_indexes(self):
+        """Test that a replaced entry keeps its position and leaves its old index."""
+        log = _IndexedLog(("status",), max_entries=None)
+        log.add({"id": "a", "status": "running"}, key="a")
+        log.add({"id": "b", "status": "success"}, key="b")
+        log.add({"id": "a", "status": "success"}, key="a")
+
+        assert log.query({"status": "running"}, limit=10)[0] == []
+        assert [entry["id"] for entry in log.query({"status": "success"}, limit=10)[0]] == ["a", "b"]
+        assert len(log) == 2
+
+    def test_retention_evicts_oldest_entries(self):
+        """Test that the log keeps its latest entries."""
+        log = _IndexedLog(("user",), max_entries=3)
+        for index in range(5):
+            log.add({"id": index, "user": "alice" if index % 2 else "bob"}, key=index)
+
+        assert [entry["id"] for entry in log.query({}, limit=10)[0]] == [2, 3, 4]
+        assert [entry["id"] for entry in log.query({"user": "bob"}, limit=10)[0]] == [2, 4]
+        assert 0 not in log._seq_by_key
+
+    def test_evicted_entries_are_compacted(self):
+        """Test that evicted sequence numbers are skipped, then dropped in batches."""
+        log = _IndexedLog(("user",), max_entries=10)
+        for index in range(3000):
+            log.add({"id": index, "user": "alice" if index % 2 else "bob"}, key=index)
+            if index == 2000:
+                _, cursor = log.query({"user": "bob"}, limit=1)
+
+        assert [entry["id"] for entry in log.query({}, limit=20)[0]] == list(range(2990, 3000))
+        assert [entry["id"] for entry in log.query({"user": "alice"}, limit=20)[0]] == list(range(2991, 3000, 2))
+        # A cursor of an evicted entry continues at the oldest kept one
+        assert log.query({"user": "bob"}, limit=1, after=cursor)[0] == [{"id": 2990, "user": "bob"}]
+        assert len(log._all) <= 10 + 1024
+        assert all(len(seqs) <= 10 + 1024 for seqs in log._indexes["user"].values())
+
+    def test_results_are_copies(self):
+        """Test that callers cannot modify stored entries."""
+        log = _IndexedLog(("user",), max_entries=None)
+        log.add({"user": "alice"})
+
+        log.query({}, limit=1)[0][0]["user"] = "mallory"
+
+        assert log.query({"user": "alice"}, limit=1)[0] == [{"user": "alice"}]
+
+
+class TestLocalHistory:
+    """Test history queries of the local backend."""
+
+    @pytest.mark.asyncio
+    async def test_saved_states_are_recorded_in_history(self):
+        """Test that workflow history follows the saved states."""
+        backend = LocalPersistenceBackend()
+        await backend.save_workflow_state("run_1", make_state("run_1", "awaiting_approval", "alice"))
+        await backend.save_workflow_state("run_2", make_state("run_2", "failed", "bob", "qa"))
+        await backend.save_workflow_state("run_1", make_state("run_1", "success", "alice"))
+
+        assert [h["run_id"] for h in await backend.get_workflow_history()] == ["run_1", "run_2"]
+        assert [h["run_id"] for h in await backend.get_workflow_history(status="success")] == ["run_1"]
+        assert await backend.get_workflow_history(status="awaiting_approval") == []
+        assert [h["run_id"] for h in await backend.get_workflow_history(agent_role="qa")] == ["run_2"]
+        assert [h["run_id"] for h in await backend.get_workflow_history(limit=1, offset=1)] == ["run_2"]
+
+    @pytest.mark.asyncio
+    async def test_approval_history_filters_and_offset(self):
+        """Test filtering approval history."""
+        backend = LocalPersistenceBackend()
+        await backend.save_approval_decision(make_decision("run_1", "alice"))
+        await backend.save_approval_decision(make_decision("run_2", "bob"))
+        await backend.save_approval_decision(make_decision("run_3", "alice", ApprovalDecision.REJECTED))
+
+        assert [h["run_id"] for h in await backend.get_approval_history(approver_id="alice")] == ["run_1", "run_3"]
+        assert [h["run_id"] for h in await backend.get_approval_history(approver_id="alice", offset=1)] == ["run_3"]
+        assert [h["run_id"] for h in await backend.get_approval_history(status="rejected")] == ["run_3"]
+        assert await backend.get_approval_history(run_id="run_2", status="rejected") == []
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination(self):
+        """Test walking the approval history page by page."""
+        backend = LocalPersistenceBackend()
+        for index in range(5):
+            await backend.save_approval_decision(make_decision(f"run_{index}", "alice"))
+
+        pages = []
+        cursor = None
+        while True:
+            page, cursor = await backend.page_approval_history(approver_id="alice", limit=2, cursor=cursor)
+            pages.append([entry["run_id"] for entry in page])
+            if cursor is None:
+                break
+
+        assert pages == [["run_0", "run_1"], ["run_2", "run_3"], ["run_4"]]
+
+    @pytest.mark.asyncio
+    async def test_workflow_cursor_pagination_with_filters(self):
+        """Test paging workflow history with combined filters."""
+        backend = LocalPersistenceBackend()
+        for index in range(6):
+            await backend.save_workflow_state(
+                f"run_{index}", make_state(f"run_{index}", "success", "alice" if index % 2 else "bob")
+            )
+
+        first, cursor = await backend.page_workflow_history(user_id="alice", status="success", limit=2)
+        second, last_cursor = await backend.page_workflow_history(
+            user_id="alice", status="success", limit=2, cursor=cursor
+        )
+
+        assert [h["run_id"] for h in first] == ["run_1", "run_3"]
+        assert [h["run_id"] for h in second] == ["run_5"]
+        assert last_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        backend = LocalPersistenceBackend()
+
+        with pytest.raises(ValueError):
+            await backend.page_workflow_history(cursor="not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_retention_bounds_history(self):
+        """Test that histories keep their latest entries."""
+        manager = PersistenceManager(backend="local", max_history_entries=2)
+        for index in range(4):
+            await manager.save_approval_decision(make_decision(f"run_{index}"))
+
+        assert [h["run_id"] for h in await manager.get_approval_history()] == ["run_2", "run_3"]
+
+    @pytest.mark.asyncio
+    async def test_clear_resets_indexes(self):
+        """Test that clearing removes history and index entries."""
+        backend = LocalPersistenceBackend()
+        await backend.save_workflow_state("run_1", make_state("run_1"))
+        await backend.save_approval_decision(make_decision("run_1"))
+
+        await backend.clear()
+
+        assert await backend.get_workflow_history(user_id="user_1") == []
+        assert await backend.get_approval_history(run_id="run_1") == []
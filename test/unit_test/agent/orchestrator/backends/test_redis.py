@@ -0,0 +1,278 @@
+"""Unit tests for the Redis persistence backend."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from gearmeshing_ai.agent.models.actions import MCPToolCatalog, MCPToolInfo
+from gearmeshing_ai.agent.orchestrator.backends.redis import RedisPersistenceBackend
+from gearmeshing_ai.agent.orchestrator.models import ApprovalDecision, ApprovalRequest
+from gearmeshing_ai.agent.orchestrator.persistence import PersistenceManager
+from gearmeshing_ai.agent.runtime.models.workflow_state import WorkflowStatus
+from gearmeshing_ai.agent.runtime.models.workflow_states import WorkflowStateEnum
+from test.unit_test.agent.orchestrator.backends.factories import make_decision, make_state
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def at(minute: int) -> datetime:
+    """Return the time a given number of minutes after ``BASE_TIME``."""
+    return BASE_TIME + timedelta(minutes=minute)
+
+
+@pytest.fixture
+def backend(fake_redis):
+    """Create a Redis backend on the in-process stand-in."""
+    return RedisPersistenceBackend(client=fake_redis, completed_state_ttl_seconds=600)
+
+
+class TestRedisWorkflowState:
+    """Test workflow state persistence."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_load(self, backend):
+        """Test that a state is loaded back as the same model."""
+        state = make_state("run_1")
+        await backend.save_workflow_state("run_1", state)
+
+        assert await backend.load_workflow_state("run_1") == state
+        assert await backend.load_workflow_state("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_save_is_one_pipelined_write(self, backend, fake_redis):
+        """Test that the state and its index entries are written in one round-trip."""
+        await backend.save_workflow_state("run_1", make_state("run_1"))
+
+        # Previous history entry and revision read, plus the write pipeline
+        assert fake_redis.round_trips == 2
+
+    @pytest.mark.asyncio
+    async def test_resave_writes_only_changed_fields(self, backend):
+        """Test that saving a run again writes a delta."""
+        state = make_state("run_1", state="running")
+        state.decisions = [{"step": index, "note": "same text"} for index in range(200)]
+        await backend.save_workflow_state("run_1", state)
+        full_bytes = backend.bytes_written
+
+        state.status = WorkflowStatus(state="awaiting_approval")
+        await backend.save_workflow_state("run_1", state)
+
+        stats = backend.get_stats()
+        assert stats["full_writes"] == 1
+        assert stats["delta_writes"] == 1
+        assert stats["bytes_written"] - full_bytes < full_bytes / 2
+        assert await backend.load_workflow_state("run_1") == state
+
+    @pytest.mark.asyncio
+    async def test_delta_is_not_applied_over_another_writer(self, fake_redis):
+        """Test that a backend writes every field when another process changed the state."""
+        first = RedisPersistenceBackend(client=fake_redis)
+        second = RedisPersistenceBackend(client=fake_redis)
+        state = make_state("run_1")
+        await first.save_workflow_state("run_1", state)
+        await second.save_workflow_state("run_1", {"run_id": "run_1", "other": True})
+
+        state.status = WorkflowStatus(state="success")
+        await first.save_workflow_state("run_1", state)
+
+        assert first.get_stats()["delta_writes"] == 0
+        assert await second.load_workflow_state("run_1") == state
+
+    @pytest.mark.asyncio
+    async def test_delta_is_not_applied_over_a_concurrent_write(self, fake_redis):
+        """Test that a state written between the revision read and the delta is replaced in full."""
+        first = RedisPersistenceBackend(client=fake_redis)
+        second = RedisPersistenceBackend(client=fake_redis)
+        state = make_state("run_1")
+        await first.save_workflow_state("run_1", state)
+        await second.load_workflow_state("run_1")
+        state.status = WorkflowStatus(state="success")
+        read_pipeline = fake_redis.pipeline
+
+        def pipeline(transaction: bool = True):
+            pipe = read_pipeline(transaction)
+            if not transaction:
+                # Let the other process write once the revision was read
+                fake_redis.pipeline = read_pipeline
+                execute = pipe.execute
+
+                async def execute_then_write():
+                    results = await execute()
+                    other = make_state("run_1", state="failed")
+                    other.decisions = [{"step": 1}]
+                    await second.save_workflow_state("run_1", other)
+                    return results
+
+                pipe.execute = execute_then_write
+            return pipe
+
+        fake_redis.pipeline = pipeline
+        await first.save_workflow_state("run_1", state)
+
+        assert first.get_stats()["delta_writes"] == 0
+        assert first.get_stats()["full_writes"] == 2
+        assert await RedisPersistenceBackend(client=fake_redis).load_workflow_state("run_1") == state
+
+    @pytest.mark.asyncio
+    async def test_capability_catalog_is_stored_once(self, backend, fake_redis):
+        """Test that runs with the same capability catalog share one stored copy."""
+        catalog = MCPToolCatalog(
+            tools=[
+                MCPToolInfo(name=f"tool_{index}", description="Run tests", mcp_server="ci", parameters={})
+                for index in range(10)
+            ]
+        )
+        for run_id in ("run_1", "run_2"):
+            state = make_state(run_id)
+            state.available_capabilities = catalog
+            await backend.save_workflow_state(run_id, state)
+
+        shared = [key for key in fake_redis.strings if ":shared:" in key]
+        assert len(shared) == 1
+        reader = RedisPersistenceBackend(client=fake_redis)
+        assert (await reader.load_workflow_state("run_2")).available_capabilities == catalog
+
+    @pytest.mark.asyncio
+    async def test_other_process_resumes_run(self, fake_redis):
+        """Test that backends sharing a Redis see each other's states."""
+        writer = RedisPersistenceBackend(client=fake_redis)
+        reader = RedisPersistenceBackend(client=fake_redis)
+
+        await writer.save_workflow_state("run_1", make_state("run_1", state="awaiting_approval"))
+
+        assert (await reader.load_workflow_state("run_1")).status.state == "awaiting_approval"
+
+    @pytest.mark.asyncio
+    async def test_completed_state_expires(self, backend, fake_redis):
+        """Test that only finished runs' states get a TTL."""
+        await backend.save_workflow_state("run_1", make_state("run_1", state="awaiting_approval"))
+        assert fake_redis.ttl("gearmeshing:orchestrator:state:run_1") is None
+
+        await backend.save_workflow_state("run_1", make_state("run_1", state="success"))
+        assert 0 < fake_redis.ttl("gearmeshing:orchestrator:state:run_1") <= 600
+        assert fake_redis.ttl("gearmeshing:orchestrator:history:run_1") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("state", [WorkflowStateEnum.COMPLETED, WorkflowStateEnum.FAILED, "APPROVAL_RESOLVED"])
+    async def test_runtime_terminal_state_expires(self, backend, fake_redis, state):
+        """Test that the runtime's terminal states get a TTL too."""
+        await backend.save_workflow_state("run_1", make_state("run_1", state=WorkflowStateEnum.RUNNING))
+        assert fake_redis.ttl("gearmeshing:orchestrator:state:run_1") is None
+
+        await backend.save_workflow_state("run_1", make_state("run_1", state=state))
+        assert 0 < fake_redis.ttl("gearmeshing:orchestrator:state:run_1") <= 600
+
+    @pytest.mark.asyncio
+    async def test_delete_state_keeps_history(self, backend):
+        """Test that deleting a state keeps the run's history."""
+        await backend.save_workflow_state("run_1", make_state("run_1"))
+        await backend.delete_workflow_state("run_1")
+
+        assert await backend.load_workflow_state("run_1") is None
+        assert [entry["run_id"] for entry in await backend.get_workflow_history()] == ["run_1"]
+
+
+class TestRedisHistory:
+    """Test history queries."""
+
+    @pytest.mark.asyncio
+    async def test_workflow_history_is_time_ordered(self, backend):
+        """Test that history is returned in creation order whatever the save order."""
+        await backend.save_workflow_state("run_2", make_state("run_2", created_at=at(2)))
+        await backend.save_workflow_state("run_1", make_state("run_1", created_at=at(1)))
+        await backend.save_workflow_state("run_3", make_state("run_3", created_at=at(3)))
+
+        history = await backend.get_workflow_history()
+
+        assert [entry["run_id"] for entry in history] == ["run_1", "run_2", "run_3"]
+        assert history[0]["created_at"] == BASE_TIME + timedelta(minutes=1)
+        assert [entry["run_id"] for entry in await backend.get_workflow_history(limit=1, offset=1)] == ["run_2"]
+
+    @pytest.mark.asyncio
+    async def test_workflow_history_filters(self, backend):
+        """Test filtering workflow history, including combined filters."""
+        await backend.save_workflow_state("run_1", make_state("run_1", "success", "alice", created_at=at(1)))
+        await backend.save_workflow_state("run_2", make_state("run_2", "failed", "bob", "qa", created_at=at(2)))
+        await backend.save_workflow_state("run_3", make_state("run_3", "failed", "alice", created_at=at(3)))
+
+        assert [h["run_id"] for h in await backend.get_workflow_history(user_id="alice")] == ["run_1", "run_3"]
+        assert [h["run_id"] for h in await backend.get_workflow_history(agent_role="qa")] == ["run_2"]
+        assert [h["run_id"] for h in await backend.get_workflow_history(user_id="alice", status="failed")] == ["run_3"]
+        assert await backend.get_workflow_history(user_id="alice", status="failed", offset=1) == []
+
+    @pytest.mark.asyncio
+    async def test_status_index_follows_latest_state(self, backend):
+        """Test that a run leaves the index of its previous status."""
+        await backend.save_workflow_state("run_1", make_state("run_1", state="awaiting_approval"))
+        await backend.save_workflow_state("run_1", make_state("run_1", state="success"))
+
+        assert await backend.get_workflow_history(status="awaiting_approval") == []
+        assert [h["status"] for h in await backend.get_workflow_history(status="success")] == ["success"]
+
+    @pytest.mark.asyncio
+    async def test_approval_history_filters(self, backend):
+        """Test filtering approval history by run, approver and status."""
+        await backend.save_approval_decision(make_decision("run_1", "alice", decided_at=at(1)))
+        await backend.save_approval_decision(make_decision("run_2", "bob", decided_at=at(2)))
+        await backend.save_approval_decision(
+            make_decision("run_3", "alice", ApprovalDecision.REJECTED, decided_at=at(3))
+        )
+
+        assert [h["run_id"] for h in await backend.get_approval_history()] == ["run_1", "run_2", "run_3"]
+        assert [h["run_id"] for h in await backend.get_approval_history(approver_id="alice")] == ["run_1", "run_3"]
+        rejected = await backend.get_approval_history(status="rejected")
+        assert [(h["run_id"], h["decision"]) for h in rejected] == [("run_3", "rejected")]
+        assert rejected[0]["decided_at"] == BASE_TIME + timedelta(minutes=3)
+        assert await backend.get_approval_history(run_id="run_1", status="rejected") == []
+
+    @pytest.mark.asyncio
+    async def test_cancellations_and_approval_requests(self, backend, fake_redis):
+        """Test cancellation and approval request records."""
+        await backend.save_cancellation({"run_id": "run_1", "canceller_id": "alice", "cancelled_at": BASE_TIME})
+        await backend.save_approval_request(
+            "run_1", ApprovalRequest(run_id="run_1", operation="deploy", risk_level="high", description="Deploy")
+        )
+
+        cancellations = await backend.get_cancellations("run_1")
+        assert [c["canceller_id"] for c in cancellations] == ["alice"]
+        assert fake_redis.strings["gearmeshing:orchestrator:approval_request:run_1"]
+
+    @pytest.mark.asyncio
+    async def test_clear_only_removes_own_keys(self, backend, fake_redis):
+        """Test that clearing leaves keys of other prefixes alone."""
+        await fake_redis.set("other:key", "value")
+        await backend.save_workflow_state("run_1", make_state("run_1"))
+        await backend.save_approval_decision(make_decision("run_1"))
+
+        await backend.clear()
+
+        assert await backend.load_workflow_state("run_1") is None
+        assert await backend.get_workflow_history() == []
+        assert await backend.get_approval_history() == []
+        assert await fake_redis.get("other:key") == b"value"
+
+
+class TestPersistenceManagerRedis:
+    """Test the persistence manager on the Redis backend."""
+
+    @pytest.mark.asyncio
+    async def test_manager_passes_backend_options(self, fake_redis):
+        """Test that backend options reach the Redis backend."""
+        manager = PersistenceManager(backend="redis", client=fake_redis, key_prefix="test")
+
+        await manager.save_workflow_state("run_1", make_state("run_1"))
+
+        assert "test:state:run_1" in fake_redis.hashes
+        await manager.close()
+        assert fake_redis.closed
+
+    def test_default_client_is_redis_asyncio(self):
+        """Test that the backend connects lazily with redis-py's async client."""
+        from redis.asyncio import Redis
+
+        backend = RedisPersistenceBackend(host="redis.internal", port=6380, db=2)
+
+        assert isinstance(backend.redis, Redis)
+        assert backend.redis.connection_pool.connection_kwargs["host"] == "redis.internal"
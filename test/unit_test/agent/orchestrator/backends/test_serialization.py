@@ -0,0 +1,43 @@
+"""Unit tests for the persistence backend helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from gearmeshing_ai.agent.orchestrator.backends.serialization import (
+    resolve_state_class,
+    workflow_history_entry,
+)
+from gearmeshing_ai.agent.runtime.models.workflow_state import WorkflowState
+
+
+def test_resolve_state_class():
+    """Test that a class path resolves to its model class."""
+    state_class = resolve_state_class("gearmeshing_ai.agent.runtime.models.workflow_state:WorkflowState")
+
+    assert state_class is WorkflowState
+
+
+def test_resolve_rejects_non_model_types():
+    """Test that only pydantic models are instantiated from stored class paths."""
+    with pytest.raises(TypeError):
+        resolve_state_class("os:system")
+
+
+def test_history_entry_from_dict_state():
+    """Test building a history entry from a dictionary state."""
+    entry = workflow_history_entry(
+        "run_1",
+        {
+            "status": {"state": "success"},
+            "context": {"user_id": "alice", "agent_role": "qa", "task_description": "Check"},
+            "created_at": "2026-01-01T00:00:00",
+        },
+    )
+
+    assert entry["user_id"] == "alice"
+    assert entry["agent_role"] == "qa"
+    assert entry["status"] == "success"
+    assert entry["created_at"] == datetime.fromisoformat("2026-01-01T00:00:00+00:00")
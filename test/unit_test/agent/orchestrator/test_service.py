@@ -4,18 +4,25 @@ Unit tests for OrchestratorService.
 Tests the thin wrapper around runtime workflow with approval support.
 """
 
+import asyncio
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
 
+from gearmeshing_ai.agent.mcp.client.config import MCPClientConfig
 from gearmeshing_ai.agent.orchestrator.models import (
     WorkflowStatus,
+    WorkflowTask,
 )
 from gearmeshing_ai.agent.orchestrator.persistence import PersistenceManager
 from gearmeshing_ai.agent.orchestrator.service import (
     OrchestratorService,
     WorkflowNotFoundError,
 )
+from gearmeshing_ai.agent.roles.models.role_definition import RoleDefinition, RoleMetadata
+from gearmeshing_ai.agent.roles.registry import RoleRegistry
+from gearmeshing_ai.agent.runtime.models import WorkflowStatus as RuntimeWorkflowStatus
 
 
 @pytest.fixture
@@ -316,3 +323,219 @@ class TestOrchestratorServiceExecuteAlternativeAction:
 
         assert isinstance(result, dict)
         assert result["status"] == "unknown"
+
+
+class TestOrchestratorServiceWorkflowCache:
+    """Tests for the compiled workflow cache."""
+
+    @pytest.fixture
+    def registry(self):
+        """Patch the global role registry with a fresh one."""
+        registry = RoleRegistry()
+        with patch("gearmeshing_ai.agent.orchestrator.service.get_global_registry", return_value=registry):
+            yield registry
+
+    @pytest.fixture
+    def build(self, orchestrator_service):
+        """Replace workflow construction with a mock returning a new workflow per build."""
+        with patch.object(orchestrator_service, "_create_workflow", side_effect=lambda: MagicMock()) as build:
+            yield build
+
+    def test_workflow_reused_while_configuration_unchanged(self, orchestrator_service, registry, build):
+        """Test that the compiled workflow is built once and then reused."""
+        first = orchestrator_service._get_workflow()
+        second = orchestrator_service._get_workflow()
+
+        assert first is second
+        assert build.call_count == 1
+        stats = orchestrator_service.get_workflow_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["cached"] is True
+
+    def test_role_change_rebuilds_workflow(self, orchestrator_service, registry, build):
+        """Test that registering a role invalidates the cached workflow."""
+        first = orchestrator_service._get_workflow()
+
+        registry.register(
+            RoleDefinition(
+                role="dev",
+                description="Developer",
+                model_provider="openai",
+                model_name="gpt-4",
+                customized_model_name="dev-gpt4",
+                system_prompt="You are a developer...",
+                metadata=RoleMetadata(domain="software_development", decision_authority="implementation"),
+            )
+        )
+        second = orchestrator_service._get_workflow()
+
+        assert second is not first
+        assert build.call_count == 2
+        assert orchestrator_service._get_workflow() is second
+
+    def test_explicit_invalidation(self, orchestrator_service, registry, build):
+        """Test that invalidate_workflow_cache forces a rebuild."""
+        first = orchestrator_service._get_workflow()
+        orchestrator_service.invalidate_workflow_cache()
+
+        assert orchestrator_service.get_workflow_cache_stats()["cached"] is False
+        assert orchestrator_service._get_workflow() is not first
+        assert build.call_count == 2
+
+    def test_cache_disabled(self, persistence_manager, registry):
+        """Test that every call builds a new workflow when caching is disabled."""
+        service = OrchestratorService(persistence=persistence_manager, cache_workflows=False)
+        with patch.object(service, "_create_workflow", side_effect=lambda: MagicMock()) as build:
+            assert service._get_workflow() is not service._get_workflow()
+
+        assert build.call_count == 2
+        assert service.get_workflow_cache_stats()["enabled"] is False
+
+    def test_mcp_config_is_part_of_cache_key(self, persistence_manager, registry):
+        """Test that services with different MCP configurations get different keys."""
+        default = OrchestratorService(persistence=persistence_manager)
+        custom = OrchestratorService(persistence=persistence_manager, mcp_config=MCPClientConfig(timeout=5.0))
+
+        assert default._workflow_cache_key() != custom._workflow_cache_key()
+        assert default._workflow_cache_key() == OrchestratorService()._workflow_cache_key()
+
+    def test_create_workflow_uses_mcp_config(self, persistence_manager):
+        """Test that the workflow MCP client is created from the service configuration."""
+        config = MCPClientConfig(timeout=5.0)
+        service = OrchestratorService(persistence=persistence_manager, mcp_config=config)
+
+        with patch("gearmeshing_ai.agent.orchestrator.service.MCPClient") as client_cls:
+            service._create_workflow()
+
+        client_cls.assert_called_once_with(config)
+
+    @pytest.mark.asyncio
+    async def test_runs_share_compiled_workflow(self, orchestrator_service):
+        """Test that consecutive runs reuse the compiled workflow."""
+        with patch.object(
+            orchestrator_service, "_create_workflow", wraps=orchestrator_service._create_workflow
+        ) as build:
+            await orchestrator_service.run_workflow(task_description="First task", agent_role="dev")
+            await orchestrator_service.run_workflow(task_description="Second task", agent_role="dev")
+
+        assert build.call_count == 1
+        assert orchestrator_service.get_workflow_cache_stats()["hits"] == 1
+
+
+class FakeWorkflow:
+    """Compiled workflow stand-in recording the concurrency of its runs."""
+
+    def __init__(self, delays: dict[str, float] | None = None) -> None:
+        self.delays = delays or {}
+        self.started: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self.cancelled = 0
+
+    async def ainvoke(self, state):
+        self.started.append(state.context.task_description)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(state.context.task_description, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+        state.status = RuntimeWorkflowStatus(state="success")
+        return state
+
+
+class TestOrchestratorServiceBatch:
+    """Tests for run_workflows_batch method."""
+
+    @pytest.mark.asyncio
+    async def test_batch_yields_every_result(self, orchestrator_service):
+        """Test that every task gets a result identified by its run_id."""
+        workflow = FakeWorkflow()
+        tasks = [WorkflowTask(task_description=f"task {index}", agent_role="dev") for index in range(5)]
+
+        with patch.object(orchestrator_service, "_create_workflow", return_value=workflow) as build:
+            results = [result async for result in orchestrator_service.run_workflows_batch(tasks)]
+
+        assert sorted(result.run_id for result in results) == sorted(task.run_id for task in tasks)
+        assert all(result.status == WorkflowStatus.SUCCESS for result in results)
+        assert build.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_limited(self, orchestrator_service):
+        """Test that at most max_concurrency workflows run at once."""
+        workflow = FakeWorkflow()
+        tasks = [WorkflowTask(task_description=f"task {index}", agent_role="dev") for index in range(10)]
+
+        with patch.object(orchestrator_service, "_create_workflow", return_value=workflow):
+            results = [result async for result in orchestrator_service.run_workflows_batch(tasks, max_concurrency=3)]
+
+        assert len(results) == 10
+        assert workflow.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_results_stream_in_completion_order(self, orchestrator_service):
+        """Test that a fast run is yielded before a slow one submitted earlier."""
+        workflow = FakeWorkflow(delays={"slow": 0.2, "fast": 0.01})
+        slow = WorkflowTask(task_description="slow", agent_role="dev")
+        fast = WorkflowTask(task_description="fast", agent_role="dev")
+
+        with patch.object(orchestrator_service, "_create_workflow", return_value=workflow):
+            results = [result.run_id async for result in orchestrator_service.run_workflows_batch([slow, fast])]
+
+        assert results == [fast.run_id, slow.run_id]
+
+    @pytest.mark.asyncio
+    async def test_roles_are_started_round_robin(self, orchestrator_service):
+        """Test that a role with many tasks does not delay the other roles."""
+        workflow = FakeWorkflow()
+        tasks = [WorkflowTask(task_description=f"dev {index}", agent_role="dev") for index in range(4)]
+        tasks += [
+            WorkflowTask(task_description="qa 0", agent_role="qa"),
+            WorkflowTask(task_description="sre 0", agent_role="sre"),
+        ]
+
+        with patch.object(orchestrator_service, "_create_workflow", return_value=workflow):
+            async for _ in orchestrator_service.run_workflows_batch(tasks, max_concurrency=1):
+                pass
+
+        assert workflow.started == ["dev 0", "qa 0", "sre 0", "dev 1", "dev 2", "dev 3"]
+
+    @pytest.mark.asyncio
+    async def test_closing_the_stream_cancels_running_workflows(self, orchestrator_service):
+        """Test that runs still in progress are cancelled when the consumer stops."""
+        workflow = FakeWorkflow(delays={"slow": 10, "fast": 0.01})
+        tasks = [
+            WorkflowTask(task_description="fast", agent_role="dev"),
+            WorkflowTask(task_description="slow", agent_role="dev"),
+        ]
+
+        with patch.object(orchestrator_service, "_create_workflow", return_value=workflow):
+            stream = orchestrator_service.run_workflows_batch(tasks)
+            first = await anext(stream)
+            await stream.aclose()
+
+        assert first.run_id == tasks[0].run_id
+        assert workflow.cancelled == 1
+        assert workflow.active == 0
+
+    @pytest.mark.asyncio
+    async def test_workflow_creation_failure_fails_every_task(self, orchestrator_service):
+        """Test that a batch whose workflow cannot be built reports failed results."""
+        tasks = [WorkflowTask(task_description=f"task {index}", agent_role="dev") for index in range(2)]
+
+        with patch.object(orchestrator_service, "_create_workflow", side_effect=ValueError("no model")):
+            results = [result async for result in orchestrator_service.run_workflows_batch(tasks)]
+
+        assert [result.status for result in results] == [WorkflowStatus.FAILED] * 2
+        assert all("no model" in result.error for result in results)
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self, orchestrator_service):
+        """Test that a concurrency limit below one is rejected."""
+        with pytest.raises(ValueError):
+            async for _ in orchestrator_service.run_workflows_batch([], max_concurrency=0):
+                pass
@@ -261,6 +261,21 @@ class TestRoleRegistry:
         assert len(registry) == 0
         assert registry.list_roles() == []
 
+    def test_version_changes_on_register_and_clear(self, registry, sample_roles):
+        """Test that the version increases whenever roles change."""
+        assert registry.version == 0
+
+        registry.register(sample_roles["dev"])
+        after_register = registry.version
+        assert after_register > 0
+
+        registry.get("dev")
+        registry.list_roles()
+        assert registry.version == after_register
+
+        registry.clear()
+        assert registry.version > after_register
+
     def test_contains_operator(self, registry, sample_roles):
         """Test using 'in' operator."""
         registry.register(sample_roles["dev"])
@@ -0,0 +1,255 @@
+"""Unit tests for runtime performance utilities.
+
+Tests for PerformanceCache including:
+- LRU eviction order
+- TinyLFU admission
+- TTL expiry on access and via the timer wheel
+- Per-namespace statistics
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from gearmeshing_ai.agent.runtime.performance import FrequencySketch, PerformanceCache
+
+CLOCK = "gearmeshing_ai.agent.runtime.performance.time.monotonic"
+
+
+class TestPerformanceCacheLRU:
+    """Test basic operations and LRU eviction."""
+
+    def test_get_and_set(self) -> None:
+        """Test storing and retrieving values."""
+        cache: PerformanceCache[str] = PerformanceCache(max_size=10)
+        cache.set("a", "value")
+
+        assert cache.get("a") == "value"
+        assert cache.get("missing") is None
+        assert cache.hit_count == 1
+        assert cache.miss_count == 1
+        assert cache.get_hit_rate() == 50.0
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that reads refresh recency and the LRU entry is evicted."""
+        cache: PerformanceCache[int] = PerformanceCache(max_size=3)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        cache.get("a")
+        cache.set("d", 4)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get("d") == 4
+        assert cache.eviction_count == 1
+
+    def test_overwrite_does_not_evict(self) -> None:
+        """Test that updating an existing key when full keeps every entry."""
+        cache: PerformanceCache[int] = PerformanceCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+
+        assert cache.get("a") == 10
+        assert cache.get("b") == 2
+        assert cache.eviction_count == 0
+
+    def test_size_stays_bounded(self) -> None:
+        """Test that the cache never grows past max_size."""
+        cache: PerformanceCache[int] = PerformanceCache(max_size=100)
+        for i in range(1000):
+            cache.set(f"key_{i}", i)
+
+        assert len(cache.cache) == 100
+        assert cache.get("key_999") == 999
+        assert cache.get("key_0") is None
+
+    def test_invalidate_and_clear(self) -> None:
+        """Test removing one entry and all entries."""
+        cache: PerformanceCache[int] = PerformanceCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert cache.get_stats()["size"] == 0
+
+    def test_unknown_admission_policy(self) -> None:
+        """Test that an unknown admission policy is rejected."""
+        with pytest.raises(ValueError, match="Unknown admission policy"):
+            PerformanceCache(admission="random")
+
+    def test_concurrent_threads(self) -> None:
+        """Test that concurrent writers keep the cache consistent."""
+        cache: PerformanceCache[int] = PerformanceCache(max_size=50)
+
+        def worker(worker_id: int) -> None:
+            for i in range(200):
+                cache.set(f"w{worker_id}:{i}", i)
+                cache.get(f"w{worker_id}:{i // 2}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.get_stats()
+        assert stats["size"] == 50
+        assert sum(ns["size"] for ns in stats["namespaces"].values()) == 50
+
+
+class TestPerformanceCacheAdmission:
+    """Test TinyLFU admission."""
+
+    def test_popular_entry_survives_scan(self) -> None:
+        """Test that a burst of one-off keys does not flush a popular entry."""
+        cache: PerformanceCache[int] = PerformanceCache(max_size=2, admission="tinylfu")
+        cache.set("hot", 0)
+        for _ in range(5):
+            cache.get("hot")
+        cache.set("warm", 1)
+
+        # "hot" is now least recently used, but far more popular than the scan
+        # (kept shorter than the sketch's aging period of 10 * max_size)
+        cache.get("warm")
+        for i in range(8):
+            cache.set(f"scan_{i}", i)
+
+        assert cache.get("hot") == 0
+        assert cache.rejected_count > 0
+
+    def test_ties_are_admitted(self) -> None:
+        """Test that equally popular keys still rotate through the cache."""
+        cache: PerformanceCache[int] = PerformanceCache(max_size=2, admission="tinylfu")
+        for i in range(5):
+            cache.set(f"key_{i}", i)
+
+        assert cache.get("key_4") == 4
+        assert cache.rejected_count == 0
+
+    def test_sketch_ages_counts(self) -> None:
+        """Test that frequencies are halved after the sample size is reached."""
+        sketch = FrequencySketch(capacity=1)
+        for _ in range(8):
+            sketch.increment("key")
+        assert sketch.frequency("key") == 8
+
+        sketch.increment("key")
+        sketch.increment("key")
+        # The tenth increment triggers aging: 10 // 2
+        assert sketch.frequency("key") == 5
+
+    def test_sketch_saturates(self) -> None:
+        """Test that counters stop at their maximum."""
+        sketch = FrequencySketch(capacity=100)
+        for _ in range(100):
+            sketch.increment("key")
+
+        assert sketch.frequency("key") == FrequencySketch.MAX_COUNT
+        assert sketch.frequency("other") <= FrequencySketch.MAX_COUNT
+
+
+class TestPerformanceCacheExpiry:
+    """Test TTL expiry."""
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        """Test that an expired entry is dropped on access."""
+        with patch(CLOCK, return_value=100.0):
+            cache: PerformanceCache[str] = PerformanceCache()
+            cache.set("a", "value", ttl_seconds=10)
+        with patch(CLOCK, return_value=105.0):
+            assert cache.get("a") == "value"
+        with patch(CLOCK, return_value=111.0):
+            assert cache.get("a") is None
+
+        assert cache.expired_count == 1
+        assert cache.miss_count == 1
+
+    def test_timer_wheel_purges_expired_entries(self) -> None:
+        """Test that expired entries are purged without being accessed."""
+        with patch(CLOCK, return_value=0.0):
+            cache: PerformanceCache[int] = PerformanceCache()
+            cache.set("short_1", 1, ttl_seconds=5)
+            cache.set("short_2", 2, ttl_seconds=5)
+            cache.set("long", 3, ttl_seconds=60)
+
+        with patch(CLOCK, return_value=7.0):
+            assert cache.purge_expired() == 2
+
+        assert list(cache.cache) == ["long"]
+
+    def test_writes_advance_the_wheel(self) -> None:
+        """Test that a write purges entries that expired in the meantime."""
+        with patch(CLOCK, return_value=0.0):
+            cache: PerformanceCache[int] = PerformanceCache()
+            cache.set("old", 1, ttl_seconds=1)
+        with patch(CLOCK, return_value=1000.0):
+            cache.set("new", 2)
+
+        assert "old" not in cache.cache
+        assert cache.expired_count == 1
+
+    def test_rewritten_entry_is_not_purged_early(self) -> None:
+        """Test that refreshing a key moves it to a later wheel slot."""
+        with patch(CLOCK, return_value=0.0):
+            cache: PerformanceCache[int] = PerformanceCache()
+            cache.set("a", 1, ttl_seconds=5)
+        with patch(CLOCK, return_value=4.0):
+            cache.set("a", 2, ttl_seconds=60)
+        with patch(CLOCK, return_value=10.0):
+            assert cache.purge_expired() == 0
+            assert cache.get("a") == 2
+
+
+class TestPerformanceCacheNamespaces:
+    """Test per-namespace statistics."""
+
+    def test_namespace_stats(self) -> None:
+        """Test that statistics are tracked per key prefix."""
+        cache: PerformanceCache[int] = PerformanceCache()
+        cache.set("capabilities:dev", 1)
+        cache.set("capabilities:qa", 2)
+        cache.set("policy:dev", 3)
+        cache.get("capabilities:dev")
+        cache.get("capabilities:sre")
+        cache.get("policy:dev")
+        cache.get("plain")
+
+        capabilities = cache.get_namespace_stats("capabilities")
+        assert capabilities["size"] == 2
+        assert capabilities["hit_count"] == 1
+        assert capabilities["miss_count"] == 1
+        assert capabilities["hit_rate_percent"] == 50.0
+
+        stats = cache.get_stats()
+        assert stats["namespaces"]["policy"]["hit_count"] == 1
+        assert stats["namespaces"][""]["miss_count"] == 1
+
+    def test_invalidate_namespace(self) -> None:
+        """Test removing every entry of one namespace."""
+        cache: PerformanceCache[int] = PerformanceCache()
+        cache.set("capabilities:dev", 1)
+        cache.set("capabilities:qa", 2)
+        cache.set("policy:dev", 3)
+
+        assert cache.invalidate_namespace("capabilities") == 2
+        assert cache.get_namespace_stats("capabilities")["size"] == 0
+        assert cache.get("policy:dev") == 3
+
+    def test_eviction_counted_in_victim_namespace(self) -> None:
+        """Test that evictions are attributed to the evicted key's namespace."""
+        cache: PerformanceCache[int] = PerformanceCache(max_size=1)
+        cache.set("a:1", 1)
+        cache.set("b:1", 2)
+
+        assert cache.get_namespace_stats("a")["eviction_count"] == 1
+        assert cache.get_namespace_stats("a")["size"] == 0
+        assert cache.get_namespace_stats("b")["size"] == 1
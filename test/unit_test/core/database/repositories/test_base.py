@@ -0,0 +1,78 @@
+"""Unit tests for the base repository."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import StaticPool, inspect, text
+
+from gearmeshing_ai.core.database.repositories.base import BaseRepository, create_pooled_engine
+from gearmeshing_ai.core.database.repositories.orchestrator import OrchestratorRepository
+
+
+class TestCreatePooledEngine:
+    """Test engine creation."""
+
+    def test_memory_sqlite_shares_one_connection(self):
+        """Test that an in-memory database is shared by every thread."""
+        engine = create_pooled_engine("sqlite://")
+
+        assert isinstance(engine.pool, StaticPool)
+
+    def test_file_sqlite_uses_pool_and_wal(self, tmp_path):
+        """Test that file databases are pooled and use write-ahead logging."""
+        engine = create_pooled_engine(f"sqlite:///{tmp_path / 'pooled.db'}", pool_size=3)
+        try:
+            assert engine.pool.size() == 3
+            with engine.connect() as connection:
+                assert connection.execute(text("PRAGMA journal_mode")).scalar_one() == "wal"
+        finally:
+            engine.dispose()
+
+
+class TestBaseRepository:
+    """Test the base repository."""
+
+    @pytest.mark.asyncio
+    async def test_run_creates_tables_once(self, tmp_path):
+        """Test that the schema is created before the first statement."""
+        repository = OrchestratorRepository(f"sqlite:///{tmp_path / 'repo.db'}")
+        try:
+            tables = await repository.run(lambda connection: inspect(connection).get_table_names())
+
+            assert "orchestrator_workflow_states" in tables
+            assert "orchestrator_approval_decisions" in tables
+            await repository.create_tables()
+            assert repository._tables_created is True
+        finally:
+            await repository.dispose()
+
+    @pytest.mark.asyncio
+    async def test_history_columns_are_indexed(self, tmp_path):
+        """Test that the columns history queries filter on are indexed."""
+        repository = OrchestratorRepository(f"sqlite:///{tmp_path / 'repo.db'}")
+        try:
+            indexes = await repository.run(
+                lambda connection: inspect(connection).get_indexes("orchestrator_workflow_history")
+            )
+            indexed = {tuple(index["column_names"]) for index in indexes}
+
+            assert {("user_id",), ("agent_role",), ("status",), ("user_id", "created_at")} <= indexed
+        finally:
+            await repository.dispose()
+
+    @pytest.mark.asyncio
+    async def test_run_in_transaction_rolls_back_on_error(self):
+        """Test that a failing function writes nothing."""
+        repository = BaseRepository("sqlite://")
+        await repository.run_in_transaction(lambda connection: connection.execute(text("CREATE TABLE t (x INTEGER)")))
+
+        def insert_then_fail(connection):
+            connection.execute(text("INSERT INTO t VALUES (1)"))
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await repository.run_in_transaction(insert_then_fail)
+
+        count = await repository.run(lambda connection: connection.execute(text("SELECT COUNT(*) FROM t")).scalar_one())
+        assert count == 0
+        await repository.dispose()
@@ -0,0 +1,83 @@
+"""Unit tests for the orchestrator repository."""
+
+from __future__ import annotations
+
+import pytest
+
+from gearmeshing_ai.core.database.repositories.orchestrator import STATE_REVISION_FIELD, OrchestratorRepository
+
+
+def state_write(fields: dict[str, bytes], changed: list[str] | None = None, base_meta: bytes | None = None) -> dict:
+    """Create a state write of run_1."""
+    return {
+        "run_id": "run_1",
+        "fields": fields,
+        "changed": changed if changed is not None else list(fields),
+        "removed": [],
+        "base_meta": base_meta,
+    }
+
+
+@pytest.fixture
+async def repository(tmp_path):
+    """Create a repository on a SQLite file."""
+    repository = OrchestratorRepository(f"sqlite:///{tmp_path / 'repo.db'}")
+    yield repository
+    await repository.dispose()
+
+
+class TestStateWrites:
+    """Test delta writes of workflow states."""
+
+    @pytest.mark.asyncio
+    async def test_delta_replaces_changed_fields(self, repository):
+        """Test that a delta based on the stored revision only rewrites its fields."""
+        await repository.save_batch(states=[state_write({STATE_REVISION_FIELD: b"r1", "a": b"1", "b": b"1"})])
+
+        stats = await repository.save_batch(
+            states=[
+                state_write(
+                    {STATE_REVISION_FIELD: b"r2", "a": b"2", "b": b"1"},
+                    changed=[STATE_REVISION_FIELD, "a"],
+                    base_meta=b"r1",
+                )
+            ]
+        )
+
+        assert stats["delta_writes"] == 1
+        assert await repository.get_workflow_state_fields("run_1") == {
+            STATE_REVISION_FIELD: b"r2",
+            "a": b"2",
+            "b": b"1",
+        }
+
+    @pytest.mark.asyncio
+    async def test_second_delta_of_a_revision_is_written_in_full(self, repository):
+        """Test that two writers deriving deltas from one revision never merge their fields."""
+        await repository.save_batch(states=[state_write({STATE_REVISION_FIELD: b"r1", "a": b"1", "b": b"1"})])
+        await repository.save_batch(
+            states=[
+                state_write(
+                    {STATE_REVISION_FIELD: b"r2", "a": b"2", "b": b"1"},
+                    changed=[STATE_REVISION_FIELD, "a"],
+                    base_meta=b"r1",
+                )
+            ]
+        )
+
+        stats = await repository.save_batch(
+            states=[
+                state_write(
+                    {STATE_REVISION_FIELD: b"r3", "a": b"1", "b": b"3"},
+                    changed=[STATE_REVISION_FIELD, "b"],
+                    base_meta=b"r1",
+                )
+            ]
+        )
+
+        assert stats == {"delta_writes": 0, "full_writes": 1, "bytes_written": 4}
+        assert await repository.get_workflow_state_fields("run_1") == {
+            STATE_REVISION_FIELD: b"r3",
+            "a": b"1",
+            "b": b"3",
+        }
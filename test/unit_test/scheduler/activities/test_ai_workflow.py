@@ -4,10 +4,13 @@ from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from temporalio.testing import ActivityEnvironment
 
+from gearmeshing_ai.scheduler.activities.ai_workflow import AIWorkflowActivity
 from gearmeshing_ai.scheduler.models.checking_point import CheckResult, CheckResultType
 from gearmeshing_ai.scheduler.models.monitoring import MonitoringData, MonitoringDataType
 from gearmeshing_ai.scheduler.models.workflow import AIAction, AIActionType, AIWorkflowResult
+from gearmeshing_ai.scheduler.utils.blobs import BlobStore, offload_large_values, set_blob_store
 
 
 class TestAIWorkflowActivity:
@@ -407,3 +410,83 @@ class TestAIWorkflowActivity:
             result = await activity.execute_workflow(action, data, check_result)
             assert result.success is True
             assert len(result.actions_taken) > 0
+
+
+class TestAIWorkflowPayloadHydration:
+    """Test hydration of blob-referenced AI action payloads."""
+
+    @pytest.mark.asyncio
+    async def test_references_are_hydrated_before_running(self, tmp_path):
+        """Test that the orchestrator receives the stored payload values."""
+        store = BlobStore(tmp_path)
+        task = {"id": "task_1", "description": "d" * 500}
+        action = AIAction(
+            name="test_workflow",
+            type=AIActionType.WORKFLOW_EXECUTION,
+            workflow_name="test_workflow",
+            checking_point_name="test_cp",
+            parameters=offload_large_values({"data": task, "config": {}}, store, threshold_bytes=100),
+            prompt_variables=offload_large_values({"data": task, "data_id": "task_1"}, store, threshold_bytes=100),
+        )
+        orchestrator = Mock()
+        orchestrator.run_workflow = AsyncMock(return_value={"success": True})
+        activity_instance = AIWorkflowActivity()
+
+        set_blob_store(store)
+        try:
+            with patch.object(activity_instance, "_get_orchestrator_service", return_value=orchestrator):
+                result = await ActivityEnvironment().run(activity_instance.execute_ai_workflow, action, {}, {})
+        finally:
+            set_blob_store(None)
+
+        assert result == {"success": True}
+        sent_action = orchestrator.run_workflow.await_args.kwargs["input_data"]["ai_action"]
+        assert sent_action["parameters"] == {"data": task, "config": {}}
+        assert sent_action["prompt_variables"] == {"data": task, "data_id": "task_1"}
+        # Stored once although referenced twice
+        assert store.get_stats()["writes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_summarized_input_is_completed_from_parameters(self, tmp_path):
+        """Test that summarized monitoring data is replaced by the full payload of the action."""
+        store = BlobStore(tmp_path)
+        data_item = {"id": "task_1", "type": "clickup_task", "source": "clickup", "data": {"d": "d" * 500}}
+        check_result = {"checking_point_name": "test_cp", "result_type": "match", "reason": "urgent"}
+        action = AIAction(
+            name="test_workflow",
+            type=AIActionType.WORKFLOW_EXECUTION,
+            workflow_name="test_workflow",
+            checking_point_name="test_cp",
+            parameters=offload_large_values({"data": data_item, "result": check_result}, store, threshold_bytes=100),
+        )
+        orchestrator = Mock()
+        orchestrator.run_workflow = AsyncMock(return_value={"success": True})
+        activity_instance = AIWorkflowActivity()
+
+        set_blob_store(store)
+        try:
+            with patch.object(activity_instance, "_get_orchestrator_service", return_value=orchestrator):
+                await ActivityEnvironment().run(
+                    activity_instance.execute_ai_workflow,
+                    action,
+                    {"id": "task_1", "type": "clickup_task", "source": "clickup"},
+                    {"checking_point_name": "test_cp", "result_type": "match"},
+                )
+        finally:
+            set_blob_store(None)
+
+        input_data = orchestrator.run_workflow.await_args.kwargs["input_data"]
+        assert input_data["data_item"] == data_item
+        assert input_data["check_result"] == check_result
+
+    def test_inline_action_is_returned_unchanged(self):
+        """Test that actions without references are not copied."""
+        action = AIAction(
+            name="test_workflow",
+            type=AIActionType.WORKFLOW_EXECUTION,
+            workflow_name="test_workflow",
+            checking_point_name="test_cp",
+            parameters={"data": {"id": "task_1"}},
+        )
+
+        assert AIWorkflowActivity()._hydrate_ai_action(action) is action
@@ -1,11 +1,22 @@
 """Unit tests for data fetch activities."""
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-
+from temporalio.testing import ActivityEnvironment
+
+from gearmeshing_ai.scheduler.activities.data_fetch import (
+    DataFetchingActivity,
+    evaluate_checking_point,
+    evaluate_checking_points_batch,
+)
+from gearmeshing_ai.scheduler.models.checking_point import CheckResult, CheckResultType
+from gearmeshing_ai.scheduler.models.config import MonitorConfig
 from gearmeshing_ai.scheduler.models.monitoring import MonitoringData, MonitoringDataType
+from gearmeshing_ai.scheduler.models.workflow import AIAction, AIActionType
+from gearmeshing_ai.scheduler.utils.blobs import BLOB_REF_KEY
 
 
 class TestDataFetchingActivity:
@@ -237,3 +248,224 @@ class TestDataFetchingActivity:
 
                 assert len(clickup_results) == 1
                 assert len(slack_results) == 1
+
+
+def _batch_checking_point(name: str, matches: set[str], stop_on_match: bool = False, handles: bool = True) -> Mock:
+    """Create a checking point double matching the given data item IDs."""
+    checking_point = Mock()
+    checking_point.name = name
+    checking_point.stop_on_match = stop_on_match
+    checking_point.can_handle.return_value = handles
+    checking_point.prepare_after_process.return_value = None
+
+    async def evaluate(data):
+        matched = data.id in matches
+        return CheckResult(
+            checking_point_name=name,
+            checking_point_type="custom_cp",
+            result_type=CheckResultType.MATCH if matched else CheckResultType.NO_MATCH,
+            should_act=matched,
+        )
+
+    checking_point.evaluate = AsyncMock(side_effect=evaluate)
+    return checking_point
+
+
+class TestEvaluateCheckingPoint:
+    """Test the evaluate_checking_point activity."""
+
+    @pytest.mark.asyncio
+    async def test_matches_carry_prepared_ai_actions(self):
+        """Test that the AI actions are prepared in the activity, not in the workflow."""
+        checking_point = _batch_checking_point("a", matches={"task_1"})
+        checking_point.type.value = "custom_cp"
+        ai_action = AIAction(
+            name="a_workflow",
+            type=AIActionType.WORKFLOW_EXECUTION,
+            workflow_name="custom_cp_workflow",
+            checking_point_name="a",
+            parameters={"data": {BLOB_REF_KEY: "0" * 64, "size": 100_000}},
+        )
+        checking_point.prepare_after_process.return_value = [ai_action]
+        data = MonitoringData(id="task_1", type=MonitoringDataType.CLICKUP_TASK, source="clickup", data={})
+
+        result = await ActivityEnvironment().run(evaluate_checking_point, checking_point, data)
+
+        assert result.ai_actions == [ai_action]
+        checking_point.prepare_after_process.assert_called_once_with(data, result)
+
+
+class TestEvaluateCheckingPointsBatch:
+    """Test the evaluate_checking_points_batch activity."""
+
+    @pytest.fixture
+    def registry(self):
+        """Patch the checking point registry used by the activity."""
+        with patch("gearmeshing_ai.scheduler.activities.data_fetch.checking_point_registry") as registry:
+            registry.instances = {}
+            registry.get_instance.side_effect = lambda name: registry.instances.get(name)
+            yield registry
+
+    @staticmethod
+    def _items(*item_ids: str) -> list[MonitoringData]:
+        return [
+            MonitoringData(id=item_id, type=MonitoringDataType.CLICKUP_TASK, source="clickup", data={"id": item_id})
+            for item_id in item_ids
+        ]
+
+    @pytest.mark.asyncio
+    async def test_returns_only_matches(self, registry):
+        """Test that results are compact and keyed by checking point name."""
+        registry.instances = {
+            "a": _batch_checking_point("a", matches={"task_1"}),
+            "b": _batch_checking_point("b", matches={"task_1", "task_2"}),
+        }
+
+        evaluations = await ActivityEnvironment().run(
+            evaluate_checking_points_batch, self._items("task_1", "task_2", "task_3"), ["a", "b"]
+        )
+
+        assert [evaluation.data_item_id for evaluation in evaluations] == ["task_1", "task_2", "task_3"]
+        assert list(evaluations[0].matches) == ["a", "b"]
+        assert list(evaluations[1].matches) == ["b"]
+        assert not evaluations[2].has_matches()
+        assert all(evaluation.evaluated_count == 2 for evaluation in evaluations)
+
+    @pytest.mark.asyncio
+    async def test_stop_on_match_skips_later_checking_points(self, registry):
+        """Test that a stopping match ends evaluation of the item."""
+        later = _batch_checking_point("later", matches={"task_1", "task_2"})
+        registry.instances = {
+            "stop": _batch_checking_point("stop", matches={"task_1"}, stop_on_match=True),
+            "later": later,
+        }
+
+        evaluations = await ActivityEnvironment().run(
+            evaluate_checking_points_batch, self._items("task_1", "task_2"), ["stop", "later"]
+        )
+
+        assert list(evaluations[0].matches) == ["stop"]
+        assert list(evaluations[1].matches) == ["later"]
+        later.evaluate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_checking_points_that_cannot_handle(self, registry):
+        """Test that checking points not handling the data type are not evaluated."""
+        skipped = _batch_checking_point("skipped", matches={"task_1"}, handles=False)
+        registry.instances = {"skipped": skipped}
+
+        evaluations = await ActivityEnvironment().run(
+            evaluate_checking_points_batch, self._items("task_1"), ["skipped"]
+        )
+
+        assert evaluations[0].evaluated_count == 0
+        skipped.evaluate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_records_errors(self, registry):
+        """Test that unknown and failing checking points are reported per item."""
+        broken = _batch_checking_point("broken", matches=set())
+        broken.evaluate.side_effect = RuntimeError("evaluation failed")
+        registry.instances = {"broken": broken, "ok": _batch_checking_point("ok", matches={"task_1"})}
+
+        evaluations = await ActivityEnvironment().run(
+            evaluate_checking_points_batch, self._items("task_1"), ["missing", "broken", "ok"]
+        )
+
+        assert evaluations[0].errors == {
+            "missing": "Unknown checking point: missing",
+            "broken": "evaluation failed",
+        }
+        assert list(evaluations[0].matches) == ["ok"]
+
+
+class TestDataFetchingActivityConcurrency:
+    """Test concurrent fetching of DataFetchingActivity.fetch_data."""
+
+    @staticmethod
+    def _config(*cp_types: str, max_concurrent_fetches: int = 4) -> MonitorConfig:
+        return MonitorConfig(
+            name="monitor",
+            checking_points=[{"type": cp_type, "enabled": True, "config": {}} for cp_type in cp_types],
+            max_concurrent_fetches=max_concurrent_fetches,
+        )
+
+    @pytest.fixture
+    def fetch_state(self):
+        """Patch checking point creation with doubles that record concurrency."""
+        state = {"in_flight": 0, "max_in_flight": 0, "fail": set()}
+
+        def create(cp_type, cp_config):
+            checking_point = Mock()
+
+            async def fetch_data(**kwargs):
+                state["in_flight"] += 1
+                state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+                try:
+                    await asyncio.sleep(0.01)
+                    if cp_type in state["fail"]:
+                        raise RuntimeError("upstream error")
+                    return [
+                        MonitoringData(id=f"{cp_type}_{i}", type=MonitoringDataType.CLICKUP_TASK, source="clickup")
+                        for i in range(2)
+                    ]
+                finally:
+                    state["in_flight"] -= 1
+
+            checking_point.fetch_data = fetch_data
+            return checking_point
+
+        with patch.object(DataFetchingActivity, "_get_checking_point_instance", side_effect=create):
+            yield state
+
+    @staticmethod
+    async def _fetch(config: MonitorConfig, heartbeats: list) -> list[MonitoringData]:
+        env = ActivityEnvironment()
+        env.on_heartbeat = lambda *details: heartbeats.append(details[0])
+        return await env.run(DataFetchingActivity().fetch_data, config)
+
+    @pytest.mark.asyncio
+    async def test_checking_points_fetch_concurrently(self, fetch_state):
+        """Test that checking points fetch at once up to the cap, keeping result order."""
+        heartbeats = []
+
+        items = await self._fetch(self._config("a", "b", "c", "d", "e", max_concurrent_fetches=3), heartbeats)
+
+        assert [item.id for item in items] == [f"{cp_type}_{i}" for cp_type in "abcde" for i in range(2)]
+        assert fetch_state["max_in_flight"] == 3
+
+    @pytest.mark.asyncio
+    async def test_heartbeats_report_progress(self, fetch_state):
+        """Test that a heartbeat is sent after each checking point."""
+        fetch_state["fail"] = {"b"}
+        heartbeats = []
+
+        items = await self._fetch(self._config("a", "b", "c"), heartbeats)
+
+        assert len(items) == 4
+        assert [heartbeat["completed"] for heartbeat in heartbeats] == [1, 2, 3]
+        assert heartbeats[-1] == {"completed": 3, "failed": 1, "total": 3, "items": 4}
+
+
+class TestDataFetchingActivityInstances:
+    """Test reuse of checking point instances across fetches."""
+
+    @pytest.fixture(autouse=True)
+    def clear_instances(self):
+        """Start and end each test without reused instances."""
+        DataFetchingActivity.clear_checking_point_instances()
+        yield
+        DataFetchingActivity.clear_checking_point_instances()
+
+    def test_same_configuration_reuses_instance(self):
+        """Test that fetches with the same type and configuration share an instance."""
+        cp_class = Mock(side_effect=lambda config: Mock(config=config))
+
+        with patch("gearmeshing_ai.scheduler.activities.data_fetch.get_checking_point_class", return_value=cp_class):
+            first = DataFetchingActivity()._get_checking_point_instance("cp", {"list_ids": ["1"], "rate_limit": 10})
+            second = DataFetchingActivity()._get_checking_point_instance("cp", {"rate_limit": 10, "list_ids": ["1"]})
+            other = DataFetchingActivity()._get_checking_point_instance("cp", {"list_ids": ["2"]})
+
+        assert first is second
+        assert other is not first
+        assert cp_class.call_count == 2
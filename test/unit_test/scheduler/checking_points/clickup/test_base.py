@@ -1,9 +1,16 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
 from gearmeshing_ai.scheduler.checking_points.base import (
     CheckingPointType,
 )
 from gearmeshing_ai.scheduler.checking_points.clickup.base import ClickUpCheckingPoint
 from gearmeshing_ai.scheduler.models.checking_point import CheckResult
 from gearmeshing_ai.scheduler.models.monitoring import MonitoringData, MonitoringDataType
+from gearmeshing_ai.scheduler.utils.clients import get_client_registry, reset_client_registry
+from gearmeshing_ai.scheduler.utils.fetching import FetchCoordinator, fetch_scope
 
 
 class TestClickUpCheckingPoint:
@@ -76,3 +83,196 @@ class TestClickUpCheckingPoint:
         assert variables["task_id"] == "task_123"
         assert variables["task_name"] == "Test Task"
         assert variables["task_priority"] == "high"
+
+
+def _task(task_id: str, updated: int, priority: str | None = None) -> dict:
+    task = {"id": task_id, "name": f"Task {task_id}", "date_updated": str(updated)}
+    if priority:
+        task["priority"] = {"priority": priority}
+    return task
+
+
+class TestClickUpTaskFetching:
+    """Test paginated and incremental task fetching of ClickUpCheckingPoint."""
+
+    ConcreteClickUpCP = TestClickUpCheckingPoint.ConcreteClickUpCP
+
+    @staticmethod
+    def _client(*pages: list[dict], last_page: bool | None = None) -> Mock:
+        """Create a ClickUp client double returning the given pages in order."""
+        responses = []
+        for index, tasks in enumerate(pages):
+            data = {"tasks": tasks}
+            if last_page is not None:
+                data["last_page"] = last_page and index == len(pages) - 1
+            responses.append(Mock(success=True, status_code=200, error=None, data=data))
+        client = Mock()
+        client.get = AsyncMock(side_effect=responses)
+        return client
+
+    def _checking_point(self, client: Mock, **config) -> ClickUpCheckingPoint:
+        cp = self.ConcreteClickUpCP(config)
+        cp._clickup_client = client
+        return cp
+
+    @pytest.mark.asyncio
+    async def test_fetches_every_page(self):
+        """Test that pages are requested until ClickUp reports the last page."""
+        client = self._client(
+            [_task(str(i), 1) for i in range(100)],
+            [_task(str(i), 1) for i in range(100, 150)],
+            last_page=True,
+        )
+        cp = self._checking_point(client)
+
+        tasks = await cp.get_workspace_tasks(list_id="list_1")
+
+        assert len(tasks) == 150
+        assert [call.kwargs["params"]["page"] for call in client.get.await_args_list] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_short_page_ends_pagination_without_last_page_flag(self):
+        """Test that a page smaller than the page size ends pagination."""
+        client = self._client([_task("1", 1), _task("2", 1)])
+        cp = self._checking_point(client)
+
+        assert len(await cp.fetch_list_tasks("list_1")) == 2
+        client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_page_raises(self):
+        """Test that a failed request is not mistaken for an empty list."""
+        client = Mock()
+        client.get = AsyncMock(return_value=Mock(success=False, status_code=429, error="rate limited", data=None))
+        cp = self._checking_point(client)
+
+        with pytest.raises(RuntimeError, match="rate limited"):
+            await cp.fetch_list_tasks("list_1")
+
+    @pytest.mark.asyncio
+    async def test_incremental_fetch_merges_changed_tasks(self):
+        """Test that later fetches request only changed tasks and merge them into the snapshot."""
+        client = self._client(
+            [_task("1", 1000), _task("2", 2000)],
+            [_task("2", 3000, priority="urgent")],
+        )
+        cp = self._checking_point(client, incremental_fetch=True)
+
+        first = await cp.get_workspace_tasks(list_id="list_1")
+        second = await cp.get_workspace_tasks(list_id="list_1")
+
+        assert "date_updated_gt" not in client.get.await_args_list[0].kwargs["params"]
+        assert client.get.await_args_list[1].kwargs["params"]["date_updated_gt"] == 2000
+        assert len(first) == 2
+        assert {task.id for task in second} == {"1", "2"}
+        assert next(task for task in second if task.id == "2").priority.priority == "urgent"
+        assert cp.get_watermark("list_1") == 3000
+
+    @pytest.mark.asyncio
+    async def test_incremental_fetch_without_changes_keeps_watermark(self):
+        """Test that an empty delta leaves the snapshot and watermark unchanged."""
+        client = self._client([_task("1", 1000)], [])
+        cp = self._checking_point(client, incremental_fetch=True)
+
+        await cp.sync_list_tasks("list_1")
+        tasks = await cp.sync_list_tasks("list_1")
+
+        assert [task.id for task in tasks] == ["1"]
+        assert cp.get_watermark("list_1") == 1000
+
+    @pytest.mark.asyncio
+    async def test_periodic_full_sync_drops_deleted_tasks(self):
+        """Test that a full sync rebuilds the snapshot."""
+        client = self._client([_task("1", 1000), _task("2", 1000)], [], [_task("1", 1000)])
+        cp = self._checking_point(client, incremental_fetch=True, full_sync_every=1)
+
+        await cp.sync_list_tasks("list_1")
+        await cp.sync_list_tasks("list_1")
+        tasks = await cp.sync_list_tasks("list_1")
+
+        assert "date_updated_gt" not in client.get.await_args_list[2].kwargs["params"]
+        assert [task.id for task in tasks] == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_filters_apply_to_snapshot(self):
+        """Test that status and priority filters still apply in incremental mode."""
+        client = self._client([_task("1", 1000, priority="urgent"), _task("2", 1000, priority="low")])
+        cp = self._checking_point(client, incremental_fetch=True)
+
+        tasks = await cp.get_workspace_tasks(list_id="list_1", priority="urgent")
+
+        assert [task.id for task in tasks] == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_lists_are_fetched_concurrently(self):
+        """Test that several lists are fetched at once and keyed by list ID."""
+        client = Mock()
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get(endpoint, params):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            list_id = endpoint.split("/")[2]
+            return Mock(success=True, status_code=200, error=None, data={"tasks": [_task(list_id, 1)]})
+
+        client.get = get
+        cp = self._checking_point(client)
+
+        tasks_by_list = await cp.get_tasks_of_lists(["list_1", "list_2", "list_3"])
+
+        assert {list_id: [task.id for task in tasks] for list_id, tasks in tasks_by_list.items()} == {
+            "list_1": ["list_1"],
+            "list_2": ["list_2"],
+            "list_3": ["list_3"],
+        }
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_same_list_is_fetched_once_per_scope(self):
+        """Test that checking points requesting the same list share one request in a fetch scope."""
+        client = self._client([_task("1", 1000)])
+        first = self._checking_point(client, api_token="token")
+        second = self._checking_point(client, api_token="token")
+
+        with fetch_scope(FetchCoordinator()):
+            first_tasks = await first.get_workspace_tasks(list_id="list_1")
+            second_tasks = await second.get_workspace_tasks(list_id="list_1")
+
+        client.get.assert_awaited_once()
+        assert [task.id for task in first_tasks] == [task.id for task in second_tasks] == ["1"]
+
+
+class TestClickUpSharedClient:
+    """Test sharing of ClickUp clients between checking points."""
+
+    ConcreteClickUpCP = TestClickUpCheckingPoint.ConcreteClickUpCP
+
+    @pytest.fixture(autouse=True)
+    async def client_registry(self):
+        """Use an empty client registry and close its clients afterwards."""
+        reset_client_registry()
+        yield get_client_registry()
+        await get_client_registry().close_all()
+        reset_client_registry()
+
+    @pytest.mark.asyncio
+    async def test_same_token_shares_client(self, client_registry):
+        """Test that checking points with the same token share one client."""
+        first = await self.ConcreteClickUpCP({"api_token": "token_a"})._get_client()
+        second = await self.ConcreteClickUpCP({"api_token": "token_a", "list_ids": ["1"]})._get_client()
+        other = await self.ConcreteClickUpCP({"api_token": "token_b"})._get_client()
+
+        assert first is second
+        assert other is not first
+        assert client_registry.get_stats()["created"] == 2
+
+    @pytest.mark.asyncio
+    async def test_client_uses_configured_rate_limit(self):
+        """Test that the shared client is built from the first checking point's configuration."""
+        client = await self.ConcreteClickUpCP({"api_token": "token", "rate_limit": 30})._get_client()
+
+        assert client.rate_limit == 30
@@ -1,7 +1,14 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
 from gearmeshing_ai.scheduler.checking_points.base import (
     CheckingPointType,
 )
-from gearmeshing_ai.scheduler.checking_points.slack.base import SlackCheckingPoint
+from gearmeshing_ai.scheduler.checking_points.slack.base import (
+    ChannelCursorStore,
+    SlackCheckingPoint,
+)
 from gearmeshing_ai.scheduler.models.checking_point import CheckResult
 from gearmeshing_ai.scheduler.models.monitoring import MonitoringData, MonitoringDataType
 
@@ -73,3 +80,187 @@ class TestSlackCheckingPoint:
         assert variables["user_name"] == "user_123"
         assert variables["channel"] == "general"
         assert variables["message_text"] == "Help needed!"
+
+
+class TestSlackMessageFetching:
+    """Test Slack history paging and per-channel cursors."""
+
+    class MessageSlackCP(SlackCheckingPoint):
+        """Slack checking point using the default fetch_data."""
+
+        name = "slack_messages_test"
+        type = CheckingPointType.SLACK_BOT_MENTION_CP
+
+        async def evaluate(self, data: MonitoringData) -> CheckResult:
+            return CheckResult(should_act=False, reason="test", confidence=0.5)
+
+    @staticmethod
+    def _checking_point(pages: list[dict], **config) -> "TestSlackMessageFetching.MessageSlackCP":
+        cp = TestSlackMessageFetching.MessageSlackCP(config)
+        client = Mock()
+        client.conversations_history = AsyncMock(side_effect=pages)
+        cp._get_client = AsyncMock(return_value=client)
+        return cp
+
+    @staticmethod
+    def _page(*ts: str, next_cursor: str = "") -> dict:
+        return {
+            "ok": True,
+            "messages": [{"ts": value, "text": f"message {value}"} for value in ts],
+            "has_more": bool(next_cursor),
+            "response_metadata": {"next_cursor": next_cursor},
+        }
+
+    @pytest.mark.asyncio
+    async def test_follows_cursor_while_has_more(self):
+        """Test that every page is read until has_more is false."""
+        cp = self._checking_point([self._page("3", "2", next_cursor="c1"), self._page("1")])
+
+        messages = await cp.get_channel_messages("C1", limit=2, oldest="0")
+
+        assert [m["ts"] for m in messages] == ["3", "2", "1"]
+        calls = cp._get_client.return_value.conversations_history.await_args_list
+        assert calls[0].kwargs == {"channel": "C1", "limit": 2, "oldest": "0"}
+        assert calls[1].kwargs["cursor"] == "c1"
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_pages(self):
+        """Test that paging stops after the configured number of pages."""
+        cp = self._checking_point([self._page("3", next_cursor="c1"), self._page("2", next_cursor="c2")], max_pages=2)
+
+        messages = await cp.get_channel_messages("C1")
+
+        assert [m["ts"] for m in messages] == ["3", "2"]
+        assert cp._get_client.return_value.conversations_history.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_max_pages_after_oldest_raises(self):
+        """Test that unread messages after the cursor are not skipped at the page limit."""
+        cp = self._checking_point([self._page("3", next_cursor="c1"), self._page("2", next_cursor="c2")], max_pages=2)
+
+        with pytest.raises(RuntimeError, match="max_pages"):
+            await cp.get_channel_messages("C1", oldest="1")
+
+    @pytest.mark.asyncio
+    async def test_fetch_at_max_pages_keeps_cursor(self):
+        """Test that the channel cursor stays put when the page limit is reached."""
+        cp = self._checking_point([self._page("3", next_cursor="c1"), self._page("2", next_cursor="c2")], max_pages=2)
+        cp.cursors.advance("C1", "1")
+
+        with pytest.raises(RuntimeError):
+            await cp.fetch_new_messages("C1")
+
+        assert cp.cursors.get("C1") == "1"
+
+    @pytest.mark.asyncio
+    async def test_failed_first_page_returns_nothing(self):
+        """Test that an error response on the first page returns no messages."""
+        cp = self._checking_point([{"ok": False, "error": "channel_not_found"}])
+
+        assert await cp.get_channel_messages("C1") == []
+
+    @pytest.mark.asyncio
+    async def test_failed_later_page_raises(self):
+        """Test that a failure after the first page is not reported as a partial result."""
+        cp = self._checking_point([self._page("3", next_cursor="c1"), {"ok": False, "error": "ratelimited"}])
+
+        with pytest.raises(RuntimeError, match="ratelimited"):
+            await cp.get_channel_messages("C1")
+
+    @pytest.mark.asyncio
+    async def test_typed_response(self):
+        """Test that typed responses are read through their attributes."""
+        response = Mock(ok=True, messages=[{"ts": "1"}], has_more=False, response_metadata=None)
+        cp = self._checking_point([response])
+
+        assert await cp.get_channel_messages("C1") == [{"ts": "1"}]
+
+    @pytest.mark.asyncio
+    async def test_fetch_new_messages_uses_channel_cursor(self):
+        """Test that each fetch only asks for messages newer than the previous one."""
+        cp = self._checking_point(
+            [
+                self._page("1700000000.000200", "1700000000.000100", next_cursor="more"),
+                self._page("1700000001.000100", next_cursor="c1"),
+                self._page("1700000000.000900"),
+            ]
+        )
+        history = cp._get_client.return_value.conversations_history
+
+        first = await cp.fetch_new_messages("C1")
+        # The first fetch only reads the latest page to start the cursor
+        assert [m["ts"] for m in first] == ["1700000000.000100", "1700000000.000200"]
+        assert "oldest" not in history.await_args_list[0].kwargs
+        assert history.await_count == 1
+        assert cp.cursors.get("C1") == "1700000000.000200"
+
+        second = await cp.fetch_new_messages("C1")
+        assert [m["ts"] for m in second] == ["1700000000.000900", "1700000001.000100"]
+        assert all(m["channel"] == "C1" for m in second)
+        assert history.await_args_list[1].kwargs["oldest"] == "1700000000.000200"
+        assert cp.cursors.get("C1") == "1700000001.000100"
+
+    @pytest.mark.asyncio
+    async def test_fetch_data_reads_configured_channels(self):
+        """Test that fetch_data converts the new messages of every channel."""
+        cp = self._checking_point([self._page("2"), self._page("5")], channels=["C1", "C2"])
+
+        data_items = await cp.fetch_data()
+
+        assert {item.data["channel"] for item in data_items} == {"C1", "C2"}
+        assert all(item.type == MonitoringDataType.SLACK_MESSAGE for item in data_items)
+        assert cp.cursors.to_dict() == {"C1": "2", "C2": "5"}
+
+    @pytest.mark.asyncio
+    async def test_failed_channel_does_not_lose_other_channels(self):
+        """Test that one failing channel keeps its cursor and the others' messages are returned."""
+        cp = self._checking_point([], channels=["C1", "C2"])
+        cp.cursors = ChannelCursorStore({"C1": "100.0", "C2": "100.0"})
+
+        async def history(channel, **kwargs):
+            if channel == "C2":
+                raise ConnectionError("connection reset")
+            return self._page("101.0")
+
+        cp._get_client.return_value.conversations_history = AsyncMock(side_effect=history)
+
+        data_items = await cp.fetch_data()
+
+        assert [item.data["ts"] for item in data_items] == ["101.0"]
+        assert cp.cursors.to_dict() == {"C1": "101.0", "C2": "100.0"}
+
+    @pytest.mark.asyncio
+    async def test_every_channel_failing_raises(self):
+        """Test that the error is raised when no channel could be read."""
+        cp = self._checking_point([ConnectionError("connection reset")], channels=["C1"])
+        cp.cursors.advance("C1", "100.0")
+
+        with pytest.raises(ConnectionError):
+            await cp.fetch_data()
+
+        assert cp.cursors.get("C1") == "100.0"
+
+
+class TestChannelCursorStore:
+    """Test ChannelCursorStore."""
+
+    def test_only_moves_forward(self):
+        """Test that older timestamps never replace a newer cursor."""
+        store = ChannelCursorStore({"C1": "1700000000.000200"})
+
+        store.advance("C1", "1700000000.000100")
+        assert store.get("C1") == "1700000000.000200"
+
+        # Compared numerically, not as strings
+        store.advance("C1", "1700000000.1")
+        assert store.get("C1") == "1700000000.1"
+
+    def test_reset(self):
+        """Test forgetting one or every cursor."""
+        store = ChannelCursorStore({"C1": "1", "C2": "2"})
+
+        store.reset("C1")
+        assert store.to_dict() == {"C2": "2"}
+
+        store.reset()
+        assert store.get("C2") is None
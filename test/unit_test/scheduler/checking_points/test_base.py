@@ -4,8 +4,9 @@ from gearmeshing_ai.scheduler.checking_points.base import (
     CheckingPoint,
     CheckingPointType,
 )
-from gearmeshing_ai.scheduler.models.checking_point import CheckResult
+from gearmeshing_ai.scheduler.models.checking_point import CheckResult, CheckResultType
 from gearmeshing_ai.scheduler.models.monitoring import MonitoringData, MonitoringDataType
+from gearmeshing_ai.scheduler.utils.blobs import BlobStore, hydrate_values, is_blob_ref, set_blob_store
 
 
 class ConcreteCheckingPoint(CheckingPoint):
@@ -172,6 +173,66 @@ class TestCheckingPoint:
         # Actions may be empty if AI workflow is not enabled by default
         assert isinstance(actions, list)
 
+    def test_create_ai_action_inlines_payloads_by_default(self):
+        """Test that AI action payloads are inline unless a threshold is configured."""
+        cp = ConcreteCheckingPoint()
+        data = MonitoringData(id="test_1", type=MonitoringDataType.CUSTOM_DATA, source="test", data={"x": 1})
+        result = CheckResult(
+            checking_point_name="test_cp",
+            checking_point_type="custom_cp",
+            result_type=CheckResultType.MATCH,
+            should_act=True,
+            reason="test match",
+            confidence=0.9,
+        )
+
+        action = cp._create_ai_action(data, result)
+
+        assert action.parameters["data"]["data"] == {"x": 1}
+        assert action.prompt_variables["data"] == {"x": 1}
+
+    def test_prepare_after_process_offloads_large_payloads(self, tmp_path):
+        """Test that large AI action payload values are passed as blob references."""
+        store = BlobStore(tmp_path)
+        set_blob_store(store)
+        try:
+            cp = ConcreteCheckingPoint({"payload_reference_threshold": 512})
+            task = {"name": "Big task", "description": "d" * 1000}
+            data = MonitoringData(id="test_1", type=MonitoringDataType.CUSTOM_DATA, source="test", data=task)
+            result = CheckResult(
+                checking_point_name="test_cp",
+                checking_point_type="custom_cp",
+                result_type=CheckResultType.MATCH,
+                should_act=True,
+                reason="test match",
+                confidence=0.9,
+            )
+
+            (action,) = cp.prepare_after_process(data, result)
+        finally:
+            set_blob_store(None)
+
+        assert is_blob_ref(action.parameters["data"])
+        assert is_blob_ref(action.prompt_variables["data"])
+        assert not is_blob_ref(action.parameters["result"])
+        assert action.prompt_variables["data_id"] == "test_1"
+        assert len(action.model_dump_json()) < 2000
+        assert hydrate_values(action.parameters, store)["data"]["data"] == task
+        assert hydrate_values(action.prompt_variables, store)["data"] == task
+
+    def test_prepare_after_process_without_threshold(self, tmp_path):
+        """Test that the workflow creates the actions itself unless offloading is configured."""
+        cp = ConcreteCheckingPoint()
+        data = MonitoringData(id="test_1", type=MonitoringDataType.CUSTOM_DATA, source="test", data={"x": 1})
+        result = CheckResult(
+            checking_point_name="test_cp",
+            checking_point_type="custom_cp",
+            result_type=CheckResultType.MATCH,
+            should_act=True,
+        )
+
+        assert cp.prepare_after_process(data, result) is None
+
     def test_get_summary(self):
         """Test get_summary method."""
         cp = ConcreteCheckingPoint()
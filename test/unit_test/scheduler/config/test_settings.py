@@ -72,6 +72,17 @@ class TestSchedulerSettings:
         settings = SchedulerSettings(temporal_worker_count=10)
         assert settings.temporal_worker_count == 10
 
+    def test_temporal_payload_compression_settings(self):
+        """Test that payload compression settings reach the Temporal configuration."""
+        settings = SchedulerSettings(temporal_payload_compression="gzip", temporal_payload_compression_level=9)
+
+        temporal_config = settings.get_scheduler_config().temporal
+
+        assert temporal_config.payload_compression == "gzip"
+        assert temporal_config.payload_compression_threshold_bytes == 4096
+        assert temporal_config.payload_compression_level == 9
+        assert SchedulerSettings().temporal_payload_compression_level is None
+
     def test_monitoring_interval_validation(self):
         """Test monitoring_interval_seconds validation."""
         # Valid value
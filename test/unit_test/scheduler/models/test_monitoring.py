@@ -205,3 +205,21 @@ class TestMonitoringData:
             metadata={"source_url": "https://example.com"},
         )
         assert data.metadata["source_url"] == "https://example.com"
+
+    def test_content_digest_ignores_capture_metadata(self):
+        """Test that the digest depends on content, not on when the item was captured or processed."""
+        from datetime import datetime
+
+        first = MonitoringData(id="task_1", type=MonitoringDataType.CLICKUP_TASK, source="clickup", data={"a": 1})
+        refetched = MonitoringData(
+            id="task_1",
+            type=MonitoringDataType.CLICKUP_TASK,
+            source="clickup",
+            data={"a": 1},
+            timestamp=datetime(2020, 1, 1),
+            processing_status="completed",
+        )
+        changed = MonitoringData(id="task_1", type=MonitoringDataType.CLICKUP_TASK, source="clickup", data={"a": 2})
+
+        assert first.content_digest() == refetched.content_digest()
+        assert first.content_digest() != changed.content_digest()
@@ -8,6 +8,8 @@ from pydantic import ValidationError
 from gearmeshing_ai.scheduler.models.workflow import (
     AIAction,
     AIActionType,
+    MonitoringCycleState,
+    SeenItem,
 )
 
 
@@ -284,3 +286,81 @@ class TestAIAction:
         )
         assert action.prompt_variables["var1"] == "value1"
         assert action.prompt_variables["var2"] == "value2"
+
+
+class TestMonitoringCycleState:
+    """Test MonitoringCycleState model."""
+
+    def test_record_cycle(self):
+        """Test that cycles, failures and processed items are counted."""
+        state = MonitoringCycleState()
+        state.record_cycle(data_items_processed=3)
+        state.record_cycle(failed=True)
+
+        assert state.cycles_completed == 2
+        assert state.failed_cycles == 1
+        assert state.data_items_processed == 3
+
+    def test_compact_carries_state_into_next_run(self):
+        """Test that compacting keeps counters and bumps the run number."""
+        state = MonitoringCycleState(cycles_completed=10, failed_cycles=1, data_items_processed=4)
+
+        next_state = state.compact(max_seen_digests=100)
+
+        assert next_state.runs == 2
+        assert next_state.cycles_completed == 10
+        assert next_state.failed_cycles == 1
+        assert next_state.data_items_processed == 4
+        assert next_state is not state
+
+    def test_compact_keeps_most_recent_digests(self):
+        """Test that only the most recently recorded digests are carried forward."""
+        state = MonitoringCycleState(
+            seen_digests={f"task_{i}": SeenItem(digest=f"digest_{i}", cycle=i) for i in range(5)}
+        )
+
+        assert list(state.compact(max_seen_digests=2).seen_digests) == ["task_3", "task_4"]
+        assert len(state.compact(max_seen_digests=10).seen_digests) == 5
+        assert state.compact(max_seen_digests=0).seen_digests == {}
+
+    def test_seen_digest_index(self):
+        """Test that items are unchanged only with the same digest and within the age limit."""
+        state = MonitoringCycleState()
+        state.mark_seen("task_1", "digest_a", max_entries=10)
+
+        assert state.is_unchanged("task_1", "digest_a")
+        assert not state.is_unchanged("task_1", "digest_b")
+        assert not state.is_unchanged("task_2", "digest_a")
+
+        state.record_cycle()
+        state.record_cycle()
+        assert state.is_unchanged("task_1", "digest_a", max_age_cycles=3)
+        assert not state.is_unchanged("task_1", "digest_a", max_age_cycles=2)
+
+    def test_seen_digest_index_is_bounded(self):
+        """Test that the least recently recorded items are dropped first."""
+        state = MonitoringCycleState()
+        for item_id in ("task_1", "task_2", "task_3"):
+            state.mark_seen(item_id, "digest", max_entries=2)
+        state.mark_seen("task_2", "digest", max_entries=2)
+        state.mark_seen("task_4", "digest", max_entries=2)
+
+        assert list(state.seen_digests) == ["task_2", "task_4"]
+
+    def test_previous_matches(self):
+        """Test that the last matches are only reported for the same content."""
+        state = MonitoringCycleState()
+        state.mark_seen("task_1", "digest_a", max_entries=10, matched=["overdue_cp"])
+
+        assert state.previous_matches("task_1", "digest_a") == ["overdue_cp"]
+        assert state.previous_matches("task_1", "digest_b") == []
+        assert state.previous_matches("task_2", "digest_a") == []
+
+    def test_seen_items_survive_serialization(self):
+        """Test that the seen items are carried through the continue-as-new payload."""
+        state = MonitoringCycleState()
+        state.mark_seen("task_1", "digest_a", max_entries=10, matched=["overdue_cp"])
+
+        restored = MonitoringCycleState.model_validate_json(state.model_dump_json())
+
+        assert restored.seen_digests == state.seen_digests
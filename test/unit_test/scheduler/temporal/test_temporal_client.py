@@ -64,6 +64,20 @@ class TestTemporalClient:
             assert client.is_connected() is True
             assert client._client is mock_client_instance
 
+    @pytest.mark.asyncio
+    async def test_connect_uses_payload_codec(self, temporal_config):
+        """Test that the client is created with the configured payload codec."""
+        config = temporal_config.model_copy(update={"payload_compression": "gzip"})
+        client = TemporalClient(config)
+        with patch("gearmeshing_ai.scheduler.temporal.client.Client") as mock_client_class:
+            mock_client_class.return_value = AsyncMock()
+
+            await client.connect()
+
+            data_converter = mock_client_class.call_args.kwargs["data_converter"]
+            assert data_converter.payload_codec is client.payload_codec
+            assert client.get_payload_codec_stats()["algorithm"] == "gzip"
+
     @pytest.mark.asyncio
     async def test_connect_already_connected(self, client):
         """Test connecting when already connected."""
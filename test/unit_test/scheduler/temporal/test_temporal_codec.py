@@ -0,0 +1,102 @@
+"""Unit tests for the Temporal payload compression codec."""
+
+import json
+import random
+
+import pytest
+import temporalio.converter
+from temporalio.api.common.v1 import Payload
+
+from gearmeshing_ai.scheduler.models.config import SchedulerTemporalConfig
+from gearmeshing_ai.scheduler.temporal.codec import (
+    CompressionCodec,
+    create_data_converter,
+    create_payload_codec,
+)
+
+
+def _json_payload(value) -> Payload:
+    return Payload(metadata={"encoding": b"json/plain"}, data=json.dumps(value).encode())
+
+
+class TestCompressionCodec:
+    """Test CompressionCodec."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_compresses_large_payloads(self):
+        """Test that large payloads are compressed and decoded back."""
+        codec = CompressionCodec("gzip", threshold_bytes=256)
+        large = _json_payload([{"id": f"task_{i}", "status": "open"} for i in range(200)])
+        small = _json_payload({"id": "task_1"})
+
+        encoded = await codec.encode([large, small])
+
+        assert encoded[0].metadata["encoding"] == b"binary/gzip"
+        assert len(encoded[0].data) < len(large.data)
+        assert encoded[1] == small
+        assert await codec.decode(encoded) == [large, small]
+
+    @pytest.mark.asyncio
+    async def test_incompressible_payload_is_left_unchanged(self):
+        """Test that payloads that do not shrink are not compressed."""
+        codec = CompressionCodec("gzip", threshold_bytes=0)
+        payload = Payload(metadata={"encoding": b"binary/plain"}, data=random.Random(0).randbytes(512))
+
+        assert await codec.encode([payload]) == [payload]
+        assert codec.get_stats()["payloads_compressed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stats(self):
+        """Test compression counters and ratio."""
+        codec = CompressionCodec("gzip", threshold_bytes=0)
+
+        await codec.encode([_json_payload("a" * 10_000)])
+        stats = codec.get_stats()
+
+        assert stats["payloads_encoded"] == 1
+        assert stats["payloads_compressed"] == 1
+        assert stats["bytes_before_compression"] > 10_000
+        assert 0 < stats["compression_ratio"] < 0.1
+
+    def test_unknown_algorithm(self):
+        """Test that unknown algorithms are rejected."""
+        with pytest.raises(ValueError, match="Unknown payload compression algorithm"):
+            CompressionCodec("lz4")
+
+    @pytest.mark.asyncio
+    async def test_data_converter_round_trip(self):
+        """Test that the configured data converter encodes and decodes values."""
+        config = SchedulerTemporalConfig(payload_compression="gzip", payload_compression_threshold_bytes=64)
+        converter = create_data_converter(config)
+        value = {"tasks": [{"id": f"task_{i}"} for i in range(100)]}
+
+        payloads = await converter.encode([value])
+
+        assert payloads[0].metadata["encoding"] == b"binary/gzip"
+        assert await converter.decode(payloads, [dict]) == [value]
+
+
+class TestCodecConfiguration:
+    """Test building codecs from SchedulerTemporalConfig."""
+
+    def test_disabled_by_default(self):
+        """Test that compression is off unless configured."""
+        config = SchedulerTemporalConfig()
+
+        assert create_payload_codec(config) is None
+        assert create_data_converter(config) is temporalio.converter.default()
+
+    def test_configured_codec(self):
+        """Test that codec options come from the configuration."""
+        config = SchedulerTemporalConfig(
+            payload_compression="GZIP", payload_compression_threshold_bytes=1024, payload_compression_level=9
+        )
+        codec = create_payload_codec(config)
+
+        assert isinstance(codec, CompressionCodec)
+        assert (codec.algorithm, codec.threshold_bytes, codec.level) == ("gzip", 1024, 9)
+
+    def test_invalid_algorithm(self):
+        """Test that the configuration rejects unknown algorithms."""
+        with pytest.raises(ValueError, match="Payload compression must be one of"):
+            SchedulerTemporalConfig(payload_compression="brotli")
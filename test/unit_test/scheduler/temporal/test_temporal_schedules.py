@@ -8,13 +8,15 @@ This module implements testing patterns recommended by Temporal documentation:
 - Error handling for invalid configurations
 """
 
+import asyncio
 from datetime import timedelta
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from gearmeshing_ai.scheduler.models.config import MonitorConfig, SchedulerTemporalConfig
 from gearmeshing_ai.scheduler.temporal.schedules import ScheduleManager
+from gearmeshing_ai.scheduler.workflows import SmartMonitoringWorkflow
 
 
 class TestScheduleManager:
@@ -270,7 +272,7 @@ class TestScheduleManager:
         """Test triggering an immediate run of a schedule."""
         mock_handle = AsyncMock()
         mock_client.create_schedule = AsyncMock(return_value=mock_handle)
-        mock_client.start_workflow = AsyncMock(return_value="workflow_123")
+        mock_client.start_workflow = AsyncMock(return_value=MagicMock(id="workflow_123"))
 
         await schedule_manager.create_monitoring_schedule(
             schedule_id="test_schedule",
@@ -282,6 +284,9 @@ class TestScheduleManager:
 
         assert workflow_id == "workflow_123"
         mock_client.start_workflow.assert_called_once()
+        workflow, _ = mock_client.start_workflow.call_args.args
+        assert workflow is SmartMonitoringWorkflow.run
+        assert mock_client.start_workflow.call_args.kwargs["task_queue"] == schedule_manager.config.task_queue
 
     @pytest.mark.asyncio
     async def test_trigger_schedule_run_not_found(self, schedule_manager):
@@ -330,3 +335,43 @@ class TestScheduleManager:
         cron = schedule_manager.create_cron_expression()
 
         assert cron == "* * * * *"
+
+
+class TestScheduledActivityRouting:
+    """Test that scheduled monitoring workflows use the workload task queues."""
+
+    @pytest.mark.asyncio
+    async def test_settings_route_fetch_to_its_task_queue(self):
+        """Test the task queue of the fetch activity from the settings to the running workflow."""
+        from gearmeshing_ai.scheduler.config.settings import SchedulerSettings
+        from gearmeshing_ai.scheduler.workflows.monitoring import SmartMonitoringWorkflow
+
+        settings = SchedulerSettings(temporal_task_queue="monitoring", temporal_workload_task_queues=True)
+        mock_client = AsyncMock()
+        schedule_manager = ScheduleManager(mock_client, settings.get_scheduler_config().temporal)
+        await schedule_manager.create_monitoring_schedule(
+            schedule_id="monitoring_schedule",
+            monitor_config=MonitorConfig(name="test_monitor"),
+            interval_seconds=60,
+        )
+        (scheduled_config,) = mock_client.create_schedule.call_args.kwargs["args"]
+
+        monitoring_workflow = SmartMonitoringWorkflow()
+        monitoring_workflow.logger = MagicMock()
+        with (
+            patch.object(monitoring_workflow, "log_workflow_start"),
+            patch.object(monitoring_workflow, "log_workflow_complete"),
+            patch(
+                "gearmeshing_ai.scheduler.workflows.monitoring.checking_point_registry.get_all_instances",
+                return_value={},
+            ),
+            patch(
+                "gearmeshing_ai.scheduler.workflows.base.workflow.execute_activity",
+                new_callable=AsyncMock,
+                side_effect=asyncio.CancelledError,
+            ) as mock_execute,
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await monitoring_workflow.run(scheduled_config)
+
+        assert mock_execute.await_args.kwargs["task_queue"] == "monitoring-fetch"
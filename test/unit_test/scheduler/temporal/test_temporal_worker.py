@@ -14,7 +14,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from gearmeshing_ai.scheduler.models.config import SchedulerTemporalConfig
-from gearmeshing_ai.scheduler.temporal.worker import TemporalWorker, WorkerManager
+from gearmeshing_ai.scheduler.temporal.worker import WORKLOADS, TemporalWorker, WorkerManager
 
 
 class TestTemporalWorker:
@@ -112,6 +112,105 @@ class TestTemporalWorker:
                 worker.stop.assert_called_once()
 
 
+class TestTemporalWorkerWorkloads:
+    """Test running workloads on separate task queues."""
+
+    @pytest.fixture
+    def split_config(self):
+        """Create a Temporal configuration with workload task queues."""
+        return SchedulerTemporalConfig(
+            task_queue="test_queue",
+            worker_count=4,
+            workload_task_queues=True,
+            workload_max_concurrent_activities={"fetch": 2, "evaluate": 30, "action": 5, "ai": 1},
+        )
+
+    @staticmethod
+    async def _start(worker: TemporalWorker) -> dict[str, dict]:
+        """Start a worker with Temporal mocked and return the Worker options per task queue."""
+        with (
+            patch("gearmeshing_ai.scheduler.temporal.worker.Client") as mock_client_class,
+            patch("gearmeshing_ai.scheduler.temporal.worker.Worker") as mock_worker_class,
+            patch.object(worker, "_setup_signal_handlers"),
+        ):
+            mock_client_class.connect = AsyncMock()
+            mock_worker_class.return_value.run = AsyncMock()
+            await worker.start()
+            mock_client_class.connect.assert_awaited_once()
+        return {call.kwargs["task_queue"]: call.kwargs for call in mock_worker_class.call_args_list}
+
+    def test_task_queues(self, split_config):
+        """Test the task queue of every workload."""
+        assert split_config.get_task_queue("workflow") == "test_queue"
+        assert split_config.get_task_queue("ai") == "test_queue-ai"
+        assert split_config.get_activity_task_queues()["evaluate"] == "test_queue-evaluate"
+        assert SchedulerTemporalConfig(task_queue="test_queue").get_activity_task_queues() == {}
+
+    def test_invalid_workload_limits(self):
+        """Test that unknown workloads are rejected in the configuration."""
+        with pytest.raises(ValueError, match="Workload must be one of"):
+            SchedulerTemporalConfig(workload_max_concurrent_activities={"gpu": 1})
+
+    def test_invalid_workload(self, split_config):
+        """Test that unknown workloads are rejected by the worker."""
+        with pytest.raises(ValueError, match="Unknown workloads"):
+            TemporalWorker(split_config, workloads=["gpu"])
+
+    def test_workloads_need_own_queues(self):
+        """Test that a worker cannot serve only some workloads of a shared queue."""
+        config = SchedulerTemporalConfig(task_queue="test_queue")
+
+        with pytest.raises(ValueError, match="workload_task_queues"):
+            TemporalWorker(config, workloads=["ai"])
+        assert TemporalWorker(config, workloads=list(WORKLOADS)).workloads == list(WORKLOADS)
+
+    @pytest.mark.asyncio
+    async def test_shared_queue_runs_everything_on_one_worker(self):
+        """Test that without workload queues one Temporal worker serves everything."""
+        config = SchedulerTemporalConfig(task_queue="test_queue", worker_count=4)
+
+        options = await self._start(TemporalWorker(config))
+
+        assert list(options) == ["test_queue"]
+        assert len(options["test_queue"]["workflows"]) == 2
+        assert len(options["test_queue"]["activities"]) == 5
+        assert options["test_queue"]["max_concurrent_activities"] == 4
+
+    @pytest.mark.asyncio
+    async def test_workload_queues_have_own_limits(self, split_config):
+        """Test that each workload polls its own queue with its own concurrency."""
+        worker = TemporalWorker(split_config)
+
+        options = await self._start(worker)
+
+        assert set(options) == {
+            "test_queue",
+            "test_queue-fetch",
+            "test_queue-evaluate",
+            "test_queue-action",
+            "test_queue-ai",
+        }
+        assert options["test_queue"]["activities"] == []
+        assert "max_concurrent_activities" not in options["test_queue"]
+        assert options["test_queue"]["max_cached_workflows"] == split_config.max_cached_workflows
+        assert options["test_queue-ai"]["workflows"] == []
+        assert options["test_queue-ai"]["max_concurrent_activities"] == 1
+        assert options["test_queue-evaluate"]["max_concurrent_activities"] == 30
+        assert len(options["test_queue-evaluate"]["activities"]) == 2
+        assert worker.is_running()
+
+    @pytest.mark.asyncio
+    async def test_worker_restricted_to_workloads(self, split_config):
+        """Test that a worker only polls the queues of its workloads."""
+        worker = TemporalWorker(split_config, workloads=["ai"])
+
+        options = await self._start(worker)
+
+        assert list(options) == ["test_queue-ai"]
+        assert worker.get_worker_info()["activities"] == ["execute_ai_workflow"]
+        assert worker.get_worker_info()["workflows"] == []
+
+
 class TestWorkerManager:
     """Test WorkerManager class for multi-worker coordination."""
 
@@ -181,6 +280,38 @@ class TestWorkerManager:
         await manager.stop_all()
         assert manager.is_running() is False
 
+    @pytest.mark.asyncio
+    async def test_stop_all_closes_shared_clients(self, manager, worker):
+        """Test that stopping every worker closes the shared integration clients."""
+        manager.add_worker("worker_1", worker)
+        manager._running = True
+
+        with (
+            patch.object(worker, "stop", new_callable=AsyncMock) as mock_stop,
+            patch("gearmeshing_ai.scheduler.temporal.worker.get_client_registry") as mock_registry,
+        ):
+            mock_registry.return_value.close_all = AsyncMock()
+            await manager.stop_all()
+
+        mock_stop.assert_awaited_once()
+        mock_registry.return_value.close_all.assert_awaited_once()
+
+    def test_add_workload_workers(self, manager, temporal_config):
+        """Test adding one worker per workload."""
+        config = temporal_config.model_copy(update={"workload_task_queues": True})
+
+        names = manager.add_workload_workers(config, ["fetch", "ai"])
+
+        assert names == ["test_queue:fetch", "test_queue:ai"]
+        assert manager._workers["test_queue:ai"].workloads == ["ai"]
+
+    def test_add_workload_workers_needs_workload_queues(self, manager, temporal_config):
+        """Test that workload workers are refused while every workload shares one queue."""
+        with pytest.raises(ValueError, match="workload_task_queues"):
+            manager.add_workload_workers(temporal_config)
+
+        assert manager._workers == {}
+
     def test_get_worker_status_empty(self, manager):
         """Test getting worker status when no workers are added."""
         status = manager.get_worker_status()
@@ -0,0 +1,172 @@
+"""Unit tests for content-addressed blob storage."""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from gearmeshing_ai.scheduler.utils.blobs import (
+    BLOB_REF_KEY,
+    BlobStore,
+    get_blob_store,
+    hydrate_values,
+    is_blob_ref,
+    offload_large_values,
+    set_blob_store,
+)
+
+
+class TestBlobStore:
+    """Test BlobStore functionality."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test that stored values round-trip through JSON."""
+        store = BlobStore(tmp_path)
+        digest = store.put({"name": "Fix login", "tags": ["bug"], "due": datetime(2024, 1, 2)})
+
+        assert len(digest) == 64
+        assert store.contains(digest)
+        assert store.get(digest) == {"name": "Fix login", "tags": ["bug"], "due": "2024-01-02 00:00:00"}
+        assert (tmp_path / digest[:2] / f"{digest[2:]}.json").exists()
+
+    def test_put_bytes(self, tmp_path):
+        """Test that encoded values share the digest of the values they encode."""
+        store = BlobStore(tmp_path)
+
+        digest = store.put_bytes(b'{"a":1}')
+
+        assert store.get(digest) == {"a": 1}
+        assert store.put({"a": 1}) == digest
+
+    def test_equal_values_are_stored_once(self, tmp_path):
+        """Test content addressing regardless of key order."""
+        store = BlobStore(tmp_path)
+
+        first = store.put({"a": 1, "b": 2})
+        second = store.put({"b": 2, "a": 1})
+
+        assert first == second
+        assert store.get_stats()["writes"] == 1
+        assert store.get_stats()["deduplicated"] == 1
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_missing_and_deleted_values(self, tmp_path):
+        """Test that unknown digests raise KeyError."""
+        store = BlobStore(tmp_path)
+        digest = store.put("value")
+
+        assert store.delete(digest) is True
+        assert store.delete(digest) is False
+        with pytest.raises(KeyError):
+            store.get(digest)
+
+    def test_invalid_digest(self, tmp_path):
+        """Test that digests cannot address paths outside the store."""
+        store = BlobStore(tmp_path)
+
+        with pytest.raises(ValueError, match="Invalid blob digest"):
+            store.get("../../etc/passwd")
+
+
+class TestBlobRetention:
+    """Test deleting blobs after their retention."""
+
+    @staticmethod
+    def _age(store: BlobStore, digest: str, seconds: float) -> None:
+        path = store._path(digest)
+        past = time.time() - seconds
+        os.utime(path, (past, past))
+
+    def test_purge_deletes_expired_blobs(self, tmp_path):
+        """Test that only blobs older than the retention are deleted."""
+        store = BlobStore(tmp_path, retention=timedelta(hours=1))
+        old = store.put("old value")
+        new = store.put("new value")
+        self._age(store, old, 7200)
+
+        assert store.purge() == 1
+        assert not store.contains(old)
+        assert store.contains(new)
+        assert store.get_stats()["purged"] == 1
+
+    def test_storing_again_renews_retention(self, tmp_path):
+        """Test that a value stored again is kept."""
+        store = BlobStore(tmp_path, retention=timedelta(hours=1))
+        digest = store.put("value")
+        self._age(store, digest, 7200)
+
+        store.put("value")
+
+        assert store.purge() == 0
+        assert store.contains(digest)
+
+    def test_writes_purge_when_due(self, tmp_path):
+        """Test that writes purge expired blobs once the purge interval passed."""
+        store = BlobStore(tmp_path, retention=timedelta(hours=1), purge_interval=timedelta(0))
+        old = store.put("old value")
+        self._age(store, old, 7200)
+
+        store.put("new value")
+
+        assert not store.contains(old)
+
+    def test_no_retention_keeps_blobs(self, tmp_path):
+        """Test that a store without retention never purges."""
+        store = BlobStore(tmp_path, retention=None)
+        digest = store.put("value")
+        self._age(store, digest, 10**8)
+
+        assert store.purge() == 0
+        assert store.purge(older_than=timedelta(days=1)) == 1
+
+
+class TestPayloadReferences:
+    """Test offloading and hydrating mapping values."""
+
+    def test_only_large_values_are_offloaded(self, tmp_path):
+        """Test that values above the threshold become references."""
+        store = BlobStore(tmp_path)
+        values = {"small": "x", "large": {"description": "y" * 500}}
+
+        offloaded = offload_large_values(values, store, threshold_bytes=100)
+
+        assert offloaded["small"] == "x"
+        assert is_blob_ref(offloaded["large"])
+        assert offloaded["large"]["size"] > 500
+        assert hydrate_values(offloaded, store) == values
+
+    def test_references_are_not_offloaded_again(self, tmp_path):
+        """Test that offloading twice keeps the first reference."""
+        store = BlobStore(tmp_path)
+        offloaded = offload_large_values({"large": "z" * 200}, store, threshold_bytes=10)
+
+        assert offload_large_values(offloaded, store, threshold_bytes=10) == offloaded
+
+    def test_missing_reference(self, tmp_path):
+        """Test that hydrating a dangling reference fails loudly."""
+        store = BlobStore(tmp_path)
+
+        with pytest.raises(KeyError):
+            hydrate_values({"data": {BLOB_REF_KEY: "0" * 64, "size": 1}}, store)
+
+    def test_process_wide_store_uses_environment(self, tmp_path, monkeypatch):
+        """Test that the default store root comes from the environment."""
+        monkeypatch.setenv("GEARMESHING_AI_BLOB_STORE_DIR", str(tmp_path))
+        set_blob_store(None)
+        try:
+            assert get_blob_store().root == tmp_path
+            assert get_blob_store() is get_blob_store()
+            assert get_blob_store().retention == timedelta(days=7)
+        finally:
+            set_blob_store(None)
+
+    def test_process_wide_store_retention(self, tmp_path, monkeypatch):
+        """Test that the retention comes from the environment and 0 disables it."""
+        monkeypatch.setenv("GEARMESHING_AI_BLOB_STORE_DIR", str(tmp_path))
+        monkeypatch.setenv("GEARMESHING_AI_BLOB_RETENTION_SECONDS", "0")
+        set_blob_store(None)
+        try:
+            assert get_blob_store().retention is None
+        finally:
+            set_blob_store(None)
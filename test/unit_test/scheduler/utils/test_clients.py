@@ -0,0 +1,78 @@
+"""Unit tests for shared integration clients."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from gearmeshing_ai.scheduler.utils.clients import (
+    IntegrationClientRegistry,
+    credentials_digest,
+    get_client_registry,
+    reset_client_registry,
+)
+
+
+class TestIntegrationClientRegistry:
+    """Test IntegrationClientRegistry functionality."""
+
+    def test_clients_are_shared_per_credentials(self):
+        """Test that one client is created per integration and credentials."""
+        registry = IntegrationClientRegistry()
+        factory = Mock(side_effect=lambda: object())
+
+        first = registry.get_or_create("clickup", "token_a", factory)
+        second = registry.get_or_create("clickup", "token_a", factory)
+        other_token = registry.get_or_create("clickup", "token_b", factory)
+        other_integration = registry.get_or_create("slack", "token_a", factory)
+
+        assert first is second
+        assert len({id(first), id(other_token), id(other_integration)}) == 3
+        assert factory.call_count == 3
+        assert registry.get_stats() == {
+            "clients": 3,
+            "integrations": {"clickup": 2, "slack": 1},
+            "hits": 1,
+            "created": 3,
+        }
+
+    def test_credentials_are_not_kept(self):
+        """Test that registry keys hold a digest instead of the token."""
+        registry = IntegrationClientRegistry()
+        registry.get_or_create("clickup", "secret_token", object)
+
+        assert ("clickup", credentials_digest("secret_token")) in registry._clients
+        assert "secret_token" not in str(registry._clients.keys())
+
+    def test_remove(self):
+        """Test that a removed client is recreated on next use."""
+        registry = IntegrationClientRegistry()
+        client = registry.get_or_create("clickup", "token", object)
+
+        assert registry.remove("clickup", "token") is client
+        assert registry.get_or_create("clickup", "token", object) is not client
+
+    @pytest.mark.asyncio
+    async def test_close_all(self):
+        """Test that async and sync clients are closed and a failing close is tolerated."""
+        registry = IntegrationClientRegistry()
+        async_client = Mock(close=AsyncMock())
+        sync_client = Mock(spec=["close"])
+        broken_client = Mock(close=AsyncMock(side_effect=RuntimeError("already closed")))
+        registry.get_or_create("clickup", "a", lambda: async_client)
+        registry.get_or_create("clickup", "b", lambda: sync_client)
+        registry.get_or_create("slack", "a", lambda: broken_client)
+
+        await registry.close_all()
+
+        async_client.close.assert_awaited_once()
+        sync_client.close.assert_called_once()
+        assert registry.get_stats()["clients"] == 0
+
+    def test_process_wide_registry(self):
+        """Test that the process-wide registry is shared until reset."""
+        reset_client_registry()
+        registry = get_client_registry()
+
+        assert get_client_registry() is registry
+        reset_client_registry()
+        assert get_client_registry() is not registry
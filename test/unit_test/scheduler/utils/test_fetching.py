@@ -0,0 +1,115 @@
+"""Unit tests for concurrent data fetching helpers."""
+
+import asyncio
+
+import pytest
+
+from gearmeshing_ai.scheduler.utils.fetching import (
+    FetchCoordinator,
+    concurrency_for_rate_limit,
+    current_fetch_coordinator,
+    fetch_scope,
+)
+
+
+class TestConcurrencyForRateLimit:
+    """Test sizing of rate-limited sources."""
+
+    def test_little_law(self):
+        """Test that concurrency is the rate times the request duration."""
+        assert concurrency_for_rate_limit(120, request_seconds=2.0, maximum=10) == 4
+        assert concurrency_for_rate_limit(100, request_seconds=2.0, maximum=10) == 4
+
+    def test_bounds(self):
+        """Test that concurrency stays between 1 and the maximum."""
+        assert concurrency_for_rate_limit(1, request_seconds=0.1, maximum=10) == 1
+        assert concurrency_for_rate_limit(10_000, request_seconds=2.0, maximum=3) == 3
+
+
+class TestFetchCoordinator:
+    """Test FetchCoordinator functionality."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_deduplicated(self):
+        """Test that overlapping requests with the same key share one call."""
+        coordinator = FetchCoordinator()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return ["task_1"]
+
+        results = await asyncio.gather(
+            *(coordinator.fetch_once(("clickup", "list_1"), fetch, source="clickup") for _ in range(3))
+        )
+
+        assert calls == 1
+        assert results == [["task_1"]] * 3
+        assert coordinator.get_stats()["deduplicated"] == 2
+
+    @pytest.mark.asyncio
+    async def test_later_requests_reuse_result(self):
+        """Test that a finished request is reused for the rest of the scope."""
+        coordinator = FetchCoordinator()
+        calls = []
+
+        async def fetch(key):
+            calls.append(key)
+            return key
+
+        await coordinator.fetch_once("a", lambda: fetch("a"), source="s")
+        await coordinator.fetch_once("a", lambda: fetch("a"), source="s")
+        await coordinator.fetch_once("b", lambda: fetch("b"), source="s")
+
+        assert calls == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_failed_request_is_retried(self):
+        """Test that a failed request is not remembered."""
+        coordinator = FetchCoordinator()
+        attempts = 0
+
+        async def fetch():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("upstream error")
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            await coordinator.fetch_once("a", fetch, source="s")
+
+        assert await coordinator.fetch_once("a", fetch, source="s") == "ok"
+        assert attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_requests_per_source_are_limited(self):
+        """Test that a rate-limited source gets a bounded number of requests in flight."""
+        coordinator = FetchCoordinator(max_concurrency_per_source=10, request_seconds=1.0)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fetch():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await asyncio.gather(
+            *(coordinator.fetch_once(i, fetch, source="clickup", rate_limit_per_minute=120) for i in range(10))
+        )
+
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_scope(self):
+        """Test that the coordinator is current only inside its scope."""
+        coordinator = FetchCoordinator()
+
+        assert current_fetch_coordinator() is None
+        with fetch_scope(coordinator):
+            assert current_fetch_coordinator() is coordinator
+        assert current_fetch_coordinator() is None
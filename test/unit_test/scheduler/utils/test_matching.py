@@ -0,0 +1,93 @@
+"""Unit tests for compiled multi-pattern matching."""
+
+import random
+
+import pytest
+
+from gearmeshing_ai.scheduler.utils import matching
+from gearmeshing_ai.scheduler.utils.matching import PatternMatcher, compile_matcher
+
+
+@pytest.fixture(params=["substring", "automaton"])
+def keyword_search(request, monkeypatch):
+    """Run a test with keyword sets searched by substring and by automaton."""
+    if request.param == "automaton":
+        monkeypatch.setattr(matching, "AUTOMATON_MIN_KEYWORDS", 0)
+    return request.param
+
+
+class TestPatternMatcher:
+    """Test PatternMatcher."""
+
+    def test_finds_overlapping_keywords_in_configuration_order(self, keyword_search):
+        """Test that nested and overlapping keywords are all reported once."""
+        matcher = PatternMatcher(["bot", "@bot", "<@U123>", "missing"])
+
+        assert matcher.find_all("Hey @Bot and <@u123>, ping the bot") == ["bot", "@bot", "<@U123>"]
+
+    def test_shared_suffixes(self, keyword_search):
+        """Test keywords found through failure links."""
+        matcher = PatternMatcher(["he", "she", "his", "hers"])
+
+        assert matcher.find_all("ushers") == ["he", "she", "hers"]
+
+    def test_case_sensitive(self, keyword_search):
+        """Test that case-sensitive matchers do not fold case."""
+        matcher = PatternMatcher(["Prod"], patterns=[r"^ALERT"], case_sensitive=True)
+
+        assert matcher.find_all("prod alert") == []
+        assert matcher.find_all("ALERT: Prod") == ["Prod", r"^ALERT"]
+
+    def test_searches_every_text(self, keyword_search):
+        """Test that hits from several texts are merged."""
+        matcher = PatternMatcher(["outage", "customer"], patterns=[r"\[sev\d\]"])
+
+        assert matcher.find_all("[SEV1] incident", "customer impact") == ["customer", r"\[sev\d\]"]
+
+    def test_matches(self, keyword_search):
+        """Test the early-exit check."""
+        matcher = PatternMatcher(["down"], patterns=[r"error \d+"])
+
+        assert matcher.matches("service is DOWN")
+        assert matcher.matches("", "Error 500")
+        assert not matcher.matches("all good")
+        assert not PatternMatcher().matches("anything")
+
+    def test_empty_keyword_matches_everything(self, keyword_search):
+        """Test that an empty keyword behaves like a substring check."""
+        matcher = PatternMatcher(["", "x"])
+
+        assert matcher.matches("abc")
+        assert matcher.find_all("abc") == [""]
+
+    def test_agrees_with_substring_search(self, keyword_search):
+        """Test the matcher against plain substring checks on random inputs."""
+        rng = random.Random(7)
+        keywords = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(30)]
+        matcher = PatternMatcher(keywords)
+
+        for _ in range(200):
+            text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 30)))
+            expected = list(dict.fromkeys(keyword for keyword in keywords if keyword in text))
+            assert matcher.find_all(text) == expected
+
+    def test_large_keyword_sets_use_the_automaton(self):
+        """Test that the automaton is only built from the size threshold on."""
+        small = PatternMatcher([f"keyword_{index}" for index in range(matching.AUTOMATON_MIN_KEYWORDS - 1)])
+        large = PatternMatcher([f"keyword_{index}" for index in range(matching.AUTOMATON_MIN_KEYWORDS)])
+
+        assert len(small._goto) == 1
+        assert len(large._goto) > 1
+        assert large.find_all("see KEYWORD_12") == small.find_all("see KEYWORD_12") == ["keyword_1", "keyword_12"]
+
+
+class TestCompileMatcher:
+    """Test compile_matcher caching."""
+
+    def test_same_configuration_shares_matcher(self):
+        """Test that equal configurations reuse one compiled matcher."""
+        first = compile_matcher(["alpha", "beta"], patterns=[r"\d+"])
+
+        assert compile_matcher(("alpha", "beta"), patterns=(r"\d+",)) is first
+        assert compile_matcher(["alpha"]) is not first
+        assert compile_matcher(["alpha", "beta"], patterns=[r"\d+"], case_sensitive=True) is not first
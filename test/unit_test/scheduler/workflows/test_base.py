@@ -1,7 +1,7 @@
 """Unit tests for base workflow classes."""
 
 from datetime import timedelta
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -137,3 +137,22 @@ class TestBaseWorkflow:
         workflow = BaseWorkflow()
         # Method should accept timeout parameter
         assert callable(workflow.execute_child_workflow_with_timeout)
+
+
+class TestBaseWorkflowTaskQueues:
+    """Test routing activities to workload task queues."""
+
+    @pytest.mark.asyncio
+    async def test_activity_routed_to_workload_queue(self):
+        """Test that a workload's activities are scheduled on its task queue."""
+        workflow = BaseWorkflow()
+        workflow.activity_task_queues = {"ai": "scheduler-tasks-ai"}
+
+        with patch(
+            "gearmeshing_ai.scheduler.workflows.base.workflow.execute_activity", new_callable=AsyncMock
+        ) as mock_execute:
+            await workflow.execute_activity_with_retry("ai_activity", workload="ai")
+            await workflow.execute_activity_with_retry("fetch_activity", workload="fetch")
+
+        assert mock_execute.await_args_list[0].kwargs["task_queue"] == "scheduler-tasks-ai"
+        assert "task_queue" not in mock_execute.await_args_list[1].kwargs
@@ -1,13 +1,22 @@
 """Unit tests for monitoring workflow."""
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from gearmeshing_ai.scheduler.models.checking_point import CheckResult, CheckResultType
+from gearmeshing_ai.scheduler.models.checking_point import CheckResult, CheckResultType, ItemEvaluation
+from gearmeshing_ai.scheduler.models.config import MonitorConfig
 from gearmeshing_ai.scheduler.models.monitoring import MonitoringData, MonitoringDataType
-from gearmeshing_ai.scheduler.models.workflow import AIWorkflowResult
+from gearmeshing_ai.scheduler.models.workflow import (
+    AIAction,
+    AIActionType,
+    AIWorkflowResult,
+    MonitoringCycleState,
+    SeenItem,
+)
+from gearmeshing_ai.scheduler.utils.blobs import BLOB_REF_KEY
 
 
 class TestMonitoringWorkflow:
@@ -254,3 +263,586 @@ class TestMonitoringWorkflow:
 
             result = await workflow.recover_from_failure()
             assert result["recovered"] is True
+
+
+def _checking_point(name: str, stop_on_match: bool = False, handles: bool = True, actions: int = 0) -> MagicMock:
+    """Create a checking point double for SmartMonitoringWorkflow tests."""
+    checking_point = MagicMock()
+    checking_point.name = name
+    checking_point.type.value = "custom_cp"
+    checking_point.stop_on_match = stop_on_match
+    checking_point.can_handle.return_value = handles
+    checking_point.get_actions.return_value = [{"type": f"{name}_action_{i}"} for i in range(actions)]
+    checking_point.get_after_process.return_value = []
+    return checking_point
+
+
+def _data_item(item_id: str) -> MonitoringData:
+    return MonitoringData(id=item_id, type=MonitoringDataType.CLICKUP_TASK, source="clickup", data={"id": item_id})
+
+
+class TestSmartMonitoringParallelEvaluation:
+    """Test bounded-parallel checking point evaluation in SmartMonitoringWorkflow."""
+
+    @pytest.fixture
+    def monitoring_workflow(self):
+        """Create a SmartMonitoringWorkflow whose activities are recorded instead of scheduled."""
+        from gearmeshing_ai.scheduler.workflows.monitoring import SmartMonitoringWorkflow
+
+        monitoring_workflow = SmartMonitoringWorkflow()
+        # workflow.logger only works inside a workflow event loop
+        monitoring_workflow.logger = MagicMock()
+        monitoring_workflow.calls = []
+        monitoring_workflow.matches = set()
+        monitoring_workflow.in_flight = 0
+        monitoring_workflow.max_in_flight = 0
+
+        async def execute_activity(activity, *args, **kwargs):
+            monitoring_workflow.in_flight += 1
+            monitoring_workflow.max_in_flight = max(monitoring_workflow.max_in_flight, monitoring_workflow.in_flight)
+            try:
+                await asyncio.sleep(0.001)
+                if activity.__name__ == "evaluate_checking_point":
+                    checking_point, data_item = args
+                    monitoring_workflow.calls.append(("evaluate", checking_point.name, data_item.id))
+                    if (checking_point.name, data_item.id) in monitoring_workflow.matches:
+                        return CheckResult(
+                            checking_point_name=checking_point.name,
+                            checking_point_type="custom_cp",
+                            result_type=CheckResultType.MATCH,
+                            should_act=True,
+                        )
+                    return CheckResult(
+                        checking_point_name=checking_point.name,
+                        checking_point_type="custom_cp",
+                        result_type=CheckResultType.NO_MATCH,
+                    )
+                if activity.__name__ == "evaluate_checking_points_batch":
+                    data_items, names = args
+                    monitoring_workflow.calls.append(("batch", [data_item.id for data_item in data_items], names))
+                    return [
+                        ItemEvaluation(
+                            data_item_id=data_item.id,
+                            matches={
+                                name: CheckResult(
+                                    checking_point_name=name,
+                                    checking_point_type="custom_cp",
+                                    result_type=CheckResultType.MATCH,
+                                    should_act=True,
+                                )
+                                for name in names
+                                if (name, data_item.id) in monitoring_workflow.matches
+                            },
+                            evaluated_count=len(names),
+                        )
+                        for data_item in data_items
+                    ]
+                monitoring_workflow.calls.append(("action", args[0]["type"]))
+                return {"success": True}
+            finally:
+                monitoring_workflow.in_flight -= 1
+
+        monitoring_workflow.execute_activity_with_retry = execute_activity
+        monitoring_workflow.log_workflow_error = MagicMock()
+        return monitoring_workflow
+
+    def test_evaluation_waves_end_at_stop_on_match(self):
+        """Test that waves are split after every stop_on_match checking point."""
+        from gearmeshing_ai.scheduler.workflows.monitoring import evaluation_waves
+
+        points = [
+            ("a", _checking_point("a")),
+            ("b", _checking_point("b", stop_on_match=True)),
+            ("c", _checking_point("c")),
+            ("d", _checking_point("d")),
+        ]
+
+        waves = evaluation_waves(points)
+
+        assert [[name for name, _ in wave] for wave in waves] == [["a", "b"], ["c", "d"]]
+        assert evaluation_waves([]) == []
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, monitoring_workflow):
+        """Test that items are evaluated concurrently up to the cap."""
+        checking_points = {name: _checking_point(name) for name in ("a", "b", "c")}
+        data_items = [_data_item(f"task_{i}") for i in range(20)]
+
+        await monitoring_workflow.process_data_items_in_parallel(data_items, checking_points, max_concurrency=4)
+
+        assert len([call for call in monitoring_workflow.calls if call[0] == "evaluate"]) == 60
+        assert 1 < monitoring_workflow.max_in_flight <= 4
+
+    @pytest.mark.asyncio
+    async def test_stop_on_match_preserves_order(self, monitoring_workflow):
+        """Test that a stopping match skips later checking points and actions run in order."""
+        checking_points = {
+            "a": _checking_point("a", actions=1),
+            "b": _checking_point("b", stop_on_match=True, actions=1),
+            "c": _checking_point("c", actions=1),
+        }
+        monitoring_workflow.matches = {("a", "task_1"), ("b", "task_1"), ("c", "task_1")}
+
+        await monitoring_workflow.process_data_items_in_parallel(
+            [_data_item("task_1")], checking_points, max_concurrency=5
+        )
+
+        evaluated = {call[1] for call in monitoring_workflow.calls if call[0] == "evaluate"}
+        actions = [call[1] for call in monitoring_workflow.calls if call[0] == "action"]
+        assert evaluated == {"a", "b"}
+        assert actions == ["a_action_0", "b_action_0"]
+
+    @pytest.mark.asyncio
+    async def test_no_stop_without_match(self, monitoring_workflow):
+        """Test that a stop_on_match checking point that does not match lets the next wave run."""
+        checking_points = {
+            "a": _checking_point("a", stop_on_match=True),
+            "b": _checking_point("b", actions=1),
+        }
+        monitoring_workflow.matches = {("b", "task_1")}
+
+        await monitoring_workflow.process_data_items_in_parallel(
+            [_data_item("task_1")], checking_points, max_concurrency=2
+        )
+
+        assert ("action", "b_action_0") in monitoring_workflow.calls
+
+    @pytest.mark.asyncio
+    async def test_skips_checking_points_that_cannot_handle(self, monitoring_workflow):
+        """Test that checking points not handling the data type are not evaluated."""
+        checking_points = {"a": _checking_point("a", handles=False), "b": _checking_point("b")}
+
+        await monitoring_workflow.process_data_items_in_parallel(
+            [_data_item("task_1")], checking_points, max_concurrency=2
+        )
+
+        assert monitoring_workflow.calls == [("evaluate", "b", "task_1")]
+
+    @pytest.mark.asyncio
+    async def test_failed_evaluation_does_not_block_others(self, monitoring_workflow):
+        """Test that one failing evaluation is logged and other checking points still act."""
+        checking_points = {"broken": _checking_point("broken"), "ok": _checking_point("ok", actions=1)}
+        monitoring_workflow.matches = {("ok", "task_1")}
+        evaluate = monitoring_workflow.execute_activity_with_retry
+
+        async def failing_activity(activity, *args, **kwargs):
+            if activity.__name__ == "evaluate_checking_point" and args[0].name == "broken":
+                raise RuntimeError("activity failed")
+            return await evaluate(activity, *args, **kwargs)
+
+        monitoring_workflow.execute_activity_with_retry = failing_activity
+
+        await monitoring_workflow.process_data_items_in_parallel(
+            [_data_item("task_1")], checking_points, max_concurrency=2
+        )
+
+        assert ("action", "ok_action_0") in monitoring_workflow.calls
+        monitoring_workflow.log_workflow_error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_stops_on_match(self, monitoring_workflow):
+        """Test that the sequential path shares the stop_on_match handling."""
+        checking_points = {
+            "a": _checking_point("a", stop_on_match=True, actions=1),
+            "b": _checking_point("b"),
+        }
+        monitoring_workflow.matches = {("a", "task_1")}
+
+        await monitoring_workflow.process_data_item_with_checking_points(_data_item("task_1"), checking_points)
+
+        assert monitoring_workflow.calls == [("evaluate", "a", "task_1"), ("action", "a_action_0")]
+        assert monitoring_workflow.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_batches_chunk_data_items(self, monitoring_workflow):
+        """Test that data items are evaluated in chunks by the batch activity."""
+        checking_points = {name: _checking_point(name) for name in ("a", "b")}
+        data_items = [_data_item(f"task_{i}") for i in range(5)]
+
+        await monitoring_workflow.process_data_items_in_batches(data_items, checking_points, batch_size=2)
+
+        assert monitoring_workflow.calls == [
+            ("batch", ["task_0", "task_1"], ["a", "b"]),
+            ("batch", ["task_2", "task_3"], ["a", "b"]),
+            ("batch", ["task_4"], ["a", "b"]),
+        ]
+        assert monitoring_workflow.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_run_actions_in_order(self, monitoring_workflow):
+        """Test that batch matches are acted on in checking point order up to a stopping match."""
+        checking_points = {
+            "a": _checking_point("a", actions=1),
+            "b": _checking_point("b", stop_on_match=True, actions=1),
+            "c": _checking_point("c", actions=1),
+        }
+        monitoring_workflow.matches = {("a", "task_1"), ("b", "task_1"), ("c", "task_1")}
+
+        await monitoring_workflow.process_data_items_in_batches([_data_item("task_1")], checking_points, batch_size=10)
+
+        actions = [call[1] for call in monitoring_workflow.calls if call[0] == "action"]
+        assert actions == ["a_action_0", "b_action_0"]
+
+    @pytest.mark.asyncio
+    async def test_batches_run_concurrently(self, monitoring_workflow):
+        """Test that chunks are evaluated concurrently up to the cap."""
+        checking_points = {"a": _checking_point("a")}
+        data_items = [_data_item(f"task_{i}") for i in range(12)]
+
+        await monitoring_workflow.process_data_items_in_batches(
+            data_items, checking_points, batch_size=2, max_concurrency=3
+        )
+
+        assert len(monitoring_workflow.calls) == 6
+        assert 1 < monitoring_workflow.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_logged(self, monitoring_workflow):
+        """Test that a failing batch activity is logged without stopping other chunks."""
+        checking_points = {"a": _checking_point("a", actions=1)}
+        monitoring_workflow.matches = {("a", "task_1")}
+        evaluate = monitoring_workflow.execute_activity_with_retry
+
+        async def failing_activity(activity, *args, **kwargs):
+            if activity.__name__ == "evaluate_checking_points_batch" and args[0][0].id == "task_0":
+                raise RuntimeError("activity failed")
+            return await evaluate(activity, *args, **kwargs)
+
+        monitoring_workflow.execute_activity_with_retry = failing_activity
+
+        await monitoring_workflow.process_data_items_in_batches(
+            [_data_item("task_0"), _data_item("task_1")], checking_points, batch_size=1
+        )
+
+        assert ("action", "a_action_0") in monitoring_workflow.calls
+        monitoring_workflow.log_workflow_error.assert_called_once()
+
+
+class _ContinuedAsNew(BaseException):
+    """Stand-in for the exception raised by workflow.continue_as_new."""
+
+
+class TestSmartMonitoringContinueAsNew:
+    """Test continue-as-new of SmartMonitoringWorkflow."""
+
+    @pytest.fixture
+    def workflow_info(self):
+        """Patch workflow.info with a configurable history length."""
+        with patch("gearmeshing_ai.scheduler.workflows.monitoring.workflow.info") as info:
+            info.return_value.get_current_history_length.return_value = 10
+            info.return_value.is_continue_as_new_suggested.return_value = False
+            yield info.return_value
+
+    @pytest.fixture
+    def monitoring_workflow(self, workflow_info):
+        """Create a SmartMonitoringWorkflow whose cycles fetch a fixed set of items."""
+        from gearmeshing_ai.scheduler.workflows.monitoring import SmartMonitoringWorkflow
+
+        monitoring_workflow = SmartMonitoringWorkflow()
+        monitoring_workflow.logger = MagicMock()
+        monitoring_workflow.log_workflow_error = MagicMock()
+        monitoring_workflow.execute_activity_with_retry = AsyncMock(return_value=[_data_item("task_1")])
+        return monitoring_workflow
+
+    @staticmethod
+    def _config(**kwargs) -> MonitorConfig:
+        return MonitorConfig(name="monitor", interval_seconds=10, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_continues_as_new_after_cycle_limit(self, monitoring_workflow):
+        """Test that the workflow continues as new with its carried state after N cycles."""
+        config = self._config(continue_as_new_after_cycles=3, skip_unchanged_items=True)
+        state = MonitoringCycleState(cycles_completed=7, runs=2)
+
+        with (
+            patch("gearmeshing_ai.scheduler.workflows.monitoring.asyncio.sleep", new=AsyncMock()),
+            patch(
+                "gearmeshing_ai.scheduler.workflows.monitoring.workflow.continue_as_new",
+                side_effect=_ContinuedAsNew,
+            ) as continue_as_new,
+            patch("gearmeshing_ai.scheduler.workflows.monitoring.checking_point_registry") as registry,
+        ):
+            registry.get_all_instances.return_value = {}
+            with pytest.raises(_ContinuedAsNew):
+                await monitoring_workflow.run(config, state)
+
+        next_config, next_state = continue_as_new.call_args.kwargs["args"]
+        assert next_config is config
+        assert monitoring_workflow.cycles_in_run == 3
+        assert next_state.cycles_completed == 10
+        # The same unchanged item is fetched every cycle and only processed once
+        assert next_state.data_items_processed == 1
+        assert next_state.data_items_skipped == 2
+        assert list(next_state.seen_digests) == ["task_1"]
+        assert next_state.runs == 3
+
+    def test_history_length_limit(self, monitoring_workflow, workflow_info):
+        """Test that a long history triggers continue-as-new before the cycle limit."""
+        config = self._config(continue_as_new_after_history_events=1000)
+        monitoring_workflow.cycles_in_run = 1
+
+        assert not monitoring_workflow.should_continue_as_new(config)
+
+        workflow_info.get_current_history_length.return_value = 1000
+        assert monitoring_workflow.should_continue_as_new(config)
+
+    def test_server_suggestion(self, monitoring_workflow, workflow_info):
+        """Test that the server's continue-as-new suggestion is followed."""
+        workflow_info.is_continue_as_new_suggested.return_value = True
+
+        assert monitoring_workflow.should_continue_as_new(self._config())
+
+    def test_carried_digests_are_bounded(self, monitoring_workflow):
+        """Test that the carried state is compacted to the configured digest limit."""
+        monitoring_workflow.state = MonitoringCycleState(
+            seen_digests={f"task_{i}": SeenItem(digest="digest", cycle=0) for i in range(10)}
+        )
+
+        with patch("gearmeshing_ai.scheduler.workflows.monitoring.workflow.continue_as_new") as continue_as_new:
+            monitoring_workflow.continue_as_new(self._config(max_seen_digests=4))
+
+        _, next_state = continue_as_new.call_args.kwargs["args"]
+        assert list(next_state.seen_digests) == ["task_6", "task_7", "task_8", "task_9"]
+
+
+class TestSmartMonitoringSeenItems:
+    """Test skipping of unchanged data items in SmartMonitoringWorkflow."""
+
+    @pytest.fixture
+    def monitoring_workflow(self):
+        """Create a SmartMonitoringWorkflow with a recording logger."""
+        from gearmeshing_ai.scheduler.workflows.monitoring import SmartMonitoringWorkflow
+
+        monitoring_workflow = SmartMonitoringWorkflow()
+        monitoring_workflow.logger = MagicMock()
+        return monitoring_workflow
+
+    @staticmethod
+    def _config(**kwargs) -> MonitorConfig:
+        kwargs.setdefault("skip_unchanged_items", True)
+        return MonitorConfig(name="monitor", **kwargs)
+
+    def test_unchanged_items_are_skipped(self, monitoring_workflow):
+        """Test that only new and changed items are selected after a cycle."""
+        config = self._config()
+        first = [_data_item("task_1"), _data_item("task_2")]
+        changed, digests = monitoring_workflow.select_changed_items(first, config)
+        for data_item in changed:
+            monitoring_workflow.state.mark_seen(data_item.id, digests[data_item.id], config.max_seen_digests)
+        monitoring_workflow.state.record_cycle(data_items_processed=len(changed))
+
+        updated = MonitoringData(
+            id="task_2", type=MonitoringDataType.CLICKUP_TASK, source="clickup", data={"id": "task_2", "status": "done"}
+        )
+        changed, _ = monitoring_workflow.select_changed_items(
+            [_data_item("task_1"), updated, _data_item("task_3")], config
+        )
+
+        assert [data_item.id for data_item in changed] == ["task_2", "task_3"]
+
+    def test_unchanged_items_expire(self, monitoring_workflow):
+        """Test that an unchanged item is selected again after the configured number of cycles."""
+        config = self._config(reevaluate_unchanged_after_cycles=2)
+        data_item = _data_item("task_1")
+        monitoring_workflow.state.mark_seen("task_1", data_item.content_digest(), config.max_seen_digests)
+
+        monitoring_workflow.state.record_cycle()
+        assert monitoring_workflow.select_changed_items([data_item], config)[0] == []
+
+        monitoring_workflow.state.record_cycle()
+        assert monitoring_workflow.select_changed_items([data_item], config)[0] == [data_item]
+
+    def test_duplicate_items_are_processed_once(self, monitoring_workflow):
+        """Test that an item fetched by several checking points is selected once."""
+        changed, digests = monitoring_workflow.select_changed_items(
+            [_data_item("task_1"), _data_item("task_1")], self._config()
+        )
+
+        assert len(changed) == 1
+        assert list(digests) == ["task_1"]
+
+    def test_disabled(self, monitoring_workflow):
+        """Test that every item is selected when skipping is disabled."""
+        data_items = [_data_item("task_1"), _data_item("task_1")]
+        monitoring_workflow.state.mark_seen("task_1", data_items[0].content_digest(), 10)
+
+        changed, digests = monitoring_workflow.select_changed_items(
+            data_items, self._config(skip_unchanged_items=False)
+        )
+
+        assert changed == data_items
+        assert digests == {}
+
+    def test_disabled_by_default(self):
+        """Test that existing monitors keep evaluating every item."""
+        assert MonitorConfig(name="monitor").skip_unchanged_items is False
+
+    def test_failed_items_are_not_marked_seen(self, monitoring_workflow):
+        """Test that only items processed without failure are recorded with their matches."""
+        config = self._config()
+        data_items = [_data_item("task_1"), _data_item("task_2")]
+        _, digests = monitoring_workflow.select_changed_items(data_items, config)
+        monitoring_workflow.start_cycle(digests)
+        monitoring_workflow.cycle_matches["task_1"] = ["a"]
+        monitoring_workflow.failed_item_ids.add("task_2")
+
+        monitoring_workflow.mark_processed_items(digests, config)
+
+        assert list(monitoring_workflow.state.seen_digests) == ["task_1"]
+        assert monitoring_workflow.state.seen_digests["task_1"].matched == ["a"]
+        assert monitoring_workflow.select_changed_items(data_items, config)[0] == [data_items[1]]
+
+    @pytest.mark.asyncio
+    async def test_failed_action_is_retried(self, monitoring_workflow):
+        """Test that an item whose action failed is processed again in the next cycle."""
+        config = self._config()
+        checking_point = _checking_point("a", actions=1)
+        data_item = _data_item("task_1")
+        match = CheckResult(
+            checking_point_name="a",
+            checking_point_type="custom_cp",
+            result_type=CheckResultType.MATCH,
+            should_act=True,
+        )
+        monitoring_workflow.log_workflow_error = MagicMock()
+        monitoring_workflow.execute_activity_with_retry = AsyncMock(side_effect=[match, RuntimeError("action failed")])
+        _, digests = monitoring_workflow.select_changed_items([data_item], config)
+        monitoring_workflow.start_cycle(digests)
+
+        await monitoring_workflow.process_data_item_with_checking_points(data_item, {"a": checking_point})
+        monitoring_workflow.mark_processed_items(digests, config)
+
+        assert monitoring_workflow.state.seen_digests == {}
+        assert monitoring_workflow.select_changed_items([data_item], config)[0] == [data_item]
+
+    @pytest.mark.asyncio
+    async def test_failed_ai_workflow_is_retried(self, monitoring_workflow):
+        """Test that an item whose AI workflow reported a failure is not marked seen."""
+        config = self._config()
+        checking_point = _checking_point("a")
+        checking_point.get_after_process.return_value = [MagicMock(workflow_name="triage", name="triage")]
+        data_item = _data_item("task_1")
+        match = CheckResult(
+            checking_point_name="a",
+            checking_point_type="custom_cp",
+            result_type=CheckResultType.MATCH,
+            should_act=True,
+        )
+        monitoring_workflow.execute_child_workflow_with_timeout = AsyncMock(
+            return_value=AIWorkflowResult(
+                workflow_name="triage",
+                checking_point_name="a",
+                success=False,
+                execution_id="exec_1",
+                started_at=datetime.utcnow(),
+            )
+        )
+        _, digests = monitoring_workflow.select_changed_items([data_item], config)
+        monitoring_workflow.start_cycle(digests)
+
+        with patch("gearmeshing_ai.scheduler.workflows.monitoring.AIWorkflowInput"):
+            await monitoring_workflow.handle_check_result(data_item, "a", checking_point, match)
+        monitoring_workflow.mark_processed_items(digests, config)
+
+        assert monitoring_workflow.state.seen_digests == {}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_result_is_not_acted_on_again(self, monitoring_workflow):
+        """Test that a re-evaluated unchanged item only triggers checking points that newly match."""
+        config = self._config(reevaluate_unchanged_after_cycles=1)
+        data_item = _data_item("task_1")
+        checking_points = {"a": _checking_point("a", actions=1), "b": _checking_point("b", actions=1)}
+        monitoring_workflow.state.mark_seen("task_1", data_item.content_digest(), 10, matched=["a"])
+        monitoring_workflow.state.record_cycle()
+
+        def match(name: str) -> CheckResult:
+            return CheckResult(
+                checking_point_name=name,
+                checking_point_type="custom_cp",
+                result_type=CheckResultType.MATCH,
+                should_act=True,
+            )
+
+        executed = []
+
+        async def execute_activity(activity, *args, **kwargs):
+            if activity.__name__ == "evaluate_checking_point":
+                return match(args[0].name)
+            executed.append(args[0]["type"])
+            return {"success": True}
+
+        monitoring_workflow.execute_activity_with_retry = execute_activity
+        changed, digests = monitoring_workflow.select_changed_items([data_item], config)
+        monitoring_workflow.start_cycle(digests)
+
+        await monitoring_workflow.process_data_item_with_checking_points(changed[0], checking_points)
+        monitoring_workflow.mark_processed_items(digests, config)
+
+        assert executed == ["b_action_0"]
+        assert monitoring_workflow.state.seen_digests["task_1"].matched == ["a", "b"]
+
+
+class TestSmartMonitoringAIWorkflowInput:
+    """Test the input of the AI workflows started by SmartMonitoringWorkflow."""
+
+    @pytest.fixture
+    def monitoring_workflow(self):
+        """Create a SmartMonitoringWorkflow whose child workflows are recorded."""
+        from gearmeshing_ai.scheduler.workflows.monitoring import SmartMonitoringWorkflow
+
+        monitoring_workflow = SmartMonitoringWorkflow()
+        monitoring_workflow.logger = MagicMock()
+        monitoring_workflow.execute_child_workflow_with_timeout = AsyncMock(return_value=None)
+        return monitoring_workflow
+
+    @staticmethod
+    def _ai_action(**parameters) -> AIAction:
+        return AIAction(
+            name="a_workflow",
+            type=AIActionType.WORKFLOW_EXECUTION,
+            workflow_name="custom_cp_workflow",
+            checking_point_name="a",
+            parameters=parameters,
+        )
+
+    @staticmethod
+    def _match(**kwargs) -> CheckResult:
+        return CheckResult(
+            checking_point_name="a",
+            checking_point_type="custom_cp",
+            result_type=CheckResultType.MATCH,
+            should_act=True,
+            context={"details": "x" * 1000},
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_workflow_creates_actions_with_full_payloads(self, monitoring_workflow):
+        """Test that without prepared actions the checking point creates them and the input is complete."""
+        checking_point = _checking_point("a")
+        checking_point.get_after_process.return_value = [self._ai_action()]
+        data_item = _data_item("task_1")
+
+        await monitoring_workflow.handle_check_result(data_item, "a", checking_point, self._match())
+
+        (input_,) = monitoring_workflow.execute_child_workflow_with_timeout.await_args.args[1:]
+        assert input_.data_item["data"] == {"id": "task_1"}
+        assert input_.check_result["context"] == {"details": "x" * 1000}
+
+    @pytest.mark.asyncio
+    async def test_prepared_actions_are_only_summarized(self, monitoring_workflow):
+        """Test that actions prepared by the evaluation activity are used and the input stays small."""
+        checking_point = _checking_point("a")
+        ai_action = self._ai_action(data={BLOB_REF_KEY: "0" * 64, "size": 100_000})
+        data_item = _data_item("task_1")
+
+        await monitoring_workflow.handle_check_result(
+            data_item, "a", checking_point, self._match(ai_actions=[ai_action])
+        )
+
+        checking_point.get_after_process.assert_not_called()
+        (input_,) = monitoring_workflow.execute_child_workflow_with_timeout.await_args.args[1:]
+        assert input_.ai_action == ai_action
+        assert input_.data_item == {"id": "task_1", "type": "clickup_task", "source": "clickup"}
+        assert "context" not in input_.check_result
+        assert len(input_.model_dump_json()) < 1000